@@ -9,15 +9,18 @@ import sys
 import json
 import click
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional, Tuple
 
 from src.utils.config import Config
 from src.utils.logger import Logger
 from src.utils.cache import DocumentCache
-from src.core.validators.yaml_validator import YAMLValidator
+from src.utils.large_files import large_file_threshold
+from src.core.validators.yaml_validator import YAMLValidator, ValidationIssue
 from src.core.validators.naming_validator import NamingValidator
 from src.core.validators.markdown_validator import MarkdownValidator
 from src.core.validators.conflict_detector import ConflictDetector
+from src.core.link_graph import LinkGraph
+from src.core.metadata_index import MetadataIndex, normalize_metadata
 from src.core.auto_fixer import AutoFixer
 from src.core.change_detector import ChangeDetector
 from src.reporting import (
@@ -34,6 +37,11 @@ from src.reporting import (
 # Version information
 VERSION = "1.0.0"
 
+# Rules whose results depend on a document's path rather than its content;
+# these are re-run when a document is renamed or a document it links to
+# moves or changes
+PATH_DEPENDENT_RULES = ('NAME-', 'MD-003')
+
 
 @click.group()
 @click.version_option(version=VERSION, prog_name="Symphony Core")
@@ -87,7 +95,18 @@ def cli(ctx):
 @click.option(
     '--preview',
     is_flag=True,
-    help='Preview auto-fixes without applying (requires --auto-fix)'
+    help='Preview auto-fixes as a unified diff without applying (requires --auto-fix)'
+)
+@click.option(
+    '--patch',
+    type=click.Path(dir_okay=False, path_type=Path),
+    help='Write the preview diff to a patch file instead of stdout (requires --preview)'
+)
+@click.option(
+    '--jobs',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Parallel workers for auto-fix (default: processing.autofix_jobs)'
 )
 @click.option(
     '--conflicts',
@@ -120,6 +139,8 @@ def validate(
     force: bool,
     auto_fix: bool,
     preview: bool,
+    patch: Optional[Path],
+    jobs: Optional[int],
     conflicts: bool,
     format: str,
     output: Optional[Path],
@@ -149,6 +170,9 @@ def validate(
         # Auto-fix issues with preview
         python main.py validate --auto-fix --preview
 
+        # Save the previewed fixes as a patch for git apply
+        python main.py validate --auto-fix --preview --patch fixes.patch
+
         # Run conflict detection
         python main.py validate --conflicts
 
@@ -162,6 +186,10 @@ def validate(
         click.echo("Error: --preview requires --auto-fix", err=True)
         sys.exit(1)
 
+    if patch and not preview:
+        click.echo("Error: --patch requires --preview", err=True)
+        sys.exit(1)
+
     if path and files:
         click.echo("Error: Cannot specify both --path and --file", err=True)
         sys.exit(1)
@@ -219,11 +247,25 @@ def validate(
         # Initialize validators
         yaml_validator = YAMLValidator(config, logger)
         naming_validator = NamingValidator(config, logger)
-        markdown_validator = MarkdownValidator(config, logger)
-        conflict_detector = ConflictDetector(config, logger)
+        # Link graph shared by MD-003 and conflict detection, rooted at the
+        # repository root so node ids stay stable across runs and match
+        # the graph 'rename apply' uses. Link checks
+        # are opt-in (validation.links.enabled); without the graph MD-003
+        # and the graph-based conflict checks do not run
+        base_path = path if path is not None else Path('.')
+        link_graph = None
+        if config.get('validation.links.enabled', False):
+            link_graph = LinkGraph(
+                config.get_repo_root(),
+                config.get_state_path('processing.link_graph_file', '_meta/.link-graph.json')
+            )
+
+        markdown_validator = MarkdownValidator(config, logger, link_graph=link_graph)
+        conflict_detector = ConflictDetector(config, logger, link_graph=link_graph)
 
         # Find documents to process
         change_detector = None  # Will be set if using incremental mode
+        metadata_index = _get_metadata_index(config)
 
         if files:
             # Use specified files
@@ -233,17 +275,35 @@ def validate(
                 if doc.suffix.lower() != '.md':
                     click.echo(f"Error: {doc} is not a markdown file (.md)", err=True)
                     sys.exit(1)
+            if tag_list:
+                documents = metadata_index.filter_by_tags(documents, tag_list)
+                metadata_index.save()
         elif conflicts or force:
             # Conflict detection and force mode process all documents
-            documents = _find_all_documents(path, tag_list)
+            documents = _find_all_documents(path, tag_list, metadata_index)
+            if tag_list:
+                metadata_index.save()
         else:
             # Incremental validation uses change detection
-            cache_file = Path(config.get('paths.cache_file', '_meta/.document-cache.json'))
-            cache = DocumentCache(cache_file)
-            change_detector = ChangeDetector(cache, logger)
+            cache_file = config.get_state_path('paths.cache_file', '_meta/.document-cache.json')
+            cache = DocumentCache(
+                cache_file,
+                repo_root=config.get_repo_root(),
+                compact_ratio=config.get('processing.cache_compact_ratio', 1.0)
+            )
+            change_detector = ChangeDetector(
+                cache,
+                logger,
+                metadata_index=metadata_index,
+                large_file_threshold=large_file_threshold(config),
+                link_graph=link_graph
+            )
             documents, change_summary = change_detector.get_files_to_process(
                 path,
-                force_reprocess=False
+                force_reprocess=False,
+                # Only documents with a requested tag are hashed and checked
+                file_filter=(lambda scanned: metadata_index.filter_by_tags(scanned, tag_list))
+                if tag_list else None
             )
 
         click.echo(f"Documents to process: {len(documents)}")
@@ -259,15 +319,23 @@ def validate(
                 conflict_detector,
                 documents,
                 format,
-                output
+                output,
+                base_path if link_graph is not None else None
             )
         elif auto_fix:
             _run_auto_fix(
+                AutoFixer(config, logger),
                 yaml_validator,
+                naming_validator,
+                markdown_validator,
                 documents,
                 preview,
                 format,
-                output
+                output,
+                change_detector,
+                jobs,
+                patch,
+                base_path
             )
         else:
             _run_validation(
@@ -289,13 +357,21 @@ def validate(
         sys.exit(1)
 
 
-def _find_all_documents(base_path: Path, tags: Optional[list] = None) -> list:
+def _find_all_documents(
+    base_path: Path,
+    tags: Optional[list] = None,
+    metadata_index: Optional[MetadataIndex] = None
+) -> list:
     """
     Find all markdown documents in the given path.
 
     Args:
         base_path: Root path to search
-        tags: Optional list of tags to filter by
+        tags: Optional list of tags to filter by (documents with any of them
+            are kept)
+        metadata_index: Index answering the tag filter; only documents that
+            changed since they were indexed are read (an in-memory index is
+            used if not given)
 
     Returns:
         List of Path objects for markdown files
@@ -312,30 +388,81 @@ def _find_all_documents(base_path: Path, tags: Optional[list] = None) -> list:
         if '_meta' in md_file.parts:
             continue
 
-        # If tags filter provided, check document tags
-        if tags:
-            # This is a placeholder - would need to parse frontmatter to check tags
-            # For now, include all documents
-            pass
-
         documents.append(md_file)
 
-    return sorted(documents)
+    documents.sort()
+
+    # If tags filter provided, keep documents with any of the tags
+    if tags:
+        if metadata_index is None:
+            metadata_index = MetadataIndex(base_path)
+        documents = metadata_index.filter_by_tags(documents, tags)
 
+    return documents
 
-def _run_validation(
+
+def _get_metadata_index(config: Config) -> MetadataIndex:
+    """
+    Open the persistent metadata index configured for the repository.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        MetadataIndex rooted at processing.repo_root (in-memory only if
+        processing.metadata_index_file is empty)
+    """
+    return MetadataIndex(
+        config.get_repo_root(),
+        config.get_state_path('processing.metadata_index_file', '_meta/.metadata-index.json'),
+        large_file_threshold=large_file_threshold(config)
+    )
+
+
+def _get_renamed_cached_issues(change_detector, doc: Path) -> Optional[list]:
+    """
+    Get cached issues for a document that was renamed without changes, or
+    that is unchanged but links to a document that moved or changed.
+
+    Args:
+        change_detector: ChangeDetector in incremental mode, or None
+        doc: Document path
+
+    Returns:
+        Serialized cached issues, or None if the document needs full validation
+    """
+    if change_detector is None:
+        return None
+
+    cached_doc = change_detector.cache.get_document(doc)
+    if not cached_doc or not (cached_doc.get('renamed_from') or cached_doc.get('links_stale')):
+        return None
+
+    return cached_doc.get('issues')
+
+
+def _validate_documents(
     yaml_validator,
     naming_validator,
     markdown_validator,
     documents: list,
-    format: str,
-    output: Optional[Path],
-    change_detector = None,
-    severity_filter: Optional[Severity] = None
-):
-    """Run full validation on documents."""
-    all_issues = []
-    issues_by_doc = {}  # Track issues per document for cache updates
+    change_detector = None
+) -> dict:
+    """
+    Run every validator over each document once.
+
+    Args:
+        yaml_validator: YAML frontmatter validator
+        naming_validator: File naming validator
+        markdown_validator: Markdown syntax validator
+        documents: Documents to validate
+        change_detector: ChangeDetector in incremental mode, or None
+
+    Returns:
+        Dictionary mapping each document to its validation issues, in the
+        order of documents
+    """
+    issues_by_doc = {}
 
     with click.progressbar(
         documents,
@@ -345,38 +472,82 @@ def _run_validation(
         for doc in bar:
             doc_issues = []
 
-            # YAML validation
-            yaml_issues = yaml_validator.validate(doc)
-            all_issues.extend(yaml_issues)
-            doc_issues.extend(yaml_issues)
+            cached_issues = _get_renamed_cached_issues(change_detector, doc)
+            if cached_issues is not None:
+                # Moved without content changes, or linking to a document
+                # that moved: keep cached results and re-run only the rules
+                # that depend on file locations
+                doc_issues.extend(
+                    ValidationIssue.from_dict(issue, doc) for issue in cached_issues
+                    if not issue['rule_id'].startswith(PATH_DEPENDENT_RULES)
+                )
+                doc_issues.extend(naming_validator.validate(doc))
+                doc_issues.extend(markdown_validator.validate_links(doc))
+            else:
+                doc_issues.extend(yaml_validator.validate(doc))
+                doc_issues.extend(naming_validator.validate(doc))
+                doc_issues.extend(markdown_validator.validate(doc))
+
+            issues_by_doc[doc] = doc_issues
 
-            # Naming validation
-            naming_issues = naming_validator.validate(doc)
-            all_issues.extend(naming_issues)
-            doc_issues.extend(naming_issues)
+    return issues_by_doc
 
-            # Markdown validation
-            markdown_issues = markdown_validator.validate(doc)
-            all_issues.extend(markdown_issues)
-            doc_issues.extend(markdown_issues)
 
-            issues_by_doc[doc] = doc_issues
+def _update_validation_cache(change_detector, issues_by_doc: dict) -> None:
+    """
+    Record validation results in the document cache and save it.
 
-            # Update cache if using incremental mode
-            if change_detector:
-                error_count = sum(1 for issue in doc_issues if issue.severity == 'error')
-                warning_count = sum(1 for issue in doc_issues if issue.severity == 'warning')
-                validation_status = 'passed' if error_count == 0 else 'failed'
-                change_detector.update_cache_for_file(
-                    doc,
-                    validation_status=validation_status,
-                    error_count=error_count,
-                    warning_count=warning_count
-                )
+    Args:
+        change_detector: ChangeDetector in incremental mode
+        issues_by_doc: Dictionary mapping documents to their issues
+    """
+    for doc, doc_issues in issues_by_doc.items():
+        error_count = sum(1 for issue in doc_issues if issue.severity == 'error')
+        warning_count = sum(1 for issue in doc_issues if issue.severity == 'warning')
+        validation_status = 'passed' if error_count == 0 else 'failed'
+        change_detector.update_cache_for_file(
+            doc,
+            validation_status=validation_status,
+            error_count=error_count,
+            warning_count=warning_count,
+            issues=doc_issues
+        )
+
+    change_detector.save_cache()
+
+
+def _save_link_graph(markdown_validator) -> None:
+    """Prune and save the link graph shared by the validators, if any."""
+    if markdown_validator.link_graph is not None:
+        markdown_validator.link_graph.prune()
+        markdown_validator.link_graph.save()
+
+
+def _run_validation(
+    yaml_validator,
+    naming_validator,
+    markdown_validator,
+    documents: list,
+    format: str,
+    output: Optional[Path],
+    change_detector = None,
+    severity_filter: Optional[Severity] = None
+):
+    """Run full validation on documents."""
+    issues_by_doc = _validate_documents(
+        yaml_validator,
+        naming_validator,
+        markdown_validator,
+        documents,
+        change_detector
+    )
+    all_issues = [issue for doc_issues in issues_by_doc.values() for issue in doc_issues]
 
-    # Save cache if using incremental mode
+    # Update cache if using incremental mode
     if change_detector:
-        change_detector.save_cache()
+        _update_validation_cache(change_detector, issues_by_doc)
+
+    _save_link_graph(markdown_validator)
 
     click.echo()
 
@@ -395,13 +566,18 @@ def _run_conflict_detection(
     conflict_detector,
     documents: list,
     format: str,
-    output: Optional[Path]
+    output: Optional[Path],
+    base_path: Optional[Path] = None
 ):
     """Run conflict detection on documents."""
     click.echo("Running conflict detection...")
 
     # Detect conflicts
-    conflicts = conflict_detector.detect_conflicts(documents)
+    conflicts = conflict_detector.detect_conflicts(documents, base_path=base_path)
+
+    if conflict_detector.link_graph is not None:
+        conflict_detector.link_graph.prune()
+        conflict_detector.link_graph.save()
 
     click.echo()
 
@@ -433,53 +609,109 @@ def _run_conflict_detection(
 
 
 def _run_auto_fix(
+    auto_fixer,
     yaml_validator,
+    naming_validator,
+    markdown_validator,
     documents: list,
     preview: bool,
     format: str,
-    output: Optional[Path]
+    output: Optional[Path],
+    change_detector = None,
+    jobs: Optional[int] = None,
+    patch: Optional[Path] = None,
+    base_path: Optional[Path] = None
 ):
-    """Run auto-fix on documents."""
-    from src.utils.config import Config
-
-    config = Config()
-    log_file = Path(config.get('paths.logs_dir', 'logs')) / 'autofix.log'
-    logger = Logger(
-        name="symphony_core.autofix",
-        log_file=log_file,
-        log_level=config.get('logging.level', 'INFO'),
-        console_output=False
+    """
+    Validate documents, then fix the issues found.
+
+    The fix stage consumes the issues of the validation pass (including
+    cached results for renamed documents), so each document is validated
+    once and every rule with a fix transform is fixed, not just YAML rules.
+    In preview mode the fixes are streamed as a unified diff instead.
+    When documents need tags, tag suggestions are first learned from the
+    tagged documents under base_path.
+    """
+    issues_by_doc = _validate_documents(
+        yaml_validator,
+        naming_validator,
+        markdown_validator,
+        documents,
+        change_detector
     )
-    auto_fixer = AutoFixer(config, logger)
 
-    results = []
+    if base_path is not None and any(auto_fixer.needs_tags(issues) for issues in issues_by_doc.values()):
+        learned = auto_fixer.train_tag_suggester(_find_all_documents(base_path))
+        if learned:
+            click.echo(f"Tag suggestions learned from {learned} tagged document(s)")
 
-    with click.progressbar(
-        documents,
-        label='Auto-fixing documents',
-        show_pos=True
-    ) as bar:
-        for doc in bar:
-            # Validate first to find issues
-            issues = yaml_validator.validate(doc)
+    if preview:
+        results = _write_previews(auto_fixer.iter_previews(issues_by_doc), patch)
+    else:
+        # Fix all documents with fixable issues as one backup run
+        results = list(auto_fixer.fix_batch(issues_by_doc, preview=False, jobs=jobs).values())
 
-            # Collect fixable issues
-            fixable_issues = [issue for issue in issues if auto_fixer.can_fix(issue)]
+    if change_detector:
+        # Leave every document with fixable issues out of the cache: fixed
+        # documents no longer match the issues found, and previewed (or
+        # failed) ones still need fixing, so the next run must pick them up
+        fixable = {result.file_path for result in results}
+        _update_validation_cache(
+            change_detector,
+            {doc: issues for doc, issues in issues_by_doc.items() if doc not in fixable}
+        )
 
-            # Fix document if there are fixable issues
-            if fixable_issues:
-                result = auto_fixer.fix_document(doc, fixable_issues, preview=preview)
-                results.append(result)
+    _save_link_graph(markdown_validator)
 
     click.echo()
 
     # Generate report
     _generate_autofix_report(results, preview, format, output)
 
+    if patch:
+        click.echo(f"Patch saved to: {patch}")
+
+    if not preview and auto_fixer.last_run_id:
+        click.echo(f"Backups saved as run {auto_fixer.last_run_id}")
+
     # Exit with success
     sys.exit(0)
 
 
+def _write_previews(previews: Iterable[Tuple[Any, str]], patch: Optional[Path] = None) -> list:
+    """
+    Stream preview diffs to a patch file or stdout.
+
+    Diffs are written as they are produced, so only one document's diff is
+    held in memory at a time.
+
+    Args:
+        previews: (result, unified diff) pairs, e.g. from AutoFixer.iter_previews
+        patch: Patch file to write (default: stdout)
+
+    Returns:
+        The preview results, in order
+    """
+    results = []
+    # newline='' keeps the diff's line endings exactly as generated
+    handle = open(patch, 'w', encoding='utf-8', newline='') if patch else None
+
+    try:
+        for result, diff in previews:
+            results.append(result)
+            if not diff:
+                continue
+            if handle:
+                handle.write(diff)
+            else:
+                click.echo(diff, nl=False)
+    finally:
+        if handle:
+            handle.close()
+
+    return results
+
+
 def _generate_validation_report(
     issues: list,
     documents: list,
@@ -780,7 +1012,12 @@ def frontmatter():
 @click.option(
     '--preview',
     is_flag=True,
-    help='Preview changes without applying them'
+    help='Preview changes as a unified diff without applying them'
+)
+@click.option(
+    '--patch',
+    type=click.Path(dir_okay=False, path_type=Path),
+    help='Write the preview diff to a patch file instead of stdout (requires --preview)'
 )
 @click.pass_context
 def add_field(
@@ -792,7 +1029,8 @@ def add_field(
     value_type: str,
     overwrite: bool,
     no_skip: bool,
-    preview: bool
+    preview: bool,
+    patch: Optional[Path]
 ):
     """
     Add a frontmatter field to multiple markdown documents.
@@ -817,6 +1055,9 @@ def add_field(
 
         # Preview changes before applying
         python main.py frontmatter add-field --field category --value "Policy" --preview
+
+        # Save the preview as a patch for review with git apply
+        python main.py frontmatter add-field --field owner --value "ops" --preview --patch owner.patch
     """
     from src.core.frontmatter_manager import FrontmatterManager
 
@@ -827,6 +1068,10 @@ def add_field(
         click.echo("Error: Cannot specify both --path and --file", err=True)
         sys.exit(1)
 
+    if patch and not preview:
+        click.echo("Error: --patch requires --preview", err=True)
+        sys.exit(1)
+
     # Set default path
     if path is None and not files:
         path = Path(config.get('paths.docs_root', '.'))
@@ -877,33 +1122,48 @@ def add_field(
         # Parse value based on type
         parsed_value = _parse_field_value(value, value_type)
 
-        # Preview mode - show what would happen
+        # Preview mode - diff every document against its would-be content
         if preview:
             click.echo("PREVIEW MODE - No changes will be applied")
             click.echo("-" * 80)
 
+            # Exact counts for every document, answered from the index
+            index = _get_metadata_index(config)
+            unreadable = index.refresh(documents)
+            entries = [entry for entry in (index.get(doc) for doc in documents) if entry is not None]
+            with_field = len(index.query([{'field': field, 'exists': True}], documents))
+            invalid = sum(1 for entry in entries if entry['error'] is not None)
+            without_frontmatter = sum(1 for entry in entries if not entry['frontmatter'])
+            index.save()
+
+            click.echo(f"Documents with '{field}': {with_field}")
+            click.echo(f"Documents missing '{field}': {len(entries) - with_field - invalid}"
+                       f" ({without_frontmatter} without frontmatter)")
+            if invalid or unreadable:
+                click.echo(f"Documents with invalid frontmatter or unreadable: {invalid + unreadable}")
+            click.echo("-" * 80)
+
             manager = FrontmatterManager(logger)
+            previews = (
+                manager.preview_add_field(
+                    doc,
+                    field,
+                    parsed_value,
+                    overwrite,
+                    only_if_missing=not no_skip
+                )
+                for doc in documents
+            )
+            summary = manager.generate_summary_report(_write_previews(previews, patch))
 
-            # Check each document to see what would happen
-            preview_count = 0
-            for doc in documents[:10]:  # Show first 10 for preview
-                from src.utils.frontmatter import has_frontmatter, parse_frontmatter
-
-                if has_frontmatter(doc):
-                    metadata = parse_frontmatter(doc)
-                    if field in metadata:
-                        if overwrite or not no_skip:
-                            click.echo(f"[WOULD UPDATE] {doc}: {field}={metadata[field]} → {parsed_value}")
-                        else:
-                            click.echo(f"[WOULD SKIP] {doc}: Field already exists")
-                    else:
-                        click.echo(f"[WOULD ADD] {doc}: {field}={parsed_value}")
-                else:
-                    click.echo(f"[WOULD CREATE] {doc}: Adding frontmatter with {field}={parsed_value}")
-                preview_count += 1
-
-            if len(documents) > 10:
-                click.echo(f"... and {len(documents) - 10} more documents")
+            click.echo()
+            click.echo(f"Would change: {summary['successful']} document(s)")
+            click.echo(f"Would skip: {summary['failed']} document(s)")
+            for reason, file_list in summary['failure_reasons'].items():
+                click.echo(f"  {reason}: {len(file_list)} documents")
+
+            if patch:
+                click.echo(f"Patch saved to: {patch}")
 
             click.echo()
             click.echo("Run without --preview to apply changes")
@@ -970,48 +1230,779 @@ def add_field(
         sys.exit(1)
 
 
-def _parse_field_value(value: str, value_type: str) -> Any:
+@frontmatter.command('apply')
+@click.argument(
+    'operations_file',
+    type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.option(
+    '--path',
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
+    help='Process documents in specific folder (default: current directory)'
+)
+@click.option(
+    '--file',
+    'files',
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, path_type=Path),
+    multiple=True,
+    help='Process specific file(s) - can be specified multiple times'
+)
+@click.option(
+    '--jobs',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Parallel workers (default: processing.frontmatter_jobs)'
+)
+@click.option(
+    '--preview',
+    is_flag=True,
+    help='Preview changes as a unified diff without applying them'
+)
+@click.option(
+    '--patch',
+    type=click.Path(dir_okay=False, path_type=Path),
+    help='Write the preview diff to a patch file instead of stdout (requires --preview)'
+)
+@click.pass_context
+def apply_operations(
+    ctx,
+    operations_file: Path,
+    path: Optional[Path],
+    files: tuple,
+    jobs: Optional[int],
+    preview: bool,
+    patch: Optional[Path]
+):
     """
-    Parse a string value into the specified type.
+    Apply a file of frontmatter operations to multiple documents.
 
-    Args:
-        value: String value to parse
-        value_type: Type to parse into (string, list, number, boolean)
+    OPERATIONS_FILE is a YAML list of operations (set, unset, rename,
+    append, each optionally with a 'when' condition). All operations are
+    applied to each document in memory, followed by a single write.
 
-    Returns:
-        Parsed value in the appropriate type
+    Examples:
 
-    Raises:
-        ValueError: If value cannot be parsed into the specified type
+        # Apply operations to all documents in a folder
+        python main.py frontmatter apply ops.yaml --path docs/
+
+        # Preview the changes as a patch
+        python main.py frontmatter apply ops.yaml --preview --patch ops.patch
+
+    Example operations file:
+
+    \b
+        operations:
+          - {op: set, field: owner, value: ops}
+          - {op: set, field: status, value: review, when: {equals: draft}}
+          - {op: rename, field: author, to: maintainer}
+          - {op: append, field: tags, value: reviewed}
+          - {op: unset, field: legacy_id}
     """
-    if value_type == 'string':
-        return value
+    from src.core.frontmatter_manager import FrontmatterManager, load_operations
 
-    elif value_type == 'list':
-        # Split by comma and strip whitespace
-        return [item.strip() for item in value.split(',')]
+    config = ctx.obj['config']
 
-    elif value_type == 'number':
-        # Try int first, then float
-        try:
-            if '.' in value:
-                return float(value)
-            else:
-                return int(value)
-        except ValueError:
-            raise ValueError(f"Cannot parse '{value}' as a number")
+    # Validate option combinations
+    if path and files:
+        click.echo("Error: Cannot specify both --path and --file", err=True)
+        sys.exit(1)
 
-    elif value_type == 'boolean':
-        value_lower = value.lower()
-        if value_lower in ('true', 'yes', '1', 'y'):
-            return True
-        elif value_lower in ('false', 'no', '0', 'n'):
-            return False
+    if patch and not preview:
+        click.echo("Error: --patch requires --preview", err=True)
+        sys.exit(1)
+
+    try:
+        operations = load_operations(operations_file)
+    except ValueError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    # Set default path
+    if path is None and not files:
+        path = Path(config.get('paths.docs_root', '.'))
+
+    click.echo("=" * 80)
+    click.echo("SYMPHONY CORE - FRONTMATTER OPERATIONS")
+    click.echo("=" * 80)
+    click.echo()
+    click.echo(f"Operations: {len(operations)} from {operations_file}")
+    click.echo(f"Mode: {'Preview' if preview else 'Apply'}")
+    click.echo()
+
+    try:
+        log_file = Path(config.get('paths.logs_dir', 'logs')) / 'frontmatter.log'
+        logger = Logger(
+            name="symphony_core.frontmatter",
+            log_file=log_file,
+            log_level=config.get('logging.level', 'INFO'),
+            console_output=False
+        )
+
+        if files:
+            documents = [Path(f) for f in files]
+            for doc in documents:
+                if doc.suffix.lower() != '.md':
+                    click.echo(f"Error: {doc} is not a markdown file (.md)", err=True)
+                    sys.exit(1)
         else:
-            raise ValueError(f"Cannot parse '{value}' as a boolean")
+            documents = _find_all_documents(path)
 
-    else:
-        raise ValueError(f"Unknown type: {value_type}")
+        click.echo(f"Documents to process: {len(documents)}")
+        click.echo()
+
+        if len(documents) == 0:
+            click.echo("No documents to process.")
+            sys.exit(0)
+
+        manager = FrontmatterManager(logger)
+
+        if preview:
+            click.echo("PREVIEW MODE - No changes will be applied")
+            click.echo("-" * 80)
+            results = _write_previews(manager.iter_operation_previews(documents, operations), patch)
+        else:
+            results = manager.apply_operations(
+                documents,
+                operations,
+                jobs=jobs if jobs is not None else config.get('processing.frontmatter_jobs', 1)
+            )
+
+        changed = [result for result in results if result.changes]
+        failed = [result for result in results if not result.success]
+
+        click.echo()
+        click.echo("=" * 80)
+        click.echo("OPERATION SUMMARY")
+        click.echo("=" * 80)
+        click.echo(f"Total documents: {len(results)}")
+        click.echo(f"{'Would change' if preview else 'Changed'}: {len(changed)}")
+        click.echo(f"Unchanged: {len(results) - len(changed) - len(failed)}")
+        click.echo(f"Failed: {len(failed)}")
+
+        if not preview:
+            for result in changed:
+                click.echo(f"\n  {result.file_path}")
+                for change in result.changes:
+                    click.echo(f"    - {change}")
+
+        for result in failed:
+            click.echo(f"  [FAILED] {result.file_path}: {result.message}")
+
+        if patch:
+            click.echo(f"Patch saved to: {patch}")
+
+        click.echo()
+        click.echo("=" * 80)
+
+        sys.exit(1 if failed else 0)
+
+    except Exception as e:
+        click.echo(f"Error during operation: {e}", err=True)
+        if config.get('debug', False):
+            import traceback
+            traceback.print_exc()
+        sys.exit(1)
+
+
+@frontmatter.command('query')
+@click.option(
+    '--path',
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
+    help='Query documents in specific folder (default: current directory)'
+)
+@click.option(
+    '--has',
+    'has_fields',
+    multiple=True,
+    help='Field must exist - can be specified multiple times'
+)
+@click.option(
+    '--missing',
+    'missing_fields',
+    multiple=True,
+    help='Field must be absent - can be specified multiple times'
+)
+@click.option(
+    '--equals',
+    'equals',
+    multiple=True,
+    help='FIELD=VALUE: field must equal value - can be specified multiple times'
+)
+@click.option(
+    '--not-equals',
+    'not_equals',
+    multiple=True,
+    help='FIELD=VALUE: field must be absent or differ from value'
+)
+@click.option(
+    '--contains',
+    'contains',
+    multiple=True,
+    help='FIELD=VALUE: list field must contain value (substring for strings)'
+)
+@click.option(
+    '--count',
+    is_flag=True,
+    help='Print only the number of matching documents'
+)
+@click.option(
+    '--format',
+    type=click.Choice(['list', 'json'], case_sensitive=False),
+    default='list',
+    help='Output format (default: list)'
+)
+@click.pass_context
+def query(
+    ctx,
+    path: Optional[Path],
+    has_fields: tuple,
+    missing_fields: tuple,
+    equals: tuple,
+    not_equals: tuple,
+    contains: tuple,
+    count: bool,
+    format: str
+):
+    """
+    Find documents by frontmatter, using the persistent metadata index.
+
+    Only documents whose file changed since they were last indexed are
+    re-read; everything else is answered from the index. All conditions
+    must hold. Values are parsed as YAML, so --equals draft=true matches a
+    boolean and --equals version=1.0 a number.
+
+    Examples:
+
+        # Documents without an owner
+        python main.py frontmatter query --missing owner
+
+        # Draft pricing documents
+        python main.py frontmatter query --equals status=draft --contains tags=pricing
+
+        # How many documents have a version field
+        python main.py frontmatter query --has version --count
+    """
+    config = ctx.obj['config']
+
+    if path is None:
+        path = Path(config.get('paths.docs_root', '.'))
+
+    try:
+        conditions = [{'field': name, 'exists': True} for name in has_fields]
+        conditions += [{'field': name, 'missing': True} for name in missing_fields]
+        for key, expressions in (('equals', equals), ('not_equals', not_equals), ('contains', contains)):
+            for expression in expressions:
+                name, value = _parse_condition_expression(expression)
+                conditions.append({'field': name, key: value})
+    except ValueError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    try:
+        documents = _find_all_documents(path)
+        index = _get_metadata_index(config)
+        index.refresh(documents)
+        matches = index.query(conditions, documents)
+        index.save()
+    except Exception as e:
+        click.echo(f"Error during query: {e}", err=True)
+        sys.exit(1)
+
+    if count:
+        click.echo(len(matches))
+    elif format == 'json':
+        click.echo(json.dumps({
+            'count': len(matches),
+            'documents': [
+                {'path': node, 'metadata': index.get(index.node_path(node))['metadata']}
+                for node in matches
+            ]
+        }, indent=2, ensure_ascii=False))
+    else:
+        for node in matches:
+            click.echo(node)
+
+
+def _parse_condition_expression(expression: str) -> tuple:
+    """
+    Split a FIELD=VALUE query expression.
+
+    The value is parsed as YAML (falling back to the raw string) and
+    normalized like indexed metadata.
+
+    Args:
+        expression: Expression such as 'status=draft'
+
+    Returns:
+        Tuple of (field name, value)
+
+    Raises:
+        ValueError: If the expression has no '=' or no field name
+    """
+    import yaml
+
+    name, separator, raw_value = expression.partition('=')
+    if not separator or not name.strip():
+        raise ValueError(f"Expected FIELD=VALUE, got '{expression}'")
+
+    try:
+        value = yaml.safe_load(raw_value)
+    except yaml.YAMLError:
+        value = raw_value
+
+    return name.strip(), normalize_metadata(value)
+
+
+def _parse_field_value(value: str, value_type: str) -> Any:
+    """
+    Parse a string value into the specified type.
+
+    Args:
+        value: String value to parse
+        value_type: Type to parse into (string, list, number, boolean)
+
+    Returns:
+        Parsed value in the appropriate type
+
+    Raises:
+        ValueError: If value cannot be parsed into the specified type
+    """
+    if value_type == 'string':
+        return value
+
+    elif value_type == 'list':
+        # Split by comma and strip whitespace
+        return [item.strip() for item in value.split(',')]
+
+    elif value_type == 'number':
+        # Try int first, then float
+        try:
+            if '.' in value:
+                return float(value)
+            else:
+                return int(value)
+        except ValueError:
+            raise ValueError(f"Cannot parse '{value}' as a number")
+
+    elif value_type == 'boolean':
+        value_lower = value.lower()
+        if value_lower in ('true', 'yes', '1', 'y'):
+            return True
+        elif value_lower in ('false', 'no', '0', 'n'):
+            return False
+        else:
+            raise ValueError(f"Cannot parse '{value}' as a boolean")
+
+    else:
+        raise ValueError(f"Unknown type: {value_type}")
+
+
+@cli.group()
+def cache():
+    """
+    Document cache management commands.
+
+    Commands for sharing warm caches between machines, e.g. restoring a
+    cache produced by a previous CI run.
+    """
+    pass
+
+
+def _get_cache_files(config: Config) -> tuple:
+    """
+    Get the local document cache and the optional derived-data cache files.
+
+    Args:
+        config: Configuration instance
+
+    Returns:
+        Tuple of (DocumentCache, extra_files mapping for cache bundles)
+    """
+    document_cache = DocumentCache(
+        config.get_state_path('paths.cache_file', '_meta/.document-cache.json'),
+        repo_root=config.get_repo_root()
+    )
+
+    extra_files = {
+        'signature_cache': config.get_state_path('validation.conflicts.near_duplicates.signature_cache'),
+        'link_graph': config.get_state_path('processing.link_graph_file', '_meta/.link-graph.json')
+    }
+
+    return document_cache, extra_files
+
+
+@cache.command('export')
+@click.option(
+    '--output',
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=Path('document-cache.tar.gz'),
+    show_default=True,
+    help='Bundle file to write'
+)
+@click.pass_context
+def cache_export(ctx, output: Path):
+    """
+    Export the local caches as a single compressed bundle.
+
+    The bundle holds cached hashes and validation issues, near-duplicate
+    signatures and the link graph, plus a manifest recording the tool
+    version and a fingerprint of the validation configuration.
+
+    Examples:
+
+        # Save the cache at the end of a CI run
+        symphony-core cache export --output doc-cache.tar.gz
+    """
+    from src.utils.cache_bundle import export_bundle
+    from src.utils.cache import CacheError
+
+    config = ctx.obj['config']
+
+    try:
+        document_cache, extra_files = _get_cache_files(config)
+        manifest = export_bundle(
+            output,
+            document_cache,
+            fingerprint=config.fingerprint(),
+            tool_version=VERSION,
+            extra_files=extra_files
+        )
+    except CacheError as e:
+        click.echo(f"Error exporting cache: {e}", err=True)
+        sys.exit(1)
+
+    click.echo(f"Exported {manifest['documents']} document(s) to {output}")
+    click.echo(f"Contents: {', '.join(manifest['members'])}")
+
+
+@cache.command('import')
+@click.argument(
+    'bundle',
+    type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.option(
+    '--force',
+    is_flag=True,
+    help='Import even if the bundle was produced with a different validation config'
+)
+@click.pass_context
+def cache_import(ctx, bundle: Path, force: bool):
+    """
+    Merge a cache bundle into the local caches.
+
+    Entries for documents already in the local cache are kept unless the
+    bundle's entry is newer. Bundles produced with a different validation
+    configuration are refused, since their cached results may not apply.
+
+    Examples:
+
+        # Restore a warm cache before validating
+        symphony-core cache import doc-cache.tar.gz
+    """
+    from src.utils.cache_bundle import import_bundle
+    from src.utils.cache import CacheError
+
+    config = ctx.obj['config']
+
+    try:
+        document_cache, extra_files = _get_cache_files(config)
+        manifest = import_bundle(
+            bundle,
+            document_cache,
+            fingerprint=config.fingerprint(),
+            extra_files=extra_files,
+            force=force
+        )
+    except CacheError as e:
+        click.echo(f"Error importing cache: {e}", err=True)
+        sys.exit(1)
+
+    if manifest.get('tool_version') != VERSION:
+        click.echo(
+            f"Note: bundle was produced by version {manifest.get('tool_version')} "
+            f"(current: {VERSION})"
+        )
+
+    merged = manifest['merged']
+    click.echo(f"Imported {merged['documents']} document(s) from {bundle}")
+    if 'signatures' in merged:
+        click.echo(f"Imported {merged['signatures']} near-duplicate signature(s)")
+    if 'link_graph_nodes' in merged:
+        click.echo(f"Imported {merged['link_graph_nodes']} link graph node(s)")
+
+
+@cli.group()
+def autofix():
+    """
+    Auto-fix backup management commands.
+
+    Every applied auto-fix run records the original content of the files it
+    changed; these commands list runs and roll them back.
+    """
+    pass
+
+
+@autofix.command('runs')
+@click.pass_context
+def autofix_runs(ctx):
+    """
+    List recorded auto-fix runs, newest first.
+    """
+    from src.core.backup_store import BackupStore, BackupError
+
+    config = ctx.obj['config']
+    store = BackupStore(config.get_backup_dir())
+
+    run_ids = store.list_runs()
+    if not run_ids:
+        click.echo("No auto-fix runs recorded.")
+        return
+
+    for run_id in reversed(run_ids):
+        try:
+            manifest = store.load_manifest(run_id)
+        except BackupError as e:
+            click.echo(f"{run_id}  (unreadable: {e})")
+            continue
+        renames = len(manifest.get('renames', []))
+        click.echo(
+            f"{run_id}  {manifest.get('created', '')}  {len(manifest.get('files', {}))} file(s)"
+            + (f", {renames} rename(s)" if renames else "")
+        )
+
+
+@autofix.command('rollback')
+@click.option(
+    '--run',
+    'run_id',
+    required=True,
+    help="Run id to roll back ('latest' for the most recent run)"
+)
+@click.option(
+    '--jobs',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Parallel workers (default: processing.autofix_jobs)'
+)
+@click.option(
+    '--force',
+    is_flag=True,
+    help='Restore files even if they were edited after the run'
+)
+@click.pass_context
+def autofix_rollback(ctx, run_id: str, jobs: Optional[int], force: bool):
+    """
+    Restore all files changed by an auto-fix run.
+
+    Each file is restored only if its current content is exactly what the
+    run wrote, so edits made after the fix are never overwritten (unless
+    --force is given).
+
+    Examples:
+
+        # Undo the most recent auto-fix
+        symphony-core autofix rollback --run latest
+
+        # Undo a specific run
+        symphony-core autofix rollback --run 20251107T103000-a1b2c3
+    """
+    from src.core.backup_store import BackupStore, BackupError
+
+    config = ctx.obj['config']
+    store = BackupStore(config.get_backup_dir())
+
+    if run_id == 'latest':
+        run_ids = store.list_runs()
+        if not run_ids:
+            click.echo("Error: No auto-fix runs recorded", err=True)
+            sys.exit(1)
+        run_id = run_ids[-1]
+
+    try:
+        result = store.restore_run(
+            run_id,
+            jobs=jobs if jobs is not None else config.get('processing.autofix_jobs', 1),
+            force=force
+        )
+    except BackupError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    click.echo(f"Rolled back run {run_id}: {len(result.restored)} file(s) restored")
+    if result.renames_undone:
+        click.echo(f"Undid {len(result.renames_undone)} rename(s)")
+    for path, reason in sorted(result.skipped.items()):
+        click.echo(f"  [SKIPPED] {path}: {reason}")
+
+    if result.skipped:
+        sys.exit(1)
+
+
+@cli.group()
+def rename():
+    """
+    Bulk rename commands.
+
+    Renames files and directories that violate naming conventions and
+    updates every link pointing at them.
+    """
+    pass
+
+
+@rename.command('apply')
+@click.option(
+    '--path',
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
+    help='Rename within specific folder (default: paths.docs_root)'
+)
+@click.option(
+    '--jobs',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Parallel workers (default: processing.rename_jobs)'
+)
+@click.option(
+    '--preview',
+    is_flag=True,
+    help='Preview renames and link rewrites as a unified diff without applying them'
+)
+@click.option(
+    '--patch',
+    type=click.Path(dir_okay=False, path_type=Path),
+    help='Write the preview diff to a patch file instead of stdout (requires --preview)'
+)
+@click.pass_context
+def rename_apply(
+    ctx,
+    path: Optional[Path],
+    jobs: Optional[int],
+    preview: bool,
+    patch: Optional[Path]
+):
+    """
+    Rename files and directories with NAME-001/NAME-002 violations.
+
+    Each path is renamed to its suggested lowercase-with-hyphens name, and
+    every document linking to a renamed path is rewritten (once, with all
+    of its affected links). Renames whose new name is already taken are
+    skipped. The run is recorded like an auto-fix run, so it can be undone
+    with 'autofix rollback'.
+
+    Examples:
+
+        # Preview the renames and link updates
+        python main.py rename apply --preview
+
+        # Save them as a patch for git apply
+        python main.py rename apply --preview --patch renames.patch
+
+        # Apply, then undo
+        python main.py rename apply --path docs/
+        python main.py autofix rollback --run latest
+    """
+    from src.core.backup_store import BackupStore
+    from src.core.rename_engine import RenameEngine
+
+    config = ctx.obj['config']
+
+    if patch and not preview:
+        click.echo("Error: --patch requires --preview", err=True)
+        sys.exit(1)
+
+    if path is None:
+        path = Path(config.get('paths.docs_root', '.'))
+
+    click.echo("=" * 80)
+    click.echo("SYMPHONY CORE - BULK RENAME")
+    click.echo("=" * 80)
+    click.echo()
+    click.echo(f"Path: {path}")
+    click.echo(f"Mode: {'Preview' if preview else 'Apply'}")
+    click.echo()
+
+    try:
+        log_file = Path(config.get('paths.logs_dir', 'logs')) / 'rename.log'
+        logger = Logger(
+            name="symphony_core.rename",
+            log_file=log_file,
+            log_level=config.get('logging.level', 'INFO'),
+            console_output=False
+        )
+
+        # Same graph (and root) as validate, so inbound links are usually
+        # answered without re-reading documents. Links into --path can come
+        # from anywhere in the repository, so the whole corpus is indexed;
+        # --path only limits what is renamed
+        repo_root = config.get_repo_root()
+        link_graph = LinkGraph(
+            repo_root,
+            config.get_state_path('processing.link_graph_file', '_meta/.link-graph.json')
+        )
+        engine = RenameEngine(
+            NamingValidator(config, logger),
+            link_graph,
+            BackupStore(config.get_backup_dir()),
+            logger
+        )
+
+        plan = engine.plan(_find_all_documents(repo_root), path)
+        directories = sum(1 for item in plan.renames if item.directory)
+
+        click.echo(
+            f"Renames: {len(plan.renames)} "
+            f"({len(plan.renames) - directories} file(s), {directories} directory(ies))"
+        )
+        click.echo(f"Documents with links to update: {len(plan.rewrites)} ({plan.link_count} link(s))")
+        for node, reason in sorted(plan.skipped.items()):
+            click.echo(f"  [SKIPPED] {node}: {reason}")
+        click.echo()
+
+        if not plan.renames:
+            link_graph.save()
+            click.echo("No renames to apply.")
+            sys.exit(0)
+
+        if preview:
+            click.echo("PREVIEW MODE - No changes will be applied")
+            click.echo("-" * 80)
+            previews = _write_previews(engine.iter_previews(plan), patch)
+            link_graph.save()
+            failed = {str(item.file_path): item.error for item in previews if item.error}
+        else:
+            result = engine.apply(
+                plan,
+                jobs=jobs if jobs is not None else config.get('processing.rename_jobs', 1)
+            )
+            link_graph.save()
+            failed = result.failed
+
+            click.echo(f"Renamed: {len(result.renamed)}")
+            click.echo(
+                f"Rewritten documents: {len(result.rewritten)} "
+                f"({sum(result.rewritten.values())} link(s))"
+            )
+            for source, target in result.renamed:
+                click.echo(f"  {source} -> {target.name}")
+            if result.run_id:
+                click.echo(f"Backup run: {result.run_id} (undo with: autofix rollback --run {result.run_id})")
+
+        for failed_path, error in sorted(failed.items()):
+            click.echo(f"  [FAILED] {failed_path}: {error}")
+
+        if patch:
+            click.echo(f"Patch saved to: {patch}")
+
+        click.echo()
+        click.echo("=" * 80)
+
+        sys.exit(1 if failed else 0)
+
+    except Exception as e:
+        click.echo(f"Error during rename: {e}", err=True)
+        if config.get('debug', False):
+            import traceback
+            traceback.print_exc()
+        sys.exit(1)
 
 
 if __name__ == '__main__':
@@ -5,24 +5,36 @@ This module provides safe automatic fixes for common validation issues,
 with preview and backup capabilities (ADR-003).
 """
 
+import io
 import re
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass
-from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, field
 
 from src.utils.config import Config
 from src.utils.logger import Logger
 from src.utils.frontmatter import (
-    parse_frontmatter,
-    add_frontmatter,
-    update_frontmatter,
-    has_frontmatter
+    FrontmatterError,
+    split_frontmatter,
+    parse_frontmatter_text,
+    render_frontmatter,
+    read_frontmatter_prefix,
+    atomic_write_prefix,
+    atomic_write_text
 )
+from src.utils.large_files import is_large_file, large_file_threshold, read_prefix
+from src.utils.patch import unified_diff
+from src.utils.tag_suggester import TagSuggester, TermCountCache
+from src.core.backup_store import BackupStore, BackupRun
 from src.core.validators.yaml_validator import ValidationIssue, ValidationSeverity
 
 
+# Bytes of body loaded after the frontmatter of a large document, enough for
+# its title heading and tag suggestions
+LARGE_FILE_HEAD = 64 * 1024
+
+
 @dataclass
 class AutoFixResult:
     """
@@ -35,6 +47,7 @@ class AutoFixResult:
         backup_path: Path to backup file (if created)
         success: Whether all fixes succeeded
         errors: Any errors encountered during fixing
+        run_id: Backup run the original content was recorded in (if written)
     """
     file_path: Path
     fixes_applied: List[str]
@@ -42,6 +55,7 @@ class AutoFixResult:
     backup_path: Optional[Path] = None
     success: bool = True
     errors: List[str] = None
+    run_id: Optional[str] = None
 
     def __post_init__(self):
         if self.errors is None:
@@ -68,17 +82,119 @@ class AutoFixResult:
         return "\n".join(parts)
 
 
+@dataclass
+class DocumentBuffer:
+    """
+    In-memory document that fix transforms edit before a single write.
+
+    Attributes:
+        file_path: Path to the document
+        original: Document text as read from disk
+        frontmatter: Original frontmatter block including delimiters
+            ('' if the document has none)
+        body: Markdown content after the frontmatter
+        metadata_changed: Whether metadata must be re-rendered on write
+        rest_offset: For a large document of which only the start is
+            loaded, the byte offset where the unloaded rest begins; the
+            rest is copied unchanged on write (None if fully loaded)
+    """
+    file_path: Path
+    original: str
+    frontmatter: str = ""
+    body: str = ""
+    metadata_changed: bool = False
+    rest_offset: Optional[int] = None
+    _metadata: Optional[Dict[str, Any]] = field(default=None, repr=False)
+
+    @classmethod
+    def from_text(cls, file_path: Path, content: str) -> 'DocumentBuffer':
+        """
+        Create a buffer from document text.
+
+        Args:
+            file_path: Path to the document
+            content: Document text
+
+        Returns:
+            DocumentBuffer with frontmatter and body split apart
+        """
+        frontmatter, body = split_frontmatter(content)
+        return cls(file_path=file_path, original=content, frontmatter=frontmatter, body=body)
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """
+        Get the document's metadata, parsing the frontmatter on first use.
+
+        Raises:
+            FrontmatterError: If the frontmatter is not valid YAML
+        """
+        if self._metadata is None:
+            self._metadata = parse_frontmatter_text(self.frontmatter) if self.frontmatter else {}
+        return self._metadata
+
+    def set_metadata(self, metadata: Dict[str, Any]) -> None:
+        """
+        Replace the document's metadata.
+
+        Args:
+            metadata: New metadata
+        """
+        self._metadata = metadata
+        self.metadata_changed = True
+
+    def render(self) -> str:
+        """
+        Get the fixed document text.
+
+        The original frontmatter block is kept byte-for-byte unless a
+        transform changed the metadata.
+
+        Returns:
+            Document text
+        """
+        if self.metadata_changed:
+            return render_frontmatter(self.metadata, self.body)
+        return self.frontmatter + self.body
+
+
+@dataclass
+class FixTransform:
+    """
+    A fix for one validation rule, applied to a DocumentBuffer in memory.
+
+    Attributes:
+        rule_id: Validation rule the transform fixes (e.g. 'YAML-002')
+        apply: Callable taking the buffer and the document's issues for
+            rule_id, editing the buffer in place and returning descriptions
+            of the fixes it made
+        frontmatter_only: Whether the transform only edits metadata, so it
+            also runs on large documents whose body is not fully loaded
+    """
+    rule_id: str
+    apply: Callable[[DocumentBuffer, List[ValidationIssue]], List[str]]
+    frontmatter_only: bool = False
+
+
 class AutoFixer:
     """
     Automatic fixer for common validation issues.
 
     Provides safe fixes with preview and backup capabilities:
-    - Add missing YAML frontmatter
-    - Extract title from H1 heading
-    - Suggest tags from file path
-    - Standardize tag format (string → list)
-    - Default status to 'draft'
+    - Add missing YAML frontmatter (YAML-001)
+    - Add missing required fields: title from H1 heading, tags from the
+      most similar tagged documents (or the file path), status 'draft'
+      (YAML-002)
+    - Standardize tag format, string → list (YAML-004)
     - Remove trailing whitespace (MD-004)
+
+    Each fix is a FixTransform over an in-memory DocumentBuffer. All
+    transforms for a document run in order on the same buffer, followed by
+    one atomic write, so fixes compose instead of overwriting each other.
+
+    Original contents are saved to a content-addressed BackupStore before
+    any write; each batch is one backup run whose manifest lists every file
+    it changed.
     """
 
     def __init__(self, config: Config, logger: Logger):
@@ -92,8 +208,13 @@ class AutoFixer:
         self.config = config
         self.logger = logger
 
-        # Load backup directory from config
-        self.backup_dir = Path(config.get('processing.backup_dir', '_meta/.backups/'))
+        # Load backup settings from config
+        self.backup_dir = config.get_backup_dir()
+        self.backup_store = BackupStore(self.backup_dir)
+        self.archive_runs = config.get('processing.backup_archive', False)
+        self.jobs = config.get('processing.autofix_jobs', 1)
+        self.large_file_threshold = large_file_threshold(config)
+        self.last_run_id: Optional[str] = None
 
         # Load validation settings
         self.required_fields = config.get(
@@ -102,11 +223,41 @@ class AutoFixer:
         )
         self.default_status = 'draft'
 
+        # Tags for untagged documents are suggested from similar tagged
+        # documents once a corpus has been learned (train_tag_suggester)
+        self.tag_suggestions_enabled = config.get('processing.tag_suggestions.enabled', True)
+        self.tag_suggester: Optional[TagSuggester] = None
+        self.term_cache: Optional[TermCountCache] = None
+
+        # Applied in this order; frontmatter is created before fields are
+        # filled in, and whitespace is cleaned up last
+        self.transforms: List[FixTransform] = [
+            FixTransform("YAML-001", self._fix_missing_frontmatter, frontmatter_only=True),
+            FixTransform("YAML-002", self._fix_missing_fields, frontmatter_only=True),
+            FixTransform("YAML-004", self._fix_tags_format, frontmatter_only=True),
+            FixTransform("MD-004", self._fix_trailing_whitespace),
+        ]
+
+    @property
+    def fixable_rules(self) -> List[str]:
+        """Rule IDs that have a registered fix transform."""
+        return [transform.rule_id for transform in self.transforms]
+
+    def register_transform(self, transform: FixTransform) -> None:
+        """
+        Add a fix transform, applied after the built-in ones.
+
+        Args:
+            transform: Transform to register
+        """
+        self.transforms.append(transform)
+
     def fix_document(
         self,
         file_path: Path,
         issues: List[ValidationIssue],
-        preview: bool = True
+        preview: bool = True,
+        backup_run: Optional[BackupRun] = None
     ) -> AutoFixResult:
         """
         Fix validation issues in a document.
@@ -115,6 +266,8 @@ class AutoFixer:
             file_path: Path to the document to fix
             issues: List of validation issues to fix
             preview: If True, only preview changes without applying them
+            backup_run: Run to record the backup in (a single-document run
+                is started and saved if not given)
 
         Returns:
             AutoFixResult with details of fixes applied
@@ -129,108 +282,30 @@ class AutoFixer:
 
         fixes_applied = []
         backup_path = None
+        run_id = None
 
         try:
-            # Read current content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                original_content = f.read()
-
-            # Determine what fixes are needed
-            needs_frontmatter = any(issue.rule_id == "YAML-001" for issue in issues)
-            missing_fields_issues = [
-                issue for issue in issues if issue.rule_id == "YAML-002"
-            ]
-            tags_format_issues = [
-                issue for issue in issues if issue.rule_id == "YAML-004"
-            ]
-
-            # Parse or create frontmatter
-            if needs_frontmatter:
-                metadata = {}
-                fixes_applied.append("Added YAML frontmatter block")
-
-                # When adding new frontmatter, automatically add required fields
-                # Extract title from content
-                title = self._extract_title_from_content(original_content)
-                if title:
-                    metadata['title'] = title
-                    fixes_applied.append(f"Added title from H1 heading: '{title}'")
-                else:
-                    metadata['title'] = file_path.stem.replace('-', ' ').replace('_', ' ').title()
-                    fixes_applied.append(f"Added title from filename: '{metadata['title']}'")
-
-                # Suggest tags from path
-                tags = self._suggest_tags_from_path(file_path)
-                metadata['tags'] = tags
-                fixes_applied.append(f"Added suggested tags: {tags}")
-
-                # Add default status
-                metadata['status'] = self.default_status
-                fixes_applied.append(f"Added default status: '{self.default_status}'")
-
-            else:
-                metadata = parse_frontmatter(file_path)
-
-            # Fix missing required fields (for docs that have frontmatter but missing fields)
-            if missing_fields_issues and not needs_frontmatter:
-                missing_fields = self._extract_missing_fields(missing_fields_issues)
-
-                for field in missing_fields:
-                    if field == 'title':
-                        title = self._extract_title_from_content(original_content)
-                        if title:
-                            metadata['title'] = title
-                            fixes_applied.append(f"Added title from H1 heading: '{title}'")
-                        else:
-                            metadata['title'] = file_path.stem.replace('-', ' ').replace('_', ' ').title()
-                            fixes_applied.append(f"Added title from filename: '{metadata['title']}'")
-
-                    elif field == 'tags':
-                        tags = self._suggest_tags_from_path(file_path)
-                        metadata['tags'] = tags
-                        fixes_applied.append(f"Added suggested tags: {tags}")
-
-                    elif field == 'status':
-                        metadata['status'] = self.default_status
-                        fixes_applied.append(f"Added default status: '{self.default_status}'")
-
-            # Fix tags format (string → list)
-            if tags_format_issues:
-                if 'tags' in metadata and isinstance(metadata['tags'], str):
-                    # Convert string to single-item list
-                    metadata['tags'] = [metadata['tags']]
-                    fixes_applied.append("Converted tags from string to list")
-
-            # Fix trailing whitespace (MD-004)
-            trailing_whitespace_issues = [
-                issue for issue in issues if issue.rule_id == "MD-004"
-            ]
-            fixed_content = original_content
-            if trailing_whitespace_issues:
-                # Remove trailing whitespace from each line
-                lines = original_content.splitlines(keepends=True)
-                fixed_lines = [line.rstrip() + ('\n' if line.endswith('\n') else '') for line in lines]
-                fixed_content = ''.join(fixed_lines)
-
-                # Count how many lines were fixed
-                num_fixed = sum(1 for orig, fixed in zip(lines, fixed_lines) if orig != fixed)
-                if num_fixed > 0:
-                    fixes_applied.append(f"Removed trailing whitespace from {num_fixed} line(s)")
+            raw_content, buffer, fixes_applied = self._prepare(file_path, issues)
+            fixed_content = buffer.render()
 
             # Apply fixes if not in preview mode
-            if not preview and fixes_applied:
+            if not preview and fixes_applied and fixed_content != buffer.original:
+                run = backup_run if backup_run is not None else self.backup_store.start_run()
+
                 # Create backup
-                backup_path = self._create_backup(file_path)
+                backup_path = run.backup(file_path, raw_content)
                 self.logger.info(f"Created backup: {backup_path}")
 
-                # Apply frontmatter fixes if needed
-                if needs_frontmatter or missing_fields_issues or tags_format_issues:
-                    add_frontmatter(file_path, metadata, preserve_content=True)
+                if buffer.rest_offset is None:
+                    atomic_write_text(file_path, fixed_content)
+                    run.record_result(file_path, fixed_content.encode('utf-8'))
+                else:
+                    atomic_write_prefix(file_path, fixed_content, buffer.rest_offset)
+                    run.record_result(file_path)
+                run_id = run.run_id
 
-                # Apply whitespace fixes if needed
-                if trailing_whitespace_issues and fixed_content != original_content:
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(fixed_content)
+                if backup_run is None:
+                    self._finish_run(run)
 
                 self.logger.info(f"Applied {len(fixes_applied)} fix(es) to {file_path}")
 
@@ -239,7 +314,8 @@ class AutoFixer:
                 fixes_applied=fixes_applied,
                 preview_only=preview,
                 backup_path=backup_path,
-                success=True
+                success=True,
+                run_id=run_id
             )
 
         except Exception as e:
@@ -252,6 +328,307 @@ class AutoFixer:
                 errors=[str(e)]
             )
 
+    def _prepare(
+        self,
+        file_path: Path,
+        issues: List[ValidationIssue]
+    ) -> Tuple[Optional[bytes], DocumentBuffer, List[str]]:
+        """
+        Read a document once and run the fix transforms on it in memory.
+
+        Of a large document only the frontmatter and the start of the body
+        are loaded; its raw bytes are not returned and the rest of the file
+        is streamed when it is backed up and written.
+
+        Args:
+            file_path: Path to the document
+            issues: The document's validation issues
+
+        Returns:
+            Tuple of (raw file bytes or None for a large document, fixed
+            buffer, descriptions of fixes)
+        """
+        if is_large_file(file_path, self.large_file_threshold):
+            frontmatter, body, rest_offset = self._read_head(file_path)
+            buffer = DocumentBuffer(
+                file_path=file_path,
+                original=frontmatter + body,
+                frontmatter=frontmatter,
+                body=body,
+                rest_offset=rest_offset
+            )
+            return None, buffer, self.apply_transforms(buffer, issues)
+
+        # The raw bytes are what gets backed up; transforms see the text
+        # with line endings normalized, as it will be written
+        raw_content = file_path.read_bytes()
+        text = io.StringIO(raw_content.decode('utf-8'), newline=None).read()
+        buffer = DocumentBuffer.from_text(file_path, text)
+
+        return raw_content, buffer, self.apply_transforms(buffer, issues)
+
+    @staticmethod
+    def _read_head(file_path: Path) -> Tuple[str, str, int]:
+        """
+        Read a large document's frontmatter and the start of its body.
+
+        Args:
+            file_path: Path to the document
+
+        Returns:
+            Tuple of (frontmatter block, first LARGE_FILE_HEAD bytes of the
+            body, offset of the rest of the file)
+        """
+        _, block_size = read_frontmatter_prefix(file_path)
+        head = read_prefix(file_path, block_size + LARGE_FILE_HEAD)
+        return head[:block_size].decode('utf-8'), head[block_size:].decode('utf-8'), len(head)
+
+    def preview_document(
+        self,
+        file_path: Path,
+        issues: List[ValidationIssue],
+        root: Optional[Path] = None
+    ) -> Tuple[AutoFixResult, str]:
+        """
+        Compute a document's fixes in memory and diff them against the file.
+
+        Uses the same transforms as fix_document; nothing is written.
+
+        Args:
+            file_path: Path to the document
+            issues: The document's validation issues
+            root: Directory diff paths are relative to (default: current directory)
+
+        Returns:
+            Tuple of (preview result, unified diff; empty if nothing changes)
+        """
+        try:
+            raw_content, buffer, fixes_applied = self._prepare(file_path, issues)
+            original = raw_content.decode('utf-8') if raw_content is not None else buffer.original
+            diff = unified_diff(file_path, original, buffer.render(), root)
+        except Exception as e:
+            self.logger.error(f"Error previewing {file_path}: {e}")
+            return AutoFixResult(
+                file_path=file_path,
+                fixes_applied=[],
+                preview_only=True,
+                success=False,
+                errors=[str(e)]
+            ), ""
+
+        return AutoFixResult(
+            file_path=file_path,
+            fixes_applied=fixes_applied,
+            preview_only=True
+        ), diff
+
+    def iter_previews(
+        self,
+        documents: Dict[Path, List[ValidationIssue]],
+        root: Optional[Path] = None
+    ) -> Iterator[Tuple[AutoFixResult, str]]:
+        """
+        Lazily preview fixes for documents with fixable issues.
+
+        One document is read and fixed in memory at a time, so diffs can be
+        streamed without keeping rewritten documents around.
+
+        Args:
+            documents: Dictionary mapping file paths to their validation issues
+            root: Directory diff paths are relative to (default: current directory)
+
+        Yields:
+            (preview result, unified diff) per document with fixable issues,
+            in the order of documents
+        """
+        for file_path, issues in documents.items():
+            fixable_issues = [issue for issue in issues if self.can_fix(issue)]
+            if fixable_issues:
+                yield self.preview_document(file_path, fixable_issues, root)
+
+        self._save_term_cache()
+
+    def apply_transforms(
+        self,
+        buffer: DocumentBuffer,
+        issues: List[ValidationIssue]
+    ) -> List[str]:
+        """
+        Run every transform whose rule has issues on a document buffer.
+
+        Only frontmatter-only transforms run on a partially loaded large
+        document; other fixes are skipped with a warning.
+
+        Args:
+            buffer: Document to edit in place
+            issues: The document's validation issues
+
+        Returns:
+            Descriptions of the fixes applied, in order
+        """
+        fixes_applied = []
+
+        for transform in self.transforms:
+            rule_issues = [issue for issue in issues if issue.rule_id == transform.rule_id]
+            if not rule_issues:
+                continue
+
+            if buffer.rest_offset is not None and not transform.frontmatter_only:
+                self.logger.warning(
+                    f"Skipping {transform.rule_id} fix for {buffer.file_path}: "
+                    f"too large to rewrite in memory"
+                )
+                continue
+
+            fixes_applied.extend(transform.apply(buffer, rule_issues))
+
+        return fixes_applied
+
+    def _fix_missing_frontmatter(
+        self,
+        buffer: DocumentBuffer,
+        issues: List[ValidationIssue]
+    ) -> List[str]:
+        """
+        Add a frontmatter block with all required fields (YAML-001).
+
+        Args:
+            buffer: Document to fix
+            issues: YAML-001 issues
+
+        Returns:
+            Descriptions of fixes applied
+        """
+        fixes_applied = ["Added YAML frontmatter block"]
+        metadata: Dict[str, Any] = {}
+
+        fixes_applied.append(self._add_title(buffer, metadata))
+
+        metadata['tags'] = self._suggest_tags(buffer)
+        fixes_applied.append(f"Added suggested tags: {metadata['tags']}")
+
+        # Add default status
+        metadata['status'] = self.default_status
+        fixes_applied.append(f"Added default status: '{self.default_status}'")
+
+        buffer.set_metadata(metadata)
+        return fixes_applied
+
+    def _fix_missing_fields(
+        self,
+        buffer: DocumentBuffer,
+        issues: List[ValidationIssue]
+    ) -> List[str]:
+        """
+        Fill in missing required fields (YAML-002).
+
+        Args:
+            buffer: Document to fix
+            issues: YAML-002 issues
+
+        Returns:
+            Descriptions of fixes applied
+        """
+        fixes_applied = []
+        metadata = dict(buffer.metadata)
+
+        for field_name in self._extract_missing_fields(issues):
+            if field_name in metadata:
+                # Already filled in, e.g. by a new frontmatter block
+                continue
+
+            if field_name == 'title':
+                fixes_applied.append(self._add_title(buffer, metadata))
+
+            elif field_name == 'tags':
+                metadata['tags'] = self._suggest_tags(buffer)
+                fixes_applied.append(f"Added suggested tags: {metadata['tags']}")
+
+            elif field_name == 'status':
+                metadata['status'] = self.default_status
+                fixes_applied.append(f"Added default status: '{self.default_status}'")
+
+        if fixes_applied:
+            buffer.set_metadata(metadata)
+        return fixes_applied
+
+    def _fix_tags_format(
+        self,
+        buffer: DocumentBuffer,
+        issues: List[ValidationIssue]
+    ) -> List[str]:
+        """
+        Convert a string tags field to a list (YAML-004).
+
+        Args:
+            buffer: Document to fix
+            issues: YAML-004 issues
+
+        Returns:
+            Descriptions of fixes applied
+        """
+        tags = buffer.metadata.get('tags')
+        if not isinstance(tags, str):
+            return []
+
+        # Convert string to single-item list
+        metadata = dict(buffer.metadata)
+        metadata['tags'] = [tags]
+        buffer.set_metadata(metadata)
+        return ["Converted tags from string to list"]
+
+    def _fix_trailing_whitespace(
+        self,
+        buffer: DocumentBuffer,
+        issues: List[ValidationIssue]
+    ) -> List[str]:
+        """
+        Remove trailing whitespace from every line (MD-004).
+
+        Args:
+            buffer: Document to fix
+            issues: MD-004 issues
+
+        Returns:
+            Descriptions of fixes applied
+        """
+        num_fixed = 0
+
+        def strip_lines(text: str) -> str:
+            nonlocal num_fixed
+            lines = text.splitlines(keepends=True)
+            fixed_lines = [line.rstrip() + ('\n' if line.endswith('\n') else '') for line in lines]
+            num_fixed += sum(1 for orig, fixed in zip(lines, fixed_lines) if orig != fixed)
+            return ''.join(fixed_lines)
+
+        buffer.body = strip_lines(buffer.body)
+        if not buffer.metadata_changed:
+            # A re-rendered block has no trailing whitespace to strip
+            buffer.frontmatter = strip_lines(buffer.frontmatter)
+
+        if num_fixed == 0:
+            return []
+        return [f"Removed trailing whitespace from {num_fixed} line(s)"]
+
+    def _add_title(self, buffer: DocumentBuffer, metadata: Dict[str, Any]) -> str:
+        """
+        Set a title from the first H1 heading, or from the filename.
+
+        Args:
+            buffer: Document the title is derived from
+            metadata: Metadata to add the title to
+
+        Returns:
+            Description of the fix applied
+        """
+        title = self._extract_title_from_content(buffer.body)
+        if title:
+            metadata['title'] = title
+            return f"Added title from H1 heading: '{title}'"
+
+        metadata['title'] = buffer.file_path.stem.replace('-', ' ').replace('_', ' ').title()
+        return f"Added title from filename: '{metadata['title']}'"
+
     def _extract_missing_fields(self, issues: List[ValidationIssue]) -> List[str]:
         """Extract list of missing field names from validation issues."""
         missing_fields = []
@@ -298,6 +675,107 @@ class AutoFixer:
 
         return None
 
+    def needs_tags(self, issues: List[ValidationIssue]) -> bool:
+        """
+        Check whether fixing a document's issues adds a tags field.
+
+        Args:
+            issues: The document's validation issues
+
+        Returns:
+            True for missing frontmatter (YAML-001) or a missing tags field
+            (YAML-002)
+        """
+        return any(
+            issue.rule_id == 'YAML-001'
+            or (issue.rule_id == 'YAML-002' and 'tags' in self._extract_missing_fields([issue]))
+            for issue in issues
+        )
+
+    def train_tag_suggester(self, documents: Iterable[Path]) -> int:
+        """
+        Learn tag suggestions from the tags of a corpus of documents.
+
+        Of a large document only the frontmatter and the start of the body
+        are read, as when it is fixed. Term counts are cached by content
+        hash in processing.tag_suggestions.term_cache, so retraining only
+        tokenizes documents that changed. The cache is saved after training
+        and again after each batch the suggester is used for.
+
+        Args:
+            documents: Corpus documents (tagged and untagged)
+
+        Returns:
+            Number of tagged documents learned from (0 if suggestions are
+            disabled or no tag could be learned)
+        """
+        if not self.tag_suggestions_enabled:
+            return 0
+
+        self.term_cache = TermCountCache(
+            self.config.get_state_path('processing.tag_suggestions.term_cache', '_meta/.term-cache.json')
+        )
+        suggester = TagSuggester(
+            top_k=self.config.get('processing.tag_suggestions.top_k', 3),
+            min_similarity=self.config.get('processing.tag_suggestions.min_similarity', 0.1),
+            min_tag_documents=self.config.get('processing.tag_suggestions.min_tag_documents', 2),
+            term_cache=self.term_cache
+        )
+
+        corpus = []
+        for file_path in documents:
+            try:
+                if is_large_file(file_path, self.large_file_threshold):
+                    frontmatter_block, body, _ = self._read_head(file_path)
+                else:
+                    frontmatter_block, body = split_frontmatter(file_path.read_text(encoding='utf-8'))
+                metadata = parse_frontmatter_text(frontmatter_block) if frontmatter_block else {}
+            except (OSError, UnicodeDecodeError, FrontmatterError):
+                continue
+
+            tags = metadata.get('tags')
+            if isinstance(tags, str):
+                tags = [tags]
+            corpus.append((self._tag_text(file_path, body), tags if isinstance(tags, list) else []))
+
+        learned = suggester.fit(corpus)
+        self._save_term_cache()
+
+        self.tag_suggester = suggester if suggester.fitted else None
+        self.logger.info(f"Learned {len(suggester.tags)} tag(s) from {learned} tagged document(s)")
+        return learned if suggester.fitted else 0
+
+    def _save_term_cache(self) -> None:
+        """Save the term counts tokenized so far, if a corpus was learned."""
+        if self.term_cache is not None:
+            self.term_cache.save()
+
+    def _suggest_tags(self, buffer: DocumentBuffer) -> List[str]:
+        """
+        Suggest tags for a document.
+
+        Uses the tags of the most similar tagged documents when a corpus has
+        been learned, otherwise (or if nothing is similar enough) the
+        document's path. The buffer's body is what gets compared, so the
+        document is not read again (of a large document, only its head).
+
+        Args:
+            buffer: Document to suggest tags for
+
+        Returns:
+            List of suggested tags
+        """
+        tags = None
+        if self.tag_suggester is not None:
+            tags = self.tag_suggester.suggest(self._tag_text(buffer.file_path, buffer.body))
+
+        return tags or self._suggest_tags_from_path(buffer.file_path)
+
+    @staticmethod
+    def _tag_text(file_path: Path, body: str) -> str:
+        """Get the text tags are suggested from: the filename's words and the body."""
+        return f"{file_path.stem.replace('-', ' ').replace('_', ' ')}\n{body}"
+
     def _suggest_tags_from_path(self, file_path: Path) -> List[str]:
         """
         Suggest tags based on file path structure.
@@ -330,65 +808,74 @@ class AutoFixer:
 
         return tags
 
-    def _create_backup(self, file_path: Path) -> Path:
+    def _finish_run(self, run: BackupRun) -> Optional[str]:
         """
-        Create backup of file before modification.
+        Save a backup run's manifest (and archive it if configured).
 
         Args:
-            file_path: Path to file to backup
+            run: Backup run to finish
 
         Returns:
-            Path to backup file
-
-        Raises:
-            IOError: If backup cannot be created
+            The run id, or None if the run backed up nothing
         """
-        # Ensure backup directory exists
-        self.backup_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create timestamped backup filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_filename = f"{file_path.stem}_{timestamp}{file_path.suffix}"
-        backup_path = self.backup_dir / backup_filename
+        if run.save() is None:
+            return None
 
-        # Copy file to backup location
-        shutil.copy2(file_path, backup_path)
+        if self.archive_runs:
+            self.backup_store.archive_run(run.run_id)
 
-        return backup_path
+        self.last_run_id = run.run_id
+        self.logger.info(f"Saved backup run {run.run_id} ({len(run.files)} file(s))")
+        return run.run_id
 
     def fix_batch(
         self,
         documents: Dict[Path, List[ValidationIssue]],
-        preview: bool = True
+        preview: bool = True,
+        jobs: Optional[int] = None
     ) -> Dict[Path, AutoFixResult]:
         """
         Fix validation issues in multiple documents.
 
+        All documents share one backup run. Documents are independent, so
+        with jobs > 1 they are fixed concurrently in a thread pool; the
+        work is dominated by file reads, writes and fsyncs.
+
         Args:
             documents: Dictionary mapping file paths to their validation issues
             preview: If True, only preview changes without applying them
+            jobs: Number of parallel workers (default: processing.autofix_jobs)
 
         Returns:
-            Dictionary mapping file paths to their auto-fix results
+            Dictionary mapping file paths to their auto-fix results, in the
+            order of documents
         """
-        results = {}
+        run = self.backup_store.start_run()
+        jobs = jobs if jobs is not None else self.jobs
 
+        # Only attempt to fix if there are fixable issues
+        work = {}
         for file_path, issues in documents.items():
-            self.logger.debug(f"Auto-fixing {file_path}")
-
-            # Only attempt to fix if there are fixable issues
-            fixable_rules = ["YAML-001", "YAML-002", "YAML-004", "MD-004"]
-            fixable_issues = [
-                issue for issue in issues
-                if issue.rule_id in fixable_rules
-            ]
-
+            fixable_issues = [issue for issue in issues if self.can_fix(issue)]
             if fixable_issues:
-                result = self.fix_document(file_path, fixable_issues, preview=preview)
-                results[file_path] = result
+                work[file_path] = fixable_issues
             else:
                 self.logger.debug(f"No auto-fixable issues in {file_path}")
 
+        def fix(file_path: Path) -> AutoFixResult:
+            self.logger.debug(f"Auto-fixing {file_path}")
+            return self.fix_document(file_path, work[file_path], preview=preview, backup_run=run)
+
+        if jobs and jobs > 1 and len(work) > 1:
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                results = dict(zip(work, executor.map(fix, work)))
+        else:
+            results = {file_path: fix(file_path) for file_path in work}
+
+        if not preview:
+            self._finish_run(run)
+        self._save_term_cache()
+
         return results
 
     def can_fix(self, issue: ValidationIssue) -> bool:
@@ -401,11 +888,4 @@ class AutoFixer:
         Returns:
             True if the issue can be auto-fixed, False otherwise
         """
-        fixable_rules = [
-            "YAML-001",  # Missing frontmatter
-            "YAML-002",  # Missing required fields
-            "YAML-004",  # Tags format (string → list)
-            "MD-004",    # Trailing whitespace
-        ]
-
-        return issue.rule_id in fixable_rules
+        return issue.rule_id in self.fixable_rules
@@ -0,0 +1,545 @@
+"""
+Content-addressed backup store for auto-fix runs.
+
+Original file contents are stored once per distinct content as blobs named
+by their SHA-256 hash, so identical documents (and repeated runs over
+unchanged files) share storage and same-named files in different folders
+never collide. Each auto-fix run writes a manifest mapping the paths it
+touched to the blob holding their original content and the hash of what
+was written, which is enough to restore every file of a run. Runs that
+move files (bulk renames) also list their renames, which are undone
+before file contents are restored.
+
+Layout:
+    <backup_dir>/objects/ab/ab12...ef   Original file contents
+    <backup_dir>/runs/<run_id>.json     Per-run manifest
+    <backup_dir>/runs/<run_id>.tar.gz   Optional self-contained run archive
+"""
+
+import hashlib
+import json
+import os
+import secrets
+import tarfile
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.utils.frontmatter import copy_file_mode
+from src.utils.large_files import HASH_CHUNK_SIZE, hash_file
+
+
+class BackupError(Exception):
+    """Raised when backups cannot be written or read."""
+    pass
+
+
+@dataclass
+class RestoreResult:
+    """
+    Result of restoring a backup run.
+
+    Attributes:
+        run_id: Restored run
+        restored: Paths whose original content was written back
+        skipped: Paths left untouched, with the reason
+        renames_undone: (renamed path, original path) pairs moved back
+    """
+    run_id: str
+    restored: List[str] = field(default_factory=list)
+    skipped: Dict[str, str] = field(default_factory=dict)
+    renames_undone: List[Tuple[str, str]] = field(default_factory=list)
+
+
+class BackupRun:
+    """
+    Backups taken during one auto-fix run.
+
+    Safe to use from several threads; each file is backed up once per run.
+
+    Attributes:
+        run_id: Identifier of the run (sortable by start time)
+        store: Store the run's blobs and manifest are written to
+    """
+
+    def __init__(self, store: 'BackupStore', run_id: str):
+        """
+        Initialize a backup run.
+
+        Args:
+            store: Backup store
+            run_id: Run identifier
+        """
+        self.store = store
+        self.run_id = run_id
+        self.created = datetime.now().isoformat()
+        self._files: Dict[str, Dict[str, Optional[str]]] = {}
+        self._renames: List[Dict[str, str]] = []
+        self._lock = threading.Lock()
+
+    def backup(self, file_path: Path, content: Optional[bytes] = None) -> Path:
+        """
+        Back up a file's current content before it is modified.
+
+        Only the first backup of a file in a run is kept, so restoring the
+        run returns the file to its content before the run, not before its
+        last change in the run.
+
+        Args:
+            file_path: File about to be modified
+            content: File content, if already read (streamed from disk otherwise)
+
+        Returns:
+            Path to the blob holding the file's content before the run
+
+        Raises:
+            BackupError: If the file cannot be read or the blob written
+        """
+        key = self.store.path_key(file_path)
+        with self._lock:
+            entry = self._files.get(key)
+        if entry is not None:
+            return self.store.blob_path(entry['before'])
+
+        if content is None:
+            blob_hash = self.store.put_file(file_path)
+        else:
+            blob_hash = self.store.put(content)
+
+        with self._lock:
+            entry = self._files.setdefault(key, {'before': blob_hash, 'after': None})
+
+        return self.store.blob_path(entry['before'])
+
+    def record_result(self, file_path: Path, content: Optional[bytes] = None) -> None:
+        """
+        Record what was written to a backed-up file.
+
+        Args:
+            file_path: Modified file
+            content: Content written (hashed from disk if not given)
+
+        Raises:
+            BackupError: If content is not given and the file cannot be read
+        """
+        if content is None:
+            try:
+                after = hash_file(file_path)
+            except OSError as e:
+                raise BackupError(f"Failed to read {file_path}: {e}")
+        else:
+            after = hashlib.sha256(content).hexdigest()
+
+        with self._lock:
+            entry = self._files.get(self.store.path_key(file_path))
+            if entry is not None:
+                entry['after'] = after
+
+    def record_rename(self, source: Path, target: Path) -> None:
+        """
+        Record that a file or directory was moved.
+
+        Contents backed up in the same run are keyed by their path before
+        any rename, so renames are undone before contents are restored.
+
+        Args:
+            source: Original path
+            target: New path
+        """
+        with self._lock:
+            self._renames.append({
+                'from': self.store.path_key(source),
+                'to': self.store.path_key(target)
+            })
+
+    @property
+    def renames(self) -> List[Dict[str, str]]:
+        """Recorded renames in the order they were made: [{'from': path, 'to': path}]."""
+        with self._lock:
+            return [dict(entry) for entry in self._renames]
+
+    @property
+    def files(self) -> Dict[str, Dict[str, Optional[str]]]:
+        """Backed-up files: path -> {'before': blob hash, 'after': hash written}."""
+        with self._lock:
+            return {path: dict(entry) for path, entry in self._files.items()}
+
+    def save(self) -> Optional[Path]:
+        """
+        Write the run manifest.
+
+        Returns:
+            Path to the manifest, or None if the run backed up and renamed
+            nothing
+
+        Raises:
+            BackupError: If the manifest cannot be written
+        """
+        files = self.files
+        renames = self.renames
+        if not files and not renames:
+            return None
+
+        return self.store.write_manifest(self.run_id, {
+            'run_id': self.run_id,
+            'created': self.created,
+            'files': files,
+            'renames': renames
+        })
+
+
+class BackupStore:
+    """
+    Content-addressed storage for original file contents.
+
+    Attributes:
+        backup_dir: Root directory of the store
+    """
+
+    def __init__(self, backup_dir: Path):
+        """
+        Initialize backup store.
+
+        Args:
+            backup_dir: Root directory (created on first write)
+        """
+        self.backup_dir = Path(backup_dir)
+        self.objects_dir = self.backup_dir / 'objects'
+        self.runs_dir = self.backup_dir / 'runs'
+
+    def start_run(self) -> BackupRun:
+        """
+        Start a new backup run.
+
+        Returns:
+            BackupRun with a fresh, time-ordered run id
+        """
+        run_id = f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{secrets.token_hex(3)}"
+        return BackupRun(self, run_id)
+
+    @staticmethod
+    def path_key(file_path: Path) -> str:
+        """Get the manifest key for a file (its absolute POSIX path)."""
+        return Path(os.path.abspath(file_path)).as_posix()
+
+    def blob_path(self, blob_hash: str) -> Path:
+        """Get the path of the blob with the given hash."""
+        return self.objects_dir / blob_hash[:2] / blob_hash
+
+    def put(self, content: bytes) -> str:
+        """
+        Store content, unless a blob with the same hash already exists.
+
+        Args:
+            content: Bytes to store
+
+        Returns:
+            SHA-256 hash of the content
+
+        Raises:
+            BackupError: If the blob cannot be written
+        """
+        blob_hash = hashlib.sha256(content).hexdigest()
+        blob_path = self.blob_path(blob_hash)
+        if blob_path.exists():
+            return blob_hash
+
+        try:
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(blob_path, content)
+        except OSError as e:
+            raise BackupError(f"Failed to write backup blob {blob_hash}: {e}")
+
+        return blob_hash
+
+    def put_file(self, file_path: Path) -> str:
+        """
+        Store a file's content without reading it into memory at once.
+
+        The file is hashed while it is copied to a temporary file in the
+        store, which then becomes the blob (or is dropped if a blob with the
+        same hash already exists).
+
+        Args:
+            file_path: File to store
+
+        Returns:
+            SHA-256 hash of the content
+
+        Raises:
+            BackupError: If the file cannot be read or the blob written
+        """
+        try:
+            self.objects_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(dir=self.objects_dir, prefix='.put.', suffix='.tmp')
+            try:
+                digest = hashlib.sha256()
+                with os.fdopen(fd, 'wb') as out, open(file_path, 'rb') as source:
+                    for block in iter(lambda: source.read(HASH_CHUNK_SIZE), b''):
+                        digest.update(block)
+                        out.write(block)
+                    out.flush()
+                    os.fsync(out.fileno())
+
+                blob_hash = digest.hexdigest()
+                blob_path = self.blob_path(blob_hash)
+                if blob_path.exists():
+                    os.unlink(temp_name)
+                else:
+                    blob_path.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(temp_name, blob_path)
+            except BaseException:
+                if os.path.exists(temp_name):
+                    os.unlink(temp_name)
+                raise
+        except OSError as e:
+            raise BackupError(f"Failed to back up {file_path}: {e}")
+
+        return blob_hash
+
+    def get(self, blob_hash: str) -> bytes:
+        """
+        Read a blob, verifying its content against its hash.
+
+        Args:
+            blob_hash: SHA-256 hash of the content
+
+        Returns:
+            Stored bytes
+
+        Raises:
+            BackupError: If the blob is missing or corrupt
+        """
+        try:
+            content = self.blob_path(blob_hash).read_bytes()
+        except OSError as e:
+            raise BackupError(f"Backup blob {blob_hash} not found: {e}")
+
+        if hashlib.sha256(content).hexdigest() != blob_hash:
+            raise BackupError(f"Backup blob {blob_hash} is corrupt")
+
+        return content
+
+    def write_manifest(self, run_id: str, manifest: Dict[str, Any]) -> Path:
+        """
+        Write a run manifest.
+
+        Args:
+            run_id: Run identifier
+            manifest: Manifest data
+
+        Returns:
+            Path to the manifest
+
+        Raises:
+            BackupError: If the manifest cannot be written
+        """
+        manifest_path = self.runs_dir / f"{run_id}.json"
+        try:
+            self.runs_dir.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(
+                manifest_path,
+                json.dumps(manifest, indent=2, ensure_ascii=False).encode('utf-8')
+            )
+        except OSError as e:
+            raise BackupError(f"Failed to write backup manifest for run {run_id}: {e}")
+
+        return manifest_path
+
+    def load_manifest(self, run_id: str) -> Dict[str, Any]:
+        """
+        Load a run manifest.
+
+        Args:
+            run_id: Run identifier
+
+        Returns:
+            Manifest data
+
+        Raises:
+            BackupError: If the run does not exist or its manifest is invalid
+        """
+        manifest_path = self.runs_dir / f"{run_id}.json"
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise BackupError(f"No backup run '{run_id}' in {self.backup_dir}")
+        except (OSError, json.JSONDecodeError) as e:
+            raise BackupError(f"Invalid backup manifest for run {run_id}: {e}")
+
+    def archive_run(self, run_id: str) -> Path:
+        """
+        Pack a run's manifest and blobs into one compressed archive.
+
+        The archive (``runs/<run_id>.tar.gz``) is self-contained, so a run
+        can be kept or moved elsewhere independently of the object store.
+
+        Args:
+            run_id: Run identifier
+
+        Returns:
+            Path to the archive
+
+        Raises:
+            BackupError: If the run does not exist or cannot be archived
+        """
+        manifest = self.load_manifest(run_id)
+        archive_path = self.runs_dir / f"{run_id}.tar.gz"
+        blob_hashes = sorted({entry['before'] for entry in manifest['files'].values()})
+
+        try:
+            with tarfile.open(archive_path, 'w:gz') as tar:
+                tar.add(self.runs_dir / f"{run_id}.json", arcname='manifest.json')
+                for blob_hash in blob_hashes:
+                    tar.add(self.blob_path(blob_hash), arcname=f"objects/{blob_hash}")
+        except (OSError, tarfile.TarError) as e:
+            raise BackupError(f"Failed to archive backup run {run_id}: {e}")
+
+        return archive_path
+
+    def restore_run(self, run_id: str, jobs: int = 1, force: bool = False) -> RestoreResult:
+        """
+        Restore every file a run modified to its original content.
+
+        A file is only overwritten if its current hash still matches what
+        the run wrote, so later edits are never lost; force skips that
+        check. Files are independent and restored concurrently when
+        jobs > 1. Renames recorded by the run are undone first, newest
+        first, and never overwrite an existing path.
+
+        Args:
+            run_id: Run to restore
+            jobs: Number of parallel workers
+            force: Restore files even if they changed after the run
+
+        Returns:
+            RestoreResult listing restored and skipped paths
+
+        Raises:
+            BackupError: If the run does not exist
+        """
+        manifest = self.load_manifest(run_id)
+        entries = sorted(manifest.get('files', {}).items())
+
+        result = RestoreResult(run_id=run_id)
+        for rename in reversed(manifest.get('renames', [])):
+            skip_reason = self._undo_rename(Path(rename['to']), Path(rename['from']))
+            if skip_reason is None:
+                result.renames_undone.append((rename['to'], rename['from']))
+            else:
+                result.skipped[rename['to']] = skip_reason
+
+        def restore(item: Tuple[str, Dict[str, Optional[str]]]) -> Optional[str]:
+            path, entry = item
+            return self._restore_file(Path(path), entry, force)
+
+        if jobs > 1 and len(entries) > 1:
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                outcomes = list(executor.map(restore, entries))
+        else:
+            outcomes = [restore(item) for item in entries]
+
+        for (path, _), skip_reason in zip(entries, outcomes):
+            if skip_reason is None:
+                result.restored.append(path)
+            else:
+                result.skipped[path] = skip_reason
+
+        return result
+
+    @staticmethod
+    def _undo_rename(renamed_path: Path, original_path: Path) -> Optional[str]:
+        """
+        Move a renamed file or directory back to its original path.
+
+        Returns:
+            None if moved back, otherwise the reason it was skipped
+        """
+        if not renamed_path.exists():
+            return "renamed path no longer exists"
+        # A case-only rename on a case-insensitive filesystem is the same entry
+        if original_path.exists() and not os.path.samefile(original_path, renamed_path):
+            return f"original path {original_path} already exists"
+
+        try:
+            os.rename(renamed_path, original_path)
+        except OSError as e:
+            return f"cannot move back to {original_path}: {e}"
+
+        return None
+
+    def _restore_file(
+        self,
+        file_path: Path,
+        entry: Dict[str, Optional[str]],
+        force: bool
+    ) -> Optional[str]:
+        """
+        Restore one file from its backup.
+
+        Returns:
+            None if restored, otherwise the reason it was skipped
+        """
+        if entry.get('after') is None:
+            return "not modified by this run"
+
+        try:
+            current = file_path.read_bytes()
+        except FileNotFoundError:
+            current = None
+        except OSError as e:
+            return f"cannot read current file: {e}"
+
+        if not force:
+            if current is None:
+                return "file no longer exists"
+            if hashlib.sha256(current).hexdigest() != entry['after']:
+                return "modified since the fix was applied"
+
+        try:
+            original = self.get(entry['before'])
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(file_path, original, keep_mode=True)
+        except (BackupError, OSError) as e:
+            return str(e)
+
+        return None
+
+    def list_runs(self) -> List[str]:
+        """
+        List recorded runs.
+
+        Returns:
+            Run ids, oldest first
+        """
+        if not self.runs_dir.exists():
+            return []
+        return sorted(path.stem for path in self.runs_dir.glob('*.json'))
+
+    @staticmethod
+    def _write_atomic(path: Path, content: bytes, keep_mode: bool = False) -> None:
+        """
+        Write bytes to a unique temporary file and rename it into place.
+
+        Backup blobs and manifests stay readable by the owner only; with
+        keep_mode, the file gets the mode of the file it replaces, or the
+        usual mode of a new file (see copy_file_mode).
+        """
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            if keep_mode:
+                copy_file_mode(path, temp_name)
+            os.replace(temp_name, path)
+        except BaseException:
+            if os.path.exists(temp_name):
+                os.unlink(temp_name)
+            raise
@@ -1,15 +1,20 @@
 """
 Change detection for markdown documents.
 
-Detects new, modified, and deleted documents using SHA-256 file hashing
+Detects new, modified, deleted, and renamed documents using SHA-256 file hashing
 and persistent caching for efficient incremental processing.
 """
 
+import os
 from pathlib import Path
-from typing import List, Set, Dict, Any, Tuple
+from typing import Callable, List, Optional, Set, Dict, Any, Tuple
 from datetime import datetime
+from collections import defaultdict
 from ..utils.cache import DocumentCache, compute_file_hash, CacheError
+from ..utils.large_files import MMAP_THRESHOLD
 from ..utils.logger import Logger
+from .link_graph import LinkGraph
+from .metadata_index import MetadataIndex
 
 
 class ChangeDetectionError(Exception):
@@ -25,23 +30,53 @@ class ChangeDetector:
     - New documents (not in cache)
     - Modified documents (hash changed)
     - Deleted documents (in cache but file missing)
+    - Renamed documents (deleted path and new path with the same hash)
     - Unchanged documents (same hash as cache)
 
+    When given a MetadataIndex, keeps it current alongside the cache: every
+    hashed file refreshes its index entry (parsing frontmatter only when the
+    hash changed), and renames and deletions are mirrored.
+
+    When given a LinkGraph, unchanged documents that link to a new, changed,
+    renamed or deleted document are reported as relinked: their link checks
+    (MD-003) are stale even though their content is not.
+
     Attributes:
         cache: DocumentCache instance for persistent storage
         logger: Logger instance for tracking operations
+        metadata_index: Optional MetadataIndex kept in sync with the cache
+        link_graph: Optional LinkGraph used to find documents linking to
+            changed paths
     """
 
-    def __init__(self, cache: DocumentCache, logger: Logger):
+    def __init__(
+        self,
+        cache: DocumentCache,
+        logger: Logger,
+        metadata_index: Optional[MetadataIndex] = None,
+        large_file_threshold: int = MMAP_THRESHOLD,
+        link_graph: Optional[LinkGraph] = None
+    ):
         """
         Initialize change detector.
 
         Args:
             cache: DocumentCache instance
             logger: Logger instance
+            metadata_index: Optional metadata index to keep current
+            large_file_threshold: Size in bytes at or above which files are
+                hashed through a memory map
+            link_graph: Optional link graph of the previous run, used to
+                find documents whose links point at changed paths
         """
         self.cache = cache
         self.logger = logger
+        self.metadata_index = metadata_index
+        self.link_graph = link_graph
+        self.large_file_threshold = large_file_threshold
+        # Cache key -> (hash, stat) captured during detection, so the cache
+        # update after validation does not read each file a second time
+        self._fingerprints: Dict[str, Tuple[str, os.stat_result]] = {}
 
     def scan_directory(
         self,
@@ -108,30 +143,44 @@ class ChangeDetector:
     def detect_changes(
         self,
         current_files: List[Path],
-        force_reprocess: bool = False
-    ) -> Dict[str, List[Path]]:
+        force_reprocess: bool = False,
+        existing_files: Optional[List[Path]] = None
+    ) -> Dict[str, List[Any]]:
         """
         Detect changes in documents by comparing with cache.
 
+        A new file whose content hash matches a deleted cache entry is a
+        rename rather than a new plus a deleted document. When several
+        deleted entries share the hash, the one with the same inode wins.
+
         Args:
             current_files: List of current document paths
             force_reprocess: If True, treat all files as changed
+            existing_files: All documents that exist, when current_files is
+                only a subset to check; cached documents outside it are
+                reported deleted (default: current_files)
 
         Returns:
-            Dictionary with keys: 'new', 'modified', 'unchanged', 'deleted'
-            Each value is a list of Path objects
+            Dictionary with keys: 'new', 'modified', 'unchanged', 'deleted',
+            'relinked' (lists of Path objects) and 'renamed' (list of
+            (old_path, new_path) tuples). 'relinked' holds unchanged
+            documents whose links point at a changed path; without a link
+            graph it only holds those left over from an interrupted run.
 
         Raises:
             ChangeDetectionError: If change detection fails
         """
         self.logger.info(f"Detecting changes in {len(current_files)} files")
 
-        changes: Dict[str, List[Path]] = {
+        changes: Dict[str, List[Any]] = {
             'new': [],
             'modified': [],
             'unchanged': [],
-            'deleted': []
+            'deleted': [],
+            'renamed': [],
+            'relinked': []
         }
+        new_hashes: Dict[Path, str] = {}
 
         # If force reprocess, treat all as modified
         if force_reprocess:
@@ -142,8 +191,12 @@ class ChangeDetector:
         # Check each current file
         for file_path in current_files:
             try:
-                # Compute current hash
-                current_hash = compute_file_hash(file_path)
+                # Compute current hash; stat first so a write during
+                # hashing shows up as a changed mtime at cache update
+                stat = file_path.stat()
+                current_hash = compute_file_hash(file_path, self.large_file_threshold)
+                self._fingerprints[self.cache.key_for(file_path)] = (current_hash, stat)
+                self._update_index(file_path, current_hash, stat)
 
                 # Check if file is in cache and compare hash
                 if self.cache.has_document_changed(file_path, current_hash):
@@ -153,60 +206,155 @@ class ChangeDetector:
                         self.logger.debug(f"Modified: {file_path}")
                     else:
                         changes['new'].append(file_path)
+                        new_hashes[file_path] = current_hash
                         self.logger.debug(f"New: {file_path}")
+                elif self.cache.get_document(file_path).get('renamed_from'):
+                    # Moved by a run that was interrupted before re-checking
+                    # its path-dependent rules; finish the rename now
+                    old_path = self.cache.path_for(self.cache.get_document(file_path)['renamed_from'])
+                    changes['renamed'].append((old_path, file_path))
+                    self.logger.debug(f"Renamed (resumed): {old_path} -> {file_path}")
+                elif self.cache.get_document(file_path).get('links_stale'):
+                    # Links not re-checked by an interrupted run
+                    changes['relinked'].append(file_path)
+                    self.logger.debug(f"Relinked (resumed): {file_path}")
                 else:
                     # Unchanged
                     changes['unchanged'].append(file_path)
                     self.logger.debug(f"Unchanged: {file_path}")
 
-            except CacheError as e:
+            except (CacheError, OSError) as e:
                 self.logger.warning(f"Failed to compute hash for {file_path}: {e}")
                 # Treat as modified to be safe
                 changes['modified'].append(file_path)
 
         # Check for deleted files (in cache but not in current files)
-        current_file_set = set(current_files)
+        # Compare by cache key so 'docs/a.md', './docs/a.md' and absolute
+        # paths to the same file match
+        current_keys = {
+            self.cache.key_for(file_path)
+            for file_path in (existing_files if existing_files is not None else current_files)
+        }
         cached_paths = self.cache.get_all_cached_paths()
 
         for cached_path in cached_paths:
-            if cached_path not in current_file_set:
+            if self.cache.key_for(cached_path) not in current_keys:
                 changes['deleted'].append(cached_path)
                 self.logger.debug(f"Deleted: {cached_path}")
 
+        if changes['new'] and changes['deleted']:
+            self._match_renames(changes, new_hashes)
+
+        if self.link_graph is not None:
+            self._find_relinked(changes)
+
         # Log summary
         self.logger.info(
             f"Changes detected - "
             f"New: {len(changes['new'])}, "
             f"Modified: {len(changes['modified'])}, "
             f"Unchanged: {len(changes['unchanged'])}, "
-            f"Deleted: {len(changes['deleted'])}"
+            f"Deleted: {len(changes['deleted'])}, "
+            f"Renamed: {len(changes['renamed'])}, "
+            f"Relinked: {len(changes['relinked'])}"
         )
 
         return changes
 
+    def _match_renames(
+        self,
+        changes: Dict[str, List[Any]],
+        new_hashes: Dict[Path, str]
+    ) -> None:
+        """
+        Pair new files with deleted cache entries that have the same content.
+
+        Moves matched paths from 'new' and 'deleted' into 'renamed'.
+
+        Args:
+            changes: Change lists from detect_changes (updated in place)
+            new_hashes: Content hash of each new file
+        """
+        deleted_by_hash: Dict[str, List[Path]] = defaultdict(list)
+        for deleted_path in changes['deleted']:
+            cached_doc = self.cache.get_document(deleted_path)
+            if cached_doc and cached_doc.get('hash'):
+                deleted_by_hash[cached_doc['hash']].append(deleted_path)
+
+        renamed_old: Set[Path] = set()
+        still_new = []
+
+        for new_path in changes['new']:
+            candidates = deleted_by_hash.get(new_hashes.get(new_path), [])
+            if not candidates:
+                still_new.append(new_path)
+                continue
+
+            old_path = candidates[0]
+            if len(candidates) > 1:
+                fingerprint = self._fingerprints.get(self.cache.key_for(new_path))
+                inode = (fingerprint[1].st_ino or None) if fingerprint else self._get_inode(new_path)
+                for candidate in candidates:
+                    if inode is not None and self.cache.get_document(candidate).get('inode') == inode:
+                        old_path = candidate
+                        break
+
+            candidates.remove(old_path)
+            renamed_old.add(old_path)
+            changes['renamed'].append((old_path, new_path))
+            self.logger.debug(f"Renamed: {old_path} -> {new_path}")
+
+        changes['new'] = still_new
+        changes['deleted'] = [p for p in changes['deleted'] if p not in renamed_old]
+
+    @staticmethod
+    def _get_inode(file_path: Path) -> Optional[int]:
+        """Get a file's inode number, or None where the platform has none."""
+        try:
+            inode = file_path.stat().st_ino
+        except OSError:
+            return None
+        return inode or None
+
+    @staticmethod
+    def _same_stat(before: os.stat_result, after: os.stat_result) -> bool:
+        """Check whether a file's modification time and size are unchanged."""
+        return before.st_mtime_ns == after.st_mtime_ns and before.st_size == after.st_size
+
     def update_cache_for_file(
         self,
         file_path: Path,
         validation_status: str = None,
         error_count: int = 0,
-        warning_count: int = 0
+        warning_count: int = 0,
+        issues: Optional[List[Any]] = None
     ) -> None:
         """
         Update cache entry for a processed file.
 
+        Reuses the hash computed by detect_changes unless the file's
+        modification time or size changed since, so unchanged files are
+        not read again.
+
         Args:
             file_path: Path to processed file
             validation_status: 'passed' or 'failed'
             error_count: Number of validation errors
             warning_count: Number of validation warnings
+            issues: ValidationIssue objects to cache, so results can be
+                carried over if the file is later renamed
 
         Raises:
             ChangeDetectionError: If cache update fails
         """
         try:
-            # Compute hash and get modification time
-            file_hash = compute_file_hash(file_path)
-            last_modified = datetime.fromtimestamp(file_path.stat().st_mtime)
+            stat = file_path.stat()
+            fingerprint = self._fingerprints.pop(self.cache.key_for(file_path), None)
+            if fingerprint is not None and self._same_stat(fingerprint[1], stat):
+                file_hash = fingerprint[0]
+            else:
+                file_hash = compute_file_hash(file_path, self.large_file_threshold)
+            last_modified = datetime.fromtimestamp(stat.st_mtime)
 
             # Update cache
             self.cache.update_document(
@@ -215,8 +363,11 @@ class ChangeDetector:
                 last_modified=last_modified,
                 validation_status=validation_status,
                 error_count=error_count,
-                warning_count=warning_count
+                warning_count=warning_count,
+                issues=[issue.to_dict() for issue in issues] if issues is not None else None,
+                inode=stat.st_ino or None
             )
+            self._update_index(file_path, file_hash, stat)
 
             self.logger.debug(f"Updated cache for: {file_path}")
 
@@ -225,6 +376,50 @@ class ChangeDetector:
                 f"Failed to update cache for {file_path}: {e}"
             )
 
+    def _find_relinked(self, changes: Dict[str, List[Any]]) -> None:
+        """
+        Move unchanged documents linking to changed paths to 'relinked'.
+
+        Links are looked up in the link graph's reverse index: a link to a
+        renamed or deleted path is now broken, one to a new path may have
+        been fixed, and one to a modified document may point at an anchor
+        that changed.
+
+        Args:
+            changes: Detected changes, updated in place
+        """
+        changed_paths = (
+            changes['new'] + changes['modified'] + changes['deleted'] +
+            [path for rename in changes['renamed'] for path in rename]
+        )
+        unchanged = {self.cache.key_for(path): path for path in changes['unchanged']}
+
+        relinked_keys: Set[str] = set()
+        for path in changed_paths:
+            for source, _ in self.link_graph.links_to(path):
+                key = self.cache.key_for(self.link_graph.node_path(source))
+                if key in unchanged:
+                    relinked_keys.add(key)
+
+        if not relinked_keys:
+            return
+
+        changes['unchanged'] = [
+            path for path in changes['unchanged']
+            if self.cache.key_for(path) not in relinked_keys
+        ]
+        changes['relinked'].extend(unchanged[key] for key in sorted(relinked_keys))
+
+    def _update_index(self, file_path: Path, file_hash: str, stat: os.stat_result) -> None:
+        """Refresh a file's metadata index entry, if an index is attached."""
+        if self.metadata_index is None:
+            return
+
+        try:
+            self.metadata_index.update(file_path, content_hash=file_hash, stat=stat)
+        except OSError as e:
+            self.logger.warning(f"Failed to index metadata for {file_path}: {e}")
+
     def remove_deleted_from_cache(self, deleted_files: List[Path]) -> None:
         """
         Remove deleted files from cache.
@@ -234,6 +429,8 @@ class ChangeDetector:
         """
         for file_path in deleted_files:
             self.cache.remove_document(file_path)
+            if self.metadata_index is not None:
+                self.metadata_index.remove(file_path)
             self.logger.debug(f"Removed from cache: {file_path}")
 
         if deleted_files:
@@ -244,7 +441,8 @@ class ChangeDetector:
         directory: Path,
         include_patterns: List[str] = None,
         exclude_patterns: List[str] = None,
-        force_reprocess: bool = False
+        force_reprocess: bool = False,
+        file_filter: Optional[Callable[[List[Path]], List[Path]]] = None
     ) -> Tuple[List[Path], Dict[str, Any]]:
         """
         Get list of files that need processing based on changes.
@@ -256,6 +454,9 @@ class ChangeDetector:
             include_patterns: Glob patterns to include
             exclude_patterns: Glob patterns to exclude
             force_reprocess: Treat all files as changed
+            file_filter: Optional function narrowing the scanned files to
+                those that should be checked (e.g. by tag); files it drops
+                are neither hashed nor reported as deleted
 
         Returns:
             Tuple of (files_to_process, change_summary)
@@ -273,13 +474,34 @@ class ChangeDetector:
         )
 
         # Detect changes
+        scanned_files = current_files
+        if file_filter is not None:
+            current_files = file_filter(scanned_files)
+
         changes = self.detect_changes(
             current_files=current_files,
-            force_reprocess=force_reprocess
+            force_reprocess=force_reprocess,
+            existing_files=scanned_files
         )
 
-        # Files to process are new + modified
-        files_to_process = changes['new'] + changes['modified']
+        # Files to process are new + modified + renamed + relinked (renamed
+        # and relinked files keep their cached results; only path-dependent
+        # rules need re-running)
+        files_to_process = (
+            changes['new'] + changes['modified'] +
+            [new_path for _, new_path in changes['renamed']] +
+            changes['relinked']
+        )
+
+        # Flag relinked entries so an interrupted run re-checks them
+        for file_path in changes['relinked']:
+            self.cache.mark_links_stale(file_path)
+
+        # Move cache entries of renamed files to their new paths
+        for old_path, new_path in changes['renamed']:
+            self.cache.rename_document(old_path, new_path)
+            if self.metadata_index is not None:
+                self.metadata_index.rename(old_path, new_path)
 
         # Clean up deleted files from cache
         if changes['deleted']:
@@ -292,14 +514,16 @@ class ChangeDetector:
             'new_files': len(changes['new']),
             'modified_files': len(changes['modified']),
             'unchanged_files': len(changes['unchanged']),
-            'deleted_files': len(changes['deleted'])
+            'deleted_files': len(changes['deleted']),
+            'renamed_files': len(changes['renamed']),
+            'relinked_files': len(changes['relinked'])
         }
 
         return files_to_process, change_summary
 
     def save_cache(self) -> None:
         """
-        Save cache to disk.
+        Save cache (and metadata index, if attached) to disk.
 
         Raises:
             ChangeDetectionError: If save fails
@@ -309,3 +533,9 @@ class ChangeDetector:
             self.logger.debug("Cache saved successfully")
         except CacheError as e:
             raise ChangeDetectionError(f"Failed to save cache: {e}")
+
+        if self.metadata_index is not None:
+            try:
+                self.metadata_index.save()
+            except OSError as e:
+                raise ChangeDetectionError(f"Failed to save metadata index: {e}")
@@ -4,20 +4,38 @@ Bulk frontmatter field management for markdown documents.
 This module provides functionality for adding, updating, or removing frontmatter
 fields across multiple markdown documents in bulk operations. It builds on top
 of the lower-level frontmatter utilities to provide batch processing capabilities.
+
+Several edits can be combined into a list of FrontmatterOperation objects
+(usually loaded from a YAML operations file), which are applied to each
+document's metadata in memory with a single read and atomic write per file.
 """
 
+import io
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, field
+
+import yaml
 
 from src.utils.frontmatter import (
     has_frontmatter,
     parse_frontmatter,
-    update_frontmatter,
     add_frontmatter,
+    split_frontmatter,
+    parse_frontmatter_text,
+    render_frontmatter,
+    atomic_write_text,
     FrontmatterError
 )
 from src.utils.logger import Logger
+from src.utils.patch import unified_diff
+from src.core.metadata_index import (
+    MetadataIndex,
+    condition_matches,
+    normalize_metadata,
+    validate_condition
+)
 
 
 @dataclass
@@ -29,6 +47,220 @@ class FrontmatterOperationResult:
     field_name: Optional[str] = None
     old_value: Optional[Any] = None
     new_value: Optional[Any] = None
+    changes: List[str] = field(default_factory=list)
+
+
+# Operation name -> keys it accepts besides 'op' and 'when'
+OPERATION_KEYS = {
+    'set': {'field', 'value'},
+    'unset': {'field'},
+    'rename': {'field', 'to'},
+    'append': {'field', 'value'},
+}
+
+
+@dataclass
+class FrontmatterOperation:
+    """
+    One edit to a document's frontmatter.
+
+    Operations:
+        set: Set field to value
+        unset: Remove field
+        rename: Rename field to 'to', keeping its position
+        append: Add value (or each item of a list value) to a list field,
+            skipping items already present; a string field becomes a list
+
+    Any operation can carry a 'when' condition; the operation is skipped
+    for documents that do not satisfy it. A condition tests 'field'
+    (default: the operation's field) with one of: equals, not_equals,
+    exists (true/false), missing (true/false), contains.
+
+    Attributes:
+        op: Operation name
+        field: Field the operation edits
+        value: Value for set and append
+        to: New field name for rename
+        when: Optional condition
+    """
+    op: str
+    field: str
+    value: Any = None
+    to: Optional[str] = None
+    when: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'FrontmatterOperation':
+        """
+        Create an operation from its operations-file form.
+
+        Args:
+            data: Mapping with 'op', its arguments and an optional 'when'
+
+        Returns:
+            FrontmatterOperation
+
+        Raises:
+            ValueError: If the operation is unknown or malformed
+        """
+        if not isinstance(data, dict):
+            raise ValueError(f"Operation must be a mapping, got {type(data).__name__}")
+
+        op = data.get('op')
+        if op not in OPERATION_KEYS:
+            raise ValueError(
+                f"Unknown operation '{op}' (expected one of: {', '.join(OPERATION_KEYS)})"
+            )
+
+        allowed = OPERATION_KEYS[op]
+        unknown = set(data) - allowed - {'op', 'when'}
+        if unknown:
+            raise ValueError(f"Unexpected key(s) for '{op}': {', '.join(sorted(unknown))}")
+
+        missing = allowed - set(data)
+        if missing:
+            raise ValueError(f"Operation '{op}' requires: {', '.join(sorted(missing))}")
+
+        when = data.get('when')
+        if when is not None:
+            validate_condition(when)
+
+        return cls(
+            op=op,
+            field=str(data['field']),
+            value=data.get('value'),
+            to=str(data['to']) if 'to' in data else None,
+            when=when
+        )
+
+    def matches(self, metadata: Dict[str, Any]) -> bool:
+        """
+        Check whether a document satisfies the operation's condition.
+
+        Args:
+            metadata: Document metadata
+
+        Returns:
+            True if there is no condition or it holds
+        """
+        if not self.when:
+            return True
+        return condition_matches(metadata, self.when, default_field=self.field)
+
+    def apply(self, metadata: Dict[str, Any]) -> Optional[str]:
+        """
+        Apply the operation to metadata in place.
+
+        Args:
+            metadata: Document metadata
+
+        Returns:
+            Description of the change, or None if nothing changed
+
+        Raises:
+            ValueError: If the operation cannot be applied to this document
+        """
+        if not self.matches(metadata):
+            return None
+
+        if self.op == 'set':
+            if self.field in metadata and metadata[self.field] == self.value:
+                return None
+            metadata[self.field] = self.value
+            return f"Set '{self.field}' to {self.value!r}"
+
+        if self.op == 'unset':
+            if self.field not in metadata:
+                return None
+            del metadata[self.field]
+            return f"Removed '{self.field}'"
+
+        if self.op == 'rename':
+            if self.field not in metadata or self.field == self.to:
+                return None
+            if self.to in metadata:
+                raise ValueError(f"Cannot rename '{self.field}' to '{self.to}': field already exists")
+            # Rebuild so the renamed field keeps its position
+            items = [(self.to if key == self.field else key, value) for key, value in metadata.items()]
+            metadata.clear()
+            metadata.update(items)
+            return f"Renamed '{self.field}' to '{self.to}'"
+
+        # append
+        current = metadata.get(self.field)
+        if current is None:
+            current = []
+        elif isinstance(current, str):
+            current = [current]
+        elif not isinstance(current, list):
+            raise ValueError(
+                f"Cannot append to '{self.field}': not a list ({type(current).__name__})"
+            )
+
+        items = self.value if isinstance(self.value, list) else [self.value]
+        added = [item for item in items if item not in current]
+        if not added and not isinstance(metadata.get(self.field), str):
+            return None
+
+        metadata[self.field] = current + added
+        if not added:
+            return f"Converted '{self.field}' to a list"
+        return f"Appended {added!r} to '{self.field}'"
+
+
+def load_operations(file_path: Path) -> List[FrontmatterOperation]:
+    """
+    Load frontmatter operations from a YAML file.
+
+    The file holds a list of operations, either at the top level or under
+    an 'operations' key:
+
+        operations:
+          - op: set
+            field: owner
+            value: ops
+          - op: set
+            field: status
+            value: review
+            when: {equals: draft}
+          - op: rename
+            field: author
+            to: maintainer
+          - op: append
+            field: tags
+            value: reviewed
+          - op: unset
+            field: legacy_id
+
+    Args:
+        file_path: Path to the operations file
+
+    Returns:
+        Operations, in the order they are applied
+
+    Raises:
+        ValueError: If the file is not a valid operations list
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f)
+    except (OSError, yaml.YAMLError) as e:
+        raise ValueError(f"Cannot read operations file {file_path}: {e}") from e
+
+    if isinstance(data, dict):
+        data = data.get('operations')
+
+    if not isinstance(data, list) or not data:
+        raise ValueError(f"Operations file {file_path} must contain a non-empty list of operations")
+
+    operations = []
+    for index, item in enumerate(data, start=1):
+        try:
+            operations.append(FrontmatterOperation.from_dict(item))
+        except ValueError as e:
+            raise ValueError(f"Operation {index}: {e}") from e
+
+    return operations
 
 
 class FrontmatterManager:
@@ -40,14 +272,21 @@ class FrontmatterManager:
     validation, and detailed reporting.
     """
 
-    def __init__(self, logger: Optional[Logger] = None):
+    def __init__(
+        self,
+        logger: Optional[Logger] = None,
+        metadata_index: Optional[MetadataIndex] = None
+    ):
         """
         Initialize the FrontmatterManager.
 
         Args:
             logger: Optional logger instance for operation logging
+            metadata_index: Optional metadata index; when given, field
+                lookups are answered from it instead of parsing documents
         """
         self.logger = logger or Logger("frontmatter_manager")
+        self.metadata_index = metadata_index
 
     def add_field_to_documents(
         self,
@@ -121,6 +360,72 @@ class FrontmatterManager:
         Returns:
             FrontmatterOperationResult with operation details
         """
+        result, _, new_content = self._plan_add_field(
+            doc_path, field_name, field_value, overwrite, only_if_missing
+        )
+
+        if new_content is not None:
+            atomic_write_text(doc_path, new_content)
+
+        return result
+
+    def preview_add_field(
+        self,
+        doc_path: Path,
+        field_name: str,
+        field_value: Any,
+        overwrite: bool = False,
+        only_if_missing: bool = True,
+        root: Optional[Path] = None
+    ) -> Tuple[FrontmatterOperationResult, str]:
+        """
+        Compute the result of adding a field without writing it.
+
+        Uses the same logic as apply mode and diffs the would-be content
+        against the file.
+
+        Args:
+            doc_path: Path to the markdown file
+            field_name: Name of the field to add
+            field_value: Value to set for the field
+            overwrite: If True, overwrite existing field values
+            only_if_missing: If True, only add if field doesn't exist
+            root: Directory diff paths are relative to (default: current directory)
+
+        Returns:
+            Tuple of (operation result, unified diff; empty if the document
+            would not change)
+        """
+        result, original, new_content = self._plan_add_field(
+            doc_path, field_name, field_value, overwrite, only_if_missing
+        )
+
+        if new_content is None:
+            return result, ""
+        return result, unified_diff(doc_path, original, new_content, root)
+
+    def _plan_add_field(
+        self,
+        doc_path: Path,
+        field_name: str,
+        field_value: Any,
+        overwrite: bool,
+        only_if_missing: bool
+    ) -> Tuple[FrontmatterOperationResult, Optional[str], Optional[str]]:
+        """
+        Work out how adding a field changes a document, in memory.
+
+        Args:
+            doc_path: Path to the markdown file
+            field_name: Name of the field to add
+            field_value: Value to set for the field
+            overwrite: If True, overwrite existing field values
+            only_if_missing: If True, only add if field doesn't exist
+
+        Returns:
+            Tuple of (operation result, current file text, new file text).
+            The new text is None if the document is left unchanged.
+        """
         # Validate file exists and is a markdown file
         if not doc_path.exists():
             return FrontmatterOperationResult(
@@ -128,7 +433,7 @@ class FrontmatterManager:
                 success=False,
                 message="File not found",
                 field_name=field_name
-            )
+            ), None, None
 
         if doc_path.suffix.lower() != '.md':
             return FrontmatterOperationResult(
@@ -136,13 +441,16 @@ class FrontmatterManager:
                 success=False,
                 message="Not a markdown file",
                 field_name=field_name
-            )
+            ), None, None
+
+        original = doc_path.read_bytes().decode('utf-8')
+        content = io.StringIO(original, newline=None).read()
+        frontmatter_block, body = split_frontmatter(content)
 
         # Check if document has frontmatter, create if missing
-        if not has_frontmatter(doc_path):
+        if not frontmatter_block:
             # Create new frontmatter with the field
             metadata = {field_name: field_value}
-            add_frontmatter(doc_path, metadata, preserve_content=True)
             return FrontmatterOperationResult(
                 file_path=doc_path,
                 success=True,
@@ -150,24 +458,24 @@ class FrontmatterManager:
                 field_name=field_name,
                 old_value=None,
                 new_value=field_value
-            )
+            ), original, render_frontmatter(metadata, content)
 
         # Parse existing frontmatter
         try:
-            metadata = parse_frontmatter(doc_path)
+            metadata = parse_frontmatter_text(frontmatter_block)
         except FrontmatterError as e:
             return FrontmatterOperationResult(
                 file_path=doc_path,
                 success=False,
                 message=f"Failed to parse frontmatter: {str(e)}",
                 field_name=field_name
-            )
+            ), original, None
 
         # Check if field already exists
         old_value = metadata.get(field_name)
         field_exists = field_name in metadata
 
-        if field_exists and only_if_missing:
+        if field_exists and (only_if_missing or not overwrite):
             return FrontmatterOperationResult(
                 file_path=doc_path,
                 success=False,
@@ -175,20 +483,10 @@ class FrontmatterManager:
                 field_name=field_name,
                 old_value=old_value,
                 new_value=None
-            )
-
-        if field_exists and not overwrite:
-            return FrontmatterOperationResult(
-                file_path=doc_path,
-                success=False,
-                message=f"Field '{field_name}' already exists (use --overwrite to replace)",
-                field_name=field_name,
-                old_value=old_value,
-                new_value=None
-            )
+            ), original, None
 
         # Add or update the field
-        update_frontmatter(doc_path, {field_name: field_value}, merge=True)
+        metadata[field_name] = field_value
 
         action = "Updated" if field_exists else "Added"
         return FrontmatterOperationResult(
@@ -198,7 +496,157 @@ class FrontmatterManager:
             field_name=field_name,
             old_value=old_value,
             new_value=field_value
-        )
+        ), original, render_frontmatter(metadata, body)
+
+    def apply_operations(
+        self,
+        documents: List[Path],
+        operations: List[FrontmatterOperation],
+        jobs: int = 1
+    ) -> List[FrontmatterOperationResult]:
+        """
+        Apply a list of operations to multiple documents.
+
+        Each document is read once, every operation is applied to its
+        metadata in order, and the result is written with one atomic write
+        (only if something changed). Documents are independent, so with
+        jobs > 1 they are processed concurrently in a thread pool.
+
+        Args:
+            documents: List of Path objects for markdown files
+            operations: Operations to apply, in order
+            jobs: Number of parallel workers
+
+        Returns:
+            List of FrontmatterOperationResult objects, in the order of documents
+        """
+        def apply(doc_path: Path) -> FrontmatterOperationResult:
+            try:
+                result, _, new_content = self._plan_operations(doc_path, operations)
+                if new_content is not None:
+                    atomic_write_text(doc_path, new_content)
+                    self.logger.info(f"Applied {len(result.changes)} change(s) to {doc_path}")
+                return result
+            except Exception as e:
+                error_msg = f"Error processing {doc_path}: {str(e)}"
+                self.logger.error(error_msg)
+                return FrontmatterOperationResult(
+                    file_path=doc_path,
+                    success=False,
+                    message=error_msg
+                )
+
+        if jobs > 1 and len(documents) > 1:
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                return list(executor.map(apply, documents))
+
+        return [apply(doc_path) for doc_path in documents]
+
+    def iter_operation_previews(
+        self,
+        documents: List[Path],
+        operations: List[FrontmatterOperation],
+        root: Optional[Path] = None
+    ) -> Iterator[Tuple[FrontmatterOperationResult, str]]:
+        """
+        Lazily preview a list of operations as unified diffs.
+
+        Args:
+            documents: List of Path objects for markdown files
+            operations: Operations to apply, in order
+            root: Directory diff paths are relative to (default: current directory)
+
+        Yields:
+            (operation result, unified diff; empty if unchanged) per document
+        """
+        for doc_path in documents:
+            try:
+                result, original, new_content = self._plan_operations(doc_path, operations)
+            except Exception as e:
+                yield FrontmatterOperationResult(
+                    file_path=doc_path,
+                    success=False,
+                    message=f"Error processing {doc_path}: {str(e)}"
+                ), ""
+                continue
+
+            if new_content is None:
+                yield result, ""
+            else:
+                yield result, unified_diff(doc_path, original, new_content, root)
+
+    def _plan_operations(
+        self,
+        doc_path: Path,
+        operations: List[FrontmatterOperation]
+    ) -> Tuple[FrontmatterOperationResult, Optional[str], Optional[str]]:
+        """
+        Work out how a list of operations changes a document, in memory.
+
+        Args:
+            doc_path: Path to the markdown file
+            operations: Operations to apply, in order
+
+        Returns:
+            Tuple of (operation result, current file text, new file text).
+            The new text is None if the document is left unchanged.
+        """
+        if doc_path.suffix.lower() != '.md':
+            return FrontmatterOperationResult(
+                file_path=doc_path,
+                success=False,
+                message="Not a markdown file"
+            ), None, None
+
+        try:
+            original = doc_path.read_bytes().decode('utf-8')
+        except FileNotFoundError:
+            return FrontmatterOperationResult(
+                file_path=doc_path,
+                success=False,
+                message="File not found"
+            ), None, None
+
+        content = io.StringIO(original, newline=None).read()
+        frontmatter_block, body = split_frontmatter(content)
+
+        try:
+            metadata = parse_frontmatter_text(frontmatter_block) if frontmatter_block else {}
+        except FrontmatterError as e:
+            return FrontmatterOperationResult(
+                file_path=doc_path,
+                success=False,
+                message=f"Failed to parse frontmatter: {str(e)}"
+            ), original, None
+
+        changes = []
+        for operation in operations:
+            try:
+                change = operation.apply(metadata)
+            except ValueError as e:
+                # Leave the document untouched rather than half-edited
+                return FrontmatterOperationResult(
+                    file_path=doc_path,
+                    success=False,
+                    message=str(e)
+                ), original, None
+            if change:
+                changes.append(change)
+
+        if not changes:
+            return FrontmatterOperationResult(
+                file_path=doc_path,
+                success=True,
+                message="No changes"
+            ), original, None
+
+        new_content = render_frontmatter(metadata, body if frontmatter_block else content)
+        return FrontmatterOperationResult(
+            file_path=doc_path,
+            success=True,
+            message=f"Applied {len(changes)} change(s)",
+            changes=changes
+        ), original, new_content
 
     def remove_field_from_documents(
         self,
@@ -334,6 +782,18 @@ class FrontmatterManager:
         Returns:
             List of tuples (file_path, field_value) for matching documents
         """
+        if self.metadata_index is not None:
+            self.metadata_index.refresh(documents)
+            condition = {'field': field_name, 'exists': True}
+            if field_value is not None:
+                condition = {'field': field_name, 'equals': normalize_metadata(field_value)}
+            matches = set(self.metadata_index.query([condition], documents))
+            return [
+                (doc_path, self.metadata_index.get(doc_path)['metadata'][field_name])
+                for doc_path in documents
+                if self.metadata_index.node_id(doc_path) in matches
+            ]
+
         matching_docs = []
 
         for doc_path in documents:
@@ -375,6 +835,11 @@ class FrontmatterManager:
         Returns:
             List of Path objects for documents missing the field
         """
+        if self.metadata_index is not None:
+            self.metadata_index.refresh(documents)
+            matches = set(self.metadata_index.query([{'field': field_name, 'missing': True}], documents))
+            return [doc_path for doc_path in documents if self.metadata_index.node_id(doc_path) in matches]
+
         missing_docs = []
 
         for doc_path in documents:
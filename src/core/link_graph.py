@@ -0,0 +1,575 @@
+"""
+Corpus link graph shared by link-based validation rules.
+
+Each document's markdown links are extracted once per content change,
+resolved to normalized corpus nodes (POSIX paths relative to the repository
+root) and kept with a reverse index, so rules can ask both "where does this
+document link to" and "what links to this document" without re-parsing.
+Each node also stores the anchors its headings produce, so #fragment links
+are checked with a set lookup. The graph can be persisted to JSON and
+updated incrementally across runs.
+"""
+
+import hashlib
+import json
+import os
+import re
+from collections import Counter
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import unquote
+
+from src.utils.frontmatter import atomic_write_text
+
+
+# Markdown link pattern: [text](url)
+LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+EXTERNAL_PREFIXES = ('http://', 'https://', 'ftp://')
+
+HEADING_PATTERN = re.compile(r'^#{1,6}\s+(.+?)\s*#*\s*$')
+HTML_ANCHOR_PATTERN = re.compile(r'<a\s+(?:name|id)=["\']([^"\']+)["\']', re.IGNORECASE)
+CODE_FENCE_PATTERN = re.compile(r'^\s*(```|~~~)')
+
+# Optional quoted title after an inline link's destination
+_LINK_TITLE_PATTERN = re.compile(r'\s+(?:"[^"]*"|\'[^\']*\')\s*$')
+
+# Inline markup removed before slugging: images/links keep their text
+_INLINE_LINK_PATTERN = re.compile(r'!?\[([^\]]*)\]\([^)]*\)')
+_SLUG_STRIP_PATTERN = re.compile(r'[^\w\- ]')
+
+
+def heading_slug(text: str) -> str:
+    """
+    Convert heading text to a GitHub-style anchor slug.
+
+    Lowercases, keeps link text, drops punctuation other than hyphens and
+    underscores, and turns spaces into hyphens ("Setup & Install!" becomes
+    "setup--install").
+
+    Args:
+        text: Heading text without the leading #'s
+
+    Returns:
+        Anchor slug (without duplicate suffix)
+    """
+    text = _INLINE_LINK_PATTERN.sub(r'\1', text)
+    return _SLUG_STRIP_PATTERN.sub('', text.strip().lower()).replace(' ', '-')
+
+
+def link_destination(url: str) -> Tuple[int, int]:
+    """
+    Find the destination within the parenthesized part of an inline link.
+
+    Angle brackets and an optional title are not part of the destination:
+    in '<My Doc.md> "Title"' it is 'My Doc.md'.
+
+    Args:
+        url: Text between the link's parentheses
+
+    Returns:
+        (start, end) of the destination in url
+    """
+    start = len(url) - len(url.lstrip())
+    if url.startswith('<', start):
+        close = url.find('>', start + 1)
+        if close != -1:
+            return start + 1, close
+
+    title = _LINK_TITLE_PATTERN.search(url, start)
+    end = title.start() if title else len(url.rstrip())
+    return start, end
+
+
+@dataclass
+class Link:
+    """
+    A markdown link found in a document.
+
+    Attributes:
+        line_number: Line the link appears on (1-indexed)
+        text: Link text
+        url: Raw link URL as written
+        target: Resolved corpus node, or None for external and same-page links
+        anchor: Fragment after '#', if any
+        external: True for absolute URLs (http, https, ftp)
+    """
+    line_number: int
+    text: str
+    url: str
+    target: Optional[str] = None
+    anchor: Optional[str] = None
+    external: bool = False
+
+
+class LinkGraph:
+    """
+    Directed graph of links between documents.
+
+    Nodes are identified by POSIX paths relative to the root (paths outside
+    the root keep their absolute POSIX form). Link targets need not be
+    documents in the graph; they may be images, missing files, etc.
+    """
+
+    VERSION = "1.3.0"
+
+    def __init__(self, root: Path, graph_file: Optional[Path] = None):
+        """
+        Initialize and load the link graph.
+
+        Args:
+            root: Repository root that node ids are relative to
+            graph_file: Path to JSON file for persistence (None for in-memory only)
+        """
+        self.root = Path(root).resolve()
+        self.graph_file = Path(graph_file) if graph_file else None
+
+        # node -> {'hash': content hash, 'stat': [mtime_ns, size] or None,
+        #          'links': [Link, ...], 'anchors': set of anchor slugs}
+        self._nodes: Dict[str, Dict] = {}
+        # target node -> set of source nodes linking to it
+        self._inbound: Dict[str, Set[str]] = {}
+        # Nodes whose stored stat was checked against disk in this run
+        self._fresh: Set[str] = set()
+
+        self._load()
+
+    def _load(self) -> None:
+        """Load the graph from disk if it was built for the same root."""
+        if self.graph_file is None or not self.graph_file.exists():
+            return
+
+        try:
+            with open(self.graph_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            # A bad graph file only costs a re-parse
+            return
+
+        if data.get('version') != self.VERSION or data.get('root') != self.root.as_posix():
+            return
+
+        for node, entry in data.get('nodes', {}).items():
+            self._set_node(node, {
+                'hash': entry.get('hash'),
+                'stat': entry.get('stat'),
+                'links': [Link(**link) for link in entry.get('links', [])],
+                'anchors': set(entry.get('anchors', []))
+            })
+
+    def save(self) -> None:
+        """Write the graph to disk atomically (see atomic_write_text)."""
+        if self.graph_file is None:
+            return
+
+        self.graph_file.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(self.graph_file, json.dumps({
+            'version': self.VERSION,
+            'root': self.root.as_posix(),
+            'nodes': {
+                node: {
+                    'hash': entry['hash'],
+                    'stat': entry['stat'],
+                    'links': [asdict(link) for link in entry['links']],
+                    'anchors': sorted(entry['anchors'])
+                }
+                for node, entry in self._nodes.items()
+            }
+        }))
+
+    def node_id(self, path: Path) -> str:
+        """
+        Get the normalized node id for a path.
+
+        Args:
+            path: Filesystem path (absolute or relative to the working directory)
+
+        Returns:
+            POSIX path relative to the root, or absolute if outside the root
+        """
+        resolved = Path(path).resolve()
+        try:
+            return resolved.relative_to(self.root).as_posix()
+        except ValueError:
+            return resolved.as_posix()
+
+    def node_path(self, node: str) -> Path:
+        """
+        Get the filesystem path for a node id.
+
+        Args:
+            node: Node id
+
+        Returns:
+            Absolute path
+        """
+        return self.root / node
+
+    def update(self, path: Path, content: Optional[str] = None) -> List[Link]:
+        """
+        Refresh a document's links, re-parsing only if its content changed.
+
+        When content is not provided and the file's mtime and size match
+        the stored entry, the file is not read at all.
+
+        Args:
+            path: Path to the document
+            content: Document content (read from disk if not provided)
+
+        Returns:
+            The document's links
+        """
+        node = self.node_id(path)
+        stat = self._stat(Path(path))
+        self._fresh.add(node)
+
+        entry = self._nodes.get(node)
+        if content is None:
+            if entry is not None and stat is not None and entry['stat'] == stat:
+                return entry['links']
+            content = Path(path).read_text(encoding='utf-8')
+
+        content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        if entry is not None and entry['hash'] == content_hash:
+            entry['stat'] = stat
+            return entry['links']
+
+        links, anchors = self._parse(Path(path).resolve(), content)
+        self._set_node(node, {
+            'hash': content_hash,
+            'stat': stat,
+            'links': links,
+            'anchors': anchors
+        })
+        return links
+
+    def remove(self, path: Path) -> None:
+        """
+        Remove a document and its outbound links from the graph.
+
+        Args:
+            path: Path to the document
+        """
+        self._set_node(self.node_id(path), None)
+
+    def prune(self) -> List[str]:
+        """
+        Remove documents whose files no longer exist.
+
+        Returns:
+            List of removed node ids
+        """
+        removed = [node for node in self._nodes if not self.node_path(node).exists()]
+        for node in removed:
+            self._set_node(node, None)
+        return removed
+
+    def links_from(self, path: Path) -> List[Link]:
+        """
+        Get the links in a document (empty if it has not been added).
+
+        Args:
+            path: Path to the document
+
+        Returns:
+            List of links in document order
+        """
+        entry = self._nodes.get(self.node_id(path))
+        return entry['links'] if entry else []
+
+    def links_to(self, path: Path) -> List[Tuple[str, Link]]:
+        """
+        Get all links pointing at a document.
+
+        Args:
+            path: Path to the link target
+
+        Returns:
+            List of (source node, link) tuples sorted by source and line
+        """
+        target = self.node_id(path)
+        result = []
+
+        for source in sorted(self._inbound.get(target, ())):
+            for link in self._nodes[source]['links']:
+                if link.target == target:
+                    result.append((source, link))
+
+        return result
+
+    def links_under(self, directories: Iterable[Path]) -> List[Tuple[str, Link]]:
+        """
+        Get all links pointing at any of several directories or inside them.
+
+        Each link target is checked against the directories once, so the
+        cost does not grow with the number of directories.
+
+        Args:
+            directories: Paths to the directories
+
+        Returns:
+            List of (source node, link) tuples sorted by source and line
+        """
+        prefixes = {self.node_id(directory) for directory in directories}
+        targets = set()
+        for target in self._inbound:
+            parts = target.split('/')
+            if any('/'.join(parts[:i]) in prefixes for i in range(1, len(parts) + 1)):
+                targets.add(target)
+
+        sources = set().union(*(self._inbound[target] for target in targets))
+
+        result = []
+        for source in sorted(sources):
+            for link in self._nodes[source]['links']:
+                if link.target in targets:
+                    result.append((source, link))
+
+        return result
+
+    def target_exists(self, link: Link) -> bool:
+        """
+        Check whether a link's target exists on disk.
+
+        Args:
+            link: Link to check
+
+        Returns:
+            True for existing targets, external and same-page links
+        """
+        if link.target is None:
+            return True
+        return self.node_path(link.target).exists()
+
+    def anchor_exists(self, source: Path, link: Link) -> bool:
+        """
+        Check whether a link's #fragment names an anchor in its target.
+
+        Same-page links are checked against the source document. Targets
+        that are not markdown files are not checked. A target whose file
+        changed since it was indexed is re-parsed first.
+
+        Args:
+            source: Path to the document containing the link
+            link: Link to check
+
+        Returns:
+            True if the link has no fragment or the anchor exists
+        """
+        if not link.anchor or link.external:
+            return True
+
+        node = link.target if link.target is not None else self.node_id(source)
+        anchors = self.anchors(node)
+        if anchors is None:
+            return True
+
+        return unquote(link.anchor).lower() in anchors
+
+    def anchors(self, node: str) -> Optional[Set[str]]:
+        """
+        Get the anchors defined by a markdown document.
+
+        Args:
+            node: Node id
+
+        Returns:
+            Set of anchor slugs, or None if the node is not a readable
+            markdown file
+        """
+        if not node.lower().endswith('.md'):
+            return None
+
+        if node not in self._fresh:
+            path = self.node_path(node)
+            entry = self._nodes.get(node)
+            self._fresh.add(node)
+            if entry is None or entry['stat'] != self._stat(path):
+                try:
+                    self.update(path)
+                except (OSError, UnicodeDecodeError):
+                    return None
+
+        entry = self._nodes.get(node)
+        return entry['anchors'] if entry else None
+
+    def orphans(self, nodes: Iterable[str]) -> List[str]:
+        """
+        Find nodes that no other node in the set links to.
+
+        Args:
+            nodes: Node ids to consider (links from outside the set are ignored)
+
+        Returns:
+            Sorted list of orphan node ids
+        """
+        node_set = set(nodes)
+        return sorted(
+            node for node in node_set
+            if not (self._inbound.get(node, set()) & node_set) - {node}
+        )
+
+    def strongly_connected_components(self, nodes: Iterable[str]) -> List[List[str]]:
+        """
+        Find groups of nodes that all reach each other through links.
+
+        Uses an iterative version of Tarjan's algorithm over the subgraph
+        induced by nodes. Single nodes (including self-links) are omitted.
+
+        Args:
+            nodes: Node ids to consider
+
+        Returns:
+            List of components, each a sorted list of node ids
+        """
+        node_set = set(nodes)
+        successors = {
+            node: sorted({
+                link.target for link in self._nodes.get(node, {'links': []})['links']
+                if link.target in node_set and link.target != node
+            })
+            for node in node_set
+        }
+
+        index_of: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+        components = []
+        counter = 0
+
+        for start in sorted(node_set):
+            if start in index_of:
+                continue
+
+            work = [(start, 0)]
+            while work:
+                node, child_index = work.pop()
+
+                if child_index == 0:
+                    index_of[node] = lowlink[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack.add(node)
+
+                recurse = False
+                children = successors[node]
+                while child_index < len(children):
+                    child = children[child_index]
+                    child_index += 1
+                    if child not in index_of:
+                        work.append((node, child_index))
+                        work.append((child, 0))
+                        recurse = True
+                        break
+                    if child in on_stack:
+                        lowlink[node] = min(lowlink[node], index_of[child])
+                if recurse:
+                    continue
+
+                if lowlink[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1:
+                        components.append(sorted(component))
+
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+        return sorted(components)
+
+    def _parse(self, path: Path, content: str) -> Tuple[List[Link], Set[str]]:
+        """Parse and resolve all links and collect heading anchors in a document."""
+        links = []
+        anchors = set()
+        slug_counts: Counter = Counter()
+        in_code_block = False
+        # Link targets are resolved lexically (one document links to the
+        # same few targets many times, and resolve() costs syscalls)
+        directory = str(path.parent)
+        root = str(self.root)
+        targets: Dict[str, str] = {}
+
+        for line_number, line in enumerate(content.splitlines(), start=1):
+            if CODE_FENCE_PATTERN.match(line):
+                in_code_block = not in_code_block
+            elif not in_code_block:
+                heading = HEADING_PATTERN.match(line)
+                if heading:
+                    # Repeated headings get -1, -2, ... suffixes like on GitHub
+                    slug = heading_slug(heading.group(1))
+                    count = slug_counts[slug]
+                    slug_counts[slug] += 1
+                    anchors.add(f"{slug}-{count}" if count else slug)
+
+                for anchor in HTML_ANCHOR_PATTERN.findall(line):
+                    anchors.add(anchor.lower())
+
+            for match in LINK_PATTERN.finditer(line):
+                text, url = match.group(1), match.group(2)
+                start, end = link_destination(url)
+                destination = url[start:end]
+
+                if destination.startswith(EXTERNAL_PREFIXES):
+                    links.append(Link(line_number, text, url, external=True))
+                    continue
+
+                link_target, _, anchor = destination.partition('#')
+                target = None
+                if link_target:
+                    # Resolve relative to the linking document's directory
+                    # ("My%20Doc.md" links to "My Doc.md")
+                    target = targets.get(link_target)
+                    if target is None:
+                        target = os.path.normpath(os.path.join(directory, unquote(link_target)))
+                        if target.startswith(root + os.sep):
+                            target = target[len(root) + 1:]
+                        target = target.replace(os.sep, '/')
+                        targets[link_target] = target
+
+                links.append(Link(line_number, text, url, target, anchor or None))
+
+        return links, anchors
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[List[int]]:
+        """Get [mtime_ns, size] for a file, or None if it does not exist."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _set_node(self, node: str, entry: Optional[Dict]) -> None:
+        """Replace a node's entry, keeping the reverse index in sync."""
+        old = self._nodes.pop(node, None)
+        if old is not None:
+            for link in old['links']:
+                sources = self._inbound.get(link.target)
+                if sources is not None:
+                    sources.discard(node)
+                    if not sources:
+                        del self._inbound[link.target]
+
+        if entry is None:
+            return
+
+        self._nodes[node] = entry
+        for link in entry['links']:
+            if link.target is not None:
+                self._inbound.setdefault(link.target, set()).add(node)
+
+    def __len__(self) -> int:
+        """Return number of documents in the graph."""
+        return len(self._nodes)
+
+    def __contains__(self, path: Path) -> bool:
+        """Check if a document is in the graph."""
+        return self.node_id(path) in self._nodes
@@ -0,0 +1,426 @@
+"""
+Persistent index of document frontmatter.
+
+Each document's parsed frontmatter is stored with the hash of the file it
+was parsed from, so metadata queries (which documents have a field, which
+have a given tag, ...) are answered from the index instead of re-reading
+and re-parsing every document. Entries are refreshed only when a file's
+mtime/size or content hash changes; ChangeDetector keeps the index current
+as part of change detection. A reverse index from tags to documents is
+maintained alongside the entries, so tag-scoped runs can select their
+documents without opening the rest.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from src.utils.frontmatter import (
+    FrontmatterError,
+    atomic_write_text,
+    parse_frontmatter_text,
+    read_frontmatter_block
+)
+from src.utils.large_files import MMAP_THRESHOLD, hash_file
+
+# Keys of a condition besides 'field' (exactly one is required)
+CONDITION_KEYS = {'equals', 'not_equals', 'exists', 'missing', 'contains'}
+
+
+def validate_condition(condition: Any) -> None:
+    """
+    Check that a condition is well-formed.
+
+    Args:
+        condition: Condition mapping, e.g. {'field': 'status', 'equals': 'draft'}
+
+    Raises:
+        ValueError: If the condition is malformed
+    """
+    if not isinstance(condition, dict) or len(set(condition) & CONDITION_KEYS) != 1 \
+            or set(condition) - CONDITION_KEYS - {'field'}:
+        raise ValueError(
+            f"Condition must have one of: {', '.join(sorted(CONDITION_KEYS))} "
+            f"(and optionally 'field'), got {condition!r}"
+        )
+
+
+def condition_matches(
+    metadata: Dict[str, Any],
+    condition: Dict[str, Any],
+    default_field: Optional[str] = None
+) -> bool:
+    """
+    Evaluate a condition against a document's metadata.
+
+    A condition tests 'field' (default: default_field) with one of:
+    equals, not_equals, exists (true/false), missing (true/false) or
+    contains (list membership, or substring for strings).
+
+    Args:
+        metadata: Document metadata
+        condition: Condition mapping
+        default_field: Field tested when the condition names none
+
+    Returns:
+        True if the condition holds
+    """
+    field_name = condition.get('field', default_field)
+    present = field_name in metadata
+    value = metadata.get(field_name)
+
+    if 'equals' in condition:
+        return present and value == condition['equals']
+    if 'not_equals' in condition:
+        return not present or value != condition['not_equals']
+    if 'exists' in condition:
+        return present == bool(condition['exists'])
+    if 'missing' in condition:
+        return present != bool(condition['missing'])
+    return present and isinstance(value, (list, str)) and condition['contains'] in value
+
+
+def normalize_metadata(value: Any) -> Any:
+    """
+    Convert parsed YAML to its JSON form (dates and other scalars become strings).
+
+    Index entries and query values are normalized the same way, so a
+    comparison gives the same answer before and after the index is saved.
+
+    Args:
+        value: Parsed YAML value
+
+    Returns:
+        JSON-compatible value
+    """
+    return json.loads(json.dumps(value, default=str))
+
+
+class MetadataIndex:
+    """
+    Frontmatter of every indexed document, keyed by document.
+
+    Documents are identified by POSIX paths relative to the root (paths
+    outside the root keep their absolute POSIX form).
+    """
+
+    VERSION = "1.0.0"
+
+    def __init__(
+        self,
+        root: Path,
+        index_file: Optional[Path] = None,
+        large_file_threshold: int = MMAP_THRESHOLD
+    ):
+        """
+        Initialize and load the metadata index.
+
+        Args:
+            root: Repository root that document ids are relative to
+            index_file: Path to JSON file for persistence (None for in-memory only)
+            large_file_threshold: Size in bytes at or above which files are
+                hashed through a memory map
+        """
+        self.root = Path(os.path.abspath(root))
+        self.index_file = Path(index_file) if index_file else None
+        self.large_file_threshold = large_file_threshold
+
+        # node -> {'hash': file hash, 'stat': [mtime_ns, size] or None,
+        #          'frontmatter': bool, 'metadata': dict, 'error': str or None}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        # lowercased tag -> set of document ids with that tag
+        self._tags: Dict[str, Set[str]] = {}
+
+        self._load()
+
+    def _load(self) -> None:
+        """Load the index from disk if it was built for the same root."""
+        if self.index_file is None or not self.index_file.exists():
+            return
+
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            # A bad index file only costs a re-parse
+            return
+
+        if data.get('version') != self.VERSION or data.get('root') != self.root.as_posix():
+            return
+
+        for node, entry in data.get('documents', {}).items():
+            self._set_entry(node, entry)
+
+    def save(self) -> None:
+        """Write the index to disk atomically (see atomic_write_text)."""
+        if self.index_file is None:
+            return
+
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(self.index_file, json.dumps({
+            'version': self.VERSION,
+            'root': self.root.as_posix(),
+            'documents': self._entries
+        }))
+
+    def node_id(self, path: Path) -> str:
+        """
+        Get the document id for a path.
+
+        Args:
+            path: Filesystem path (absolute or relative to the working directory)
+
+        Returns:
+            POSIX path relative to the root, or absolute if outside the root
+        """
+        # Lexical, unlike Path.resolve(): queries map thousands of paths and
+        # realpath costs several syscalls per path
+        absolute = os.path.abspath(path)
+        root = str(self.root)
+        if absolute.startswith(root + os.sep):
+            absolute = absolute[len(root) + 1:]
+        return Path(absolute).as_posix()
+
+    def node_path(self, node: str) -> Path:
+        """Get the filesystem path for a document id."""
+        return self.root / node
+
+    def update(
+        self,
+        path: Path,
+        content_hash: Optional[str] = None,
+        stat: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
+        """
+        Refresh a document's entry, re-parsing only if its content changed.
+
+        Without content_hash, a file whose mtime and size match the entry is
+        not read at all. With it (e.g. from change detection), a matching
+        hash is enough. Only the frontmatter block is read to re-parse a
+        document; the rest is hashed without being loaded.
+
+        Args:
+            path: Path to the document
+            content_hash: SHA-256 of the file, if already known
+            stat: os.stat result for the file, if already known
+
+        Returns:
+            The document's entry
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        node = self.node_id(path)
+        stat = stat if stat is not None else Path(path).stat()
+        stat_key = [stat.st_mtime_ns, stat.st_size]
+
+        entry = self._entries.get(node)
+        if entry is not None:
+            if content_hash is None and entry['stat'] == stat_key:
+                return entry
+            if content_hash is not None and entry['hash'] == content_hash:
+                entry['stat'] = stat_key
+                return entry
+
+        if content_hash is None:
+            content_hash = hash_file(path, self.large_file_threshold)
+            if entry is not None and entry['hash'] == content_hash:
+                entry['stat'] = stat_key
+                return entry
+
+        entry = {'hash': content_hash, 'stat': stat_key, **self._parse(Path(path))}
+        self._set_entry(node, entry)
+        return entry
+
+    def refresh(self, paths: Iterable[Path]) -> int:
+        """
+        Bring the entries for a set of documents up to date.
+
+        Args:
+            paths: Documents to refresh
+
+        Returns:
+            Number of documents that were unreadable (left out of the index)
+        """
+        unreadable = 0
+        for path in paths:
+            try:
+                self.update(path)
+            except OSError:
+                self.remove(path)
+                unreadable += 1
+        return unreadable
+
+    def remove(self, path: Path) -> None:
+        """
+        Remove a document from the index.
+
+        Args:
+            path: Path to the document
+        """
+        self._set_entry(self.node_id(path), None)
+
+    def rename(self, old_path: Path, new_path: Path) -> None:
+        """
+        Move a document's entry to a new path.
+
+        Args:
+            old_path: Previous path
+            new_path: Current path
+        """
+        old_node, new_node = self.node_id(old_path), self.node_id(new_path)
+        entry = self._entries.get(old_node)
+        if entry is None:
+            return
+
+        self._set_entry(old_node, None)
+        # Keep an entry already refreshed at the new path
+        if new_node not in self._entries:
+            self._set_entry(new_node, entry)
+
+    def prune(self) -> List[str]:
+        """
+        Remove documents whose files no longer exist.
+
+        Returns:
+            List of removed document ids
+        """
+        removed = [node for node in self._entries if not self.node_path(node).exists()]
+        for node in removed:
+            self._set_entry(node, None)
+        return removed
+
+    def get(self, path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Get a document's entry.
+
+        Args:
+            path: Path to the document
+
+        Returns:
+            Entry with 'frontmatter', 'metadata' and 'error' keys, or None
+            if the document is not indexed
+        """
+        return self._entries.get(self.node_id(path))
+
+    def query(
+        self,
+        conditions: List[Dict[str, Any]],
+        paths: Optional[Iterable[Path]] = None
+    ) -> List[str]:
+        """
+        Find documents whose metadata satisfies every condition.
+
+        Documents whose frontmatter could not be parsed never match.
+
+        Args:
+            conditions: Conditions (see condition_matches), combined with AND
+            paths: Documents to consider (default: every indexed document)
+
+        Returns:
+            Sorted list of matching document ids
+        """
+        if paths is None:
+            nodes = self._entries.keys()
+        else:
+            nodes = [self.node_id(path) for path in paths]
+
+        matches = []
+        for node in nodes:
+            entry = self._entries.get(node)
+            if entry is None or entry['error'] is not None:
+                continue
+            if all(condition_matches(entry['metadata'], condition) for condition in conditions):
+                matches.append(node)
+
+        return sorted(matches)
+
+    def filter_by_tags(self, paths: Iterable[Path], tags: Iterable[str]) -> List[Path]:
+        """
+        Select the documents that have any of the given tags.
+
+        The documents are refreshed first, which only reads files whose
+        mtime or size changed since they were indexed.
+
+        Args:
+            paths: Candidate documents
+            tags: Tags to match (case-insensitive)
+
+        Returns:
+            Matching documents, in the order given
+        """
+        paths = list(paths)
+        self.refresh(paths)
+
+        wanted: Set[str] = set()
+        for tag in tags:
+            wanted |= self._tags.get(tag.strip().lower(), set())
+
+        return [path for path in paths if self.node_id(path) in wanted]
+
+    def documents_with_tag(self, tag: str) -> List[str]:
+        """
+        Get the indexed documents that have a tag.
+
+        Args:
+            tag: Tag to look up (case-insensitive)
+
+        Returns:
+            Sorted list of document ids
+        """
+        return sorted(self._tags.get(tag.strip().lower(), ()))
+
+    def _set_entry(self, node: str, entry: Optional[Dict[str, Any]]) -> None:
+        """Replace (or remove, if entry is None) a document's entry and tag postings."""
+        previous = self._entries.pop(node, None)
+        if previous is not None:
+            for tag in self._entry_tags(previous):
+                postings = self._tags.get(tag)
+                if postings is not None:
+                    postings.discard(node)
+                    if not postings:
+                        del self._tags[tag]
+
+        if entry is not None:
+            self._entries[node] = entry
+            for tag in self._entry_tags(entry):
+                self._tags.setdefault(tag, set()).add(node)
+
+    @staticmethod
+    def _entry_tags(entry: Dict[str, Any]) -> Set[str]:
+        """Get an entry's lowercased tags (a string tags field counts as one tag)."""
+        tags = entry.get('metadata', {}).get('tags')
+        if isinstance(tags, str):
+            tags = [tags]
+        if not isinstance(tags, list):
+            return set()
+        return {str(tag).strip().lower() for tag in tags if tag is not None}
+
+    @staticmethod
+    def _parse(path: Path) -> Dict[str, Any]:
+        """
+        Parse a document's frontmatter into the indexed fields.
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        try:
+            frontmatter_block = read_frontmatter_block(path)
+            metadata = parse_frontmatter_text(frontmatter_block) if frontmatter_block else {}
+        except (FrontmatterError, UnicodeDecodeError) as e:
+            return {'frontmatter': True, 'metadata': {}, 'error': str(e)}
+
+        return {
+            'frontmatter': bool(frontmatter_block),
+            'metadata': normalize_metadata(metadata),
+            'error': None
+        }
+
+    def __len__(self) -> int:
+        """Get number of indexed documents."""
+        return len(self._entries)
+
+    def __contains__(self, path: Path) -> bool:
+        """Check if a document is indexed."""
+        return self.node_id(path) in self._entries
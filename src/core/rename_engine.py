@@ -0,0 +1,579 @@
+"""
+Bulk renames for naming violations, with corpus-wide link rewriting.
+
+A rename plan is built from the NAME-001/NAME-002 suggestions of
+NamingValidator for files and the directories above them. Documents that
+link to a renamed path are found through the link graph's reverse index,
+and each referencing document is rewritten in one pass that updates all of
+its affected links. Rewrites run in a thread pool; the original content of
+every rewritten document and every rename are recorded in one backup run,
+so the whole operation can be rolled back like an auto-fix run.
+"""
+
+import os
+import posixpath
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import unquote
+
+from src.core.backup_store import BackupError, BackupStore
+from src.core.link_graph import LinkGraph, link_destination
+from src.core.validators.naming_validator import NamingValidator
+from src.utils.frontmatter import atomic_write_text
+from src.utils.logger import Logger
+from src.utils.patch import unified_diff
+
+
+@dataclass
+class Rename:
+    """
+    One planned rename.
+
+    Attributes:
+        source: Path before the rename
+        target: Path after the rename (same parent directory)
+        directory: True if a directory is renamed
+    """
+    source: Path
+    target: Path
+    directory: bool = False
+
+
+@dataclass
+class LinkRewrite:
+    """
+    A link to update in a referencing document.
+
+    Attributes:
+        line_number: Line the link appears on (1-indexed)
+        old_url: Link URL as written
+        new_url: URL pointing at the renamed path
+    """
+    line_number: int
+    old_url: str
+    new_url: str
+
+
+@dataclass
+class RenamePlan:
+    """
+    Renames to apply and the link rewrites they require.
+
+    Renames are listed in the order they are applied: files first, then
+    directories deepest first. Each source and target is given as it is at
+    the time of that rename (a file in a renamed directory is renamed
+    within the directory's old path).
+
+    Attributes:
+        root: Repository root
+        documents: Documents the plan was built from
+        renames: Renames in application order
+        rewrites: Referencing document -> links to rewrite
+        skipped: Paths that will not be renamed, with the reason
+        renamed: Node id (POSIX path relative to root) -> new name, for
+            every planned rename
+    """
+    root: Path
+    documents: List[Path] = field(default_factory=list)
+    renames: List[Rename] = field(default_factory=list)
+    rewrites: Dict[Path, List[LinkRewrite]] = field(default_factory=dict)
+    skipped: Dict[str, str] = field(default_factory=dict)
+    renamed: Dict[str, str] = field(default_factory=dict)
+
+    def final_path(self, path: Path) -> Path:
+        """
+        Get where a path ends up once every rename is applied.
+
+        Args:
+            path: Path before the renames
+
+        Returns:
+            Path after the renames (unchanged if nothing above it moves)
+        """
+        resolved = Path(path).resolve()
+        try:
+            node = resolved.relative_to(self.root).as_posix()
+        except ValueError:
+            return Path(path)
+
+        return self.root / final_node(node, self.renamed)
+
+    @property
+    def link_count(self) -> int:
+        """Total number of links to rewrite."""
+        return sum(len(rewrites) for rewrites in self.rewrites.values())
+
+
+@dataclass
+class RenamePreview:
+    """
+    Preview of the changes to one file.
+
+    Attributes:
+        file_path: File before the renames
+        new_path: Path the file moves to, if it moves
+        links: Number of links rewritten in the file
+        error: Error message if the file could not be read
+    """
+    file_path: Path
+    new_path: Optional[Path] = None
+    links: int = 0
+    error: Optional[str] = None
+
+
+@dataclass
+class RenameResult:
+    """
+    Result of applying a rename plan.
+
+    Attributes:
+        renamed: (old path, new path) pairs, in the order applied
+        rewritten: Documents whose links were rewritten -> number of links
+        failed: Paths that could not be rewritten or renamed, with the error
+        run_id: Backup run recording the changes (None if nothing changed)
+    """
+    renamed: List[Tuple[Path, Path]] = field(default_factory=list)
+    rewritten: Dict[Path, int] = field(default_factory=dict)
+    failed: Dict[str, str] = field(default_factory=dict)
+    run_id: Optional[str] = None
+
+
+def final_node(node: str, renamed: Dict[str, str]) -> str:
+    """
+    Get the node id a path has once every rename is applied.
+
+    Args:
+        node: Node id before the renames
+        renamed: Node id -> new name
+
+    Returns:
+        Node id after the renames
+    """
+    parts = node.split('/')
+    current = ''
+    for i, part in enumerate(parts):
+        current = f"{current}/{part}" if current else part
+        parts[i] = renamed.get(current, part)
+    return '/'.join(parts)
+
+
+def rewrite_url(url: str, source_dir: str, renamed: Dict[str, str]) -> str:
+    """
+    Point a relative link URL at renamed paths.
+
+    Each path segment of the link's destination is resolved against the
+    linking document's directory and replaced if the path it names is
+    renamed, so the URL keeps its shape ('../', './', <brackets>, fragment,
+    title) and only renamed segments change.
+
+    Args:
+        url: Link URL as written
+        source_dir: Node id of the linking document's directory ('' for root)
+        renamed: Node id -> new name
+
+    Returns:
+        Rewritten URL (unchanged if it names no renamed path)
+    """
+    start, end = link_destination(url)
+    link_target, separator, anchor = url[start:end].partition('#')
+    if not link_target or link_target.startswith('/'):
+        return url
+
+    segments = link_target.split('/')
+    current = source_dir
+    for i, segment in enumerate(segments):
+        if not segment:
+            continue
+        current = posixpath.normpath(posixpath.join(current, unquote(segment)))
+        # '.' and '..' are relative to the linking document, which moves
+        # with its directory
+        new_name = renamed.get(current) if segment not in ('.', '..') else None
+        if new_name is not None:
+            segments[i] = new_name
+
+    return url[:start] + '/'.join(segments) + separator + anchor + url[end:]
+
+
+class RenameEngine:
+    """
+    Plans and applies renames for naming violations across a corpus.
+
+    Attributes:
+        naming_validator: Source of rename suggestions
+        link_graph: Corpus link graph (its reverse index finds referencing
+            documents)
+        backup_store: Store the run's backups and renames are recorded in
+    """
+
+    def __init__(
+        self,
+        naming_validator: NamingValidator,
+        link_graph: LinkGraph,
+        backup_store: BackupStore,
+        logger: Logger
+    ):
+        """
+        Initialize rename engine.
+
+        Args:
+            naming_validator: Naming validator providing rename suggestions
+            link_graph: Link graph rooted at the repository root
+            backup_store: Backup store for rollback
+            logger: Logger for diagnostic messages
+        """
+        self.naming_validator = naming_validator
+        self.link_graph = link_graph
+        self.backup_store = backup_store
+        self.logger = logger
+
+    def plan(self, documents: List[Path], base_path: Path) -> RenamePlan:
+        """
+        Build the rename plan for a corpus of documents.
+
+        Files under base_path are renamed to their suggested filename and
+        directories below base_path to their suggested name; links to them
+        are rewritten in every document of the corpus. A rename is skipped
+        if another file already has the new name, two paths would get the
+        same name, or a link to the path could not be rewritten to follow it.
+
+        Args:
+            documents: Every document that may link to a renamed path
+                (normally all documents under the link graph's root)
+            base_path: Directory whose files and subdirectories are renamed
+
+        Returns:
+            RenamePlan with renames in application order and link rewrites
+        """
+        plan = RenamePlan(root=self.link_graph.root, documents=list(documents))
+        if not self.naming_validator.enabled:
+            return plan
+
+        # Bring the graph up to date; unchanged documents are not re-read
+        for doc in documents:
+            try:
+                self.link_graph.update(doc)
+            except (OSError, UnicodeDecodeError) as e:
+                self.logger.warning(f"Cannot read links in {doc}: {e}")
+        self.link_graph.prune()
+
+        candidates: Dict[str, str] = {}
+        directories = set()
+        base_path = base_path.resolve()
+        for doc in documents:
+            doc = doc.resolve()
+            if not doc.is_relative_to(base_path):
+                continue
+            suggestions = self.naming_validator.get_rename_suggestions(doc, base_path)
+            if 'filename' in suggestions:
+                candidates[self.link_graph.node_id(doc)] = suggestions['filename']
+            for directory, new_name in suggestions.get('directories', {}).items():
+                # Suggestions are relative to base_path, node ids to the graph's root
+                node = self.link_graph.node_id(base_path / directory)
+                candidates[node] = new_name
+                directories.add(node)
+
+        plan.renamed = self._resolve_conflicts(candidates, plan.skipped)
+
+        while True:
+            files = sorted(node for node in plan.renamed if node not in directories)
+            # Deepest directories first, so each rename happens inside its
+            # parent's old path
+            ordered_directories = sorted(
+                (node for node in plan.renamed if node in directories),
+                key=lambda node: (-node.count('/'), node)
+            )
+            plan.rewrites, blocked = self._plan_rewrites(plan, files, ordered_directories)
+            if not blocked:
+                break
+            # Renames would leave these links broken; drop them and replan,
+            # since the remaining rewrites depend on what is renamed
+            for node, reason in blocked.items():
+                plan.renamed.pop(node, None)
+                plan.skipped[node] = reason
+
+        for node in files + ordered_directories:
+            source = self.link_graph.node_path(node)
+            plan.renames.append(Rename(
+                source=source,
+                target=source.with_name(plan.renamed[node]),
+                directory=node in directories
+            ))
+
+        return plan
+
+    def _resolve_conflicts(self, candidates: Dict[str, str], skipped: Dict[str, str]) -> Dict[str, str]:
+        """
+        Drop renames whose new name is taken.
+
+        Args:
+            candidates: Node id -> suggested new name
+            skipped: Receives skipped node ids with the reason
+
+        Returns:
+            Node id -> new name for the renames that can be applied
+        """
+        by_target: Dict[str, List[str]] = defaultdict(list)
+        for node, new_name in candidates.items():
+            by_target[posixpath.join(posixpath.dirname(node), new_name)].append(node)
+
+        accepted = {}
+        for target, nodes in by_target.items():
+            if len(nodes) > 1:
+                for node in nodes:
+                    skipped[node] = f"'{target}' would also be the new name of {len(nodes) - 1} other path(s)"
+                continue
+
+            node = nodes[0]
+            source, target_path = self.link_graph.node_path(node), self.link_graph.node_path(target)
+            # A case-only rename on a case-insensitive filesystem finds itself
+            if target_path.exists() and not os.path.samefile(source, target_path):
+                skipped[node] = f"'{target}' already exists"
+                continue
+
+            accepted[node] = candidates[node]
+
+        return accepted
+
+    def _plan_rewrites(
+        self,
+        plan: RenamePlan,
+        files: List[str],
+        directories: List[str]
+    ) -> Tuple[Dict[Path, List[LinkRewrite]], Dict[str, str]]:
+        """
+        Find the links that point at renamed paths, grouped by document.
+
+        Every rewritten URL is checked to resolve, from the linking
+        document's new location, to the target's new path. Links that
+        cannot be rewritten block the renames of the paths they go through.
+
+        Args:
+            plan: Plan with its renamed mapping filled in
+            files: Renamed file node ids
+            directories: Renamed directory node ids
+
+        Returns:
+            Tuple of (referencing document -> links to rewrite by line,
+            blocked node id -> reason)
+        """
+        inbound = []
+        for node in files:
+            inbound.extend(self.link_graph.links_to(self.link_graph.node_path(node)))
+        inbound.extend(self.link_graph.links_under(
+            self.link_graph.node_path(node) for node in directories
+        ))
+
+        by_source: Dict[str, Dict[Tuple[int, str], str]] = defaultdict(dict)
+        blocked: Dict[str, str] = {}
+        for source, link in inbound:
+            new_url = rewrite_url(link.url, posixpath.dirname(source), plan.renamed)
+            if self._resolves_to(new_url, source, link.target, plan.renamed):
+                if new_url != link.url:
+                    by_source[source][(link.line_number, link.url)] = new_url
+                continue
+
+            reason = f"link '{link.url}' in {source}:{link.line_number} cannot be rewritten"
+            self.logger.warning(f"Rename skipped: {reason}")
+            for node in self._ancestors(link.target) + self._ancestors(source):
+                if node in plan.renamed:
+                    blocked.setdefault(node, reason)
+
+        grouped = {
+            self.link_graph.node_path(source): [
+                LinkRewrite(line_number, old_url, new_url)
+                for (line_number, old_url), new_url in sorted(rewrites.items())
+            ]
+            for source, rewrites in sorted(by_source.items())
+        }
+        return grouped, blocked
+
+    @staticmethod
+    def _ancestors(node: str) -> List[str]:
+        """Get a node id and the node ids of its parent directories."""
+        parts = node.split('/')
+        return ['/'.join(parts[:i]) for i in range(len(parts), 0, -1)]
+
+    @staticmethod
+    def _resolves_to(url: str, source: str, target: str, renamed: Dict[str, str]) -> bool:
+        """Check that a URL in source points at target once the renames are applied."""
+        start, end = link_destination(url)
+        link_target = url[start:end].partition('#')[0]
+        source_dir = posixpath.dirname(final_node(source, renamed))
+        resolved = posixpath.normpath(posixpath.join(source_dir, unquote(link_target)))
+        return resolved == final_node(target, renamed)
+
+    @staticmethod
+    def _rewrite_document(
+        file_path: Path,
+        rewrites: List[LinkRewrite]
+    ) -> Tuple[bytes, str, str, int]:
+        """
+        Apply a document's link rewrites in memory, in one pass.
+
+        Returns:
+            Tuple of (raw bytes, original text, rewritten text, links rewritten)
+
+        Raises:
+            OSError: If the file cannot be read
+            UnicodeDecodeError: If the file is not valid UTF-8
+            ValueError: If a planned link is no longer on its recorded line
+                (the document changed since the plan was made)
+        """
+        raw_content = file_path.read_bytes()
+        original = raw_content.decode('utf-8')
+        # Same line numbering as the link graph
+        lines = original.splitlines(keepends=True)
+
+        count = 0
+        for rewrite in rewrites:
+            index = rewrite.line_number - 1
+            old_link = f"]({rewrite.old_url})"
+            if index >= len(lines) or old_link not in lines[index]:
+                raise ValueError(
+                    f"link '{rewrite.old_url}' no longer found on line {rewrite.line_number}"
+                )
+            count += lines[index].count(old_link)
+            lines[index] = lines[index].replace(old_link, f"]({rewrite.new_url})")
+
+        return raw_content, original, ''.join(lines), count
+
+    def iter_previews(
+        self,
+        plan: RenamePlan,
+        root: Optional[Path] = None
+    ) -> Iterator[Tuple[RenamePreview, str]]:
+        """
+        Preview a plan one file at a time, without changing anything.
+
+        Every file that moves (including all files inside renamed
+        directories) gets git rename headers; referencing documents get
+        hunks for their rewritten links.
+
+        Args:
+            plan: Rename plan
+            root: Directory diff paths are relative to (default: current directory)
+
+        Yields:
+            (RenamePreview, unified diff) for each affected file, by path
+        """
+        moves: Dict[Path, Path] = {}
+        for rename in plan.renames:
+            if rename.directory:
+                for dirpath, _, filenames in os.walk(rename.source):
+                    for filename in filenames:
+                        path = Path(dirpath) / filename
+                        moves[path] = plan.final_path(path)
+            else:
+                moves[rename.source] = plan.final_path(rename.source)
+
+        for path in sorted(set(moves) | set(plan.rewrites)):
+            preview = RenamePreview(file_path=path, new_path=moves.get(path))
+            original = modified = ''
+
+            if path in plan.rewrites:
+                try:
+                    _, original, modified, preview.links = self._rewrite_document(path, plan.rewrites[path])
+                except (OSError, ValueError) as e:
+                    preview.error = str(e)
+                    yield preview, ''
+                    continue
+
+            yield preview, unified_diff(path, original, modified, root, new_path=preview.new_path)
+
+    def apply(self, plan: RenamePlan, jobs: int = 1) -> RenameResult:
+        """
+        Rewrite referencing documents, then perform the renames.
+
+        All rewrites are computed before anything is written; if any
+        referencing document cannot be read or no longer contains a planned
+        link, nothing is changed. Documents
+        are rewritten concurrently when jobs > 1. If a rewrite cannot be
+        written, the renames are not performed, so no link is left pointing
+        at a name that does not exist. Backups of rewritten documents and
+        the renames share one backup run.
+
+        Args:
+            plan: Rename plan
+            jobs: Number of parallel workers
+
+        Returns:
+            RenameResult with renamed paths, rewritten documents and failures
+        """
+        result = RenameResult()
+        items = list(plan.rewrites.items())
+
+        def run_all(function, work):
+            if jobs > 1 and len(work) > 1:
+                with ThreadPoolExecutor(max_workers=jobs) as executor:
+                    return list(executor.map(function, work))
+            return [function(item) for item in work]
+
+        def prepare(item):
+            file_path, rewrites = item
+            try:
+                return self._rewrite_document(file_path, rewrites), None
+            except (OSError, ValueError) as e:
+                return None, str(e)
+
+        prepared = []
+        for (file_path, _), (rewritten, error) in zip(items, run_all(prepare, items)):
+            if error is not None:
+                result.failed[str(file_path)] = error
+            elif rewritten[3]:
+                prepared.append((file_path, rewritten))
+
+        if result.failed:
+            self.logger.error(
+                f"Rename aborted: {len(result.failed)} referencing document(s) cannot be rewritten"
+            )
+            return result
+
+        run = self.backup_store.start_run()
+
+        def write(item):
+            file_path, (raw_content, _, new_content, _) = item
+            try:
+                run.backup(file_path, raw_content)
+                atomic_write_text(file_path, new_content)
+                run.record_result(file_path, new_content.encode('utf-8'))
+            except (BackupError, OSError) as e:
+                return str(e)
+            return None
+
+        for (file_path, rewritten), error in zip(prepared, run_all(write, prepared)):
+            if error is not None:
+                result.failed[str(file_path)] = error
+            else:
+                result.rewritten[file_path] = rewritten[3]
+
+        if result.failed:
+            self.logger.error("Renames not performed: some referencing documents could not be written")
+        else:
+            for rename in plan.renames:
+                try:
+                    os.rename(rename.source, rename.target)
+                except OSError as e:
+                    result.failed[str(rename.source)] = str(e)
+                    continue
+                run.record_rename(rename.source, rename.target)
+                result.renamed.append((rename.source, rename.target))
+                self.logger.info(f"Renamed {rename.source} -> {rename.target}")
+
+        if run.save() is not None:
+            result.run_id = run.run_id
+            self.logger.info(f"Saved backup run {run.run_id}")
+
+        self._refresh_link_graph(plan)
+        return result
+
+    def _refresh_link_graph(self, plan: RenamePlan) -> None:
+        """Move the graph's entries to the documents' new paths."""
+        self.link_graph.prune()
+        for doc in plan.documents:
+            try:
+                self.link_graph.update(plan.final_path(doc))
+            except (OSError, UnicodeDecodeError):
+                continue
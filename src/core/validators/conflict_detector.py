@@ -6,13 +6,31 @@ including metadata conflicts, pricing conflicts, and cross-reference issues.
 """
 
 from pathlib import Path
-from typing import List, Dict, Set, Optional, Tuple
+from typing import Any, Iterable, Iterator, List, Dict, Set, Optional, Tuple
 from collections import defaultdict
+from fnmatch import fnmatch
+import hashlib
 import re
 
 from src.utils.config import Config
 from src.utils.logger import Logger
-from src.utils.frontmatter import parse_frontmatter, has_frontmatter
+from src.utils.frontmatter import (
+    FrontmatterError,
+    parse_frontmatter_text,
+    read_frontmatter_block,
+    split_frontmatter
+)
+from src.utils.fuzzy_index import FuzzyIndex
+from src.utils.keyword_matcher import KeywordMatcher
+from src.utils.large_files import is_large_file, iter_lines, large_file_threshold
+from src.core.link_graph import LinkGraph
+from src.utils.minhash import (
+    MinHasher,
+    LSHIndex,
+    SignatureCache,
+    shingle_hashes,
+    estimate_similarity
+)
 from src.core.validators.yaml_validator import ValidationIssue, ValidationSeverity
 
 
@@ -22,21 +40,35 @@ class ConflictDetector:
 
     Implements validation rules:
     - CONFLICT-001: Status value conflicts (non-standard values, case mismatches)
-    - CONFLICT-002: Tag synonym conflicts (same concept, different tag)
+    - CONFLICT-002: Tag synonym conflicts (same concept, different tag),
+      including fuzzy variants such as misspellings and separator changes
     - CONFLICT-003: Pricing conflicts (inconsistent pricing information)
     - CONFLICT-004: Cross-reference validation (links to deprecated docs)
+    - CONFLICT-005: Near-duplicate documents (MinHash + LSH similarity)
+    - CONFLICT-006: Duplicate blocks (paragraphs/list items repeated across docs)
+    - CONFLICT-007: Orphan documents (no inbound links, off by default)
+    - CONFLICT-008: Link cycles (documents linking in a loop, off by default)
     """
 
-    def __init__(self, config: Config, logger: Logger):
+    def __init__(
+        self,
+        config: Config,
+        logger: Logger,
+        link_graph: Optional[LinkGraph] = None
+    ):
         """
         Initialize conflict detector.
 
         Args:
             config: Configuration object with validation settings
             logger: Logger for diagnostic messages
+            link_graph: Shared corpus link graph (one is built per base path
+                if not provided)
         """
         self.config = config
         self.logger = logger
+        self.link_graph = link_graph
+        self._link_graphs: Dict[Path, LinkGraph] = {}
 
         # Load conflict detection settings from config
         self.enabled = config.get('validation.conflicts.enabled', True)
@@ -55,12 +87,85 @@ class ConflictDetector:
             }
         )
 
+        # Fuzzy tag variant clustering (CONFLICT-002)
+        self.fuzzy_tags_enabled = config.get('validation.conflicts.fuzzy_tags.enabled', True)
+        self.fuzzy_tags_max_distance = config.get(
+            'validation.conflicts.fuzzy_tags.max_distance', 1
+        )
+        self.fuzzy_tags_min_length = config.get(
+            'validation.conflicts.fuzzy_tags.min_length', 5
+        )
+
         # Pricing patterns to extract
         self.pricing_patterns = [
             r'\$\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:/|per)?\s*(month|mo|year|yr)',  # $99/month, $1,200 per year
             r'(\d+(?:,\d{3})*(?:\.\d{2})?)\s*dollars?\s*(?:/|per)?\s*(month|mo|year|yr)',  # 99 dollars/month
         ]
 
+        # All pricing patterns compiled into a single alternation so each
+        # document is scanned once. Pattern N contributes groups 2N+1 (amount)
+        # and 2N+2 (unit).
+        self.pricing_regex = re.compile(
+            '|'.join(f'(?:{pattern})' for pattern in self.pricing_patterns),
+            re.IGNORECASE
+        )
+
+        # Product catalog used to attribute prices, compiled once per run.
+        # Entries are either a plain name or a mapping with name, aliases
+        # and paths (directory names or globs the product is scoped to).
+        self.default_product_paths = config.get(
+            'validation.conflicts.product_paths',
+            ['pricing', 'sales']
+        )
+        self.products = self._load_product_catalog(
+            config.get(
+                'validation.conflicts.products',
+                ['basic', 'standard', 'premium', 'pro', 'enterprise', 'starter']
+            )
+        )
+        self.product_matcher = KeywordMatcher({
+            keyword: index
+            for index, product in enumerate(self.products)
+            for keyword in product['keywords']
+        })
+
+        # Near-duplicate detection settings (CONFLICT-005)
+        self.near_duplicates_enabled = config.get(
+            'validation.conflicts.near_duplicates.enabled', True
+        )
+        self.near_duplicate_threshold = config.get(
+            'validation.conflicts.near_duplicates.threshold', 0.8
+        )
+        self.shingle_size = config.get('validation.conflicts.near_duplicates.shingle_size', 5)
+        self.min_shingles = config.get('validation.conflicts.near_duplicates.min_shingles', 20)
+        self.num_perm = config.get('validation.conflicts.near_duplicates.num_perm', 128)
+        self.lsh_bands = config.get('validation.conflicts.near_duplicates.bands', 32)
+        self.signature_cache_file = config.get_state_path(
+            'validation.conflicts.near_duplicates.signature_cache'
+        )
+
+        # Duplicate block detection settings (CONFLICT-006)
+        self.duplicate_blocks_enabled = config.get(
+            'validation.conflicts.duplicate_blocks.enabled', True
+        )
+        self.duplicate_block_min_length = config.get(
+            'validation.conflicts.duplicate_blocks.min_length', 80
+        )
+
+        # Link graph reports (CONFLICT-007, CONFLICT-008)
+        self.orphans_enabled = config.get('validation.conflicts.orphans.enabled', False)
+        self.orphan_ignore_patterns = config.get(
+            'validation.conflicts.orphans.ignore',
+            ['README.md', 'index.md']
+        )
+        self.link_cycles_enabled = config.get(
+            'validation.conflicts.link_cycles.enabled', False
+        )
+
+        # Documents at or above this size are not kept in memory between
+        # detectors (processing.large_file_threshold_mb)
+        self.large_file_threshold = large_file_threshold(config)
+
     def detect_conflicts(
         self,
         file_paths: List[Path],
@@ -90,7 +195,11 @@ class ConflictDetector:
             'status': self._detect_status_conflicts(documents),
             'tags': self._detect_tag_conflicts(documents),
             'pricing': self._detect_pricing_conflicts(documents),
-            'cross_references': self._detect_cross_reference_conflicts(documents, base_path)
+            'cross_references': self._detect_cross_reference_conflicts(documents, base_path),
+            'near_duplicates': self._detect_near_duplicates(documents),
+            'duplicate_blocks': self._detect_duplicate_blocks(documents),
+            'orphans': self._detect_orphans(documents, base_path),
+            'link_cycles': self._detect_link_cycles(documents, base_path)
         }
 
         # Flatten into single list
@@ -109,8 +218,9 @@ class ConflictDetector:
         Returns list of document dictionaries with:
         - path: Path to document
         - metadata: Parsed frontmatter (or empty dict)
-        - content: Full document content
-        - content_lines: List of content lines for line number tracking
+        - frontmatter: Frontmatter block ('' if none)
+        - content: Full document content, or None for large documents,
+          which are only read while a detector needs them (see _content)
         """
         documents = []
 
@@ -119,22 +229,27 @@ class ConflictDetector:
                 if not file_path.exists():
                     continue
 
-                content = file_path.read_text(encoding='utf-8')
-                content_lines = content.splitlines()
+                # Each document is read once; of large documents only the
+                # frontmatter block is read here
+                if is_large_file(file_path, self.large_file_threshold):
+                    content = None
+                    frontmatter_block = read_frontmatter_block(file_path)
+                else:
+                    content = file_path.read_text(encoding='utf-8')
+                    frontmatter_block, _ = split_frontmatter(content)
 
-                # Try to parse frontmatter
                 metadata = {}
-                if has_frontmatter(file_path):
+                if frontmatter_block:
                     try:
-                        metadata = parse_frontmatter(file_path)
-                    except Exception as e:
+                        metadata = parse_frontmatter_text(frontmatter_block)
+                    except FrontmatterError as e:
                         self.logger.warning(f"Could not parse frontmatter in {file_path}: {e}")
 
                 documents.append({
                     'path': file_path,
                     'metadata': metadata,
-                    'content': content,
-                    'content_lines': content_lines
+                    'frontmatter': frontmatter_block,
+                    'content': content
                 })
 
             except Exception as e:
@@ -142,6 +257,34 @@ class ConflictDetector:
 
         return documents
 
+    def _content(self, doc: Dict) -> str:
+        """
+        Get a document's full text.
+
+        Large documents are read on each call instead of being kept, so at
+        most one of them is in memory at a time.
+
+        Args:
+            doc: Loaded document
+
+        Returns:
+            Document text ('' if a large document can no longer be read)
+        """
+        if doc['content'] is not None:
+            return doc['content']
+
+        try:
+            return doc['path'].read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            self.logger.error(f"Error loading document {doc['path']}: {e}")
+            return ''
+
+    def _lines(self, doc: Dict) -> Iterable[str]:
+        """Get a document's lines, streamed from disk for large documents."""
+        if doc['content'] is not None:
+            return doc['content'].splitlines()
+        return iter_lines(doc['path'])
+
     def _get_line_number(self, content: str, char_position: int) -> int:
         """
         Convert character position to line number.
@@ -201,7 +344,7 @@ class ConflictDetector:
                 status = metadata['status']
                 if isinstance(status, str):
                     # Find line number where status field is defined
-                    line_num = self._find_yaml_field_line(doc['content_lines'], 'status')
+                    line_num = self._find_yaml_field_line(doc['frontmatter'].splitlines(), 'status')
                     status_variations[status].append((doc['path'], line_num))
 
         # Check for case variations of same status
@@ -257,7 +400,7 @@ class ConflictDetector:
             metadata = doc['metadata']
             if 'tags' in metadata and isinstance(metadata['tags'], list):
                 # Find line number where tags field is defined
-                line_num = self._find_yaml_field_line(doc['content_lines'], 'tags')
+                line_num = self._find_yaml_field_line(doc['frontmatter'].splitlines(), 'tags')
                 for tag in metadata['tags']:
                     if isinstance(tag, str):
                         tag_usage[tag.lower()].append((doc['path'], line_num))
@@ -280,6 +423,84 @@ class ConflictDetector:
                         suggestion=f"Standardize to canonical form: '{canonical}'"
                     ))
 
+        if self.fuzzy_tags_enabled:
+            issues.extend(self._detect_fuzzy_tag_variants(tag_usage))
+
+        return issues
+
+    def _detect_fuzzy_tag_variants(
+        self,
+        tag_usage: Dict[str, List[Tuple[Path, Optional[int]]]]
+    ) -> List[ValidationIssue]:
+        """
+        Cluster tags that look like variants of each other.
+
+        Tags are grouped when they are equal after removing separators
+        ('go-high-level' and 'gohighlevel') or within a small edit distance
+        ('onbaording' and 'onboarding'). Candidate pairs come from a
+        deletion index, so the vocabulary is never compared pairwise.
+
+        Args:
+            tag_usage: Mapping of lowercased tag to (path, line) usages
+
+        Returns:
+            One INFO issue per candidate synonym group
+        """
+        issues = []
+
+        # Tags sharing a separator-free key are variants outright
+        tags_by_key = defaultdict(list)
+        for tag in tag_usage:
+            key = re.sub(r'[\s_\-]+', '', tag)
+            if key:
+                tags_by_key[key].append(tag)
+
+        # Union-find over keys, joined by near-identical spellings
+        parent = {key: key for key in tags_by_key}
+
+        def find(key: str) -> str:
+            while parent[key] != key:
+                parent[key] = parent[parent[key]]
+                key = parent[key]
+            return key
+
+        index = FuzzyIndex(max_distance=self.fuzzy_tags_max_distance)
+        for key in tags_by_key:
+            # Short keys are too close to each other to compare meaningfully
+            if len(key) >= self.fuzzy_tags_min_length:
+                index.add(key)
+
+        for key_a, key_b, _ in index.similar_pairs():
+            root_a, root_b = find(key_a), find(key_b)
+            if root_a != root_b:
+                parent[root_b] = root_a
+
+        groups = defaultdict(list)
+        for key, tags in tags_by_key.items():
+            groups[find(key)].extend(tags)
+
+        for tags in groups.values():
+            if len(tags) < 2:
+                continue
+
+            # Most-used variant first; it is the suggested canonical form
+            ranked = sorted(tags, key=lambda t: (-len(tag_usage[t]), t))
+            canonical = ranked[0]
+            first_path, first_line = tag_usage[ranked[1]][0]
+            variants = ', '.join(f"'{tag}' ({len(tag_usage[tag])})" for tag in ranked)
+
+            issues.append(ValidationIssue(
+                rule_id="CONFLICT-002",
+                severity=ValidationSeverity.INFO,
+                message=f"Possible tag variants: {variants}",
+                file_path=first_path,
+                line_number=first_line,
+                suggestion=(
+                    f"Standardize to '{canonical}' or add the variants to "
+                    f"validation.conflicts.tag_synonyms"
+                )
+            ))
+
         return issues
 
     def _detect_pricing_conflicts(self, documents: List[Dict]) -> List[ValidationIssue]:
@@ -293,36 +514,53 @@ class ConflictDetector:
         pricing_mentions = defaultdict(list)  # product_context -> list of pricing info
 
         for doc in documents:
-            content = doc['content']
+            content = self._content(doc)
             path = doc['path']
 
-            # Extract pricing mentions from content
-            for pattern in self.pricing_patterns:
-                for match in re.finditer(pattern, content, re.IGNORECASE):
-                    amount = match.group(1).replace(',', '')  # Remove commas
-                    unit = match.group(2).lower()
-
-                    # Normalize to monthly price
-                    price_monthly = self._normalize_to_monthly(float(amount), unit)
-
-                    # Calculate line number for this match
-                    line_num = self._get_line_number(content, match.start())
-
-                    # Try to extract context (nearby words)
-                    start = max(0, match.start() - 50)
-                    end = min(len(content), match.end() + 50)
-                    context = content[start:end].lower()
-
-                    # Simple product identification (can be enhanced)
-                    product = self._identify_product_from_context(context, path)
+            # Cheap prefilter: every pricing pattern needs '$' or 'dollar'
+            content_lower = content.lower()
+            if '$' not in content and 'dollar' not in content_lower:
+                continue
 
-                    pricing_mentions[product].append({
-                        'price': price_monthly,
-                        'original': match.group(0),
-                        'path': path,
-                        'line_number': line_num,
-                        'context': context
-                    })
+            # Products whose path scope covers this document
+            in_scope = self._products_in_scope(path)
+
+            # Line numbers are tracked incrementally (matches arrive in order)
+            line_num = 1
+            last_pos = 0
+
+            for match in self.pricing_regex.finditer(content):
+                amount, unit = self._extract_price_groups(match)
+                amount = amount.replace(',', '')  # Remove commas
+                unit = unit.lower()
+
+                # Normalize to monthly price
+                price_monthly = self._normalize_to_monthly(float(amount), unit)
+
+                # Calculate line number for this match
+                line_num += content.count('\n', last_pos, match.start())
+                last_pos = match.start()
+
+                # Try to extract context (nearby words)
+                start = max(0, match.start() - 50)
+                end = min(len(content), match.end() + 50)
+                context = content_lower[start:end]
+
+                # Attribute to the catalog product mentioned closest to the price
+                product = self._identify_product_from_context(
+                    context,
+                    path,
+                    price_span=(match.start() - start, match.end() - start),
+                    in_scope=in_scope
+                )
+
+                pricing_mentions[product].append({
+                    'price': price_monthly,
+                    'original': match.group(0),
+                    'path': path,
+                    'line_number': line_num,
+                    'context': context
+                })
 
         # Check for pricing conflicts within each product
         for product, mentions in pricing_mentions.items():
@@ -365,54 +603,341 @@ class ConflictDetector:
         if not base_path:
             return issues
 
-        # Build map of deprecated documents
-        deprecated_docs = set()
+        link_graph = self._get_link_graph(base_path)
+        active_docs = self._add_to_link_graph(link_graph, documents)
+
+        # Deprecated documents are looked up in the reverse link index
         for doc in documents:
-            metadata = doc['metadata']
-            if metadata.get('status') == 'deprecated':
-                deprecated_docs.add(doc['path'])
+            if doc['metadata'].get('status') != 'deprecated':
+                continue
+
+            for source, link in link_graph.links_to(doc['path']):
+                # Links from deprecated or out-of-scope documents are ignored
+                if source not in active_docs:
+                    continue
+
+                issues.append(ValidationIssue(
+                    rule_id="CONFLICT-004",
+                    severity=ValidationSeverity.WARNING,
+                    message=f"Link to deprecated document: '{link.url}'",
+                    file_path=active_docs[source],
+                    line_number=link.line_number,
+                    suggestion="Update link to current documentation or remove if obsolete"
+                ))
+
+        return sorted(issues, key=lambda issue: (str(issue.file_path), issue.line_number))
+
+    def _detect_orphans(
+        self,
+        documents: List[Dict],
+        base_path: Optional[Path]
+    ) -> List[ValidationIssue]:
+        """
+        Detect documents no other document links to.
+
+        Implements CONFLICT-007: Orphan document detection.
+        """
+        issues = []
+
+        link_graph = self._get_link_graph(base_path)
+        if not self.orphans_enabled or link_graph is None:
+            return issues
+
+        paths = self._add_to_link_graph(link_graph, documents, include_deprecated=True)
+
+        for node in link_graph.orphans(paths):
+            path = paths[node]
+            if any(fnmatch(path.name, pattern) for pattern in self.orphan_ignore_patterns):
+                continue
+
+            issues.append(ValidationIssue(
+                rule_id="CONFLICT-007",
+                severity=ValidationSeverity.INFO,
+                message="Orphan document: no other document links to it",
+                file_path=path,
+                suggestion="Link to this document from a related document or index"
+            ))
+
+        return issues
+
+    def _detect_link_cycles(
+        self,
+        documents: List[Dict],
+        base_path: Optional[Path]
+    ) -> List[ValidationIssue]:
+        """
+        Detect groups of documents that link to each other in a loop.
+
+        Implements CONFLICT-008: Link cycle detection.
+        """
+        issues = []
+
+        link_graph = self._get_link_graph(base_path)
+        if not self.link_cycles_enabled or link_graph is None:
+            return issues
+
+        paths = self._add_to_link_graph(link_graph, documents, include_deprecated=True)
+
+        for component in link_graph.strongly_connected_components(paths):
+            issues.append(ValidationIssue(
+                rule_id="CONFLICT-008",
+                severity=ValidationSeverity.INFO,
+                message=f"Link cycle between {len(component)} documents: {', '.join(component)}",
+                file_path=paths[component[0]],
+                suggestion="Check that navigation between these documents has a clear entry point"
+            ))
+
+        return issues
+
+    def _get_link_graph(self, base_path: Optional[Path]) -> Optional[LinkGraph]:
+        """
+        Get the link graph for a run.
+
+        Args:
+            base_path: Base repository path, if any
 
-        # Check for links to deprecated docs
-        link_pattern = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+        Returns:
+            The shared graph, a per-base-path graph, or None if neither exists
+        """
+        if self.link_graph is not None:
+            return self.link_graph
+        if not base_path:
+            return None
+
+        base_path = Path(base_path)
+        if base_path not in self._link_graphs:
+            self._link_graphs[base_path] = LinkGraph(base_path)
+        return self._link_graphs[base_path]
+
+    def _add_to_link_graph(
+        self,
+        link_graph: LinkGraph,
+        documents: List[Dict],
+        include_deprecated: bool = False
+    ) -> Dict[str, Path]:
+        """
+        Refresh documents in the link graph.
+
+        Documents whose content is unchanged are not re-parsed.
+
+        Args:
+            link_graph: Graph to update
+            documents: Loaded documents
+            include_deprecated: Include deprecated documents in the result
+
+        Returns:
+            Mapping of node id to document path
+        """
+        paths = {}
 
         for doc in documents:
-            content = doc['content']
-            path = doc['path']
-            metadata = doc['metadata']
+            link_graph.update(doc['path'], doc['content'])
+            if include_deprecated or doc['metadata'].get('status') != 'deprecated':
+                paths[link_graph.node_id(doc['path'])] = doc['path']
+
+        return paths
+
+    def _extract_price_groups(self, match: re.Match) -> Tuple[str, str]:
+        """
+        Return the (amount, unit) groups of whichever pricing pattern matched.
+
+        Args:
+            match: Match object from the combined pricing regex
+
+        Returns:
+            Tuple of raw amount string and unit string
+        """
+        groups = match.groups()
+        for i in range(0, len(groups), 2):
+            if groups[i] is not None:
+                return groups[i], groups[i + 1]
+        raise ValueError(f"Pricing match without amount: {match.group(0)!r}")
+
+    def _detect_near_duplicates(self, documents: List[Dict]) -> List[ValidationIssue]:
+        """
+        Detect near-duplicate documents.
+
+        Implements CONFLICT-005: Near-duplicate detection.
+        Shingles each document body, computes MinHash signatures (cached by
+        content hash so unchanged documents are not re-signed), and uses LSH
+        banding to compare only candidate pairs instead of every pair.
+        """
+        issues = []
+
+        if not self.near_duplicates_enabled:
+            return issues
+
+        hasher = MinHasher(num_perm=self.num_perm)
+        index = LSHIndex(num_perm=self.num_perm, bands=self.lsh_bands)
+        cache = SignatureCache(
+            self.signature_cache_file,
+            num_perm=self.num_perm,
+            seed=hasher.seed,
+            shingle_size=self.shingle_size
+        )
+
+        signatures = {}
+        docs_by_key = {}
+        signed = 0
+
+        for doc in documents:
+            key = str(doc['path'])
+            content = self._content(doc)
+            content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+            signature = cache.get(content_hash)
+            if signature is None:
+                shingles = shingle_hashes(self._strip_frontmatter(content), self.shingle_size)
+                if len(shingles) < self.min_shingles:
+                    continue
+                signature = hasher.signature(shingles)
+                cache.put(content_hash, signature)
+                signed += 1
+
+            signatures[key] = signature
+            docs_by_key[key] = doc
+            index.add(key, signature)
 
-            # Skip if this document itself is deprecated
-            if metadata.get('status') == 'deprecated':
+        try:
+            cache.save()
+        except OSError as e:
+            self.logger.warning(f"Could not save signature cache: {e}")
+
+        self.logger.debug(
+            f"Near-duplicate detection: {len(signatures)} documents, {signed} newly signed"
+        )
+
+        for key_a, key_b in sorted(index.candidate_pairs()):
+            similarity = estimate_similarity(signatures[key_a], signatures[key_b])
+            if similarity < self.near_duplicate_threshold:
                 continue
 
-            for match in link_pattern.finditer(content):
-                link_text = match.group(1)
-                link_url = match.group(2)
+            doc_b = docs_by_key[key_b]
+            issues.append(ValidationIssue(
+                rule_id="CONFLICT-005",
+                severity=ValidationSeverity.WARNING,
+                message=(
+                    f"Near-duplicate of '{doc_b['path']}' "
+                    f"(~{similarity:.0%} similar)"
+                ),
+                file_path=docs_by_key[key_a]['path'],
+                suggestion="Merge the documents or keep one and link to it from the other"
+            ))
+
+        return issues
+
+    def _detect_duplicate_blocks(self, documents: List[Dict]) -> List[ValidationIssue]:
+        """
+        Detect paragraphs and list items repeated across documents.
+
+        Implements CONFLICT-006: Duplicate block detection.
+        Normalizes and hashes every block in one pass, building a
+        hash -> locations index, then reports blocks found in more than one
+        document. Runs in linear time over the corpus.
+        """
+        issues = []
+
+        if not self.duplicate_blocks_enabled:
+            return issues
 
-                # Skip external links and anchors
-                if link_url.startswith(('http://', 'https://', '#')):
+        locations = defaultdict(list)  # block hash -> list of (doc_path, line_number)
+        previews = {}
+
+        for doc in documents:
+            blocks = self._iter_blocks(self._lines(doc), doc['frontmatter'].count('\n'))
+            for line_num, text in blocks:
+                normalized = self._normalize_block(text)
+                if len(normalized) < self.duplicate_block_min_length:
                     continue
 
-                # Resolve relative link
-                link_target = link_url.split('#')[0]
-                if link_target:
-                    target_path = (path.parent / link_target).resolve()
-
-                    # Check if target is deprecated
-                    if target_path in deprecated_docs:
-                        # Calculate line number for this link
-                        line_num = self._get_line_number(content, match.start())
-
-                        issues.append(ValidationIssue(
-                            rule_id="CONFLICT-004",
-                            severity=ValidationSeverity.WARNING,
-                            message=f"Link to deprecated document: '{link_url}'",
-                            file_path=path,
-                            line_number=line_num,
-                            suggestion="Update link to current documentation or remove if obsolete"
-                        ))
+                block_hash = hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).digest()
+                locations[block_hash].append((doc['path'], line_num))
+                previews.setdefault(block_hash, normalized)
+
+        for block_hash, block_locations in locations.items():
+            doc_paths = {path for path, _ in block_locations}
+            if len(doc_paths) < 2:
+                continue
+
+            first_path, first_line = block_locations[0]
+            other_locations = ', '.join(
+                f"{path}:{line}" for path, line in block_locations[1:]
+            )
+            preview = previews[block_hash]
+            if len(preview) > 60:
+                preview = preview[:57] + '...'
+
+            issues.append(ValidationIssue(
+                rule_id="CONFLICT-006",
+                severity=ValidationSeverity.INFO,
+                message=(
+                    f"Block repeated in {len(doc_paths)} documents: '{preview}' "
+                    f"(also at {other_locations})"
+                ),
+                file_path=first_path,
+                line_number=first_line,
+                suggestion="Keep this text in one document and link to it from the others"
+            ))
 
         return issues
 
+    def _iter_blocks(
+        self,
+        lines: Iterable[str],
+        frontmatter_lines: int = 0
+    ) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (line_number, text) for each paragraph and list item.
+
+        Skips YAML frontmatter, fenced code blocks and headings. Consecutive
+        non-blank lines form a paragraph; each list item is its own block.
+        Lines are consumed one at a time, so they can be streamed.
+
+        Args:
+            lines: Document lines
+            frontmatter_lines: Number of leading lines that are frontmatter
+        """
+        list_item = re.compile(r'^\s*(?:[-*+]|\d+[.)])\s+')
+        paragraph = []
+        paragraph_start = 0
+        in_code_block = False
+
+        for line_num, line in enumerate(lines, start=1):
+            if line_num <= frontmatter_lines:
+                continue
+            stripped = line.strip()
+
+            if stripped.startswith('```'):
+                in_code_block = not in_code_block
+                stripped = ''
+            elif in_code_block:
+                continue
+
+            if not stripped or stripped.startswith('#') or list_item.match(line):
+                if paragraph:
+                    yield paragraph_start, ' '.join(paragraph)
+                    paragraph = []
+                if stripped and not stripped.startswith('#'):
+                    yield line_num, list_item.sub('', line, count=1)
+                continue
+
+            if not paragraph:
+                paragraph_start = line_num
+            paragraph.append(stripped)
+
+        if paragraph:
+            yield paragraph_start, ' '.join(paragraph)
+
+    def _normalize_block(self, text: str) -> str:
+        """Normalize a block for hashing (case, whitespace, inline emphasis)."""
+        text = re.sub(r'[*_`]', '', text.lower())
+        return ' '.join(text.split())
+
+    def _strip_frontmatter(self, content: str) -> str:
+        """Return document content without the YAML frontmatter block."""
+        match = re.match(r'^---\s*\n.*?\n---\s*\n', content, re.DOTALL)
+        return content[match.end():] if match else content
+
     def _normalize_to_monthly(self, amount: float, unit: str) -> float:
         """Normalize pricing to monthly rate."""
         unit_lower = unit.lower()
@@ -420,24 +945,123 @@ class ConflictDetector:
             return amount / 12
         return amount  # Already monthly
 
-    def _identify_product_from_context(self, context: str, path: Path) -> str:
+    def _load_product_catalog(self, entries: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Normalize the configured product catalog.
+
+        Args:
+            entries: Product names or mappings with 'name', 'aliases', 'paths'
+
+        Returns:
+            List of product dicts with 'name', 'keywords' and 'paths'
+        """
+        products = []
+
+        for entry in entries or []:
+            if isinstance(entry, dict):
+                name = str(entry.get('name', '')).strip()
+                aliases = entry.get('aliases') or []
+                paths = entry.get('paths') or self.default_product_paths
+            else:
+                name = str(entry).strip()
+                aliases = []
+                paths = self.default_product_paths
+
+            if not name:
+                self.logger.warning(f"Ignoring product catalog entry without a name: {entry}")
+                continue
+
+            keywords = {name.lower()}
+            keywords.update(str(alias).strip().lower() for alias in aliases if str(alias).strip())
+
+            products.append({
+                'name': name.lower(),
+                'keywords': sorted(keywords),
+                'paths': tuple(paths)
+            })
+
+        return products
+
+    def _products_in_scope(self, path: Path) -> Set[int]:
+        """
+        Get indexes of catalog products whose path scope covers a document.
+
+        A scope entry matches if it equals one of the document's path
+        components or is a glob matching the document's POSIX path.
+        Products sharing a scope are evaluated once.
+        """
+        path_parts = set(path.parts)
+        path_posix = path.as_posix()
+        scope_matches: Dict[Tuple[str, ...], bool] = {}
+        in_scope = set()
+
+        for index, product in enumerate(self.products):
+            scope = product['paths']
+            if scope not in scope_matches:
+                scope_matches[scope] = any(
+                    pattern in path_parts or fnmatch(path_posix, pattern)
+                    for pattern in scope
+                )
+            if scope_matches[scope]:
+                in_scope.add(index)
+
+        return in_scope
+
+    def _identify_product_from_context(
+        self,
+        context: str,
+        path: Path,
+        price_span: Optional[Tuple[int, int]] = None,
+        in_scope: Optional[Set[int]] = None
+    ) -> str:
         """
         Identify product/service from context.
 
-        Simple heuristic: look for common product keywords.
-        Can be enhanced with more sophisticated NLP.
+        Scans the lowercased context with the product catalog automaton
+        (``validation.conflicts.products``) and picks the in-scope product
+        mentioned closest to the price, or the first one if no price
+        position is given.
+
+        Args:
+            context: Lowercased text surrounding the price
+            path: Document path (used for product path scopes)
+            price_span: Optional (start, end) of the price within context
+            in_scope: Precomputed in-scope product indexes for path
+
+        Returns:
+            Canonical product name, or 'general' if none matched
         """
-        # Extract from path
-        path_parts = path.parts
-        if 'pricing' in path_parts or 'sales' in path_parts:
-            # Look for common product names in context
-            products = ['basic', 'standard', 'premium', 'pro', 'enterprise', 'starter']
-            for product in products:
-                if product in context:
-                    return product
+        if not self.product_matcher:
+            return "general"
+
+        if in_scope is None:
+            in_scope = self._products_in_scope(path)
+        if not in_scope:
+            return "general"
+
+        best_product = None
+        best_distance = None
+
+        for start, end, index in self.product_matcher.find_all(context):
+            if index not in in_scope:
+                continue
+
+            if price_span is None:
+                distance = start
+            elif end <= price_span[0]:
+                distance = price_span[0] - end
+            else:
+                distance = max(0, start - price_span[1])
+
+            if best_distance is None or distance < best_distance:
+                best_product = index
+                best_distance = distance
+
+        if best_product is None:
+            # Default to generic
+            return "general"
 
-        # Default to generic
-        return "general"
+        return self.products[best_product]['name']
 
     def generate_conflict_report(
         self,
@@ -6,11 +6,14 @@ defined in the configuration file.
 """
 
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
+import difflib
 import re
 
 from src.utils.config import Config
+from src.utils.large_files import is_large_file, iter_lines, large_file_threshold
 from src.utils.logger import Logger
+from src.core.link_graph import LinkGraph
 from src.core.validators.yaml_validator import ValidationIssue, ValidationSeverity
 
 
@@ -21,21 +24,30 @@ class MarkdownValidator:
     Implements validation rules:
     - MD-001: Heading hierarchy (H1 → H2 → H3, no skipped levels)
     - MD-002: Code blocks must specify language
-    - MD-003: Link validation (relative links, check if targets exist)
+    - MD-003: Link validation (relative links, check if targets and #anchors exist)
     - MD-004: No trailing whitespace on lines
     - MD-005: Horizontal rule format consistency
     """
 
-    def __init__(self, config: Config, logger: Logger):
+    def __init__(
+        self,
+        config: Config,
+        logger: Logger,
+        link_graph: Optional[LinkGraph] = None
+    ):
         """
         Initialize markdown validator.
 
         Args:
             config: Configuration object with validation settings
             logger: Logger for diagnostic messages
+            link_graph: Shared corpus link graph (one is built per base path
+                if not provided)
         """
         self.config = config
         self.logger = logger
+        self.link_graph = link_graph
+        self._link_graphs: dict[Path, LinkGraph] = {}
 
         # Load markdown validation settings from config
         self.enabled = config.get('validation.markdown.enabled', True)
@@ -54,11 +66,17 @@ class MarkdownValidator:
         self.check_trailing_whitespace = config.get(
             'validation.markdown.check_trailing_whitespace', True
         )
+        self.check_anchors = config.get('validation.markdown.check_anchors', True)
+        self.large_file_threshold = large_file_threshold(config)
 
     def validate(self, file_path: Path, base_path: Optional[Path] = None) -> List[ValidationIssue]:
         """
         Validate markdown syntax and structure in a file.
 
+        Files above processing.large_file_threshold_mb are never loaded as a
+        whole: each line-based rule streams lines from a memory map, and
+        links are only re-parsed if the file changed since the last run.
+
         Args:
             file_path: Path to the markdown file to validate
             base_path: Base repository path (for checking relative links)
@@ -80,10 +98,39 @@ class MarkdownValidator:
 
         issues: List[ValidationIssue] = []
 
-        # Read file content
         try:
-            content = file_path.read_text(encoding='utf-8')
-        except Exception as e:
+            if is_large_file(file_path, self.large_file_threshold):
+                # Each rule makes its own pass over the mapped file
+                content = None
+                lines = None
+            else:
+                # Read file content and split into lines once
+                content = file_path.read_text(encoding='utf-8')
+                lines = content.splitlines()
+
+            # MD-001: Validate heading hierarchy
+            if self.enforce_heading_hierarchy:
+                issues.extend(self._validate_heading_hierarchy(file_path, self._lines(file_path, lines)))
+
+            # MD-002: Validate code blocks have language specified
+            if self.require_language_in_code_blocks:
+                issues.extend(self._validate_code_blocks(file_path, self._lines(file_path, lines)))
+
+            # MD-003: Validate links
+            link_graph = self._get_link_graph(base_path)
+            if link_graph is not None:
+                issues.extend(self._validate_links(file_path, content, link_graph))
+
+            # MD-004: Check for trailing whitespace
+            if self.check_trailing_whitespace:
+                issues.extend(self._validate_trailing_whitespace(file_path, self._lines(file_path, lines)))
+
+            # MD-005: Validate horizontal rule format
+            issues.extend(self._validate_horizontal_rules(file_path, self._lines(file_path, lines)))
+
+        except (OSError, UnicodeDecodeError) as e:
+            # Only read errors; a failing rule is a bug and must not be
+            # reported as an unreadable file
             self.logger.error(f"Error reading file {file_path}: {e}")
             return [ValidationIssue(
                 rule_id="MD-000",
@@ -92,34 +139,41 @@ class MarkdownValidator:
                 file_path=file_path
             )]
 
-        # Split into lines for line-by-line validation
-        lines = content.splitlines()
+        return issues
 
-        # MD-001: Validate heading hierarchy
-        if self.enforce_heading_hierarchy:
-            issues.extend(self._validate_heading_hierarchy(file_path, lines))
+    @staticmethod
+    def _lines(file_path: Path, lines: Optional[List[str]]) -> Iterable[str]:
+        """Get a document's lines, streaming them if they were not loaded."""
+        return lines if lines is not None else iter_lines(file_path)
 
-        # MD-002: Validate code blocks have language specified
-        if self.require_language_in_code_blocks:
-            issues.extend(self._validate_code_blocks(file_path, lines))
+    def validate_links(
+        self,
+        file_path: Path,
+        base_path: Optional[Path] = None
+    ) -> List[ValidationIssue]:
+        """
+        Run only link validation (MD-003) on a file.
 
-        # MD-003: Validate links
-        if base_path:
-            issues.extend(self._validate_links(file_path, lines, base_path))
+        Used when a document moved without changing, since relative links
+        are the only markdown check that depends on the file's location.
 
-        # MD-004: Check for trailing whitespace
-        if self.check_trailing_whitespace:
-            issues.extend(self._validate_trailing_whitespace(file_path, lines))
+        Args:
+            file_path: Path to the markdown file to validate
+            base_path: Base repository path (for checking relative links)
 
-        # MD-005: Validate horizontal rule format
-        issues.extend(self._validate_horizontal_rules(file_path, lines))
+        Returns:
+            List of MD-003 ValidationIssue objects
+        """
+        link_graph = self._get_link_graph(base_path)
+        if not self.enabled or link_graph is None or not file_path.exists():
+            return []
 
-        return issues
+        return self._validate_links(file_path, None, link_graph)
 
     def _validate_heading_hierarchy(
         self,
         file_path: Path,
-        lines: List[str]
+        lines: Iterable[str]
     ) -> List[ValidationIssue]:
         """
         Validate heading hierarchy (no skipped levels).
@@ -159,7 +213,7 @@ class MarkdownValidator:
     def _validate_code_blocks(
         self,
         file_path: Path,
-        lines: List[str]
+        lines: Iterable[str]
     ) -> List[ValidationIssue]:
         """
         Validate code blocks have language specified.
@@ -207,11 +261,31 @@ class MarkdownValidator:
 
         return issues
 
+    def _get_link_graph(self, base_path: Optional[Path]) -> Optional[LinkGraph]:
+        """
+        Get the link graph to validate links against.
+
+        Args:
+            base_path: Base repository path, if any
+
+        Returns:
+            The shared graph, a per-base-path graph, or None if neither exists
+        """
+        if self.link_graph is not None:
+            return self.link_graph
+        if not base_path:
+            return None
+
+        base_path = Path(base_path)
+        if base_path not in self._link_graphs:
+            self._link_graphs[base_path] = LinkGraph(base_path)
+        return self._link_graphs[base_path]
+
     def _validate_links(
         self,
         file_path: Path,
-        lines: List[str],
-        base_path: Path
+        content: Optional[str],
+        link_graph: LinkGraph
     ) -> List[ValidationIssue]:
         """
         Validate markdown links.
@@ -219,59 +293,61 @@ class MarkdownValidator:
         Implements MD-003: Link validation.
         - Checks for absolute URLs in internal docs (if relative_links_only is True)
         - Validates that relative link targets exist
+        - Validates that #fragments match a heading anchor in the target
         """
         issues: List[ValidationIssue] = []
 
-        # Markdown link pattern: [text](url)
-        link_pattern = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
-
-        for line_num, line in enumerate(lines, start=1):
-            for match in link_pattern.finditer(line):
-                link_text = match.group(1)
-                link_url = match.group(2)
-
-                # Skip anchor links (same page)
-                if link_url.startswith('#'):
-                    continue
-
-                # Check for absolute URLs
-                if link_url.startswith(('http://', 'https://', 'ftp://')):
-                    if self.relative_links_only:
-                        issues.append(ValidationIssue(
-                            rule_id="MD-003",
-                            severity=ValidationSeverity.INFO,
-                            message=f"Absolute URL in internal doc: {link_url}",
-                            file_path=file_path,
-                            line_number=line_num,
-                            suggestion="Consider using relative path for internal documentation links"
-                        ))
-                    continue
-
-                # Validate relative link target exists
-                # Remove anchor if present (e.g., "file.md#section")
-                link_target = link_url.split('#')[0]
+        for link in link_graph.update(file_path, content):
+            # Check for absolute URLs
+            if link.external:
+                if self.relative_links_only:
+                    issues.append(ValidationIssue(
+                        rule_id="MD-003",
+                        severity=ValidationSeverity.INFO,
+                        message=f"Absolute URL in internal doc: {link.url}",
+                        file_path=file_path,
+                        line_number=link.line_number,
+                        suggestion="Consider using relative path for internal documentation links"
+                    ))
+                continue
 
-                if link_target:
-                    # Resolve relative to current file's directory
-                    target_path = (file_path.parent / link_target).resolve()
+            # Validate relative link target exists (anchor links have no target)
+            if not link_graph.target_exists(link):
+                link_target = link.url.split('#')[0]
+                issues.append(ValidationIssue(
+                    rule_id="MD-003",
+                    severity=ValidationSeverity.ERROR,
+                    message=f"Broken link: target not found '{link.url}'",
+                    file_path=file_path,
+                    line_number=link.line_number,
+                    suggestion=f"Check if '{link_target}' exists or fix the link path"
+                ))
+                continue
 
-                    # Check if target exists relative to base path
-                    if not target_path.exists():
-                        issues.append(ValidationIssue(
-                            rule_id="MD-003",
-                            severity=ValidationSeverity.ERROR,
-                            message=f"Broken link: target not found '{link_url}'",
-                            file_path=file_path,
-                            line_number=line_num,
-                            suggestion=f"Check if '{link_target}' exists or fix the link path"
-                        ))
+            # Validate #fragment against the target's heading anchors
+            if self.check_anchors and not link_graph.anchor_exists(file_path, link):
+                target_node = link.target or link_graph.node_id(file_path)
+                close = difflib.get_close_matches(
+                    link.anchor.lower(), link_graph.anchors(target_node) or [], n=1
+                )
+                issues.append(ValidationIssue(
+                    rule_id="MD-003",
+                    severity=ValidationSeverity.WARNING,
+                    message=f"Broken anchor: '#{link.anchor}' not found in '{target_node}'",
+                    file_path=file_path,
+                    line_number=link.line_number,
+                    suggestion=(
+                        f"Did you mean '#{close[0]}'?" if close
+                        else "Update the link to match an existing heading"
+                    )
+                ))
 
         return issues
 
     def _validate_trailing_whitespace(
         self,
         file_path: Path,
-        lines: List[str]
+        lines: Iterable[str]
     ) -> List[ValidationIssue]:
         """
         Check for trailing whitespace on lines.
@@ -297,7 +373,7 @@ class MarkdownValidator:
     def _validate_horizontal_rules(
         self,
         file_path: Path,
-        lines: List[str]
+        lines: Iterable[str]
     ) -> List[ValidationIssue]:
         """
         Validate horizontal rule format consistency.
@@ -6,7 +6,7 @@ defined in the configuration file (lowercase-with-hyphens pattern).
 """
 
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional
 import re
 
 from src.utils.config import Config
@@ -271,12 +271,22 @@ class NamingValidator:
 
         return results
 
-    def get_rename_suggestions(self, file_path: Path) -> dict[str, str]:
+    def get_rename_suggestions(
+        self,
+        file_path: Path,
+        base_path: Optional[Path] = None
+    ) -> dict[str, Any]:
         """
         Generate rename suggestions for a file with naming violations.
 
+        Args:
+            file_path: Path to the file
+            base_path: Base repository path (directories below it are checked)
+
         Returns:
-            Dictionary with 'filename' and/or 'directories' suggestions
+            Dictionary with 'filename' (suggested new filename) and/or
+            'directories' (directory path relative to base_path, in POSIX
+            form -> suggested new directory name) suggestions
         """
         suggestions = {}
         issues = self._validate_filename(file_path)
@@ -290,4 +300,21 @@ class NamingValidator:
                     suggestions['filename'] = match.group(1)
                     break
 
+        if base_path is not None:
+            try:
+                relative_path = file_path.relative_to(base_path)
+            except ValueError:
+                relative_path = None
+
+            directories = {}
+            if relative_path is not None:
+                for i, part in enumerate(relative_path.parts[:-1]):
+                    # Satisfies both NAME-001 (lowercase) and NAME-002 (no spaces)
+                    suggested_name = part.lower().replace(' ', '-')
+                    if suggested_name != part:
+                        directories[Path(*relative_path.parts[:i + 1]).as_posix()] = suggested_name
+
+            if directories:
+                suggestions['directories'] = directories
+
         return suggestions
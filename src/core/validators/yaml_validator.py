@@ -13,7 +13,7 @@ from fnmatch import fnmatch
 
 from src.utils.config import Config
 from src.utils.logger import Logger
-from src.utils.frontmatter import parse_frontmatter, has_frontmatter, FrontmatterError
+from src.utils.frontmatter import has_frontmatter, parse_frontmatter_text, read_frontmatter_block, FrontmatterError
 
 
 class ValidationSeverity(Enum):
@@ -45,6 +45,42 @@ class ValidationIssue:
     line_number: Optional[int] = None
     suggestion: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the issue for caching (file path is stored by the cache key).
+
+        Returns:
+            Dictionary of JSON-compatible values
+        """
+        return {
+            'rule_id': self.rule_id,
+            'severity': self.severity.value,
+            'message': self.message,
+            'line_number': self.line_number,
+            'suggestion': self.suggestion
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], file_path: Path) -> 'ValidationIssue':
+        """
+        Restore an issue serialized with to_dict.
+
+        Args:
+            data: Serialized issue
+            file_path: Path of the document the issue belongs to
+
+        Returns:
+            ValidationIssue instance
+        """
+        return cls(
+            rule_id=data['rule_id'],
+            severity=ValidationSeverity(data['severity']),
+            message=data['message'],
+            file_path=file_path,
+            line_number=data.get('line_number'),
+            suggestion=data.get('suggestion')
+        )
+
     def __str__(self) -> str:
         """Format validation issue as a readable string."""
         location = f"{self.file_path}"
@@ -150,10 +186,11 @@ class YAMLValidator:
 
         issues: List[ValidationIssue] = []
 
-        # YAML-001: Check if YAML frontmatter block is present
+        # YAML-001: Check if YAML frontmatter block is present. Only the
+        # block is read, however large the document
         try:
-            has_yaml = has_frontmatter(file_path)
-        except Exception as e:
+            frontmatter_block = read_frontmatter_block(file_path)
+        except (OSError, UnicodeDecodeError) as e:
             self.logger.error(f"Error checking frontmatter in {file_path}: {e}")
             return [
                 ValidationIssue(
@@ -164,14 +201,14 @@ class YAMLValidator:
                 )
             ]
 
-        if not has_yaml:
+        if not frontmatter_block:
             issues.append(self._create_missing_frontmatter_issue(file_path))
             # If no frontmatter, no point checking other rules
             return issues
 
         # Parse frontmatter
         try:
-            metadata = parse_frontmatter(file_path)
+            metadata = parse_frontmatter_text(frontmatter_block)
         except FrontmatterError as e:
             issues.append(
                 ValidationIssue(
@@ -142,6 +142,26 @@ class ConflictReporter:
                 "Update or remove references to deprecated documents"
             )
 
+        if 'near_duplicates' in conflicts and conflicts['near_duplicates']:
+            recommendations.append(
+                "Consolidate near-duplicate documents so each procedure has one source of truth"
+            )
+
+        if 'duplicate_blocks' in conflicts and conflicts['duplicate_blocks']:
+            recommendations.append(
+                "Move repeated pricing and policy text into one document and link to it"
+            )
+
+        if 'orphans' in conflicts and conflicts['orphans']:
+            recommendations.append(
+                "Link orphan documents from an index or related page so readers can find them"
+            )
+
+        if 'link_cycles' in conflicts and conflicts['link_cycles']:
+            recommendations.append(
+                "Review circular links between documents and give each topic a clear entry point"
+            )
+
         # General recommendations
         if not recommendations:
             recommendations.append("No critical conflicts found. Consider periodic reviews.")
@@ -6,12 +6,16 @@ to enable incremental processing and change detection.
 """
 
 import json
-import hashlib
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 import os
 
+from .frontmatter import copy_file_mode
+from .large_files import MMAP_THRESHOLD, hash_file
+
 # Conditional import for Unix-only file locking module
 try:
     import fcntl
@@ -25,6 +29,38 @@ class CacheError(Exception):
     pass
 
 
+def _migrate_1_0_0(cache_data: Dict[str, Any], cache: 'DocumentCache') -> Dict[str, Any]:
+    """
+    Upgrade a 1.0.0 cache to 1.1.0.
+
+    1.1.0 added cached issues and inode numbers. Existing hashes and
+    validation results keep their meaning; the new fields start unknown.
+    """
+    for doc_data in cache_data.get('documents', {}).values():
+        doc_data.setdefault('issues', None)
+        doc_data.setdefault('inode', None)
+    return cache_data
+
+
+def _migrate_1_1_0(cache_data: Dict[str, Any], cache: 'DocumentCache') -> Dict[str, Any]:
+    """
+    Upgrade a 1.1.0 cache to 2.0.0.
+
+    2.0.0 keys documents relative to the repository root. Older keys were
+    paths as passed by the caller, which were relative to the working
+    directory, so they are re-keyed from there.
+    """
+    documents = {}
+    for key, doc_data in cache_data.get('documents', {}).items():
+        if doc_data.get('renamed_from'):
+            doc_data['renamed_from'] = cache.key_for(Path(doc_data['renamed_from']))
+        documents[cache.key_for(Path(key))] = doc_data
+
+    cache_data['documents'] = documents
+    cache_data['repo_root'] = cache.repo_root.as_posix()
+    return cache_data
+
+
 class DocumentCache:
     """
     Persistent cache for document processing state.
@@ -32,10 +68,30 @@ class DocumentCache:
     Stores document hashes, timestamps, and validation results to enable
     efficient incremental processing.
 
+    Documents are keyed by POSIX paths relative to the repository root, so
+    the same cache file works from any working directory or checkout path
+    (e.g. restored as a CI artifact). Documents outside the root keep
+    absolute keys.
+
+    Several processes may share one cache file. Loads and saves hold a lock
+    on a sibling ``.lock`` file, and save merges this process's entries
+    with whatever another process wrote in the meantime, keeping the most
+    recently processed entry for each document.
+
+    Every change is also appended to a sibling ``.journal`` file as it
+    happens. Loading replays the journal, so an interrupted run resumes
+    from the last processed document instead of from the last save. Saving
+    compacts the journal into the main file, which also happens
+    automatically once the journal outgrows the cache file (times
+    ``compact_ratio``). Since every compaction rewrites the whole cache,
+    tying it to the cache's size keeps the total cost of a long first run
+    linear in the number of documents.
+
     Cache structure:
     {
-        "version": "1.0.0",
+        "version": "2.0.0",
         "last_updated": "2025-11-07T10:30:00",
+        "repo_root": "/path/to/checkout",
         "documents": {
             "path/to/doc.md": {
                 "hash": "sha256_hash",
@@ -43,67 +99,241 @@ class DocumentCache:
                 "last_modified": "2025-11-07T09:15:00",
                 "validation_status": "passed"|"failed",
                 "error_count": 0,
-                "warning_count": 0
+                "warning_count": 0,
+                "issues": [{"rule_id": ..., "severity": ..., ...}] | null,
+                "inode": 1234567 | null,
+                "renamed_from": "old/path/doc.md"  (only after a rename),
+                "links_stale": true  (only while a linked document changed)
             }
         }
     }
     """
 
-    VERSION = "1.0.0"
+    VERSION = "2.0.0"
+
+    # Smaller journals are never compacted automatically
+    MIN_COMPACT_BYTES = 64 * 1024
+
+    # Upgrade steps: old version -> (new version, migration function).
+    # Each step only resets fields whose meaning changed, so a tool upgrade
+    # keeps the warm cache instead of forcing a full revalidation.
+    MIGRATIONS: Dict[str, Tuple[str, Callable[[Dict[str, Any], 'DocumentCache'], Dict[str, Any]]]] = {
+        "1.0.0": ("1.1.0", _migrate_1_0_0),
+        "1.1.0": ("2.0.0", _migrate_1_1_0),
+    }
 
-    def __init__(self, cache_file: Path):
+    def __init__(
+        self,
+        cache_file: Path,
+        repo_root: Optional[Path] = None,
+        compact_ratio: float = 1.0
+    ):
         """
         Initialize document cache.
 
         Args:
             cache_file: Path to cache file (JSON format)
+            repo_root: Repository root that keys are relative to
+                (default: current working directory)
+            compact_ratio: The journal is compacted into the cache file
+                once it is larger than this multiple of the cache file
+                (0 to compact only on save)
         """
         self.cache_file = Path(cache_file)
+        self.repo_root = Path(os.path.abspath(repo_root if repo_root is not None else '.'))
+        self.lock_file = self.cache_file.with_name(self.cache_file.name + '.lock')
+        self.journal_file = self.cache_file.with_name(self.cache_file.name + '.journal')
+        self.compact_ratio = compact_ratio
         self.cache_data: Dict[str, Any] = {
             "version": self.VERSION,
             "last_updated": None,
+            "repo_root": self.repo_root.as_posix(),
             "documents": {}
         }
+        # Size of the cache file as last read or written
+        self._cache_file_size = 0
 
         self._load()
 
     def _load(self) -> None:
         """
-        Load cache from file.
+        Load cache from file and replay the journal.
+
+        Creates new cache if file doesn't exist or has an unknown version.
+        A corrupt cache file is moved aside (to ``<cache_file>.corrupt``)
+        rather than aborting the run; journaled entries still apply.
 
-        Creates new cache if file doesn't exist or is invalid.
+        Raises:
+            CacheError: If the cache file cannot be read
         """
-        if not self.cache_file.exists():
+        with self._locked(exclusive=False):
+            loaded_data = self._read_cache_file()
+            journal = self._read_journal()
+
+        if loaded_data is None:
+            # Missing, corrupt or unknown version - start from the journal alone
             self._initialize_new_cache()
             return
 
+        self._replay_journal(loaded_data, journal)
+
+        # Keys are root-relative, so a cache written under another
+        # checkout path stays valid; record where it is used now
+        loaded_data['repo_root'] = self.repo_root.as_posix()
+        self.cache_data = loaded_data
+
+    def _read_cache_file(self) -> Optional[Dict[str, Any]]:
+        """
+        Read and migrate the cache file on disk.
+
+        Returns:
+            Migrated cache data, or None if missing, corrupt (moved aside)
+            or of an unknown version
+
+        Raises:
+            CacheError: If the cache file exists but cannot be read
+        """
+        if not self.cache_file.exists():
+            self._cache_file_size = 0
+            return None
+
         try:
             with open(self.cache_file, 'r', encoding='utf-8') as f:
-                # Acquire shared lock for reading (Unix-like systems only)
-                if fcntl is not None and os.name != 'nt':
-                    fcntl.flock(f.fileno(), fcntl.LOCK_SH)
-
+                self._cache_file_size = os.fstat(f.fileno()).st_size
                 loaded_data = json.load(f)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            self.cache_file.replace(self.cache_file.with_name(self.cache_file.name + '.corrupt'))
+            return None
+        except OSError as e:
+            raise CacheError(f"Failed to load cache from {self.cache_file}: {e}")
+
+        if not isinstance(loaded_data, dict) or not isinstance(loaded_data.get('documents', {}), dict):
+            self.cache_file.replace(self.cache_file.with_name(self.cache_file.name + '.corrupt'))
+            return None
 
-                if fcntl is not None and os.name != 'nt':
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        # Upgrade older caches in place (None for unknown or newer versions)
+        return self._migrate(loaded_data)
 
-            # Validate cache version
-            if loaded_data.get('version') != self.VERSION:
-                # Version mismatch - reinitialize
-                self._initialize_new_cache()
-                return
+    def _read_journal(self) -> List[Dict[str, Any]]:
+        """
+        Read journal records written since the last compaction.
 
-            self.cache_data = loaded_data
+        A run killed mid-write leaves a truncated last line; reading stops
+        there and keeps every complete record before it.
 
-        except (json.JSONDecodeError, OSError, IOError) as e:
-            raise CacheError(f"Failed to load cache from {self.cache_file}: {e}")
+        Returns:
+            Journal records in the order they were written
+        """
+        if not self.journal_file.exists():
+            return []
+
+        records = []
+        try:
+            with open(self.journal_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        break
+                    if isinstance(record, dict) and record.get('version') == self.VERSION:
+                        records.append(record)
+        except (OSError, UnicodeDecodeError):
+            pass
+
+        return records
+
+    def _replay_journal(self, cache_data: Dict[str, Any], journal: List[Dict[str, Any]]) -> None:
+        """
+        Apply journal records to cache data.
+
+        Records from other processes may interleave, so each one only
+        overrides entries processed before it.
+
+        Args:
+            cache_data: Cache data to update in place
+            journal: Records from _read_journal
+        """
+        documents = cache_data.setdefault('documents', {})
+
+        for record in journal:
+            op = record.get('op')
+            at = record.get('at') or ''
+
+            if op == 'put':
+                existing = documents.get(record['key'])
+                if existing is None or (existing.get('last_processed') or '') <= at:
+                    documents[record['key']] = record['data']
+            elif op == 'delete':
+                existing = documents.get(record['key'])
+                if existing is not None and (existing.get('last_processed') or '') <= at:
+                    del documents[record['key']]
+            elif op == 'clear':
+                for doc_key in [
+                    key for key, doc_data in documents.items()
+                    if (doc_data.get('last_processed') or '') <= at
+                ]:
+                    del documents[doc_key]
+
+    def _append_journal(self, op: str, **fields: Any) -> None:
+        """
+        Append a record to the journal, compacting it once it outgrows the cache file.
+
+        Records are flushed immediately so they survive the process being
+        killed; they are fsynced only when compacted into the cache file.
+
+        Args:
+            op: Operation ('put', 'delete' or 'clear')
+            **fields: Operation fields ('key', 'data')
+
+        Raises:
+            CacheError: If the journal cannot be written
+        """
+        record = {'version': self.VERSION, 'op': op, 'at': self._current_timestamp()}
+        record.update(fields)
+
+        try:
+            with self._locked(exclusive=True):
+                with open(self.journal_file, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                    f.flush()
+                    journal_size = f.tell()
+        except OSError as e:
+            raise CacheError(f"Failed to write cache journal {self.journal_file}: {e}")
+
+        if (
+            self.compact_ratio
+            and journal_size >= self.MIN_COMPACT_BYTES
+            and journal_size > self.compact_ratio * self._cache_file_size
+        ):
+            self.save()
+
+    def _migrate(self, cache_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Apply migration steps until the cache reaches the current version.
+
+        Args:
+            cache_data: Loaded cache data
+
+        Returns:
+            Migrated cache data, or None if the version cannot be migrated
+        """
+        version = cache_data.get('version')
+
+        while version != self.VERSION:
+            if version not in self.MIGRATIONS:
+                return None
+            version, migrate = self.MIGRATIONS[version]
+            cache_data = migrate(cache_data, self)
+            cache_data['version'] = version
+
+        return cache_data
 
     def _initialize_new_cache(self) -> None:
         """Initialize a new empty cache."""
         self.cache_data = {
             "version": self.VERSION,
             "last_updated": self._current_timestamp(),
+            "repo_root": self.repo_root.as_posix(),
             "documents": {}
         }
         self.save()
@@ -114,9 +344,13 @@ class DocumentCache:
 
     def save(self) -> None:
         """
-        Save cache to file atomically.
+        Merge with the cache on disk and save atomically.
 
-        Uses atomic write pattern to prevent corruption.
+        Holds the cache lock while reading, merging and replacing the file,
+        so concurrent runs never lose each other's entries. For documents
+        both processes touched, the most recently processed entry wins.
+        Writes go to a uniquely named temporary file that is renamed into
+        place, after which the journal (now folded in) is removed.
 
         Raises:
             CacheError: If save fails
@@ -124,32 +358,126 @@ class DocumentCache:
         # Ensure cache directory exists
         self.cache_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Update last_updated timestamp
-        self.cache_data['last_updated'] = self._current_timestamp()
+        temp_name = None
+        try:
+            with self._locked(exclusive=True):
+                disk_data = self._read_cache_file() or {'documents': {}}
+                journal = self._read_journal()
+                self._replay_journal(disk_data, journal)
+                # Journaled removals apply to this process's view as well
+                self._replay_journal(self.cache_data, [
+                    record for record in journal if record.get('op') != 'put'
+                ])
+                self._merge_documents(disk_data['documents'])
+
+                # Update last_updated timestamp
+                self.cache_data['last_updated'] = self._current_timestamp()
+
+                # Write to a unique temporary file first (atomic write pattern)
+                fd, temp_name = tempfile.mkstemp(
+                    dir=self.cache_file.parent,
+                    prefix=self.cache_file.name + '.',
+                    suffix='.tmp'
+                )
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(self.cache_data, f, indent=2, ensure_ascii=False)
+                    f.flush()
+                    os.fsync(f.fileno())
+                    cache_file_size = f.tell()
+
+                # Atomic rename, keeping the cache file's permission bits
+                copy_file_mode(self.cache_file, temp_name)
+                os.replace(temp_name, self.cache_file)
+                temp_name = None
+
+                if self.journal_file.exists():
+                    self.journal_file.unlink()
+
+            self._cache_file_size = cache_file_size
 
-        # Write to temporary file first (atomic write pattern)
-        temp_file = self.cache_file.with_suffix('.tmp')
+        except (OSError, IOError) as e:
+            if temp_name is not None and os.path.exists(temp_name):
+                os.unlink(temp_name)
+            raise CacheError(f"Failed to save cache to {self.cache_file}: {e}")
 
-        try:
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                # Acquire exclusive lock for writing (Unix-like systems only)
-                if fcntl is not None and os.name != 'nt':
-                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        """
+        Hold the cross-process cache lock.
 
-                json.dump(self.cache_data, f, indent=2, ensure_ascii=False)
-                f.flush()
-                os.fsync(f.fileno())
+        Locking is skipped where fcntl is unavailable (Windows).
 
-                if fcntl is not None and os.name != 'nt':
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        Args:
+            exclusive: Take an exclusive (write) lock instead of a shared one
+        """
+        if fcntl is None or os.name == 'nt':
+            yield
+            return
 
-            # Atomic rename
-            temp_file.replace(self.cache_file)
+        self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_file, 'a') as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
 
-        except (OSError, IOError) as e:
-            if temp_file.exists():
-                temp_file.unlink()
-            raise CacheError(f"Failed to save cache to {self.cache_file}: {e}")
+    def _merge_documents(self, documents: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Merge document entries, keeping the most recently processed ones.
+
+        Args:
+            documents: Entries keyed by cache key
+
+        Returns:
+            Number of entries taken from documents
+        """
+        local_documents = self.cache_data['documents']
+        merged = 0
+
+        for doc_key, doc_data in documents.items():
+            local = local_documents.get(doc_key)
+            if local is not None and (
+                (doc_data.get('last_processed') or '') <= (local.get('last_processed') or '')
+            ):
+                continue
+
+            local_documents[doc_key] = doc_data
+            merged += 1
+
+        return merged
+
+    def key_for(self, doc_path: Path) -> str:
+        """
+        Get the cache key for a document path.
+
+        Args:
+            doc_path: Absolute path or path relative to the working directory
+
+        Returns:
+            POSIX path relative to the repository root (absolute if outside it)
+        """
+        absolute = os.path.abspath(doc_path)
+        root = str(self.repo_root)
+        if absolute.startswith(root + os.sep):
+            absolute = absolute[len(root) + 1:]
+        return Path(absolute).as_posix()
+
+    def path_for(self, doc_key: str) -> Path:
+        """
+        Get a usable path for a cache key.
+
+        Args:
+            doc_key: Cache key
+
+        Returns:
+            Path relative to the working directory if below it, else absolute
+        """
+        path = self.repo_root / doc_key
+        try:
+            return path.relative_to(Path.cwd())
+        except ValueError:
+            return path
 
     def get_document(self, doc_path: Path) -> Optional[Dict[str, Any]]:
         """
@@ -161,7 +489,7 @@ class DocumentCache:
         Returns:
             Cached document data or None if not found
         """
-        doc_key = str(doc_path)
+        doc_key = self.key_for(doc_path)
         return self.cache_data['documents'].get(doc_key)
 
     def update_document(
@@ -171,7 +499,9 @@ class DocumentCache:
         last_modified: Optional[datetime] = None,
         validation_status: Optional[str] = None,
         error_count: int = 0,
-        warning_count: int = 0
+        warning_count: int = 0,
+        issues: Optional[List[Dict[str, Any]]] = None,
+        inode: Optional[int] = None
     ) -> None:
         """
         Update cache entry for a document.
@@ -183,8 +513,10 @@ class DocumentCache:
             validation_status: 'passed' or 'failed'
             error_count: Number of validation errors
             warning_count: Number of validation warnings
+            issues: Serialized validation issues (None if not recorded)
+            inode: File inode number, used to disambiguate renames
         """
-        doc_key = str(doc_path)
+        doc_key = self.key_for(doc_path)
 
         doc_data = {
             "hash": file_hash,
@@ -192,10 +524,77 @@ class DocumentCache:
             "last_modified": last_modified.isoformat() if last_modified else None,
             "validation_status": validation_status,
             "error_count": error_count,
-            "warning_count": warning_count
+            "warning_count": warning_count,
+            "issues": issues,
+            "inode": inode
         }
 
         self.cache_data['documents'][doc_key] = doc_data
+        self._append_journal('put', key=doc_key, data=doc_data)
+
+    def merge_cache_data(self, cache_data: Dict[str, Any]) -> int:
+        """
+        Merge entries from another cache (e.g. an imported bundle).
+
+        The other cache is migrated to the current version first. For
+        documents present in both, the more recently processed entry wins.
+
+        Args:
+            cache_data: Parsed contents of another cache file
+
+        Returns:
+            Number of entries taken from the other cache
+
+        Raises:
+            CacheError: If the other cache's version cannot be migrated
+        """
+        migrated = self._migrate(cache_data)
+        if migrated is None:
+            raise CacheError(
+                f"Cannot merge cache with unsupported version: {cache_data.get('version')}"
+            )
+
+        return self._merge_documents(migrated.get('documents', {}))
+
+    def rename_document(self, old_path: Path, new_path: Path) -> None:
+        """
+        Move a cache entry to a new path, keeping its cached results.
+
+        The entry records where it came from so callers can re-run only
+        path-dependent checks.
+
+        Args:
+            old_path: Previous document path
+            new_path: New document path
+        """
+        old_key = self.key_for(old_path)
+        doc_data = self.cache_data['documents'].pop(old_key, None)
+        if doc_data is None:
+            return
+
+        new_key = self.key_for(new_path)
+        doc_data['renamed_from'] = old_key
+        self.cache_data['documents'][new_key] = doc_data
+        self._append_journal('delete', key=old_key)
+        self._append_journal('put', key=new_key, data=doc_data)
+
+    def mark_links_stale(self, doc_path: Path) -> None:
+        """
+        Flag a cache entry whose link checks must be re-run.
+
+        The entry keeps its cached results; the flag is cleared when the
+        document's results are next updated.
+
+        Args:
+            doc_path: Document linking to a changed path
+        """
+        doc_key = self.key_for(doc_path)
+        doc_data = self.cache_data['documents'].get(doc_key)
+        if doc_data is None or doc_data.get('links_stale'):
+            return
+
+        doc_data['links_stale'] = True
+        self._append_journal('put', key=doc_key, data=doc_data)
 
     def remove_document(self, doc_path: Path) -> None:
         """
@@ -204,9 +603,10 @@ class DocumentCache:
         Args:
             doc_path: Path to document
         """
-        doc_key = str(doc_path)
+        doc_key = self.key_for(doc_path)
         if doc_key in self.cache_data['documents']:
             del self.cache_data['documents'][doc_key]
+            self._append_journal('delete', key=doc_key)
 
     def has_document_changed(
         self,
@@ -237,7 +637,7 @@ class DocumentCache:
         Returns:
             List of Path objects for cached documents
         """
-        return [Path(path) for path in self.cache_data['documents'].keys()]
+        return [self.path_for(key) for key in self.cache_data['documents'].keys()]
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -268,6 +668,7 @@ class DocumentCache:
         """Clear all cached documents."""
         self.cache_data['documents'] = {}
         self.cache_data['last_updated'] = self._current_timestamp()
+        self._append_journal('clear')
 
     def __len__(self) -> int:
         """Return number of cached documents."""
@@ -275,7 +676,7 @@ class DocumentCache:
 
     def __contains__(self, doc_path: Path) -> bool:
         """Check if document is in cache."""
-        return str(doc_path) in self.cache_data['documents']
+        return self.key_for(doc_path) in self.cache_data['documents']
 
     def __repr__(self) -> str:
         """String representation of cache."""
@@ -286,12 +687,16 @@ class DocumentCache:
         )
 
 
-def compute_file_hash(file_path: Path) -> str:
+def compute_file_hash(file_path: Path, large_file_threshold: int = MMAP_THRESHOLD) -> str:
     """
     Compute SHA-256 hash of file content.
 
+    Files at or above the large-file threshold are hashed from a memory map.
+
     Args:
         file_path: Path to file
+        large_file_threshold: Size in bytes at or above which the file is
+            memory-mapped (processing.large_file_threshold_mb)
 
     Returns:
         Hexadecimal string of SHA-256 hash
@@ -300,14 +705,6 @@ def compute_file_hash(file_path: Path) -> str:
         CacheError: If file cannot be read
     """
     try:
-        sha256_hash = hashlib.sha256()
-
-        with open(file_path, 'rb') as f:
-            # Read file in chunks to handle large files
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-
-        return sha256_hash.hexdigest()
-
-    except (OSError, IOError) as e:
+        return hash_file(file_path, large_file_threshold)
+    except OSError as e:
         raise CacheError(f"Failed to compute hash for {file_path}: {e}")
@@ -0,0 +1,298 @@
+"""
+Portable cache bundles.
+
+Packs the document cache (hashes and cached validation issues) together
+with the derived-data caches (MinHash signatures, link graph) into a single
+compressed file, so a CI job can restore a warm cache produced elsewhere
+instead of revalidating the whole repository.
+
+A bundle is a gzipped tar archive containing:
+    manifest.json         Format version, tool version, config fingerprint
+    document-cache.json   DocumentCache contents
+    signature-cache.json  MinHash signature cache (optional)
+    link-graph.json       Link graph (optional)
+"""
+
+import io
+import json
+import os
+import tarfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .cache import CacheError, DocumentCache
+
+BUNDLE_FORMAT = "symphony-cache-bundle"
+BUNDLE_VERSION = "1.0.0"
+
+MANIFEST_MEMBER = "manifest.json"
+DOCUMENT_CACHE_MEMBER = "document-cache.json"
+
+# Optional member name -> key used in the extra_files mapping
+EXTRA_MEMBERS = {
+    "signature-cache.json": "signature_cache",
+    "link-graph.json": "link_graph",
+}
+
+
+def export_bundle(
+    bundle_path: Path,
+    cache: DocumentCache,
+    fingerprint: str,
+    tool_version: str,
+    extra_files: Optional[Dict[str, Optional[Path]]] = None
+) -> Dict[str, Any]:
+    """
+    Write a cache bundle.
+
+    Args:
+        bundle_path: Output file (conventionally *.tar.gz)
+        cache: Document cache to export
+        fingerprint: Config fingerprint the cached results were produced under
+        tool_version: Version of the tool that produced them
+        extra_files: Optional caches to include, keyed 'signature_cache' and
+            'link_graph'; missing or unset files are skipped
+
+    Returns:
+        The bundle manifest
+
+    Raises:
+        CacheError: If the bundle cannot be written
+    """
+    members: Dict[str, bytes] = {
+        DOCUMENT_CACHE_MEMBER: _encode(cache.cache_data)
+    }
+    link_graph_root = None
+
+    for member, key in EXTRA_MEMBERS.items():
+        data = _read_json((extra_files or {}).get(key))
+        if data is None:
+            continue
+        if key == 'link_graph':
+            # Graph nodes are relative to the graph root; store the root
+            # relative to the repository so it can be relocated on import
+            link_graph_root = _relative_root(data.get('root'), cache.repo_root)
+            if link_graph_root is None:
+                continue
+        members[member] = _encode(data)
+
+    manifest = {
+        'format': BUNDLE_FORMAT,
+        'version': BUNDLE_VERSION,
+        'tool_version': tool_version,
+        'config_fingerprint': fingerprint,
+        'created': datetime.now().isoformat(),
+        'documents': len(cache.cache_data.get('documents', {})),
+        'link_graph_root': link_graph_root,
+        'members': sorted(members),
+    }
+
+    bundle_path = Path(bundle_path)
+    try:
+        bundle_path.parent.mkdir(parents=True, exist_ok=True)
+        with tarfile.open(bundle_path, 'w:gz') as tar:
+            _add_member(tar, MANIFEST_MEMBER, _encode(manifest))
+            for name, payload in members.items():
+                _add_member(tar, name, payload)
+    except (OSError, tarfile.TarError) as e:
+        raise CacheError(f"Failed to write cache bundle {bundle_path}: {e}")
+
+    return manifest
+
+
+def import_bundle(
+    bundle_path: Path,
+    cache: DocumentCache,
+    fingerprint: str,
+    extra_files: Optional[Dict[str, Optional[Path]]] = None,
+    force: bool = False
+) -> Dict[str, Any]:
+    """
+    Merge a cache bundle into the local caches.
+
+    Document entries are merged with DocumentCache.merge_cache_data (the
+    more recently processed entry wins). Signatures and link graph nodes
+    only fill gaps in the local caches. The document cache is saved; the
+    extra caches are written to their configured files.
+
+    Args:
+        bundle_path: Bundle produced by export_bundle
+        cache: Local document cache to merge into
+        fingerprint: Local config fingerprint
+        extra_files: Local cache files, keyed as in export_bundle
+        force: Import even if the config fingerprint differs
+
+    Returns:
+        The bundle manifest, with a 'merged' mapping of entries taken per cache
+
+    Raises:
+        CacheError: If the bundle is invalid or was produced under a
+            different configuration (unless force is set)
+    """
+    bundle_path = Path(bundle_path)
+    if not bundle_path.exists():
+        raise CacheError(f"Cache bundle not found: {bundle_path}")
+
+    try:
+        with tarfile.open(bundle_path, 'r:gz') as tar:
+            manifest = _read_member(tar, MANIFEST_MEMBER)
+            if manifest is None or manifest.get('format') != BUNDLE_FORMAT:
+                raise CacheError(f"Not a cache bundle: {bundle_path}")
+            if manifest.get('version') != BUNDLE_VERSION:
+                raise CacheError(
+                    f"Unsupported cache bundle version: {manifest.get('version')}"
+                )
+            if manifest.get('config_fingerprint') != fingerprint and not force:
+                raise CacheError(
+                    "Cache bundle was produced with a different validation "
+                    "configuration; use --force to import anyway"
+                )
+
+            # Only known member names are read, so a crafted archive cannot
+            # write outside the cache files
+            document_data = _read_member(tar, DOCUMENT_CACHE_MEMBER)
+            extras = {
+                key: _read_member(tar, member)
+                for member, key in EXTRA_MEMBERS.items()
+            }
+    except (OSError, tarfile.TarError, json.JSONDecodeError) as e:
+        raise CacheError(f"Failed to read cache bundle {bundle_path}: {e}")
+
+    if document_data is None:
+        raise CacheError(f"Cache bundle has no document cache: {bundle_path}")
+
+    merged = {'documents': cache.merge_cache_data(document_data)}
+    cache.save()
+
+    extra_files = extra_files or {}
+
+    signature_file = extra_files.get('signature_cache')
+    if signature_file and extras['signature_cache'] is not None:
+        merged['signatures'] = _merge_signature_cache(
+            Path(signature_file), extras['signature_cache']
+        )
+
+    graph_file = extra_files.get('link_graph')
+    if graph_file and extras['link_graph'] is not None and manifest.get('link_graph_root') is not None:
+        graph_data = extras['link_graph']
+        graph_data['root'] = (cache.repo_root / manifest['link_graph_root']).resolve().as_posix()
+        merged['link_graph_nodes'] = _merge_link_graph(Path(graph_file), graph_data)
+
+    manifest['merged'] = merged
+    return manifest
+
+
+def _merge_signature_cache(local_file: Path, data: Dict[str, Any]) -> int:
+    """
+    Merge imported signatures into a local signature cache file.
+
+    Signatures are only comparable under the same version and MinHash
+    parameters; otherwise the local file is left as it is.
+
+    Returns:
+        Number of signatures added
+    """
+    local = _read_json(local_file)
+    if local is None:
+        _write_json(local_file, data)
+        return len(data.get('signatures', {}))
+
+    if local.get('version') != data.get('version') or local.get('params') != data.get('params'):
+        return 0
+
+    signatures = local.setdefault('signatures', {})
+    added = 0
+    for content_hash, values in data.get('signatures', {}).items():
+        if content_hash not in signatures:
+            signatures[content_hash] = values
+            added += 1
+
+    _write_json(local_file, local)
+    return added
+
+
+def _merge_link_graph(local_file: Path, data: Dict[str, Any]) -> int:
+    """
+    Merge imported link graph nodes into a local graph file.
+
+    Local nodes win; the graph re-parses any node whose hash is stale on
+    its next update, so imported nodes never override what is on disk.
+
+    Returns:
+        Number of nodes added
+    """
+    local = _read_json(local_file)
+    if local is None or local.get('version') != data.get('version') or local.get('root') != data.get('root'):
+        _write_json(local_file, data)
+        return len(data.get('nodes', {}))
+
+    nodes = local.setdefault('nodes', {})
+    added = 0
+    for node, entry in data.get('nodes', {}).items():
+        if node not in nodes:
+            nodes[node] = entry
+            added += 1
+
+    _write_json(local_file, local)
+    return added
+
+
+def _relative_root(root: Optional[str], repo_root: Path) -> Optional[str]:
+    """Get a graph root relative to the repository root, or None if outside it."""
+    if not root:
+        return None
+    try:
+        return Path(root).relative_to(repo_root.resolve()).as_posix()
+    except ValueError:
+        return None
+
+
+def _encode(data: Dict[str, Any]) -> bytes:
+    """Serialize a JSON document for the bundle."""
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def _add_member(tar: tarfile.TarFile, name: str, payload: bytes) -> None:
+    """Add an in-memory file to a tar archive."""
+    info = tarfile.TarInfo(name)
+    info.size = len(payload)
+    info.mtime = int(datetime.now().timestamp())
+    tar.addfile(info, io.BytesIO(payload))
+
+
+def _read_member(tar: tarfile.TarFile, name: str) -> Optional[Dict[str, Any]]:
+    """Read a JSON member from a tar archive, or None if absent."""
+    try:
+        member = tar.getmember(name)
+    except KeyError:
+        return None
+    if not member.isfile():
+        return None
+
+    handle = tar.extractfile(member)
+    return json.loads(handle.read().decode('utf-8'))
+
+
+def _read_json(path: Optional[Path]) -> Optional[Dict[str, Any]]:
+    """Read a JSON cache file, or None if unset, missing or unreadable."""
+    if not path or not Path(path).exists():
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return None
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    """Write a JSON cache file atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = path.with_suffix('.tmp')
+
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+
+    temp_file.replace(path)
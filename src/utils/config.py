@@ -7,6 +7,7 @@ from YAML files with support for environment variable overrides.
 
 import os
 import json
+import hashlib
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 import yaml
@@ -327,25 +328,70 @@ class Config:
         dirs = self.get('processing.doc_directories', ['.'])
         return [Path(d) for d in dirs]
 
+    def get_repo_root(self) -> Path:
+        """
+        Get the repository root that state files and cache keys are relative to.
+
+        A relative processing.repo_root is resolved against the directory of
+        the config file. If it is not set, the root is the nearest directory
+        containing .git, searching up from the working directory (or the
+        working directory itself if there is none).
+
+        Returns:
+            Absolute path of the repository root
+        """
+        configured = self.get('processing.repo_root')
+        if configured:
+            root = Path(os.path.expanduser(str(configured)))
+            if not root.is_absolute():
+                root = self.config_path.parent / root
+            return Path(os.path.abspath(root))
+
+        cwd = Path.cwd()
+        for directory in (cwd, *cwd.parents):
+            if (directory / '.git').exists():
+                return directory
+        return cwd
+
+    def get_state_path(self, key_path: str, default: Optional[str] = None) -> Optional[Path]:
+        """
+        Get the path of a state file or directory (caches, indexes, backups).
+
+        Relative paths are resolved against the repository root (see
+        get_repo_root), so state is shared by every working directory in
+        the repository.
+
+        Args:
+            key_path: Dot-separated path to the configuration value
+            default: Default value if key not found
+
+        Returns:
+            Absolute path, or None if the value is empty (state disabled)
+        """
+        value = self.get(key_path, default)
+        if not value:
+            return None
+
+        path = Path(os.path.expanduser(str(value)))
+        return path if path.is_absolute() else self.get_repo_root() / path
+
     def get_cache_file_path(self) -> Path:
         """
         Get path to cache file for change detection.
 
         Returns:
-            Path object for cache file
+            Path object for cache file, under the repository root
         """
-        cache_file = self.get('processing.cache_file', '_meta/.document-cache.json')
-        return Path(cache_file)
+        return self.get_state_path('processing.cache_file', '_meta/.document-cache.json')
 
     def get_backup_dir(self) -> Path:
         """
         Get path to backup directory.
 
         Returns:
-            Path object for backup directory
+            Path object for backup directory, under the repository root
         """
-        backup_dir = self.get('processing.backup_dir', '_meta/.backups/')
-        return Path(backup_dir)
+        return self.get_state_path('processing.backup_dir', '_meta/.backups/')
 
     def get_report_output_dir(self) -> Path:
         """
@@ -435,6 +481,29 @@ class Config:
         """
         return self.get('validation.yaml.exclude_patterns', [])
 
+    def fingerprint(self, sections: Optional[List[str]] = None) -> str:
+        """
+        Get a stable hash of the settings that affect validation results.
+
+        Cached results are only reusable under the same settings, so cache
+        bundles record this fingerprint and check it on import.
+
+        Args:
+            sections: Top-level sections to include (default: mode and validation)
+
+        Returns:
+            Hexadecimal SHA-256 digest
+        """
+        if sections is None:
+            sections = ['validation']
+
+        relevant = {'mode': self.mode}
+        for section in sections:
+            relevant[section] = self.config_data.get(section)
+
+        encoded = json.dumps(relevant, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
     def __repr__(self) -> str:
         """String representation of configuration."""
         return f"Config(mode={self.mode}, config_path={self.config_path})"
@@ -6,17 +6,110 @@ in markdown files. Frontmatter is metadata enclosed between --- delimiters at th
 start of markdown files.
 """
 
+import os
 import re
+import shutil
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 import yaml
 
+# Frontmatter block at the start of a document: (---\n<yaml>\n---\n)(<body>)
+FRONTMATTER_PATTERN = re.compile(r'^(---\s*\n(.*?)\n---\s*\n)(.*)$', re.DOTALL)
+
+# A frontmatter block still open after this many bytes is not frontmatter;
+# bounds what is read from documents without a closing ---
+MAX_FRONTMATTER_BYTES = 1024 * 1024
+
+# Splits after a bare \r (old Mac line ending); \n-terminated lines come
+# from readline
+_CR_LINE_BREAK = re.compile(rb'(?<=\r)(?!\n)')
+
+# Bytes copied at a time when a document's body is carried over unchanged
+COPY_CHUNK_SIZE = 1024 * 1024
+
 
 class FrontmatterError(Exception):
     """Raised when frontmatter cannot be parsed or is malformed."""
     pass
 
 
+def read_frontmatter_prefix(file_path: Path) -> Tuple[str, int]:
+    """
+    Read a document's frontmatter block without reading its body.
+
+    Lines are read until the block's closing delimiter, so the cost does
+    not depend on the size of the document, and only the block itself is
+    decoded. A block still open after MAX_FRONTMATTER_BYTES bytes is
+    treated as no frontmatter.
+
+    Args:
+        file_path: Path to the markdown file
+
+    Returns:
+        Tuple of (frontmatter block with line endings normalized to '\\n',
+        including both --- delimiters; length of the block in the file in
+        bytes). ('', 0) if the document has no frontmatter.
+
+    Raises:
+        OSError: If the file cannot be read
+        UnicodeDecodeError: If the block is not valid UTF-8
+    """
+    lines: List[str] = []
+    size = 0
+
+    with open(file_path, 'rb') as f:
+        while size < MAX_FRONTMATTER_BYTES:
+            limit = MAX_FRONTMATTER_BYTES - size
+            chunk = f.readline(limit)
+            if not chunk:
+                break
+
+            pieces = _CR_LINE_BREAK.split(chunk)
+            truncated = len(chunk) == limit and not chunk.endswith(b'\n')
+            if truncated:
+                # Cut off at the limit: the last piece is not a whole line
+                pieces = pieces[:-1]
+
+            for raw_line in pieces:
+                if not raw_line:
+                    continue
+                line = raw_line.decode('utf-8')
+                lines.append(line)
+                size += len(raw_line)
+
+                if len(lines) == 1:
+                    if line.rstrip() != '---':
+                        return '', 0
+                elif line.startswith('---'):
+                    text = ''.join(lines).replace('\r\n', '\n').replace('\r', '\n')
+                    match = FRONTMATTER_PATTERN.match(text)
+                    if match and len(match.group(1)) == len(text):
+                        return text, size
+
+            if truncated:
+                break
+
+    return '', 0
+
+
+def read_frontmatter_block(file_path: Path) -> str:
+    """
+    Read a document's frontmatter block without reading its body.
+
+    Args:
+        file_path: Path to the markdown file
+
+    Returns:
+        Frontmatter block including both --- delimiters ('' if none)
+
+    Raises:
+        OSError: If the file cannot be read
+        UnicodeDecodeError: If the block is not valid UTF-8
+    """
+    return read_frontmatter_prefix(file_path)[0]
+
+
 def has_frontmatter(file_path: Path) -> bool:
     """
     Check if a markdown file contains YAML frontmatter.
@@ -34,14 +127,8 @@ def has_frontmatter(file_path: Path) -> bool:
         raise FileNotFoundError(f"File not found: {file_path}")
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Check for frontmatter delimiters at start of file
-        # Pattern: starts with ---, has content, ends with ---
-        pattern = r'^---\s*\n.*?\n---\s*\n'
-        return bool(re.match(pattern, content, re.DOTALL))
-
+        # Only the block is read, however large the document
+        return bool(read_frontmatter_block(file_path))
     except Exception:
         return False
 
@@ -65,48 +152,14 @@ def parse_frontmatter(file_path: Path) -> Dict[str, Any]:
         raise FileNotFoundError(f"File not found: {file_path}")
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Only the block is read, however large the document
+        frontmatter_block = read_frontmatter_block(file_path)
 
-        # Handle empty files
-        if not content.strip():
-            return {}
-
-        # Extract frontmatter using regex
-        # Pattern: ---\n<yaml content>\n---
-        pattern = r'^---\s*\n(.*?)\n---\s*\n'
-        match = re.match(pattern, content, re.DOTALL)
-
-        if not match:
+        if not frontmatter_block:
             # No frontmatter found
             return {}
 
-        yaml_content = match.group(1)
-
-        # Handle empty frontmatter block
-        if not yaml_content.strip():
-            return {}
-
-        # Parse YAML
-        try:
-            metadata = yaml.safe_load(yaml_content)
-
-            # Handle case where YAML is valid but empty (None)
-            if metadata is None:
-                return {}
-
-            # Ensure we return a dictionary
-            if not isinstance(metadata, dict):
-                raise FrontmatterError(
-                    f"Frontmatter must be a YAML dictionary, got {type(metadata).__name__}"
-                )
-
-            return metadata
-
-        except yaml.YAMLError as e:
-            raise FrontmatterError(
-                f"Invalid YAML in frontmatter: {str(e)}"
-            ) from e
+        return parse_frontmatter_text(frontmatter_block)
 
     except FrontmatterError:
         raise
@@ -202,21 +255,8 @@ def add_frontmatter(
         else:
             markdown_content = ""
 
-        # Generate YAML frontmatter
-        try:
-            yaml_str = yaml.dump(
-                metadata,
-                default_flow_style=False,
-                allow_unicode=True,
-                sort_keys=False
-            )
-        except Exception as e:
-            raise FrontmatterError(
-                f"Cannot serialize metadata to YAML: {str(e)}"
-            ) from e
-
         # Construct new file content
-        new_content = f"---\n{yaml_str}---\n{markdown_content}"
+        new_content = render_frontmatter(metadata, markdown_content)
 
         # Write back to file
         with open(file_path, 'w', encoding='utf-8') as f:
@@ -291,3 +331,191 @@ def remove_frontmatter(file_path: Path) -> None:
         with open(file_path, 'w', encoding='utf-8') as f:
             f.write(markdown_content)
     # If no frontmatter, file remains unchanged
+
+
+def split_frontmatter(content: str) -> Tuple[str, str]:
+    """
+    Split document text into its frontmatter block and body.
+
+    Args:
+        content: Full document text
+
+    Returns:
+        Tuple of (frontmatter_block, body). The block includes both ---
+        delimiters and is empty if the document has no frontmatter, so
+        block + body always equals content.
+    """
+    match = FRONTMATTER_PATTERN.match(content)
+    if not match:
+        return "", content
+    return match.group(1), match.group(3)
+
+
+def parse_frontmatter_text(yaml_content: str) -> Dict[str, Any]:
+    """
+    Parse the YAML between frontmatter delimiters.
+
+    Args:
+        yaml_content: YAML text (a frontmatter block with or without its
+            --- delimiters)
+
+    Returns:
+        Dictionary of metadata (empty for an empty block)
+
+    Raises:
+        FrontmatterError: If the YAML is invalid or not a dictionary
+    """
+    match = FRONTMATTER_PATTERN.match(yaml_content)
+    if match:
+        yaml_content = match.group(2)
+
+    # Handle empty frontmatter block
+    if not yaml_content.strip():
+        return {}
+
+    try:
+        metadata = yaml.safe_load(yaml_content)
+    except yaml.YAMLError as e:
+        raise FrontmatterError(
+            f"Invalid YAML in frontmatter: {str(e)}"
+        ) from e
+
+    # Handle case where YAML is valid but empty (None)
+    if metadata is None:
+        return {}
+
+    # Ensure we return a dictionary
+    if not isinstance(metadata, dict):
+        raise FrontmatterError(
+            f"Frontmatter must be a YAML dictionary, got {type(metadata).__name__}"
+        )
+
+    return metadata
+
+
+def render_frontmatter(metadata: Dict[str, Any], body: str) -> str:
+    """
+    Build document text from metadata and a markdown body.
+
+    Args:
+        metadata: Metadata to serialize as frontmatter
+        body: Markdown content following the frontmatter
+
+    Returns:
+        Document text with a --- delimited YAML block followed by body
+
+    Raises:
+        FrontmatterError: If metadata cannot be serialized to YAML
+    """
+    try:
+        yaml_str = yaml.dump(
+            metadata,
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=False
+        )
+    except Exception as e:
+        raise FrontmatterError(
+            f"Cannot serialize metadata to YAML: {str(e)}"
+        ) from e
+
+    return f"---\n{yaml_str}---\n{body}"
+
+
+def copy_file_mode(file_path: Path, temp_name: str) -> None:
+    """
+    Give a temporary file the permission bits of the file it replaces.
+
+    mkstemp creates files readable by the owner only; a replacement keeps
+    the target's mode, and a new file gets the mode a plain open() would
+    give it under the current umask.
+
+    Args:
+        file_path: File about to be replaced (may not exist yet)
+        temp_name: Temporary file that will replace it
+    """
+    if os.path.exists(file_path):
+        shutil.copymode(file_path, temp_name)
+        return
+
+    umask = os.umask(0)
+    os.umask(umask)
+    os.chmod(temp_name, 0o666 & ~umask)
+
+
+def atomic_write_text(file_path: Path, content: str) -> None:
+    """
+    Replace a file's content atomically.
+
+    Writes to a uniquely named temporary file in the same directory and
+    renames it over the target, so readers never see a partial document.
+    The target's permission bits are kept (see copy_file_mode).
+
+    Args:
+        file_path: File to write
+        content: New text content (UTF-8)
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    file_path = Path(file_path)
+    fd, temp_name = tempfile.mkstemp(
+        dir=file_path.parent,
+        prefix=f".{file_path.name}.",
+        suffix='.tmp'
+    )
+
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+
+        copy_file_mode(file_path, temp_name)
+        os.replace(temp_name, file_path)
+
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
+        raise
+
+
+def atomic_write_prefix(file_path: Path, prefix: str, offset: int) -> None:
+    """
+    Atomically replace the start of a file, streaming the rest unchanged.
+
+    The first offset bytes of the file are replaced by prefix and the
+    remainder is copied a chunk at a time, so large documents can have
+    their frontmatter rewritten without being loaded. The target's
+    permission bits are kept.
+
+    Args:
+        file_path: File to write
+        prefix: New text (UTF-8) for the start of the file
+        offset: Number of bytes of the current file that prefix replaces
+
+    Raises:
+        OSError: If the file cannot be read or written
+    """
+    file_path = Path(file_path)
+    fd, temp_name = tempfile.mkstemp(
+        dir=file_path.parent,
+        prefix=f".{file_path.name}.",
+        suffix='.tmp'
+    )
+
+    try:
+        with os.fdopen(fd, 'wb') as f, open(file_path, 'rb') as source:
+            f.write(prefix.encode('utf-8'))
+            source.seek(offset)
+            shutil.copyfileobj(source, f, COPY_CHUNK_SIZE)
+            f.flush()
+            os.fsync(f.fileno())
+
+        copy_file_mode(file_path, temp_name)
+        os.replace(temp_name, file_path)
+
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
+        raise
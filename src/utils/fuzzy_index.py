@@ -0,0 +1,168 @@
+"""
+Fuzzy string matching over large vocabularies.
+
+Finds all pairs of strings within a small edit distance without comparing
+every pair, using a symmetric deletion index: two strings within distance d
+share at least one variant obtained by deleting up to d characters.
+"""
+
+from collections import defaultdict
+from itertools import combinations
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+
+def edit_distance(a: str, b: str, max_distance: Optional[int] = None) -> int:
+    """
+    Compute optimal string alignment distance between two strings.
+
+    Counts insertions, deletions, substitutions and transpositions of
+    adjacent characters (so 'onbaording' is distance 1 from 'onboarding').
+
+    Args:
+        a: First string
+        b: Second string
+        max_distance: If set, return max_distance + 1 as soon as the
+            distance is known to exceed it
+
+    Returns:
+        Edit distance (capped at max_distance + 1 when max_distance is set)
+    """
+    if a == b:
+        return 0
+    if max_distance is not None and abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    # Near-identical strings differ in a short middle section; only that
+    # part needs the quadratic table
+    prefix = 0
+    while prefix < len(a) and prefix < len(b) and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < len(a) - prefix and suffix < len(b) - prefix
+        and a[-1 - suffix] == b[-1 - suffix]
+    ):
+        suffix += 1
+    a = a[prefix:len(a) - suffix]
+    b = b[prefix:len(b) - suffix]
+
+    if not a:
+        return len(b)
+    if not b:
+        return len(a)
+
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(
+                previous[j] + 1,         # deletion
+                current[j - 1] + 1,      # insertion
+                previous[j - 1] + cost   # substitution
+            )
+            if (
+                previous_previous is not None
+                and i > 1 and j > 1
+                and a[i - 1] == b[j - 2]
+                and a[i - 2] == b[j - 1]
+            ):
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if max_distance is not None and min(current) > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+
+    return previous[-1]
+
+
+def deletion_variants(word: str, max_distance: int) -> Set[str]:
+    """
+    Get all strings obtained by deleting up to max_distance characters.
+
+    Args:
+        word: Source string
+        max_distance: Maximum number of deletions
+
+    Returns:
+        Set of variants, including the word itself
+    """
+    variants = {word}
+    frontier = {word}
+
+    for _ in range(max_distance):
+        next_frontier = set()
+        for variant in frontier:
+            for i in range(len(variant)):
+                next_frontier.add(variant[:i] + variant[i + 1:])
+        variants.update(next_frontier)
+        frontier = next_frontier
+
+    return variants
+
+
+class FuzzyIndex:
+    """
+    Symmetric deletion index for finding near-identical strings.
+
+    Building the index costs O(n * L^d) for n words of length L, and only
+    words sharing a deletion variant are compared, instead of all n^2 pairs.
+
+    Example:
+        >>> index = FuzzyIndex(max_distance=1)
+        >>> for word in ['onboarding', 'onbaording', 'pricing']:
+        ...     index.add(word)
+        >>> list(index.similar_pairs())
+        [('onbaording', 'onboarding', 1)]
+    """
+
+    def __init__(self, max_distance: int = 1):
+        """
+        Initialize fuzzy index.
+
+        Args:
+            max_distance: Maximum edit distance for reported pairs
+        """
+        self.max_distance = max_distance
+        self._words: Set[str] = set()
+        self._variants: Dict[str, Set[str]] = defaultdict(set)
+
+    def add(self, word: str) -> None:
+        """
+        Add a word to the index.
+
+        Args:
+            word: Word to index
+        """
+        if word in self._words:
+            return
+
+        self._words.add(word)
+        for variant in deletion_variants(word, self.max_distance):
+            self._variants[variant].add(word)
+
+    def similar_pairs(self) -> Iterator[Tuple[str, str, int]]:
+        """
+        Find all pairs of indexed words within max_distance.
+
+        Yields:
+            Tuples of (word_a, word_b, distance) with word_a < word_b,
+            sorted by word_a then word_b
+        """
+        pairs = set()
+
+        for words in self._variants.values():
+            if len(words) < 2:
+                continue
+            for a, b in combinations(sorted(words), 2):
+                pairs.add((a, b))
+
+        for a, b in sorted(pairs):
+            distance = edit_distance(a, b, self.max_distance)
+            if distance <= self.max_distance:
+                yield a, b, distance
+
+    def __len__(self) -> int:
+        """Return number of indexed words."""
+        return len(self._words)
@@ -0,0 +1,126 @@
+"""
+Multi-keyword matching using an Aho-Corasick automaton.
+
+Finds every occurrence of a large set of keywords in a single pass over the
+text, so matching cost depends on the text length and the number of matches
+rather than on the number of keywords.
+"""
+
+from collections import deque
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton mapping keywords to arbitrary values.
+
+    Keywords are matched exactly (callers lowercase both keywords and text
+    for case-insensitive matching). Several keywords may share a value,
+    which is how aliases map to a single canonical name.
+
+    Example:
+        >>> matcher = KeywordMatcher({'pro': 'pro', 'pro plus': 'pro-plus'})
+        >>> [value for _, _, value in matcher.find_all('the pro plus plan')]
+        ['pro', 'pro-plus']
+    """
+
+    def __init__(self, keywords: Dict[str, Any] = None):
+        """
+        Initialize matcher and build the automaton.
+
+        Args:
+            keywords: Mapping of keyword to the value reported when it matches
+        """
+        # Trie transitions, failure links and outputs, indexed by state number
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, Any]]] = [[]]
+        self._size = 0
+
+        for keyword, value in (keywords or {}).items():
+            self._add(keyword, value)
+        self._build()
+
+    def _add(self, keyword: str, value: Any) -> None:
+        """Insert a keyword into the trie."""
+        if not keyword:
+            return
+
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+
+        if not self._output[state]:
+            self._size += 1
+        self._output[state] = [(len(keyword), value)]
+
+    def _build(self) -> None:
+        """Compute failure links breadth-first and merge suffix outputs."""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+
+                # A state also emits every keyword that is a suffix of it
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+
+    def find_all(
+        self,
+        text: str,
+        whole_words: bool = True
+    ) -> Iterator[Tuple[int, int, Any]]:
+        """
+        Find all keyword occurrences in text.
+
+        Args:
+            text: Text to scan
+            whole_words: If True, skip matches adjacent to letters or digits
+
+        Yields:
+            Tuples of (start, end, value) in order of match end position
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for length, value in output[state]:
+                start = index - length + 1
+                end = index + 1
+                if whole_words and not self._is_word_bounded(text, start, end):
+                    continue
+                yield start, end, value
+
+    @staticmethod
+    def _is_word_bounded(text: str, start: int, end: int) -> bool:
+        """Check that a match is not part of a longer word."""
+        if start > 0 and text[start - 1].isalnum():
+            return False
+        if end < len(text) and text[end].isalnum():
+            return False
+        return True
+
+    def __len__(self) -> int:
+        """Return number of distinct keywords."""
+        return self._size
@@ -0,0 +1,173 @@
+"""
+Bounded-memory access to very large documents.
+
+Files above a size threshold are memory-mapped instead of read into a
+string, so hashing and line-based validation touch the file through the
+page cache and keep per-process memory independent of document size.
+"""
+
+import hashlib
+import mmap
+from pathlib import Path
+from typing import Any, Iterator
+
+# Files at or above this size are memory-mapped (8 MiB)
+MMAP_THRESHOLD = 8 * 1024 * 1024
+
+# Bytes decoded at a time when streaming lines from a mapped file
+CHUNK_SIZE = 1024 * 1024
+
+# Block size for hashing files that are not memory-mapped
+HASH_CHUNK_SIZE = 64 * 1024
+
+
+def large_file_threshold(config: Any) -> int:
+    """
+    Get the configured large-file threshold in bytes.
+
+    Args:
+        config: Configuration object (processing.large_file_threshold_mb)
+
+    Returns:
+        Size in bytes at or above which a file counts as large
+    """
+    megabytes = config.get('processing.large_file_threshold_mb', MMAP_THRESHOLD / (1024 * 1024))
+    return int(megabytes * 1024 * 1024)
+
+
+def is_large_file(file_path: Path, threshold: int = MMAP_THRESHOLD) -> bool:
+    """
+    Check whether a file should be processed through a memory map.
+
+    Args:
+        file_path: Path to file
+        threshold: Size in bytes at or above which a file counts as large
+
+    Returns:
+        True if the file exists and is at least threshold bytes
+    """
+    try:
+        return Path(file_path).stat().st_size >= threshold
+    except OSError:
+        return False
+
+
+def hash_file(file_path: Path, threshold: int = MMAP_THRESHOLD) -> str:
+    """
+    Compute the SHA-256 of a file without reading it into memory.
+
+    Files at or above threshold are hashed straight from a memory map;
+    smaller files are read in blocks.
+
+    Args:
+        file_path: Path to file
+        threshold: Size in bytes at or above which the file is mapped
+
+    Returns:
+        Hexadecimal SHA-256 digest
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    sha256_hash = hashlib.sha256()
+
+    with open(file_path, 'rb') as f:
+        if is_large_file(file_path, threshold):
+            # Hash from the page cache without copying the file into
+            # Python buffers
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                sha256_hash.update(mapped)
+        else:
+            for byte_block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                sha256_hash.update(byte_block)
+
+    return sha256_hash.hexdigest()
+
+
+def read_prefix(file_path: Path, size: int) -> bytes:
+    """
+    Read the start of a file, ending at a line boundary.
+
+    Args:
+        file_path: Path to file
+        size: Maximum number of bytes to read
+
+    Returns:
+        The whole file if it is at most size bytes, otherwise its first
+        size bytes cut after the last newline
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    with open(file_path, 'rb') as f:
+        data = f.read(size + 1)
+
+    if len(data) <= size:
+        return data
+
+    data = data[:size]
+    return data[:data.rfind(b'\n') + 1]
+
+
+def _line_cut(chunk: bytes) -> int:
+    """
+    Find where to cut a chunk so no line continues into the next chunk.
+
+    Returns:
+        Offset just after the last line terminator ('\n', '\r' or
+        '\r\n') that is known to be complete, or 0 if there is none
+    """
+    cut = max(chunk.rfind(b'\n'), chunk.rfind(b'\r')) + 1
+    if cut == len(chunk) and chunk.endswith(b'\r'):
+        # The '\n' of a '\r\n' may start the next chunk
+        end = len(chunk) - 1
+        cut = max(chunk.rfind(b'\n', 0, end), chunk.rfind(b'\r', 0, end)) + 1
+    return cut
+
+
+def iter_lines(file_path: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """
+    Iterate over a file's lines through a memory map.
+
+    The mapping is decoded a chunk at a time, cut at the last line break
+    ('\n', '\r' or '\r\n') in the chunk, so lines match
+    ``str.splitlines()`` on the whole file while memory use stays
+    proportional to chunk_size (plus the longest line).
+
+    Args:
+        file_path: Path to a UTF-8 text file
+        chunk_size: Bytes to decode at a time
+
+    Yields:
+        Each line of the file, without its line terminator
+
+    Raises:
+        OSError: If the file cannot be opened or mapped
+        UnicodeDecodeError: If the file is not valid UTF-8
+    """
+    with open(file_path, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return
+
+        with mapped:
+            size = len(mapped)
+            position = 0
+            carry = b''
+
+            while position < size:
+                chunk = carry + mapped[position:position + chunk_size]
+                position += chunk_size
+
+                if position < size:
+                    # Cut after the last line break so neither a line nor a
+                    # multi-byte character is split across chunks
+                    cut = _line_cut(chunk)
+                    if cut == 0:
+                        carry = chunk
+                        continue
+                    chunk, carry = chunk[:cut], chunk[cut:]
+
+                yield from chunk.decode('utf-8').splitlines()
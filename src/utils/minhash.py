@@ -0,0 +1,267 @@
+"""
+MinHash signatures and locality-sensitive hashing for near-duplicate detection.
+
+Documents are reduced to sets of word shingles, summarized as fixed-size
+MinHash signatures (computed with NumPy), and bucketed with LSH banding so
+only documents sharing at least one band are compared.
+"""
+
+import json
+import re
+import zlib
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .frontmatter import atomic_write_text
+
+
+# Mersenne prime used for the universal hash family (a * x + b) mod p
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+# Shingles are hashed in blocks to bound the permutation matrix size
+_SHINGLE_BLOCK = 4096
+
+_WORD_PATTERN = re.compile(r'\w+')
+
+
+def shingle_hashes(text: str, shingle_size: int = 5) -> Set[int]:
+    """
+    Compute stable 32-bit hashes of the word shingles in text.
+
+    Args:
+        text: Text to shingle (lowercased internally)
+        shingle_size: Number of consecutive words per shingle
+
+    Returns:
+        Set of shingle hashes (empty if text has fewer words than shingle_size)
+    """
+    words = _WORD_PATTERN.findall(text.lower())
+    if len(words) < shingle_size:
+        return set()
+
+    return {
+        zlib.crc32(' '.join(words[i:i + shingle_size]).encode('utf-8'))
+        for i in range(len(words) - shingle_size + 1)
+    }
+
+
+class MinHasher:
+    """
+    Computes MinHash signatures with a seeded family of hash permutations.
+
+    Attributes:
+        num_perm: Number of permutations (signature length)
+        seed: Seed for the permutation parameters
+    """
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        """
+        Initialize permutation parameters.
+
+        Args:
+            num_perm: Number of permutations (signature length)
+            seed: Random seed so signatures are stable across runs
+        """
+        self.num_perm = num_perm
+        self.seed = seed
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+
+    def signature(self, hashes: Iterable[int]) -> np.ndarray:
+        """
+        Compute the MinHash signature of a set of shingle hashes.
+
+        Args:
+            hashes: 32-bit shingle hashes
+
+        Returns:
+            uint32 array of length num_perm
+        """
+        values = np.fromiter(hashes, dtype=np.uint64)
+        signature = np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+
+        # uint64 arithmetic wraps on overflow, which is fine for hashing
+        with np.errstate(over='ignore'):
+            for start in range(0, len(values), _SHINGLE_BLOCK):
+                block = values[start:start + _SHINGLE_BLOCK]
+                permuted = (
+                    (self._a[:, None] * block[None, :] + self._b[:, None])
+                    % _MERSENNE_PRIME
+                ) & _MAX_HASH
+                np.minimum(signature, permuted.min(axis=1), out=signature)
+
+        return signature.astype(np.uint32)
+
+
+def estimate_similarity(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+    """
+    Estimate Jaccard similarity from two MinHash signatures.
+
+    Args:
+        sig_a: First signature
+        sig_b: Second signature
+
+    Returns:
+        Fraction of positions where the signatures agree
+    """
+    return float(np.count_nonzero(sig_a == sig_b)) / len(sig_a)
+
+
+class LSHIndex:
+    """
+    Locality-sensitive hashing index over MinHash signatures.
+
+    Signatures are split into bands; documents sharing any band bucket
+    become candidate pairs. With b bands of r rows, pairs with Jaccard
+    similarity s collide with probability 1 - (1 - s^r)^b.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 32):
+        """
+        Initialize LSH index.
+
+        Args:
+            num_perm: Signature length
+            bands: Number of bands (must divide num_perm)
+
+        Raises:
+            ValueError: If bands does not divide num_perm
+        """
+        if bands <= 0 or num_perm % bands != 0:
+            raise ValueError(f"bands ({bands}) must evenly divide num_perm ({num_perm})")
+
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: List[Dict[bytes, List[str]]] = [defaultdict(list) for _ in range(bands)]
+
+    def add(self, key: str, signature: np.ndarray) -> None:
+        """
+        Add a signature to the index.
+
+        Args:
+            key: Identifier for the document
+            signature: MinHash signature
+        """
+        for band in range(self.bands):
+            band_slice = signature[band * self.rows:(band + 1) * self.rows]
+            self._buckets[band][band_slice.tobytes()].append(key)
+
+    def candidate_pairs(self) -> Set[Tuple[str, str]]:
+        """
+        Get all pairs of keys sharing at least one band bucket.
+
+        Returns:
+            Set of (key_a, key_b) tuples with key_a < key_b
+        """
+        pairs = set()
+
+        for buckets in self._buckets:
+            for keys in buckets.values():
+                if len(keys) < 2:
+                    continue
+                for i in range(len(keys)):
+                    for j in range(i + 1, len(keys)):
+                        a, b = keys[i], keys[j]
+                        pairs.add((a, b) if a < b else (b, a))
+
+        return pairs
+
+
+class SignatureCache:
+    """
+    Persistent store of MinHash signatures keyed by content hash.
+
+    Signatures are only valid for the parameters they were computed with,
+    so the cache is discarded when num_perm, seed or shingle_size change.
+    Only signatures used in the current run are written back, which keeps
+    the file from growing with stale content.
+    """
+
+    VERSION = "1.0.0"
+
+    def __init__(
+        self,
+        cache_file: Optional[Path],
+        num_perm: int,
+        seed: int,
+        shingle_size: int
+    ):
+        """
+        Initialize and load the signature cache.
+
+        Args:
+            cache_file: Path to JSON cache file (None for in-memory only)
+            num_perm: Signature length
+            seed: Permutation seed
+            shingle_size: Words per shingle
+        """
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.params = {'num_perm': num_perm, 'seed': seed, 'shingle_size': shingle_size}
+        self._signatures: Dict[str, List[int]] = {}
+        self._used: Dict[str, List[int]] = {}
+
+        self._load()
+
+    def _load(self) -> None:
+        """Load signatures from disk if the file matches current parameters."""
+        if self.cache_file is None or not self.cache_file.exists():
+            return
+
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            # A bad signature cache only costs a re-sign
+            return
+
+        if data.get('version') != self.VERSION or data.get('params') != self.params:
+            return
+
+        self._signatures = data.get('signatures', {})
+
+    def get(self, content_hash: str) -> Optional[np.ndarray]:
+        """
+        Get a cached signature.
+
+        Args:
+            content_hash: Hash of the document content
+
+        Returns:
+            Signature array or None if not cached
+        """
+        values = self._signatures.get(content_hash)
+        if values is None:
+            return None
+
+        self._used[content_hash] = values
+        return np.array(values, dtype=np.uint32)
+
+    def put(self, content_hash: str, signature: np.ndarray) -> None:
+        """
+        Store a signature.
+
+        Args:
+            content_hash: Hash of the document content
+            signature: MinHash signature
+        """
+        values = signature.tolist()
+        self._signatures[content_hash] = values
+        self._used[content_hash] = values
+
+    def save(self) -> None:
+        """Write signatures used in this run to disk atomically (see atomic_write_text)."""
+        if self.cache_file is None:
+            return
+
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(self.cache_file, json.dumps({
+            'version': self.VERSION,
+            'params': self.params,
+            'signatures': self._used
+        }))
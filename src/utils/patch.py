@@ -0,0 +1,103 @@
+"""
+Unified diffs for previewing document changes.
+
+Previews compute a document's would-be content in memory and render the
+change as a git-style unified diff. Diffs are produced one document at a
+time, so a preview over many documents can be streamed to stdout or a
+patch file without holding every rewritten document in memory. The output
+applies cleanly with ``git apply`` (or ``patch -p1``) from the directory
+paths are relative to. Renames are written as git rename headers.
+"""
+
+import difflib
+import os
+from pathlib import Path
+from typing import List, Optional
+
+# Lines of unchanged context around each hunk (git's default)
+CONTEXT_LINES = 3
+
+NO_NEWLINE_MARKER = "\\ No newline at end of file\n"
+
+
+def patch_path(file_path: Path, root: Optional[Path] = None) -> str:
+    """
+    Get the path a diff refers to a file by.
+
+    Args:
+        file_path: Changed file
+        root: Directory the patch is applied from (default: current directory)
+
+    Returns:
+        POSIX path of file_path relative to root
+    """
+    relative = os.path.relpath(os.path.abspath(file_path), os.path.abspath(root or Path.cwd()))
+    return Path(relative).as_posix()
+
+
+def split_patch_lines(text: str) -> List[str]:
+    """
+    Split text into lines the way diff and git do.
+
+    Only '\\n' ends a line; '\\r' and other characters str.splitlines()
+    treats as breaks stay part of the line, so CRLF documents round-trip.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Lines including their '\\n' (the last line lacks it if the text
+        does not end with a newline)
+    """
+    lines = text.split('\n')
+    result = [line + '\n' for line in lines[:-1]]
+    if lines[-1]:
+        result.append(lines[-1])
+    return result
+
+
+def unified_diff(
+    file_path: Path,
+    original: str,
+    modified: str,
+    root: Optional[Path] = None,
+    context: int = CONTEXT_LINES,
+    new_path: Optional[Path] = None
+) -> str:
+    """
+    Render the change to one file as a git-style unified diff.
+
+    Args:
+        file_path: File the change applies to
+        original: Current file content
+        modified: Content the file would have after the change
+        root: Directory the patch is applied from (default: current directory)
+        context: Lines of unchanged context around each hunk
+        new_path: Path the file is renamed to, if it moves
+
+    Returns:
+        Diff text, or an empty string if the file is neither changed nor moved
+    """
+    path = patch_path(file_path, root)
+    target = patch_path(new_path, root) if new_path is not None else path
+    if original == modified and target == path:
+        return ""
+
+    hunks = difflib.unified_diff(
+        split_patch_lines(original),
+        split_patch_lines(modified),
+        fromfile=f"a/{path}",
+        tofile=f"b/{target}",
+        n=context
+    )
+
+    parts = [f"diff --git a/{path} b/{target}\n"]
+    if target != path:
+        parts.append(f"rename from {path}\nrename to {target}\n")
+    for line in hunks:
+        parts.append(line)
+        if not line.endswith('\n'):
+            # Last line of a file without a trailing newline
+            parts.append('\n' + NO_NEWLINE_MARKER)
+
+    return ''.join(parts)
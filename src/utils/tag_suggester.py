@@ -0,0 +1,281 @@
+"""
+TF-IDF tag suggestions learned from already-tagged documents.
+
+Document text is reduced to term counts (cached by content hash, so reruns
+only re-tokenize changed documents) and weighted with TF-IDF over the
+corpus. Each tag is represented by the normalized centroid of the vectors
+of the documents carrying it, and a document is matched against every tag
+centroid at once with a NumPy product of its sparse vector and the
+centroid matrix. Everything is computed locally.
+"""
+
+import hashlib
+import json
+import math
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .frontmatter import atomic_write_text
+
+
+# Bumped whenever tokenization changes, invalidating cached term counts
+TOKENIZER_VERSION = 1
+
+_TOKEN_PATTERN = re.compile(r'[a-z][a-z0-9]{2,}')
+_CODE_BLOCK_PATTERN = re.compile(r'^(```|~~~).*?^\1', re.MULTILINE | re.DOTALL)
+_LINK_URL_PATTERN = re.compile(r'\]\([^)]*\)')
+
+STOP_WORDS = frozenset({
+    'about', 'after', 'all', 'also', 'and', 'any', 'are', 'been', 'before', 'but',
+    'can', 'each', 'for', 'from', 'has', 'have', 'how', 'into', 'its', 'may',
+    'more', 'most', 'must', 'not', 'one', 'only', 'other', 'our', 'out', 'should',
+    'such', 'than', 'that', 'the', 'their', 'them', 'then', 'there', 'these',
+    'they', 'this', 'through', 'use', 'used', 'using', 'was', 'were', 'what',
+    'when', 'which', 'while', 'who', 'will', 'with', 'would', 'you', 'your',
+})
+
+
+def term_counts(text: str) -> Dict[str, int]:
+    """
+    Count the terms in markdown text.
+
+    Code blocks and link URLs are ignored; terms are lowercased words of at
+    least three characters that are not stop words.
+
+    Args:
+        text: Document text
+
+    Returns:
+        Mapping of term to number of occurrences
+    """
+    text = _CODE_BLOCK_PATTERN.sub(' ', text)
+    text = _LINK_URL_PATTERN.sub(']', text)
+    return dict(Counter(
+        term for term in _TOKEN_PATTERN.findall(text.lower()) if term not in STOP_WORDS
+    ))
+
+
+class TermCountCache:
+    """
+    Persistent store of document term counts keyed by content hash.
+
+    Counts are discarded when the tokenizer changes. Only counts used in the
+    current run are written back, which keeps the file from growing with
+    stale content.
+    """
+
+    VERSION = "1.0.0"
+
+    def __init__(self, cache_file: Optional[Path]):
+        """
+        Initialize and load the term count cache.
+
+        Args:
+            cache_file: Path to JSON cache file (None for in-memory only)
+        """
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.params = {'tokenizer': TOKENIZER_VERSION}
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._used: Dict[str, Dict[str, int]] = {}
+
+        self._load()
+
+    def _load(self) -> None:
+        """Load term counts from disk if the file matches the tokenizer."""
+        if self.cache_file is None or not self.cache_file.exists():
+            return
+
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            # A bad term cache only costs a re-tokenize
+            return
+
+        if data.get('version') != self.VERSION or data.get('params') != self.params:
+            return
+
+        self._counts = data.get('counts', {})
+
+    def get(self, text: str) -> Dict[str, int]:
+        """
+        Get the term counts of a text, tokenizing it only if not cached.
+
+        Args:
+            text: Document text
+
+        Returns:
+            Mapping of term to number of occurrences
+        """
+        content_hash = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        counts = self._counts.get(content_hash)
+        if counts is None:
+            counts = term_counts(text)
+            self._counts[content_hash] = counts
+
+        self._used[content_hash] = counts
+        return counts
+
+    def save(self) -> None:
+        """Write term counts used in this run to disk atomically (see atomic_write_text)."""
+        if self.cache_file is None:
+            return
+
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(self.cache_file, json.dumps({
+            'version': self.VERSION,
+            'params': self.params,
+            'counts': self._used
+        }))
+
+
+class TagSuggester:
+    """
+    Suggests tags for documents from the tags of similar documents.
+
+    Documents are compared with tag centroids by cosine similarity of their
+    TF-IDF vectors (sublinear term frequency, smoothed IDF).
+
+    Attributes:
+        top_k: Maximum number of tags suggested per document
+        min_similarity: Minimum cosine similarity for a tag to be suggested
+        min_tag_documents: Tags on fewer tagged documents are not learned
+        max_features: Vocabulary size (most widespread terms are kept)
+    """
+
+    def __init__(
+        self,
+        top_k: int = 3,
+        min_similarity: float = 0.1,
+        min_tag_documents: int = 2,
+        max_features: int = 20000,
+        term_cache: Optional[TermCountCache] = None
+    ):
+        """
+        Initialize tag suggester.
+
+        Args:
+            top_k: Maximum number of tags suggested per document
+            min_similarity: Minimum cosine similarity for a suggestion
+            min_tag_documents: Minimum number of tagged documents per tag
+            max_features: Maximum vocabulary size
+            term_cache: Cache of term counts by content hash (optional)
+        """
+        self.top_k = top_k
+        self.min_similarity = min_similarity
+        self.min_tag_documents = min_tag_documents
+        self.max_features = max_features
+        self.term_cache = term_cache
+
+        self._vocabulary: Dict[str, int] = {}
+        self._idf = np.zeros(0, dtype=np.float32)
+        self._tags: List[str] = []
+        # One L2-normalized TF-IDF centroid per tag (tags x vocabulary)
+        self._centroids = np.zeros((0, 0), dtype=np.float32)
+
+    @property
+    def tags(self) -> List[str]:
+        """Tags the suggester has learned, sorted."""
+        return list(self._tags)
+
+    @property
+    def fitted(self) -> bool:
+        """True if at least one tag has been learned."""
+        return bool(self._tags)
+
+    def _counts(self, text: str) -> Dict[str, int]:
+        """Get term counts through the cache, if any."""
+        if self.term_cache is not None:
+            return self.term_cache.get(text)
+        return term_counts(text)
+
+    def fit(self, documents: Iterable[Tuple[str, Iterable[str]]]) -> int:
+        """
+        Learn tag centroids from a corpus.
+
+        Every document contributes to the IDF weights; documents with tags
+        also contribute to the centroids of their tags.
+
+        Args:
+            documents: (text, tags) pairs; tags may be empty
+
+        Returns:
+            Number of tagged documents learned from
+        """
+        corpus = []
+        document_frequency: Counter = Counter()
+        for text, tags in documents:
+            counts = self._counts(text)
+            document_frequency.update(counts.keys())
+            tag_set = sorted({str(tag).strip().lower() for tag in tags if str(tag).strip()})
+            corpus.append((counts, tag_set))
+
+        tagged = [(counts, tags) for counts, tags in corpus if tags and counts]
+        tag_frequency = Counter(tag for _, tags in tagged for tag in tags)
+        self._tags = sorted(tag for tag, count in tag_frequency.items() if count >= self.min_tag_documents)
+
+        # Only terms of tagged documents can weigh in a centroid
+        tagged_terms = {term for counts, _ in tagged for term in counts}
+        terms = sorted(tagged_terms, key=lambda term: (-document_frequency[term], term))[:self.max_features]
+        self._vocabulary = {term: index for index, term in enumerate(sorted(terms))}
+
+        total = len(corpus)
+        self._idf = np.array([
+            math.log((1 + total) / (1 + document_frequency[term])) + 1
+            for term in self._vocabulary
+        ], dtype=np.float32)
+
+        tag_index = {tag: index for index, tag in enumerate(self._tags)}
+        centroids = np.zeros((len(self._tags), len(self._vocabulary)), dtype=np.float32)
+        for counts, tags in tagged:
+            indices, weights = self._vectorize(counts)
+            for tag in tags:
+                if tag in tag_index:
+                    centroids[tag_index[tag], indices] += weights
+
+        norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        self._centroids = np.divide(centroids, norms, out=centroids, where=norms > 0)
+
+        return len(tagged)
+
+    def _vectorize(self, counts: Dict[str, int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute a document's L2-normalized TF-IDF vector in sparse form.
+
+        Returns:
+            Tuple of (vocabulary indices, weights)
+        """
+        known = [(self._vocabulary[term], count) for term, count in counts.items() if term in self._vocabulary]
+        if not known:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+
+        indices = np.fromiter((index for index, _ in known), dtype=np.int64, count=len(known))
+        frequencies = np.fromiter((count for _, count in known), dtype=np.float32, count=len(known))
+        weights = (1 + np.log(frequencies)) * self._idf[indices]
+        return indices, weights / np.linalg.norm(weights)
+
+    def suggest(self, text: str) -> List[str]:
+        """
+        Suggest tags for a document.
+
+        Args:
+            text: Document text
+
+        Returns:
+            Up to top_k tags ordered by similarity (empty if no tag is
+            similar enough or nothing has been learned)
+        """
+        if not self.fitted:
+            return []
+
+        indices, weights = self._vectorize(self._counts(text))
+        # Only the centroid columns of the document's terms contribute
+        similarities = self._centroids[:, indices] @ weights
+        # Stable sort keeps ties in tag order
+        ranked = np.argsort(-similarities, kind='stable')[:self.top_k]
+
+        return [self._tags[row] for row in ranked if similarities[row] >= self.min_similarity]
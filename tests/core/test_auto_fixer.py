@@ -2,13 +2,16 @@
 Tests for auto-fix engine.
 """
 
+import json
+
 import pytest
 from pathlib import Path
-from src.core.auto_fixer import AutoFixer, AutoFixResult
+from src.core.auto_fixer import AutoFixer, AutoFixResult, FixTransform
 from src.core.validators.yaml_validator import YAMLValidator, ValidationIssue, ValidationSeverity
 from src.utils.config import Config
 from src.utils.logger import Logger
-from src.utils.frontmatter import parse_frontmatter, has_frontmatter
+from src.utils.frontmatter import parse_frontmatter, has_frontmatter, atomic_write_text
+from src.utils.tag_suggester import TagSuggester
 
 
 class TestAutoFixer:
@@ -197,6 +200,86 @@ performance:
 
         assert 'general' in tags
 
+    def test_trained_tag_suggestions(self, fixer, validator, tmp_path, monkeypatch):
+        """Test untagged documents get the tags of similar tagged documents."""
+        monkeypatch.chdir(tmp_path)
+        docs = tmp_path / "unknown"
+        docs.mkdir()
+        for name, tags, body in [
+            ("invoices", "[billing]", "Invoice payment terms and billing due dates"),
+            ("refunds", "[billing]", "Refund an invoice and issue billing credit"),
+            ("laptops", "[onboarding]", "Laptop setup checklist for new hires"),
+            ("benefits", "[onboarding]", "Benefits enrollment for new hires"),
+        ]:
+            (docs / f"{name}.md").write_text(f"---\ntitle: {name}\ntags: {tags}\nstatus: draft\n---\n{body}\n")
+        untagged = docs / "overdue.md"
+        untagged.write_text("# Overdue invoices\n\nSend billing reminders for an overdue invoice.\n")
+        unmatched = docs / "kubernetes.md"
+        unmatched.write_text("# Kubernetes\n\nCluster autoscaling.\n")
+
+        learned = fixer.train_tag_suggester(sorted(docs.glob('*.md')))
+        results = fixer.fix_batch({path: validator.validate(path) for path in (untagged, unmatched)}, preview=False)
+
+        assert learned == 4
+        assert (tmp_path / "_meta" / ".term-cache.json").exists()
+        assert parse_frontmatter(untagged)['tags'] == ['billing']
+        assert parse_frontmatter(unmatched)['tags'] == ['general']
+        assert "Added suggested tags: ['billing']" in results[untagged].fixes_applied
+
+    def test_tag_suggestions_read_documents_once(self, fixer, validator, tmp_path, monkeypatch, mocker):
+        """Test suggestions reuse the fixed buffer and their term counts are saved."""
+        monkeypatch.chdir(tmp_path)
+        for name, tags, body in [
+            ("invoices", "[billing]", "Invoice payment terms and billing due dates"),
+            ("refunds", "[billing]", "Refund an invoice and issue billing credit"),
+        ]:
+            (tmp_path / f"{name}.md").write_text(f"---\ntitle: {name}\ntags: {tags}\nstatus: draft\n---\n{body}\n")
+        fixer.train_tag_suggester(sorted(tmp_path.glob('*.md')))
+        untagged = tmp_path / "overdue.md"
+        untagged.write_text("# Overdue invoices\n\nSend billing reminders for an overdue invoice.\n")
+        issues = {untagged: validator.validate(untagged)}
+
+        read_text = mocker.spy(Path, 'read_text')
+        read_bytes = mocker.spy(Path, 'read_bytes')
+        fixer.fix_batch(issues, preview=False)
+
+        assert read_text.call_count == 0
+        assert read_bytes.call_count == 1
+        assert parse_frontmatter(untagged)['tags'] == ['billing']
+        cache = json.loads((tmp_path / "_meta" / ".term-cache.json").read_text())
+        assert len(cache['counts']) == 3
+
+    def test_training_reads_head_of_large_documents(self, fixer, tmp_path, mocker):
+        """Test only the start of a large document's body is learned from."""
+        for name, body in [("invoices", "Invoice billing\n"), ("refunds", "Refund billing\n")]:
+            (tmp_path / f"{name}.md").write_text(
+                f"---\ntitle: {name}\ntags: [billing]\n---\n{body}" + "payroll\n" * 10
+            )
+        fixer.large_file_threshold = 0
+        mocker.patch('src.core.auto_fixer.LARGE_FILE_HEAD', 16)
+        fit = mocker.spy(TagSuggester, 'fit')
+        read_text = mocker.spy(Path, 'read_text')
+
+        assert fixer.train_tag_suggester(sorted(tmp_path.glob('*.md'))) == 2
+        assert fit.call_args.args[1] == [
+            ("invoices\nInvoice billing\n", ['billing']),
+            ("refunds\nRefund billing\n", ['billing']),
+        ]
+        assert read_text.call_count == 0
+
+    def test_needs_tags(self, fixer, validator, tmp_path):
+        """Test only fixes that add a tags field need tag suggestions."""
+        no_frontmatter = tmp_path / "a.md"
+        no_frontmatter.write_text("# A\n")
+        no_tags = tmp_path / "b.md"
+        no_tags.write_text("---\ntitle: B\nstatus: draft\n---\n# B\n")
+        no_status = tmp_path / "c.md"
+        no_status.write_text("---\ntitle: C\ntags: [x]\n---\n# C\n")
+
+        assert fixer.needs_tags(validator.validate(no_frontmatter))
+        assert fixer.needs_tags(validator.validate(no_tags))
+        assert not fixer.needs_tags(validator.validate(no_status))
+
     def test_fix_missing_title_from_h1(self, fixer, tmp_path):
         """Test fixing missing title by extracting from H1."""
         test_file = tmp_path / "test.md"
@@ -293,21 +376,6 @@ performance:
         assert isinstance(metadata['tags'], list)
         assert metadata['status'] == 'draft'
 
-    def test_create_backup(self, fixer, tmp_path):
-        """Test backup creation before fixes."""
-        test_file = tmp_path / "test.md"
-        original_content = "# Test\n\nOriginal content"
-        test_file.write_text(original_content, encoding='utf-8')
-
-        backup_path = fixer._create_backup(test_file)
-
-        assert backup_path.exists()
-        assert backup_path.parent == fixer.backup_dir
-        assert test_file.stem in backup_path.name
-
-        # Verify backup has same content
-        assert backup_path.read_text(encoding='utf-8') == original_content
-
     def test_fix_nonexistent_file(self, fixer, tmp_path):
         """Test fixing non-existent file returns error."""
         test_file = tmp_path / "nonexistent.md"
@@ -352,6 +420,61 @@ performance:
         assert results[file1].success is True
         assert results[file2].success is True
 
+    def test_iter_previews_diff_matches_apply(self, fixer, validator, tmp_path):
+        """Test preview diffs describe exactly what apply mode writes."""
+        test_file = tmp_path / "doc.md"
+        test_file.write_text("---\ntags: pricing\nstatus: draft\n---\n# Doc  \n", encoding='utf-8')
+        clean_file = tmp_path / "clean.md"
+        clean_file.write_text("---\ntitle: Clean\ntags: [a]\nstatus: draft\n---\n# Clean\n", encoding='utf-8')
+        documents = {
+            test_file: validator.validate(test_file),
+            clean_file: validator.validate(clean_file)
+        }
+        documents[test_file].append(ValidationIssue(
+            rule_id="MD-004",
+            severity=ValidationSeverity.WARNING,
+            message="Line has trailing whitespace",
+            file_path=test_file,
+            line_number=5
+        ))
+
+        previews = list(fixer.iter_previews(documents, root=tmp_path))
+
+        assert len(previews) == 1
+        result, diff = previews[0]
+        assert result.preview_only is True
+        assert diff.startswith("diff --git a/doc.md b/doc.md\n")
+        assert "-# Doc  \n+# Doc\n" in diff
+        assert "+title: Doc\n" in diff
+        assert test_file.read_text(encoding='utf-8').endswith("# Doc  \n")
+
+        fixer.fix_document(test_file, documents[test_file], preview=False)
+        fixed = test_file.read_text(encoding='utf-8')
+        assert all(line[1:] in fixed for line in diff.splitlines() if line.startswith('+') and not line.startswith('+++'))
+
+    def test_fix_batch_parallel_single_backup_run(self, fixer, tmp_path):
+        """Test a parallel batch fixes every file and records one backup run."""
+        documents = {}
+        for index in range(6):
+            folder = tmp_path / f"folder{index % 2}"
+            folder.mkdir(exist_ok=True)
+            doc = folder / f"doc{index // 2}.md"
+            doc.write_text(f"# Doc {index}\n", encoding='utf-8')
+            documents[doc] = [ValidationIssue(
+                "YAML-001", ValidationSeverity.ERROR, "Missing frontmatter", doc
+            )]
+
+        results = fixer.fix_batch(documents, preview=False, jobs=4)
+
+        assert list(results) == list(documents)
+        assert all(result.success and result.run_id == fixer.last_run_id for result in results.values())
+        manifest = fixer.backup_store.load_manifest(fixer.last_run_id)
+        assert len(manifest['files']) == 6
+        for doc in documents:
+            entry = manifest['files'][fixer.backup_store.path_key(doc)]
+            assert fixer.backup_store.get(entry['before']).startswith(b"# Doc")
+            assert has_frontmatter(doc)
+
     def test_can_fix_validation_issue(self, fixer, tmp_path):
         """Test checking if an issue can be auto-fixed."""
         fixable_issue = ValidationIssue(
@@ -371,6 +494,84 @@ performance:
         assert fixer.can_fix(fixable_issue) is True
         assert fixer.can_fix(unfixable_issue) is False
 
+    def test_frontmatter_and_whitespace_fixes_compose(self, fixer, tmp_path, mocker):
+        """Test several fixes land in one write without undoing each other."""
+        test_file = tmp_path / "test.md"
+        test_file.write_text("# Test Document   \n\nContent  \n", encoding='utf-8')
+        write_spy = mocker.patch(
+            'src.core.auto_fixer.atomic_write_text',
+            wraps=atomic_write_text
+        )
+
+        issues = [
+            ValidationIssue("YAML-001", ValidationSeverity.ERROR, "Missing frontmatter", test_file),
+            ValidationIssue("MD-004", ValidationSeverity.INFO, "Trailing whitespace", test_file, 1),
+        ]
+        result = fixer.fix_document(test_file, issues, preview=False)
+
+        assert result.success is True
+        assert write_spy.call_count == 1
+        assert parse_frontmatter(test_file)['title'] == "Test Document"
+        content = test_file.read_text(encoding='utf-8')
+        assert all(line == line.rstrip() for line in content.splitlines())
+        assert "Removed trailing whitespace from 2 line(s)" in result.fixes_applied
+
+    def test_whitespace_fix_keeps_frontmatter_formatting(self, fixer, tmp_path):
+        """Test fixes that don't touch metadata leave the YAML block as written."""
+        test_file = tmp_path / "test.md"
+        test_file.write_text(
+            "---\ntitle: \"Quoted\"   \ntags: [a, b]\n---\n# Title  \n", encoding='utf-8'
+        )
+
+        fixer.fix_document(
+            test_file,
+            [ValidationIssue("MD-004", ValidationSeverity.INFO, "Trailing whitespace", test_file, 2)],
+            preview=False
+        )
+
+        assert test_file.read_text(encoding='utf-8') == \
+            "---\ntitle: \"Quoted\"\ntags: [a, b]\n---\n# Title\n"
+
+    def test_large_document_fixes_frontmatter_only(self, fixer, tmp_path, mocker):
+        """Test a large document's metadata is fixed with its body copied as is."""
+        test_file = tmp_path / "test.md"
+        body = b"# Title  \r\n" + b"line  \n" * 100 + b"\xff not utf-8\n"
+        original = b"---\ntitle: Test\ntags: pricing\nstatus: draft\n---\n" + body
+        test_file.write_bytes(original)
+        fixer.large_file_threshold = 0
+        mocker.patch('src.core.auto_fixer.LARGE_FILE_HEAD', 32)
+
+        issues = [
+            ValidationIssue("YAML-004", ValidationSeverity.ERROR, "Tags must be a list", test_file),
+            ValidationIssue("MD-004", ValidationSeverity.INFO, "Trailing whitespace", test_file, 6),
+        ]
+        result = fixer.fix_document(test_file, issues, preview=False)
+
+        assert result.success is True
+        assert result.fixes_applied == ["Converted tags from string to list"]
+        assert test_file.read_bytes().endswith(b"---\n" + body)
+        assert parse_frontmatter(test_file)['tags'] == ['pricing']
+        assert result.backup_path.read_bytes() == original
+
+    def test_registered_transform_is_fixable(self, fixer, tmp_path):
+        """Test can_fix and fix_batch follow registered transforms."""
+        test_file = tmp_path / "test.md"
+        test_file.write_text("---\ntitle: T\n---\nbody\n", encoding='utf-8')
+        issue = ValidationIssue("TEST-001", ValidationSeverity.WARNING, "Custom", test_file)
+
+        assert fixer.can_fix(issue) is False
+
+        def uppercase_body(buffer, issues):
+            buffer.body = buffer.body.upper()
+            return ["Uppercased body"]
+
+        fixer.register_transform(FixTransform("TEST-001", uppercase_body))
+        results = fixer.fix_batch({test_file: [issue]}, preview=False)
+
+        assert fixer.can_fix(issue) is True
+        assert results[test_file].fixes_applied == ["Uppercased body"]
+        assert test_file.read_text(encoding='utf-8') == "---\ntitle: T\n---\nBODY\n"
+
     def test_auto_fix_result_str_format(self):
         """Test AutoFixResult string representation."""
         result = AutoFixResult(
@@ -0,0 +1,252 @@
+"""
+Tests for the content-addressed backup store.
+"""
+
+import hashlib
+import os
+import tarfile
+import pytest
+from pathlib import Path
+from src.core.backup_store import BackupStore, BackupError
+
+
+class TestBackupStore:
+    """Tests for BackupStore and BackupRun."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Create a BackupStore instance."""
+        return BackupStore(tmp_path / "backups")
+
+    def test_put_deduplicates_content(self, store):
+        """Test identical content is stored once under its hash."""
+        first = store.put(b"same content")
+        second = store.put(b"same content")
+
+        assert first == second == hashlib.sha256(b"same content").hexdigest()
+        assert len(list(store.objects_dir.rglob('*'))) == 2  # one prefix dir + one blob
+
+    def test_get_verifies_hash(self, store):
+        """Test corrupt blobs are rejected."""
+        blob_hash = store.put(b"content")
+        assert store.get(blob_hash) == b"content"
+
+        store.blob_path(blob_hash).write_bytes(b"tampered")
+        with pytest.raises(BackupError, match="corrupt"):
+            store.get(blob_hash)
+
+    def test_put_file_streams_content(self, store, tmp_path):
+        """Test files are stored under the hash of their content."""
+        test_file = tmp_path / "doc.md"
+        test_file.write_bytes(b"content")
+
+        blob_hash = store.put_file(test_file)
+
+        assert blob_hash == store.put(b"content")
+        assert store.get(blob_hash) == b"content"
+        assert store.put_file(test_file) == blob_hash
+        assert [p.name for p in store.objects_dir.iterdir()] == [blob_hash[:2]]
+
+    def test_record_result_hashes_file(self, store, tmp_path):
+        """Test the written content is hashed from disk when not given."""
+        test_file = tmp_path / "doc.md"
+        test_file.write_bytes(b"original")
+        run = store.start_run()
+        run.backup(test_file)
+
+        test_file.write_bytes(b"fixed")
+        run.record_result(test_file)
+
+        assert run.files[BackupStore.path_key(test_file)]['after'] == \
+            hashlib.sha256(b"fixed").hexdigest()
+
+    def test_run_manifest_records_same_named_files(self, store, tmp_path):
+        """Test same-named files in different folders are backed up separately."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        file_a = tmp_path / "a" / "readme.md"
+        file_b = tmp_path / "b" / "readme.md"
+        file_a.write_text("A")
+        file_b.write_text("B")
+
+        run = store.start_run()
+        run.backup(file_a)
+        run.backup(file_b)
+        run.record_result(file_a, b"A fixed")
+        run.save()
+
+        manifest = store.load_manifest(run.run_id)
+        entry_a = manifest['files'][BackupStore.path_key(file_a)]
+        entry_b = manifest['files'][BackupStore.path_key(file_b)]
+        assert store.get(entry_a['before']) == b"A"
+        assert store.get(entry_b['before']) == b"B"
+        assert entry_a['after'] == hashlib.sha256(b"A fixed").hexdigest()
+        assert entry_b['after'] is None
+        assert store.list_runs() == [run.run_id]
+
+    def test_first_backup_in_run_is_kept(self, store, tmp_path):
+        """Test a file changed twice in one run restores to its original content."""
+        test_file = tmp_path / "doc.md"
+        test_file.write_bytes(b"original")
+        run = store.start_run()
+        first = run.backup(test_file)
+        test_file.write_bytes(b"first fix")
+
+        assert run.backup(test_file) == first
+        assert run.backup(test_file, b"first fix") == first
+        assert store.get(run.files[BackupStore.path_key(test_file)]['before']) == b"original"
+
+    def test_empty_run_not_saved(self, store):
+        """Test a run that backed up nothing leaves no manifest."""
+        assert store.start_run().save() is None
+        assert store.list_runs() == []
+
+    def test_load_missing_run(self, store):
+        """Test loading an unknown run fails clearly."""
+        with pytest.raises(BackupError, match="No backup run"):
+            store.load_manifest("missing")
+
+    def test_archive_run(self, store, tmp_path):
+        """Test a run can be packed into one self-contained archive."""
+        test_file = tmp_path / "doc.md"
+        test_file.write_text("original")
+        run = store.start_run()
+        run.backup(test_file)
+        run.save()
+
+        archive = store.archive_run(run.run_id)
+
+        blob_hash = hashlib.sha256(b"original").hexdigest()
+        with tarfile.open(archive, 'r:gz') as tar:
+            assert sorted(tar.getnames()) == ["manifest.json", f"objects/{blob_hash}"]
+
+    def _fixed_run(self, store, tmp_path, count=1):
+        """Back up and 'fix' some files in one run, returning files and run."""
+        run = store.start_run()
+        files = []
+        for i in range(count):
+            path = tmp_path / f"doc{i}.md"
+            path.write_text(f"original {i}")
+            run.backup(path)
+            path.write_text(f"fixed {i}")
+            run.record_result(path, f"fixed {i}".encode('utf-8'))
+            files.append(path)
+        run.save()
+        return files, run
+
+    def test_restore_run(self, store, tmp_path):
+        """Test restoring a run writes back every original."""
+        files, run = self._fixed_run(store, tmp_path, count=3)
+
+        result = store.restore_run(run.run_id)
+
+        assert sorted(result.restored) == sorted(BackupStore.path_key(f) for f in files)
+        assert result.skipped == {}
+        assert [f.read_text() for f in files] == ["original 0", "original 1", "original 2"]
+
+    def test_restore_run_parallel(self, store, tmp_path):
+        """Test restoring with several workers restores every file."""
+        files, run = self._fixed_run(store, tmp_path, count=20)
+
+        result = store.restore_run(run.run_id, jobs=4)
+
+        assert len(result.restored) == 20
+        assert all(f.read_text() == f"original {i}" for i, f in enumerate(files))
+
+    def test_restore_skips_modified_file(self, store, tmp_path):
+        """Test files edited after the fix are not overwritten unless forced."""
+        files, run = self._fixed_run(store, tmp_path, count=2)
+        files[0].write_text("edited later")
+
+        result = store.restore_run(run.run_id)
+
+        assert result.skipped == {
+            BackupStore.path_key(files[0]): "modified since the fix was applied"
+        }
+        assert files[0].read_text() == "edited later"
+        assert files[1].read_text() == "original 1"
+
+        forced = store.restore_run(run.run_id, force=True)
+        assert BackupStore.path_key(files[0]) in forced.restored
+        assert files[0].read_text() == "original 0"
+
+    def test_restore_skips_missing_and_unmodified_files(self, store, tmp_path):
+        """Test deleted files and files the run never wrote are skipped."""
+        files, run = self._fixed_run(store, tmp_path, count=1)
+        files[0].unlink()
+        untouched = tmp_path / "untouched.md"
+        untouched.write_text("same")
+        run.backup(untouched)
+        run.save()
+
+        result = store.restore_run(run.run_id)
+
+        assert result.restored == []
+        assert result.skipped == {
+            BackupStore.path_key(files[0]): "file no longer exists",
+            BackupStore.path_key(untouched): "not modified by this run",
+        }
+        assert not files[0].exists()
+
+    def test_restore_keeps_file_modes(self, store, tmp_path):
+        """Test restored files keep their mode, and recreated files get the usual one."""
+        files, run = self._fixed_run(store, tmp_path, count=2)
+        files[0].chmod(0o640)
+        files[1].unlink()
+        umask = os.umask(0)
+        os.umask(umask)
+
+        result = store.restore_run(run.run_id, force=True)
+
+        assert len(result.restored) == 2
+        assert files[0].stat().st_mode & 0o777 == 0o640
+        assert files[1].stat().st_mode & 0o777 == 0o666 & ~umask
+
+    def test_restore_undoes_renames_before_contents(self, store, tmp_path):
+        """Test renames are moved back, newest first, then contents restored."""
+        (tmp_path / "Old Dir").mkdir()
+        doc = tmp_path / "Old Dir" / "My Doc.md"
+        doc.write_text("original")
+
+        run = store.start_run()
+        run.backup(doc)
+        doc.write_text("rewritten")
+        run.record_result(doc, b"rewritten")
+        doc.rename(tmp_path / "Old Dir" / "my-doc.md")
+        run.record_rename(doc, tmp_path / "Old Dir" / "my-doc.md")
+        (tmp_path / "Old Dir").rename(tmp_path / "old-dir")
+        run.record_rename(tmp_path / "Old Dir", tmp_path / "old-dir")
+        run.save()
+
+        result = store.restore_run(run.run_id)
+
+        assert result.skipped == {}
+        assert result.renames_undone == [
+            (BackupStore.path_key(tmp_path / "old-dir"), BackupStore.path_key(tmp_path / "Old Dir")),
+            (BackupStore.path_key(tmp_path / "Old Dir" / "my-doc.md"), BackupStore.path_key(doc)),
+        ]
+        assert result.restored == [BackupStore.path_key(doc)]
+        assert doc.read_text() == "original"
+        assert not (tmp_path / "old-dir").exists()
+
+    def test_restore_never_overwrites_with_rename(self, store, tmp_path):
+        """Test a rename is not undone over a path that exists again."""
+        original = tmp_path / "Pricing Notes.md"
+        renamed = tmp_path / "pricing-notes.md"
+        renamed.write_text("renamed")
+        run = store.start_run()
+        run.record_rename(original, renamed)
+        run.save()
+        original.write_text("new file")
+
+        result = store.restore_run(run.run_id)
+
+        assert "already exists" in result.skipped[BackupStore.path_key(renamed)]
+        assert result.renames_undone == []
+        assert renamed.read_text() == "renamed"
+        assert original.read_text() == "new file"
+
+    def test_restore_missing_run(self, store):
+        """Test restoring an unknown run fails clearly."""
+        with pytest.raises(BackupError, match="No backup run"):
+            store.restore_run("missing")
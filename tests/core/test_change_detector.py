@@ -5,7 +5,9 @@ Tests for change detector module.
 import pytest
 from pathlib import Path
 from src.core.change_detector import ChangeDetector, ChangeDetectionError
-from src.utils.cache import DocumentCache
+from src.core.link_graph import LinkGraph
+from src.core.metadata_index import MetadataIndex
+from src.utils.cache import DocumentCache, compute_file_hash
 from src.utils.logger import Logger
 
 
@@ -217,6 +219,170 @@ class TestChangeDetector:
         assert summary['modified_files'] == 1
         assert summary['unchanged_files'] == 2
 
+    def test_detect_renamed_files(self, detector, temp_dir, cache):
+        """Test moved files are reported as renames, not new + deleted."""
+        files_to_process, _ = detector.get_files_to_process(temp_dir)
+        for file in files_to_process:
+            detector.update_cache_for_file(file, "passed", 0, 0, issues=[])
+
+        moved_dir = temp_dir / "moved"
+        moved_dir.mkdir()
+        (temp_dir / "doc1.md").rename(moved_dir / "doc1.md")
+        (temp_dir / "doc2.md").unlink()
+
+        changes = detector.detect_changes(detector.scan_directory(temp_dir))
+
+        assert changes['renamed'] == [(temp_dir / "doc1.md", moved_dir / "doc1.md")]
+        assert changes['new'] == []
+        assert changes['deleted'] == [temp_dir / "doc2.md"]
+
+    def test_renamed_files_keep_cache_entry(self, detector, temp_dir, cache):
+        """Test renames transfer the cached entry to the new path."""
+        files_to_process, _ = detector.get_files_to_process(temp_dir)
+        for file in files_to_process:
+            detector.update_cache_for_file(file, "failed", 1, 0, issues=[])
+
+        (temp_dir / "doc1.md").rename(temp_dir / "renamed-doc.md")
+        files_to_process, summary = detector.get_files_to_process(temp_dir)
+
+        assert files_to_process == [temp_dir / "renamed-doc.md"]
+        assert summary['renamed_files'] == 1
+        assert summary['new_files'] == 0
+        assert summary['deleted_files'] == 0
+        entry = cache.get_document(temp_dir / "renamed-doc.md")
+        assert entry['validation_status'] == "failed"
+        assert entry['renamed_from'] == str(temp_dir / "doc1.md")
+
+    def test_interrupted_rename_is_resumed(self, detector, temp_dir, cache, logger):
+        """Test a rename saved before its document was revalidated is reported again."""
+        files_to_process, _ = detector.get_files_to_process(temp_dir)
+        for file in files_to_process:
+            detector.update_cache_for_file(file, "passed", 0, 0, issues=[])
+
+        (temp_dir / "doc1.md").rename(temp_dir / "renamed-doc.md")
+        detector.get_files_to_process(temp_dir)
+        # Run interrupted here: the moved entry is journaled, not revalidated
+
+        resumed = ChangeDetector(DocumentCache(cache.cache_file), logger)
+        changes = resumed.detect_changes(resumed.scan_directory(temp_dir))
+
+        assert changes['renamed'] == [(temp_dir / "doc1.md", temp_dir / "renamed-doc.md")]
+        assert temp_dir / "renamed-doc.md" not in changes['unchanged']
+
+    def test_cache_update_reuses_detection_hash(self, detector, temp_dir, mocker):
+        """Test files are hashed once per run when unchanged since detection."""
+        hash_spy = mocker.patch(
+            'src.core.change_detector.compute_file_hash',
+            wraps=compute_file_hash
+        )
+
+        changes = detector.detect_changes(detector.scan_directory(temp_dir))
+        for file in changes['new']:
+            detector.update_cache_for_file(file, "passed", 0, 0)
+
+        assert hash_spy.call_count == len(changes['new'])
+
+    def test_cache_update_rehashes_file_changed_during_run(self, detector, temp_dir, cache):
+        """Test a file edited after detection is hashed again."""
+        doc = temp_dir / "doc1.md"
+        detector.detect_changes(detector.scan_directory(temp_dir))
+
+        doc.write_text("# Document 1\nEdited while validating, longer content")
+        detector.update_cache_for_file(doc, "passed", 0, 0)
+
+        assert cache.get_document(doc)['hash'] == compute_file_hash(doc)
+
+    def test_rename_prefers_matching_inode(self, detector, temp_dir, cache):
+        """Test identical copies are paired with the entry sharing the inode."""
+        (temp_dir / "doc2.md").write_text("# Document 1\nContent")
+        files_to_process, _ = detector.get_files_to_process(temp_dir)
+        for file in files_to_process:
+            detector.update_cache_for_file(file, "passed", 0, 0)
+
+        (temp_dir / "doc1.md").unlink()
+        (temp_dir / "doc2.md").rename(temp_dir / "moved.md")
+
+        changes = detector.detect_changes(detector.scan_directory(temp_dir))
+
+        assert changes['renamed'] == [(temp_dir / "doc2.md", temp_dir / "moved.md")]
+        assert changes['deleted'] == [temp_dir / "doc1.md"]
+
+    def test_equivalent_paths_not_reported_deleted(self, detector, temp_dir, monkeypatch):
+        """Test files scanned via a different path spelling still match."""
+        monkeypatch.chdir(temp_dir.parent)
+        for file in detector.scan_directory(Path("docs")):
+            detector.update_cache_for_file(file, "passed", 0, 0)
+
+        changes = detector.detect_changes(detector.scan_directory(temp_dir))
+
+        assert len(changes['unchanged']) == 3
+        assert changes['deleted'] == []
+        assert changes['new'] == []
+
+    def test_documents_linking_to_moved_document_are_relinked(self, cache, logger, temp_dir):
+        """Test unchanged documents linking to a renamed path are re-checked once."""
+        (temp_dir / "doc2.md").write_text("# Document 2\nSee [one](doc1.md)\n")
+        link_graph = LinkGraph(temp_dir)
+        detector = ChangeDetector(cache, logger, link_graph=link_graph)
+        files, _ = detector.get_files_to_process(temp_dir)
+        for file_path in files:
+            link_graph.update(file_path)
+            detector.update_cache_for_file(file_path, issues=[])
+
+        (temp_dir / "doc1.md").rename(temp_dir / "moved.md")
+        files, summary = detector.get_files_to_process(temp_dir)
+
+        assert files == [temp_dir / "moved.md", temp_dir / "doc2.md"]
+        assert summary['relinked_files'] == 1
+        assert cache.get_document(temp_dir / "doc2.md")['links_stale'] is True
+
+        resumed = ChangeDetector(DocumentCache(cache.cache_file), logger)
+        assert resumed.detect_changes(resumed.scan_directory(temp_dir))['relinked'] == [temp_dir / "doc2.md"]
+
+        detector.update_cache_for_file(temp_dir / "doc2.md", issues=[])
+        assert 'links_stale' not in cache.get_document(temp_dir / "doc2.md")
+
+    def test_metadata_index_kept_current(self, cache, logger, temp_dir, tmp_path):
+        """Test detection and cache updates keep an attached metadata index current."""
+        index = MetadataIndex(tmp_path, tmp_path / "index.json")
+        detector = ChangeDetector(cache, logger, metadata_index=index)
+
+        files, _ = detector.get_files_to_process(temp_dir)
+        for file_path in files:
+            detector.update_cache_for_file(file_path)
+        detector.save_cache()
+        assert len(index) == 3
+
+        (temp_dir / "doc1.md").write_text("---\nstatus: draft\n---\n# Document 1\n")
+        (temp_dir / "doc2.md").rename(temp_dir / "renamed.md")
+        (temp_dir / "subdir" / "doc3.md").unlink()
+        detector.get_files_to_process(temp_dir)
+
+        assert index.query([{'field': 'status', 'equals': 'draft'}]) == ["docs/doc1.md"]
+        assert (temp_dir / "renamed.md") in index
+        assert len(index) == 2
+        assert MetadataIndex(tmp_path, tmp_path / "index.json").get(temp_dir / "doc2.md") is not None
+
+    def test_file_filter_limits_checked_files(self, detector, temp_dir, cache, mocker):
+        """Test filtered-out files are neither hashed nor reported deleted."""
+        files, _ = detector.get_files_to_process(temp_dir)
+        for file_path in files:
+            detector.update_cache_for_file(file_path)
+
+        (temp_dir / "doc1.md").write_text("# Document 1\nChanged")
+        (temp_dir / "doc2.md").write_text("# Document 2\nChanged")
+        hash_spy = mocker.spy(ChangeDetector, '_update_index')
+
+        to_process, summary = detector.get_files_to_process(
+            temp_dir,
+            file_filter=lambda scanned: [f for f in scanned if f.name == "doc1.md"]
+        )
+
+        assert to_process == [temp_dir / "doc1.md"]
+        assert summary['deleted_files'] == 0
+        assert hash_spy.call_count == 1
+        assert len(cache) == 3
+
     def test_save_cache(self, detector, cache):
         """Test saving cache to disk."""
         # This should not raise an exception
@@ -0,0 +1,234 @@
+"""
+Tests for corpus link graph.
+"""
+
+import os
+
+import pytest
+from pathlib import Path
+from src.core.link_graph import LinkGraph, heading_slug
+
+
+class TestHeadingSlug:
+    """Tests for heading_slug function."""
+
+    def test_github_style_slugs(self):
+        """Test slugs match GitHub's heading anchors."""
+        assert heading_slug("Getting Started") == "getting-started"
+        assert heading_slug("Setup & Install!") == "setup--install"
+        assert heading_slug("What's `new` in v2.0?") == "whats-new-in-v20"
+        assert heading_slug("See [the guide](guide.md)") == "see-the-guide"
+        assert heading_slug("snake_case-name") == "snake_case-name"
+
+
+class TestLinkGraph:
+    """Tests for LinkGraph class."""
+
+    @pytest.fixture
+    def docs_dir(self, tmp_path):
+        """Create a small linked corpus."""
+        docs = tmp_path / "docs"
+        (docs / "guides").mkdir(parents=True)
+        (docs / "index.md").write_text(
+            "# Index\n\n[Setup](guides/setup.md)\n[FAQ](faq.md#billing)\n"
+        )
+        (docs / "faq.md").write_text("# FAQ\n\nBack to [index](index.md)\n")
+        (docs / "guides" / "setup.md").write_text(
+            "# Setup\n\n[Home](../index.md) and [site](https://example.com)\n[Top](#setup)\n"
+        )
+        return docs
+
+    @pytest.fixture
+    def graph(self, docs_dir):
+        """Create a graph containing every document."""
+        graph = LinkGraph(docs_dir)
+        for path in sorted(docs_dir.rglob('*.md')):
+            graph.update(path)
+        return graph
+
+    def test_links_resolved_to_nodes(self, graph, docs_dir):
+        """Test links are resolved relative to the linking document."""
+        links = graph.links_from(docs_dir / "guides" / "setup.md")
+
+        assert [link.target for link in links] == ['index.md', None, None]
+        assert links[0].line_number == 3
+        assert links[1].external is True
+        assert links[2].anchor == 'setup'
+
+        faq_link = graph.links_from(docs_dir / "index.md")[1]
+        assert (faq_link.target, faq_link.anchor) == ('faq.md', 'billing')
+
+    def test_reverse_index(self, graph, docs_dir):
+        """Test inbound links are answered from the reverse index."""
+        inbound = graph.links_to(docs_dir / "index.md")
+
+        assert [(source, link.line_number) for source, link in inbound] == [
+            ('faq.md', 3),
+            ('guides/setup.md', 3),
+        ]
+
+    def test_links_under_directory(self, graph, docs_dir):
+        """Test links into a directory are found through the reverse index."""
+        (docs_dir / "faq.md").write_text("[guides](guides/) [img](guides/img/a.png) [x](guidesx.md)\n")
+        graph.update(docs_dir / "faq.md")
+
+        inbound = graph.links_under([docs_dir / "guides"])
+
+        assert [(source, link.target) for source, link in inbound] == [
+            ('faq.md', 'guides'),
+            ('faq.md', 'guides/img/a.png'),
+            ('index.md', 'guides/setup.md'),
+        ]
+        assert graph.links_under([]) == []
+
+    def test_percent_encoded_links_resolved(self, graph, docs_dir):
+        """Test percent-encoded link paths resolve to the file they name."""
+        (docs_dir / "My Notes.md").write_text("# Notes\n")
+        (docs_dir / "faq.md").write_text("[notes](My%20Notes.md)\n")
+
+        link = graph.update(docs_dir / "faq.md")[0]
+
+        assert link.target == 'My Notes.md'
+        assert graph.target_exists(link)
+
+    def test_bracketed_and_titled_links_resolved(self, graph, docs_dir):
+        """Test <brackets> and link titles are not part of the target."""
+        (docs_dir / "My Notes.md").write_text("# Notes\n")
+        (docs_dir / "faq.md").write_text('[a](<My Notes.md#top>) [b](My%20Notes.md "Notes")\n')
+
+        links = graph.update(docs_dir / "faq.md")
+
+        assert [(link.target, link.anchor) for link in links] == [('My Notes.md', 'top'), ('My Notes.md', None)]
+
+    def test_update_replaces_links(self, graph, docs_dir):
+        """Test changed content replaces old edges in both directions."""
+        faq = docs_dir / "faq.md"
+        faq.write_text("# FAQ\n\nNo links now.\n")
+
+        assert graph.update(faq) == []
+        assert [source for source, _ in graph.links_to(docs_dir / "index.md")] == [
+            'guides/setup.md'
+        ]
+
+    def test_unchanged_content_not_reparsed(self, graph, docs_dir, mocker):
+        """Test links are only extracted when content changes."""
+        spy = mocker.spy(graph, '_parse')
+
+        graph.update(docs_dir / "faq.md")
+
+        assert spy.call_count == 0
+
+    def test_target_exists(self, graph, docs_dir):
+        """Test target existence checks for files, externals and anchors."""
+        setup = docs_dir / "guides" / "setup.md"
+        setup.write_text("[gone](missing.md) [ok](../faq.md) [x](https://a.b) [y](#top)\n")
+
+        links = graph.update(setup)
+
+        assert [graph.target_exists(link) for link in links] == [False, True, True, True]
+
+    def test_persistence_round_trip(self, docs_dir, tmp_path):
+        """Test the graph is saved and reloaded for the same root only."""
+        graph_file = tmp_path / "graph.json"
+        graph = LinkGraph(docs_dir, graph_file)
+        graph.update(docs_dir / "index.md")
+        graph.save()
+
+        reloaded = LinkGraph(docs_dir, graph_file)
+        assert docs_dir / "index.md" in reloaded
+        assert [s for s, _ in reloaded.links_to(docs_dir / "faq.md")] == ['index.md']
+
+        other_root = LinkGraph(tmp_path, graph_file)
+        assert len(other_root) == 0
+
+    def test_save_uses_unique_temp_file(self, docs_dir, tmp_path):
+        """Test saving never touches a fixed '.tmp' sibling of the graph file."""
+        meta = tmp_path / "meta"
+        meta.mkdir()
+        (meta / "graph.tmp").write_text("not ours")
+        graph = LinkGraph(docs_dir, meta / "graph.json")
+        graph.update(docs_dir / "index.md")
+        graph.save()
+
+        assert sorted(p.name for p in meta.iterdir()) == ["graph.json", "graph.tmp"]
+        assert (meta / "graph.tmp").read_text() == "not ours"
+
+    def test_prune_removes_deleted_documents(self, graph, docs_dir):
+        """Test documents deleted from disk are dropped with their edges."""
+        (docs_dir / "faq.md").unlink()
+
+        assert graph.prune() == ['faq.md']
+        assert [s for s, _ in graph.links_to(docs_dir / "index.md")] == ['guides/setup.md']
+
+    def test_orphans(self, graph):
+        """Test nodes without inbound links from the set are orphans."""
+        assert graph.orphans(['index.md', 'faq.md', 'guides/setup.md']) == []
+        assert graph.orphans(['faq.md', 'guides/setup.md']) == ['faq.md', 'guides/setup.md']
+
+    def test_strongly_connected_components(self, graph, docs_dir):
+        """Test mutually reachable documents are grouped."""
+        nodes = ['index.md', 'faq.md', 'guides/setup.md']
+        assert graph.strongly_connected_components(nodes) == [sorted(nodes)]
+
+        (docs_dir / "extra.md").write_text("[self](extra.md)\n[index](index.md)\n")
+        graph.update(docs_dir / "extra.md")
+        assert graph.strongly_connected_components(nodes + ['extra.md']) == [sorted(nodes)]
+
+    def test_long_chain_does_not_recurse(self, tmp_path):
+        """Test cycle detection handles deep link chains iteratively."""
+        graph = LinkGraph(tmp_path)
+        count = 3000
+        for i in range(count):
+            path = tmp_path / f"doc{i}.md"
+            graph.update(path, f"[next](doc{(i + 1) % count}.md)\n")
+
+        components = graph.strongly_connected_components(f"doc{i}.md" for i in range(count))
+
+        assert len(components) == 1
+        assert len(components[0]) == count
+
+    def test_anchors_from_headings(self, tmp_path):
+        """Test anchors include duplicate suffixes and HTML anchors, not code."""
+        doc = tmp_path / "doc.md"
+        doc.write_text(
+            "# Title\n## Usage\n## Usage\n```bash\n# not a heading\n```\n"
+            '<a name="Custom-Anchor"></a>\n### Closing hashes ##\n'
+        )
+        graph = LinkGraph(tmp_path)
+        graph.update(doc)
+
+        assert graph.anchors('doc.md') == {
+            'title', 'usage', 'usage-1', 'custom-anchor', 'closing-hashes'
+        }
+
+    def test_anchor_exists(self, tmp_path):
+        """Test same-page and cross-document anchors are checked."""
+        (tmp_path / "target.md").write_text("# Target\n## Install Steps\n")
+        source = tmp_path / "source.md"
+        source.write_text(
+            "# Source\n[a](#source)\n[b](#missing)\n"
+            "[c](target.md#install-steps)\n[d](target.md#Install%20Steps)\n"
+            "[e](target.md#gone)\n[f](image.png#x)\n"
+        )
+        graph = LinkGraph(tmp_path)
+
+        links = graph.update(source)
+
+        assert [graph.anchor_exists(source, link) for link in links] == [
+            True, False, True, False, False, True
+        ]
+
+    def test_stale_target_anchors_refreshed(self, tmp_path):
+        """Test anchors of a target changed on disk are re-read."""
+        target = tmp_path / "target.md"
+        target.write_text("# Old Name\n")
+        graph_file = tmp_path / "graph.json"
+        graph = LinkGraph(tmp_path, graph_file)
+        graph.update(target)
+        graph.save()
+
+        target.write_text("# New Name\n")
+        os.utime(target, ns=(1, 1))
+
+        reloaded = LinkGraph(tmp_path, graph_file)
+        assert reloaded.anchors('target.md') == {'new-name'}
@@ -0,0 +1,186 @@
+"""
+Tests for the persistent frontmatter metadata index.
+"""
+
+import pytest
+from pathlib import Path
+from src.core.metadata_index import MetadataIndex, condition_matches, validate_condition
+
+
+class TestConditions:
+    """Tests for metadata conditions."""
+
+    def test_condition_matches(self):
+        """Test each condition kind."""
+        metadata = {'status': 'draft', 'tags': ['pricing', 'billing'], 'title': 'Price list'}
+
+        assert condition_matches(metadata, {'field': 'status', 'equals': 'draft'})
+        assert not condition_matches(metadata, {'field': 'status', 'not_equals': 'draft'})
+        assert condition_matches(metadata, {'field': 'owner', 'not_equals': 'ops'})
+        assert condition_matches(metadata, {'field': 'owner', 'missing': True})
+        assert condition_matches(metadata, {'field': 'tags', 'exists': True})
+        assert condition_matches(metadata, {'field': 'tags', 'contains': 'billing'})
+        assert condition_matches(metadata, {'field': 'title', 'contains': 'Price'})
+        assert not condition_matches(metadata, {'field': 'owner', 'contains': 'x'})
+        assert condition_matches(metadata, {'equals': 'draft'}, default_field='status')
+
+    def test_validate_condition(self):
+        """Test malformed conditions are rejected."""
+        validate_condition({'field': 'a', 'exists': True})
+        for condition in ({'field': 'a'}, {'equals': 1, 'missing': True}, {'is': 1}, 'a'):
+            with pytest.raises(ValueError, match="Condition must have"):
+                validate_condition(condition)
+
+
+class TestMetadataIndex:
+    """Tests for MetadataIndex."""
+
+    @pytest.fixture
+    def docs(self, tmp_path):
+        """Create documents with varied frontmatter."""
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        (docs_dir / "draft.md").write_text("---\ntitle: Draft\ntags: [pricing]\nstatus: draft\ndate: 2025-01-02\n---\n# Draft\n")
+        (docs_dir / "final.md").write_text("---\ntitle: Final\ntags: [legal]\nstatus: final\n---\n# Final\n")
+        (docs_dir / "plain.md").write_text("# No frontmatter\n")
+        (docs_dir / "broken.md").write_text("---\ntitle: [unclosed\n---\n# Broken\n")
+        return sorted(docs_dir.glob("*.md"))
+
+    def test_query(self, tmp_path, docs):
+        """Test queries combine conditions and skip unparseable documents."""
+        index = MetadataIndex(tmp_path)
+        assert index.refresh(docs) == 0
+
+        assert index.query([{'field': 'status', 'equals': 'draft'}]) == ["docs/draft.md"]
+        assert index.query([{'field': 'owner', 'missing': True}]) == [
+            "docs/draft.md", "docs/final.md", "docs/plain.md"
+        ]
+        assert index.query([
+            {'field': 'tags', 'contains': 'legal'},
+            {'field': 'status', 'not_equals': 'draft'}
+        ]) == ["docs/final.md"]
+        assert index.get(docs[0])['error'] is not None
+        assert index.get(docs[3])['frontmatter'] is False
+
+    def test_persisted_entries_skip_unchanged_files(self, tmp_path, docs, mocker):
+        """Test a saved index answers without re-reading unchanged files."""
+        index_file = tmp_path / "index.json"
+        index = MetadataIndex(tmp_path, index_file)
+        index.refresh(docs)
+        index.save()
+
+        reloaded = MetadataIndex(tmp_path, index_file)
+        read_spy = mocker.spy(Path, 'read_bytes')
+        reloaded.refresh(docs)
+
+        assert read_spy.call_count == 0
+        assert reloaded.query([{'field': 'date', 'equals': '2025-01-02'}]) == ["docs/draft.md"]
+
+    def test_save_uses_unique_temp_file(self, tmp_path, docs):
+        """Test saving never touches a fixed '.tmp' sibling of the index."""
+        meta_dir = tmp_path / "_meta"
+        meta_dir.mkdir()
+        (meta_dir / "index.tmp").write_text("not ours")
+        index = MetadataIndex(tmp_path, meta_dir / "index.json")
+        index.refresh(docs)
+        index.save()
+
+        assert sorted(p.name for p in meta_dir.iterdir()) == ["index.json", "index.tmp"]
+        assert (meta_dir / "index.tmp").read_text() == "not ours"
+        assert len(MetadataIndex(tmp_path, meta_dir / "index.json")) == 4
+
+    def test_changed_file_is_reparsed(self, tmp_path, docs):
+        """Test an edited document's entry is refreshed."""
+        index = MetadataIndex(tmp_path)
+        index.refresh(docs)
+
+        docs[2].write_text("---\ntitle: Final\ntags: [legal]\nstatus: archived\n---\n# Final, revised\n")
+        index.refresh(docs)
+
+        assert index.query([{'field': 'status', 'equals': 'archived'}]) == ["docs/final.md"]
+
+    def test_known_hash_skips_read(self, tmp_path, docs, mocker):
+        """Test a matching content hash refreshes the entry without reading."""
+        index = MetadataIndex(tmp_path)
+        entry = index.update(docs[1])
+
+        read_spy = mocker.spy(Path, 'read_bytes')
+        index.update(docs[1], content_hash=entry['hash'])
+
+        assert read_spy.call_count == 0
+
+    def test_body_is_not_read(self, tmp_path, docs):
+        """Test only the frontmatter is parsed, so the body need not be UTF-8."""
+        docs[2].write_bytes(b"---\ntitle: Final\nstatus: final\n---\n\xff\xfe binary body\n")
+        index = MetadataIndex(tmp_path)
+        entry = index.update(docs[2])
+
+        assert entry['error'] is None
+        assert index.query([{'field': 'status', 'equals': 'final'}]) == ["docs/final.md"]
+
+    def test_rename_remove_and_prune(self, tmp_path, docs):
+        """Test entries follow renames and deletions."""
+        index = MetadataIndex(tmp_path)
+        index.refresh(docs)
+
+        moved = docs[1].with_name("moved.md")
+        docs[1].rename(moved)
+        index.rename(docs[1], moved)
+        index.remove(docs[3])
+        docs[2].unlink()
+
+        assert index.prune() == ["docs/final.md"]
+        assert moved in index
+        assert len(index) == 2
+
+
+class TestTagIndex:
+    """Tests for the tag -> documents index."""
+
+    @pytest.fixture
+    def docs(self, tmp_path):
+        """Create tagged documents."""
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        (docs_dir / "a.md").write_text("---\ntags: [Pricing, billing]\n---\n")
+        (docs_dir / "b.md").write_text("---\ntags: pricing\n---\n")
+        (docs_dir / "c.md").write_text("---\ntags: [legal]\n---\n")
+        (docs_dir / "d.md").write_text("# Untagged\n")
+        return sorted(docs_dir.glob("*.md"))
+
+    def test_filter_by_tags(self, tmp_path, docs):
+        """Test documents with any requested tag are kept, case-insensitively."""
+        index = MetadataIndex(tmp_path)
+
+        assert index.filter_by_tags(docs, ["pricing"]) == docs[:2]
+        assert index.filter_by_tags(docs, ["LEGAL", "billing"]) == [docs[0], docs[2]]
+        assert index.filter_by_tags(docs, ["missing"]) == []
+
+    def test_postings_follow_changes(self, tmp_path, docs):
+        """Test the tag index is updated as documents change, move and go away."""
+        index = MetadataIndex(tmp_path)
+        index.refresh(docs)
+
+        docs[2].write_text("---\ntags: [pricing]\n---\n# Now about pricing\n")
+        index.refresh(docs)
+        moved = docs[1].with_name("moved.md")
+        docs[1].rename(moved)
+        index.rename(docs[1], moved)
+        index.remove(docs[0])
+
+        assert index.documents_with_tag("pricing") == ["docs/c.md", "docs/moved.md"]
+        assert index.documents_with_tag("billing") == []
+        assert index.documents_with_tag("legal") == []
+
+    def test_tag_index_rebuilt_on_load(self, tmp_path, docs, mocker):
+        """Test a reloaded index filters by tag without reading unchanged files."""
+        index_file = tmp_path / "index.json"
+        index = MetadataIndex(tmp_path, index_file)
+        index.refresh(docs)
+        index.save()
+
+        reloaded = MetadataIndex(tmp_path, index_file)
+        read_spy = mocker.spy(Path, 'read_bytes')
+
+        assert reloaded.filter_by_tags(docs, ["legal"]) == [docs[2]]
+        assert read_spy.call_count == 0
@@ -0,0 +1,262 @@
+"""
+Tests for the bulk rename engine.
+"""
+
+import pytest
+from pathlib import Path
+from src.core.backup_store import BackupStore
+from src.core.link_graph import LinkGraph
+from src.core.rename_engine import RenameEngine, rewrite_url
+from src.core.validators.naming_validator import NamingValidator
+from src.utils.config import Config
+from src.utils.logger import Logger
+
+
+class TestRewriteUrl:
+    """Tests for rewrite_url function."""
+
+    def test_only_renamed_segments_change(self):
+        """Test URLs keep their shape and fragment."""
+        renamed = {'Sales Team': 'sales-team', 'Sales Team/Price List.md': 'price-list.md'}
+
+        assert rewrite_url('Sales%20Team/Price%20List.md#tiers', '', renamed) == 'sales-team/price-list.md#tiers'
+        assert rewrite_url('../Sales Team/', 'guides', renamed) == '../sales-team/'
+        assert rewrite_url('./Price%20List.md', 'Sales Team', renamed) == './price-list.md'
+        assert rewrite_url('other.md', '', renamed) == 'other.md'
+        assert rewrite_url('#tiers', '', renamed) == '#tiers'
+
+    def test_brackets_and_title_are_kept(self):
+        """Test only the destination of a link with <brackets> or a title changes."""
+        renamed = {'My Dir': 'my-dir', 'My Dir/Some File.md': 'some-file.md'}
+
+        assert rewrite_url('../My%20Dir/Some%20File.md "title"', 'guides', renamed) == (
+            '../my-dir/some-file.md "title"'
+        )
+        assert rewrite_url('<../My Dir/Some File.md>', 'guides', renamed) == '<../my-dir/some-file.md>'
+
+
+class TestRenameEngine:
+    """Tests for RenameEngine class."""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        """Create a test configuration."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+processing:
+  doc_directories: ["."]
+  cache_file: "_meta/.document-cache.json"
+  backup_dir: "_meta/.backups/"
+
+validation:
+  naming:
+    enabled: true
+    pattern: "lowercase-with-hyphens"
+    max_length: 50
+    min_length: 3
+
+reporting:
+  format: "markdown"
+
+logging:
+  level: "INFO"
+""")
+        return Config(config_file)
+
+    @pytest.fixture
+    def engine_factory(self, config, tmp_path):
+        """Create RenameEngine instances rooted at the docs directory."""
+        logger = Logger("test", log_file=tmp_path / "test.log")
+
+        def create(docs_dir):
+            return RenameEngine(
+                NamingValidator(config, logger),
+                LinkGraph(docs_dir),
+                BackupStore(tmp_path / "backups"),
+                logger
+            )
+
+        return create
+
+    @pytest.fixture
+    def docs_dir(self, tmp_path):
+        """Create a corpus with misnamed files and directories."""
+        docs = tmp_path / "docs"
+        (docs / "Sales Team" / "assets").mkdir(parents=True)
+        (docs / "Sales Team" / "Price List.md").write_text(
+            "# Prices\n\nSee [plan](../Pricing%20Plan.md#tiers) and ![logo](assets/logo.png)\n"
+        )
+        (docs / "Sales Team" / "assets" / "logo.png").write_bytes(b"png")
+        (docs / "Pricing Plan.md").write_text("# Plan\n\n## Tiers\n\n[list](Sales%20Team/Price%20List.md)\n")
+        (docs / "index.md").write_text(
+            "# Index\n\n[a](Pricing%20Plan.md) [b](Sales%20Team/Price%20List.md)\n"
+            "[c](Sales%20Team/assets/logo.png) [d](Pricing%20Plan.md)\n"
+        )
+        return docs
+
+    def _documents(self, docs_dir):
+        return sorted(docs_dir.rglob('*.md'))
+
+    def test_plan_orders_files_before_directories(self, engine_factory, docs_dir):
+        """Test files are renamed within their old directory, then directories."""
+        engine = engine_factory(docs_dir)
+
+        plan = engine.plan(self._documents(docs_dir), docs_dir)
+
+        root = engine.link_graph.root
+        assert [(r.source, r.target, r.directory) for r in plan.renames] == [
+            (root / "Pricing Plan.md", root / "pricing-plan.md", False),
+            (root / "Sales Team" / "Price List.md", root / "Sales Team" / "price-list.md", False),
+            (root / "Sales Team", root / "sales-team", True),
+        ]
+        assert plan.final_path(docs_dir / "Sales Team" / "Price List.md") == root / "sales-team" / "price-list.md"
+        assert sorted(path.name for path in plan.rewrites) == ["Price List.md", "Pricing Plan.md", "index.md"]
+        assert plan.link_count == 6
+
+    def test_plan_renames_only_under_base_path(self, engine_factory, tmp_path):
+        """Test links from outside base_path are rewritten but only base_path is renamed."""
+        (tmp_path / "a" / "Old Dir").mkdir(parents=True)
+        (tmp_path / "b").mkdir()
+        (tmp_path / "a" / "Old Dir" / "Bad_Name.md").write_text("# Bad\n")
+        (tmp_path / "a" / "local-ref.md").write_text("[x](Old%20Dir/Bad_Name.md)\n")
+        (tmp_path / "b" / "Other Name.md").write_text("[x](../a/Old%20Dir/Bad_Name.md)\n")
+        engine = engine_factory(tmp_path)
+
+        result = engine.apply(engine.plan(self._documents(tmp_path), tmp_path / "a"))
+
+        assert result.failed == {}
+        assert (tmp_path / "a" / "old-dir" / "bad-name.md").exists()
+        assert (tmp_path / "a" / "local-ref.md").read_text() == "[x](old-dir/bad-name.md)\n"
+        assert (tmp_path / "b" / "Other Name.md").read_text() == "[x](../a/old-dir/bad-name.md)\n"
+
+    def test_plan_skips_taken_names(self, engine_factory, docs_dir):
+        """Test a rename is skipped if the new name already exists."""
+        (docs_dir / "pricing-plan.md").write_text("# Existing\n")
+        engine = engine_factory(docs_dir)
+
+        plan = engine.plan(self._documents(docs_dir), docs_dir)
+
+        assert plan.skipped == {'Pricing Plan.md': "'pricing-plan.md' already exists"}
+        assert "Pricing Plan.md" not in plan.renamed
+        assert all(
+            "Pricing%20Plan" not in rewrite.old_url
+            for rewrites in plan.rewrites.values() for rewrite in rewrites
+        )
+
+    def test_plan_rewrites_links_with_brackets_and_titles(self, engine_factory, docs_dir):
+        """Test bracketed and titled links are found and rewritten in full."""
+        (docs_dir / "guide.md").write_text(
+            '# Guide\n\n[t](Pricing%20Plan.md "Plan") [x](<Sales Team/Price List.md>)\n'
+        )
+        engine = engine_factory(docs_dir)
+
+        result = engine.apply(engine.plan(self._documents(docs_dir), docs_dir))
+
+        assert result.failed == {}
+        assert (docs_dir / "guide.md").read_text() == (
+            '# Guide\n\n[t](pricing-plan.md "Plan") [x](<sales-team/price-list.md>)\n'
+        )
+
+    def test_plan_skips_renames_with_unrewritable_links(self, engine_factory, docs_dir):
+        """Test a path is not renamed if a link to it cannot follow the rename."""
+        (docs_dir / "guide.md").write_text("# Guide\n\n[x](Sales%20Team%2FPrice%20List.md)\n")
+        engine = engine_factory(docs_dir)
+
+        plan = engine.plan(self._documents(docs_dir), docs_dir)
+
+        assert sorted(plan.skipped) == ['Sales Team', 'Sales Team/Price List.md']
+        assert "cannot be rewritten" in plan.skipped['Sales Team']
+        assert [rename.source.name for rename in plan.renames] == ["Pricing Plan.md"]
+        assert all("Sales" not in rewrite.new_url for rewrites in plan.rewrites.values() for rewrite in rewrites)
+
+    def test_plan_skips_colliding_names(self, engine_factory, tmp_path):
+        """Test paths that would get the same new name are all skipped."""
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "Team Notes.md").write_text("# A\n")
+        (docs / "team notes.md").write_text("# B\n")
+        engine = engine_factory(docs)
+
+        plan = engine.plan(self._documents(docs), docs)
+
+        assert plan.renames == []
+        assert sorted(plan.skipped) == ['Team Notes.md', 'team notes.md']
+
+    def test_apply_renames_and_rewrites(self, engine_factory, docs_dir):
+        """Test renames are applied and every inbound link follows them."""
+        engine = engine_factory(docs_dir)
+        plan = engine.plan(self._documents(docs_dir), docs_dir)
+
+        result = engine.apply(plan, jobs=4)
+
+        assert result.failed == {}
+        assert len(result.renamed) == 3
+        assert sorted(result.rewritten.values()) == [1, 1, 4]
+        assert (docs_dir / "index.md").read_text() == (
+            "# Index\n\n[a](pricing-plan.md) [b](sales-team/price-list.md)\n"
+            "[c](sales-team/assets/logo.png) [d](pricing-plan.md)\n"
+        )
+        assert (docs_dir / "sales-team" / "price-list.md").read_text().startswith(
+            "# Prices\n\nSee [plan](../pricing-plan.md#tiers)"
+        )
+        assert (docs_dir / "sales-team" / "assets" / "logo.png").exists()
+
+        graph = engine.link_graph
+        assert sorted({source for source, _ in graph.links_to(docs_dir / "pricing-plan.md")}) == [
+            'index.md', 'sales-team/price-list.md'
+        ]
+        assert all(graph.target_exists(link) for link in graph.links_from(docs_dir / "index.md"))
+
+    def test_apply_is_rolled_back_by_backup_run(self, engine_factory, docs_dir):
+        """Test restoring the run undoes the renames and the link rewrites."""
+        before = {path: path.read_bytes() for path in docs_dir.rglob('*') if path.is_file()}
+        engine = engine_factory(docs_dir)
+        result = engine.apply(engine.plan(self._documents(docs_dir), docs_dir))
+
+        restore = engine.backup_store.restore_run(result.run_id)
+
+        assert restore.skipped == {}
+        assert len(restore.renames_undone) == 3
+        assert {path: path.read_bytes() for path in docs_dir.rglob('*') if path.is_file()} == before
+
+    def test_apply_aborts_if_a_reference_is_unreadable(self, engine_factory, docs_dir):
+        """Test nothing is renamed or written if a referencing document fails."""
+        engine = engine_factory(docs_dir)
+        plan = engine.plan(self._documents(docs_dir), docs_dir)
+        (docs_dir / "index.md").write_bytes(b"\xff\xfe broken")
+
+        result = engine.apply(plan)
+
+        assert list(result.failed) == [str(engine.link_graph.root / "index.md")]
+        assert result.renamed == [] and result.run_id is None
+        assert (docs_dir / "Pricing Plan.md").read_text().endswith("[list](Sales%20Team/Price%20List.md)\n")
+
+    def test_apply_aborts_if_a_planned_link_changed(self, engine_factory, docs_dir):
+        """Test nothing is renamed if a referencing document changed after planning."""
+        engine = engine_factory(docs_dir)
+        plan = engine.plan(self._documents(docs_dir), docs_dir)
+        (docs_dir / "index.md").write_text("# Index\n\nRewritten by hand\n")
+
+        result = engine.apply(plan)
+
+        assert "no longer found" in result.failed[str(engine.link_graph.root / "index.md")]
+        assert result.renamed == [] and result.run_id is None
+        assert (docs_dir / "Pricing Plan.md").exists()
+
+    def test_previews_change_nothing(self, engine_factory, docs_dir):
+        """Test previews cover moved and rewritten files without touching disk."""
+        engine = engine_factory(docs_dir)
+        plan = engine.plan(self._documents(docs_dir), docs_dir)
+
+        previews = list(engine.iter_previews(plan, root=docs_dir))
+
+        assert [(p.file_path.name, p.links) for p, _ in previews] == [
+            ("Pricing Plan.md", 1), ("Price List.md", 1), ("logo.png", 0), ("index.md", 4)
+        ]
+        logo_diff = previews[2][1]
+        assert logo_diff == (
+            "diff --git a/Sales Team/assets/logo.png b/sales-team/assets/logo.png\n"
+            "rename from Sales Team/assets/logo.png\n"
+            "rename to sales-team/assets/logo.png\n"
+        )
+        assert (docs_dir / "Sales Team" / "Price List.md").exists()
@@ -138,6 +138,24 @@ Content
             if "case variations" in issue.message.lower():
                 assert issue.line_number == 4, f"Expected line 4, got {issue.line_number}"
 
+    def test_large_documents_give_same_conflicts(self, detector, test_docs_dir):
+        """Test documents above the large-file threshold are checked the same way."""
+        for name, status in (("doc1.md", "draft"), ("doc2.md", "Draft")):
+            (test_docs_dir / name).write_text(
+                f"---\ntitle: {name}\ntags: [test]\nstatus: {status}\n---\nPrice: $100/month\n"
+            )
+        docs = sorted(test_docs_dir.glob("*.md"))
+
+        expected = detector.detect_conflicts(docs)
+        detector.large_file_threshold = 0
+        streamed = detector.detect_conflicts(docs)
+
+        assert {category: [(i.rule_id, i.line_number) for i in issues]
+                for category, issues in streamed.items()} == \
+            {category: [(i.rule_id, i.line_number) for i in issues]
+             for category, issues in expected.items()}
+        assert any(i.rule_id == "CONFLICT-001" for i in streamed['status'])
+
     def test_non_standard_status(self, detector, test_docs_dir):
         """Test detection of non-standard status values."""
         doc1 = test_docs_dir / "doc1.md"
@@ -199,6 +217,46 @@ Content about GoHighLevel
             if "synonym conflict" in issue.message.lower():
                 assert issue.line_number == 3, f"Expected line 3, got {issue.line_number}"
 
+    def test_fuzzy_tag_variants(self, detector, test_docs_dir):
+        """Test tag variants not in the synonym map are grouped with counts."""
+        for i, tags in enumerate([
+            '[gohighlevel, onboarding]',
+            '[gohighlevel, onboarding]',
+            '[go-high-level, on-boarding]',
+            '[onbaording, sales]',
+        ]):
+            (test_docs_dir / f"doc{i}.md").write_text(
+                f"---\ntitle: Doc {i}\ntags: {tags}\nstatus: draft\n---\nContent\n"
+            )
+
+        conflicts = detector.detect_conflicts(sorted(test_docs_dir.glob("*.md")))
+        messages = [
+            issue.message for issue in conflicts['tags']
+            if issue.message.startswith("Possible tag variants")
+        ]
+
+        assert sorted(messages) == [
+            "Possible tag variants: 'gohighlevel' (2), 'go-high-level' (1)",
+            "Possible tag variants: 'onboarding' (2), 'on-boarding' (1), 'onbaording' (1)",
+        ]
+        variant_issue = next(
+            issue for issue in conflicts['tags'] if 'onbaording' in issue.message
+        )
+        assert variant_issue.severity == ValidationSeverity.INFO
+        assert variant_issue.line_number == 3
+        assert "'onboarding'" in variant_issue.suggestion
+
+    def test_fuzzy_tags_skip_short_tags(self, detector, test_docs_dir):
+        """Test short tags one edit apart are not grouped."""
+        doc1 = test_docs_dir / "doc1.md"
+        doc1.write_text("---\ntitle: Doc 1\ntags: [api, seo]\nstatus: draft\n---\n")
+        doc2 = test_docs_dir / "doc2.md"
+        doc2.write_text("---\ntitle: Doc 2\ntags: [app, sem]\nstatus: draft\n---\n")
+
+        conflicts = detector.detect_conflicts([doc1, doc2])
+
+        assert conflicts['tags'] == []
+
     def test_pricing_conflict(self, detector, test_docs_dir):
         """Test detection of pricing conflicts."""
         doc1 = test_docs_dir / "pricing1.md"
@@ -266,6 +324,134 @@ Basic plan: $99/month
         # Should have no conflicts (same price)
         assert len(pricing_conflicts) == 0
 
+    def test_pricing_attributed_to_product_in_sales_docs(self, detector, test_docs_dir):
+        """Test prices in sales docs are grouped by configured product keyword."""
+        sales_dir = test_docs_dir / "sales"
+        sales_dir.mkdir()
+        doc1 = sales_dir / "plans.md"
+        doc1.write_text(
+            "Starter plan: $49/month\n\n"
+            "Our dedicated onboarding team supports every customer.\n\n"
+            "Enterprise plan: $499/month\n"
+        )
+        doc2 = sales_dir / "faq.md"
+        doc2.write_text("The Enterprise tier is 6,000 dollars per year\n")
+
+        conflicts = detector.detect_conflicts([doc1, doc2])
+        pricing_conflicts = conflicts['pricing']
+
+        # starter has one price; enterprise is quoted as $499/mo and $500/mo
+        assert len(pricing_conflicts) == 1
+        assert "'enterprise'" in pricing_conflicts[0].message
+        assert "$499.00/mo" in pricing_conflicts[0].message
+        assert "$500.00/mo" in pricing_conflicts[0].message
+
+    def test_pricing_product_keywords_match_whole_words(self, detector):
+        """Test product keywords do not match inside longer words."""
+        path = Path("docs/pricing/plans.md")
+        assert detector._identify_product_from_context("our product costs", path) == "general"
+        assert detector._identify_product_from_context("the pro plan costs", path) == "pro"
+
+    def test_pricing_products_loaded_from_config(self, tmp_path, logger):
+        """Test product keywords come from validation.conflicts.products."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+processing:
+  doc_directories: ["."]
+  cache_file: "_meta/.document-cache.json"
+validation:
+  yaml:
+    enabled: true
+    required_fields: [title]
+    allowed_statuses: [draft]
+  markdown:
+    enabled: false
+  naming:
+    enabled: false
+  conflicts:
+    enabled: true
+    products: [growth, scale]
+reporting:
+  format: "markdown"
+logging:
+  level: "INFO"
+""")
+        detector = ConflictDetector(Config(config_file), logger)
+        path = Path("docs/sales/plans.md")
+
+        assert detector._identify_product_from_context("growth plan: $99/month", path) == "growth"
+        assert detector._identify_product_from_context("basic plan: $99/month", path) == "general"
+
+    def test_pricing_product_catalog_aliases_and_scopes(self, tmp_path, logger):
+        """Test catalog entries with aliases and path scopes attribute prices."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+processing:
+  doc_directories: ["."]
+  cache_file: "_meta/.document-cache.json"
+validation:
+  yaml:
+    enabled: true
+    required_fields: [title]
+    allowed_statuses: [draft]
+  markdown:
+    enabled: false
+  naming:
+    enabled: false
+  conflicts:
+    enabled: true
+    products:
+      - name: website-care
+        aliases: [care plan, wcp]
+        paths: ["*/services/*"]
+      - growth
+reporting:
+  format: "markdown"
+logging:
+  level: "INFO"
+""")
+        detector = ConflictDetector(Config(config_file), logger)
+
+        services_dir = tmp_path / "docs" / "services"
+        services_dir.mkdir(parents=True)
+        doc1 = services_dir / "care.md"
+        doc1.write_text("The Care Plan is $79/month\n")
+        doc2 = services_dir / "care-faq.md"
+        doc2.write_text("WCP costs $89/month\n")
+        # Same alias outside the product's scope is not attributed to it
+        doc3 = tmp_path / "docs" / "notes.md"
+        doc3.write_text("care plan at $99/month\n")
+
+        conflicts = detector.detect_conflicts([doc1, doc2, doc3])
+        messages = [issue.message for issue in conflicts['pricing']]
+
+        assert len(messages) == 1
+        assert "'website-care'" in messages[0]
+        assert "$79.00/mo, $89.00/mo" in messages[0]
+
+    def test_pricing_attributed_to_nearest_product(self, detector):
+        """Test the product mentioned closest to the price wins."""
+        path = Path("docs/sales/plans.md")
+        context = "starter is $19/month and premium is $99/month"
+        price_start = context.index("$99")
+
+        product = detector._identify_product_from_context(
+            context,
+            path,
+            price_span=(price_start, price_start + len("$99/month"))
+        )
+
+        assert product == "premium"
+
+    def test_pricing_skips_documents_without_currency(self, detector, test_docs_dir):
+        """Test documents without '$' or 'dollar' are not scanned for prices."""
+        doc1 = test_docs_dir / "notes.md"
+        doc1.write_text("We meet 12 per month and 4 per year.\n")
+
+        conflicts = detector.detect_conflicts([doc1])
+
+        assert conflicts['pricing'] == []
+
     def test_cross_reference_to_deprecated_doc(self, detector, test_docs_dir):
         """Test detection of links to deprecated documents."""
         deprecated_doc = test_docs_dir / "old-guide.md"
@@ -318,6 +504,169 @@ status: draft
         # Should not flag external links
         assert len(cross_ref_conflicts) == 0
 
+    def test_cross_reference_uses_shared_link_graph(self, config, logger, test_docs_dir):
+        """Test CONFLICT-004 queries the shared graph's reverse index."""
+        from src.core.link_graph import LinkGraph
+
+        deprecated_doc = test_docs_dir / "old-guide.md"
+        deprecated_doc.write_text("---\ntitle: Old\ntags: [guide]\nstatus: deprecated\n---\n")
+        active_doc = test_docs_dir / "current-doc.md"
+        active_doc.write_text(
+            "---\ntitle: Current\ntags: [guide]\nstatus: active\n---\n"
+            "[old](old-guide.md)\n\n[again](./old-guide.md#intro)\n"
+        )
+
+        link_graph = LinkGraph(test_docs_dir)
+        detector = ConflictDetector(config, logger, link_graph=link_graph)
+        conflicts = detector.detect_conflicts([deprecated_doc, active_doc], base_path=test_docs_dir)
+
+        assert [issue.line_number for issue in conflicts['cross_references']] == [6, 8]
+        assert active_doc in link_graph
+
+    def test_orphans_and_link_cycles_disabled_by_default(self, detector, test_docs_dir):
+        """Test graph reports are opt-in."""
+        doc = test_docs_dir / "lonely.md"
+        doc.write_text("---\ntitle: Lonely\ntags: [x]\nstatus: draft\n---\n")
+
+        conflicts = detector.detect_conflicts([doc], base_path=test_docs_dir)
+
+        assert conflicts['orphans'] == []
+        assert conflicts['link_cycles'] == []
+
+    def test_orphans_and_link_cycles(self, tmp_path, logger, test_docs_dir):
+        """Test orphan documents and link cycles are reported when enabled."""
+        config_file = tmp_path / "graph-config.yaml"
+        config_file.write_text("""
+processing:
+  doc_directories: ["."]
+  cache_file: "_meta/.document-cache.json"
+validation:
+  yaml:
+    enabled: true
+    required_fields: [title]
+    allowed_statuses: [draft]
+  markdown:
+    enabled: false
+  naming:
+    enabled: false
+  conflicts:
+    enabled: true
+    orphans:
+      enabled: true
+    link_cycles:
+      enabled: true
+reporting:
+  format: "markdown"
+logging:
+  level: "INFO"
+""")
+        detector = ConflictDetector(Config(config_file), logger)
+
+        docs = {
+            'README.md': "[a](a.md)",
+            'a.md': "[b](b.md)",
+            'b.md': "[a](a.md)",
+            'lonely.md': "[a](a.md)",
+        }
+        for name, body in docs.items():
+            (test_docs_dir / name).write_text(f"---\ntitle: {name}\ntags: [x]\nstatus: draft\n---\n{body}\n")
+
+        conflicts = detector.detect_conflicts(
+            sorted(test_docs_dir.glob("*.md")), base_path=test_docs_dir
+        )
+
+        assert [issue.file_path.name for issue in conflicts['orphans']] == ['lonely.md']
+        assert conflicts['orphans'][0].rule_id == "CONFLICT-007"
+        assert len(conflicts['link_cycles']) == 1
+        assert conflicts['link_cycles'][0].rule_id == "CONFLICT-008"
+        assert "a.md, b.md" in conflicts['link_cycles'][0].message
+
+    def test_near_duplicate_documents(self, detector, test_docs_dir):
+        """Test detection of copy-pasted documents that drifted slightly."""
+        body = "\n".join(
+            f"Step {i}: open the client record and confirm the onboarding checklist item {i}."
+            for i in range(1, 30)
+        )
+        doc1 = test_docs_dir / "client-onboarding-sop.md"
+        doc1.write_text(f"---\ntitle: Onboarding SOP\ntags: [sop]\nstatus: draft\n---\n{body}\n")
+        doc2 = test_docs_dir / "client-onboarding-sop-copy.md"
+        doc2.write_text(
+            f"---\ntitle: Onboarding SOP (old)\ntags: [sop]\nstatus: draft\n---\n"
+            f"{body.replace('Step 7:', 'Step seven:')}\n"
+        )
+        doc3 = test_docs_dir / "pricing-overview.md"
+        doc3.write_text(" ".join(f"unrelated{i}" for i in range(200)))
+
+        conflicts = detector.detect_conflicts([doc1, doc2, doc3])
+        duplicates = conflicts['near_duplicates']
+
+        assert len(duplicates) == 1
+        assert duplicates[0].rule_id == "CONFLICT-005"
+        assert "client-onboarding-sop" in duplicates[0].message
+
+    def test_near_duplicates_skip_short_documents(self, detector, test_docs_dir):
+        """Test tiny documents are not reported as duplicates."""
+        doc1 = test_docs_dir / "doc1.md"
+        doc1.write_text("Content\n")
+        doc2 = test_docs_dir / "doc2.md"
+        doc2.write_text("Content\n")
+
+        conflicts = detector.detect_conflicts([doc1, doc2])
+
+        assert conflicts['near_duplicates'] == []
+
+    def test_near_duplicate_signatures_cached(self, config, logger, test_docs_dir, tmp_path, mocker):
+        """Test unchanged documents are not re-signed on a second run."""
+        config.config_data['validation']['conflicts']['near_duplicates'] = {
+            'signature_cache': str(tmp_path / "signatures.json")
+        }
+        doc1 = test_docs_dir / "long-document.md"
+        doc1.write_text(" ".join(f"word{i}" for i in range(100)))
+
+        ConflictDetector(config, logger).detect_conflicts([doc1])
+        assert (tmp_path / "signatures.json").exists()
+
+        spy = mocker.patch('src.core.validators.conflict_detector.MinHasher.signature')
+        ConflictDetector(config, logger).detect_conflicts([doc1])
+
+        spy.assert_not_called()
+
+    def test_duplicate_blocks_across_documents(self, detector, test_docs_dir):
+        """Test paragraphs and list items repeated across documents are reported."""
+        policy = (
+            "Refunds are available within 30 days of purchase for all monthly plans,\n"
+            "provided the account has not exceeded its included usage."
+        )
+        doc1 = test_docs_dir / "refund-policy.md"
+        doc1.write_text(f"---\ntitle: Refunds\ntags: [policy]\nstatus: draft\n---\n# Refunds\n\n{policy}\n")
+        doc2 = test_docs_dir / "sales-faq.md"
+        doc2.write_text(
+            "# FAQ\n\n"
+            "Intro text.\n\n"
+            "- " + policy.replace("\n", " ").upper() + "\n"
+        )
+
+        conflicts = detector.detect_conflicts([doc1, doc2])
+        duplicates = conflicts['duplicate_blocks']
+
+        assert len(duplicates) == 1
+        assert duplicates[0].rule_id == "CONFLICT-006"
+        assert duplicates[0].file_path == doc1
+        assert duplicates[0].line_number == 8
+        assert f"{doc2}:5" in duplicates[0].message
+
+    def test_duplicate_blocks_ignore_code_and_same_document(self, detector, test_docs_dir):
+        """Test code blocks and repeats within one document are not reported."""
+        repeated = "This onboarding reminder paragraph is long enough to count as a real block of text."
+        doc1 = test_docs_dir / "doc1.md"
+        doc1.write_text(f"{repeated}\n\n{repeated}\n\n```text\n{repeated}x\n```\n")
+        doc2 = test_docs_dir / "doc2.md"
+        doc2.write_text(f"```text\n{repeated}x\n```\n")
+
+        conflicts = detector.detect_conflicts([doc1, doc2])
+
+        assert conflicts['duplicate_blocks'] == []
+
     def test_documents_without_frontmatter(self, detector, test_docs_dir):
         """Test detector handles documents without frontmatter gracefully."""
         doc1 = test_docs_dir / "no-frontmatter.md"
@@ -273,6 +273,37 @@ print("No closing fence")
         md_003_issues = [i for i in issues if i.rule_id == "MD-003"]
         assert len(md_003_issues) == 0
 
+    def test_links_validated_against_shared_graph(self, config, logger, test_docs_dir):
+        """Test MD-003 uses a shared link graph without a base path."""
+        from src.core.link_graph import LinkGraph
+
+        test_file = test_docs_dir / "shared.md"
+        test_file.write_text("# Title\n\n[Missing](./missing.md)\n")
+        link_graph = LinkGraph(test_docs_dir)
+        validator = MarkdownValidator(config, logger, link_graph=link_graph)
+
+        issues = validator.validate(test_file)
+
+        assert [i.line_number for i in issues if i.rule_id == "MD-003"] == [3]
+        assert [link.target for link in link_graph.links_from(test_file)] == ['missing.md']
+
+    def test_broken_anchor_links(self, validator, test_docs_dir):
+        """Test #fragments are checked against heading slugs."""
+        (test_docs_dir / "guide.md").write_text("# Guide\n\n## Installation Steps\n")
+        test_file = test_docs_dir / "anchors.md"
+        test_file.write_text(
+            "# Title\n\n[ok](#title)\n[bad](#titel)\n"
+            "[ok](./guide.md#installation-steps)\n[bad](./guide.md#installation)\n"
+        )
+
+        issues = validator.validate(test_file, base_path=test_docs_dir)
+        anchor_issues = [i for i in issues if i.rule_id == "MD-003"]
+
+        assert [i.line_number for i in anchor_issues] == [4, 6]
+        assert all(i.severity == ValidationSeverity.WARNING for i in anchor_issues)
+        assert anchor_issues[0].suggestion == "Did you mean '#title'?"
+        assert "'guide.md'" in anchor_issues[1].message
+
     def test_trailing_whitespace(self, validator, test_docs_dir):
         """Test detection of trailing whitespace."""
         content = "# Title   \n\nSome content here.   \n"
@@ -372,6 +403,44 @@ Content after rule.
         assert issues[0].rule_id == "MD-000"
         assert "not found" in issues[0].message.lower()
 
+    def test_large_file_streams_same_issues(self, validator, test_docs_dir):
+        """Test files above the large-file threshold give the same results."""
+        content = (
+            "# Title\n\n### Skipped\n\nTrailing   \r\n\n```\ncode\n```\n\n***\n"
+            "[Missing](missing.md)\n"
+        )
+        test_file = test_docs_dir / "large.md"
+        test_file.write_bytes(content.encode('utf-8'))
+
+        expected = validator.validate(test_file, base_path=test_docs_dir)
+        validator.large_file_threshold = 1
+        streamed = validator.validate(test_file, base_path=test_docs_dir)
+
+        assert [(i.rule_id, i.line_number) for i in streamed] == \
+            [(i.rule_id, i.line_number) for i in expected]
+        assert {i.rule_id for i in streamed} == {"MD-001", "MD-002", "MD-003", "MD-004", "MD-005"}
+
+    def test_large_file_not_loaded(self, validator, test_docs_dir, mocker):
+        """Test line rules on large files never read the whole file."""
+        test_file = test_docs_dir / "large.md"
+        test_file.write_text("# Title\n\nText   \n")
+        validator.large_file_threshold = 1
+        read_text = mocker.patch.object(Path, 'read_text')
+
+        issues = validator.validate(test_file)
+
+        read_text.assert_not_called()
+        assert [issue.rule_id for issue in issues] == ["MD-004"]
+
+
+    def test_rule_errors_are_not_reported_as_read_errors(self, validator, test_docs_dir, mocker):
+        """Test a failing rule raises instead of becoming an MD-000 issue."""
+        test_file = test_docs_dir / "doc.md"
+        test_file.write_text("# Title\n")
+        mocker.patch.object(validator, '_validate_heading_hierarchy', side_effect=KeyError('bug'))
+
+        with pytest.raises(KeyError):
+            validator.validate(test_file)
 
 class TestMarkdownValidatorRealDocs:
     """Tests with real Symphony Core documentation (if available)."""
@@ -258,6 +258,21 @@ performance:
         assert 'filename' in suggestions
         assert suggestions['filename'] == 'pricing-strategy.md'
 
+    def test_get_rename_suggestions_for_directories(self, validator, test_docs_dir):
+        """Test directory suggestions cover every violating directory in the path."""
+        nested_dir = test_docs_dir / "Sales Team" / "Q1 Plans" / "drafts"
+        nested_dir.mkdir(parents=True)
+        test_file = nested_dir / "pricing-plan.md"
+        test_file.write_text("# Test")
+
+        suggestions = validator.get_rename_suggestions(test_file, test_docs_dir)
+
+        assert 'filename' not in suggestions
+        assert suggestions['directories'] == {
+            'Sales Team': 'sales-team',
+            'Sales Team/Q1 Plans': 'q1-plans',
+        }
+
     def test_validate_batch(self, validator, test_docs_dir):
         """Test batch validation of multiple files."""
         # Create multiple test files with various issues
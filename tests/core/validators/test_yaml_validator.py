@@ -436,3 +436,26 @@ performance:
         # Test both
         assert validator.has_complete_frontmatter(doc_with_fm) is True
         assert validator.has_complete_frontmatter(doc_without_fm) is False
+
+
+class TestValidationIssue:
+    """Tests for ValidationIssue serialization."""
+
+    def test_round_trip(self, tmp_path):
+        """Test issues survive to_dict/from_dict with a new file path."""
+        issue = ValidationIssue(
+            rule_id="YAML-003",
+            severity=ValidationSeverity.WARNING,
+            message="Invalid status",
+            file_path=tmp_path / "old.md",
+            line_number=4,
+            suggestion="Use draft"
+        )
+
+        restored = ValidationIssue.from_dict(issue.to_dict(), tmp_path / "new.md")
+
+        assert restored.file_path == tmp_path / "new.md"
+        assert (restored.rule_id, restored.severity, restored.line_number) == (
+            "YAML-003", ValidationSeverity.WARNING, 4
+        )
+        assert restored.suggestion == "Use draft"
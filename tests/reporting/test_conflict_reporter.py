@@ -290,3 +290,35 @@ class TestConflictReporterIntegration:
         # Verify all types in recommendations
         recs = ' '.join(data.recommendations)
         assert 'status' in recs.lower() or 'pricing' in recs.lower() or 'tag' in recs.lower()
+
+    def test_near_duplicate_recommendation(self, tmp_path):
+        """Test near-duplicate conflicts produce a consolidation recommendation."""
+        reporter = ConflictReporter()
+
+        conflicts = {
+            'near_duplicates': [
+                ValidationIssue('CONFLICT-005', ValidationSeverity.WARNING, 'msg', tmp_path / 'd1.md')
+            ]
+        }
+
+        data = reporter.analyze_conflicts(conflicts)
+
+        assert any('near-duplicate' in rec for rec in data.recommendations)
+
+    def test_link_graph_recommendations(self, tmp_path):
+        """Test orphan and link cycle reports produce recommendations."""
+        reporter = ConflictReporter()
+
+        conflicts = {
+            'orphans': [
+                ValidationIssue('CONFLICT-007', ValidationSeverity.INFO, 'msg', tmp_path / 'd1.md')
+            ],
+            'link_cycles': [
+                ValidationIssue('CONFLICT-008', ValidationSeverity.INFO, 'msg', tmp_path / 'd2.md')
+            ]
+        }
+
+        data = reporter.analyze_conflicts(conflicts)
+
+        assert any('orphan' in rec for rec in data.recommendations)
+        assert any('circular links' in rec for rec in data.recommendations)
@@ -12,7 +12,7 @@ import json
 import tempfile
 import shutil
 
-from src.cli import cli
+from src.cli import cli, _get_renamed_cached_issues
 
 
 class TestCLIBasics:
@@ -215,3 +215,439 @@ class TestCLIRealDocs:
         # 09-clients folder should have 100% pass rate
         assert result.exit_code == 0
         assert 'VALIDATION REPORT' in result.output
+
+
+class TestRenamedDocuments:
+    """Test cached results are reused for renamed documents."""
+
+    def test_get_renamed_cached_issues(self, tmp_path):
+        """Test only renamed entries with cached issues skip full validation."""
+        from src.core.change_detector import ChangeDetector
+        from src.utils.cache import DocumentCache
+        from src.utils.logger import Logger
+
+        cache = DocumentCache(tmp_path / "cache.json")
+        detector = ChangeDetector(cache, Logger("test", log_file=tmp_path / "test.log"))
+        issue = {'rule_id': 'YAML-002', 'severity': 'error', 'message': 'Missing title'}
+        cache.update_document(Path("a.md"), "h1", issues=[issue])
+        cache.update_document(Path("b.md"), "h2", issues=None)
+        cache.update_document(Path("c.md"), "h3", issues=[issue])
+        cache.rename_document(Path("a.md"), Path("new-a.md"))
+        cache.rename_document(Path("b.md"), Path("new-b.md"))
+
+        assert _get_renamed_cached_issues(detector, Path("new-a.md")) == [issue]
+        assert _get_renamed_cached_issues(detector, Path("new-b.md")) is None
+        assert _get_renamed_cached_issues(detector, Path("c.md")) is None
+        assert _get_renamed_cached_issues(None, Path("new-a.md")) is None
+
+
+class TestAutofixCommands:
+    """Test auto-fix run management commands."""
+
+    def test_rollback_latest(self, tmp_path, monkeypatch):
+        """Test rolling back the most recent auto-fix run."""
+        from src.core.backup_store import BackupStore
+
+        monkeypatch.chdir(tmp_path)
+        doc = tmp_path / "doc.md"
+        doc.write_text("original")
+        store = BackupStore(tmp_path / "_meta" / ".backups")
+        run = store.start_run()
+        run.backup(doc)
+        doc.write_text("fixed")
+        run.record_result(doc, b"fixed")
+        run.save()
+
+        result = CliRunner().invoke(cli, ['autofix', 'rollback', '--run', 'latest'])
+
+        assert result.exit_code == 0, result.output
+        assert f"Rolled back run {run.run_id}: 1 file(s) restored" in result.output
+        assert doc.read_text() == "original"
+
+    def test_rollback_unknown_run(self, tmp_path, monkeypatch):
+        """Test rolling back an unknown run exits with an error."""
+        monkeypatch.chdir(tmp_path)
+
+        result = CliRunner().invoke(cli, ['autofix', 'rollback', '--run', 'nope'])
+
+        assert result.exit_code == 1
+        assert "No backup run 'nope'" in result.output
+
+
+class TestAutoFixMode:
+    """Test validate --auto-fix consumes the validation pass."""
+
+    @pytest.fixture
+    def docs(self, tmp_path, monkeypatch):
+        """Create one clean and one fixable document."""
+        monkeypatch.chdir(tmp_path)
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        clean = docs_dir / "clean-doc.md"
+        clean.write_text("---\ntitle: Clean\ntags: [general]\nstatus: draft\n---\n\n# Clean\n")
+        messy = docs_dir / "messy-doc.md"
+        messy.write_text("---\ntitle: Messy\ntags: [general]\nstatus: draft\n---\n\n# Messy   \n\nText  \n")
+        return docs_dir, clean, messy
+
+    def test_auto_fix_validates_each_document_once(self, docs, mocker):
+        """Test each document is validated once and non-YAML issues are fixed."""
+        from src.core.validators.yaml_validator import YAMLValidator
+        from src.core.validators.markdown_validator import MarkdownValidator
+
+        docs_dir, clean, messy = docs
+        yaml_spy = mocker.spy(YAMLValidator, 'validate')
+        markdown_spy = mocker.spy(MarkdownValidator, 'validate')
+
+        result = CliRunner().invoke(cli, ['validate', '--path', str(docs_dir), '--force', '--auto-fix'])
+
+        assert result.exit_code == 0, result.output
+        assert yaml_spy.call_count == 2
+        assert markdown_spy.call_count == 2
+        assert "Removed trailing whitespace from 2 line(s)" in result.output
+        assert messy.read_text() == "---\ntitle: Messy\ntags: [general]\nstatus: draft\n---\n\n# Messy\n\nText\n"
+
+    def test_auto_fix_leaves_fixed_documents_uncached(self, docs):
+        """Test rewritten documents are revalidated on the next incremental run."""
+        from src.utils.cache import DocumentCache
+
+        docs_dir, clean, messy = docs
+
+        result = CliRunner().invoke(cli, ['validate', '--path', str(docs_dir), '--auto-fix'])
+
+        assert result.exit_code == 0, result.output
+        cache = DocumentCache(Path('_meta/.document-cache.json'))
+        assert clean in cache
+        assert messy not in cache
+
+    def test_auto_fix_after_preview_fixes_documents(self, docs):
+        """Test a preview run does not cache documents that still need fixing."""
+        docs_dir, clean, messy = docs
+
+        preview = CliRunner().invoke(cli, ['validate', '--path', str(docs_dir), '--auto-fix', '--preview'])
+        result = CliRunner().invoke(cli, ['validate', '--path', str(docs_dir), '--auto-fix'])
+
+        assert preview.exit_code == 0, preview.output
+        assert result.exit_code == 0, result.output
+        assert "[FIXED]" in result.output
+        assert messy.read_text() == "---\ntitle: Messy\ntags: [general]\nstatus: draft\n---\n\n# Messy\n\nText\n"
+
+    def test_auto_fix_suggests_tags_from_tagged_documents(self, docs):
+        """Test missing tags are suggested from similar tagged documents."""
+        from src.utils.frontmatter import parse_frontmatter
+
+        docs_dir, clean, messy = docs
+        for name, body in [
+            ("invoice-terms", "Invoice payment terms and billing due dates"),
+            ("refund-policy", "Refund an invoice and issue billing credit"),
+        ]:
+            (docs_dir / f"{name}.md").write_text(f"---\ntitle: T\ntags: [billing]\nstatus: draft\n---\n\n{body}\n")
+        untagged = docs_dir / "overdue-invoices.md"
+        untagged.write_text("---\ntitle: Overdue\nstatus: draft\n---\n\nBilling reminders for an overdue invoice.\n")
+
+        result = CliRunner().invoke(cli, ['validate', '--path', str(docs_dir), '--force', '--auto-fix'])
+
+        assert result.exit_code == 0, result.output
+        assert "Tag suggestions learned from 4 tagged document(s)" in result.output
+        assert parse_frontmatter(untagged)['tags'] == ['billing']
+
+class TestPreviewPatches:
+    """Test preview modes write unified diffs."""
+
+    def test_auto_fix_preview_patch(self, tmp_path, monkeypatch):
+        """Test --patch writes the previewed fixes without changing files."""
+        monkeypatch.chdir(tmp_path)
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        doc = docs_dir / "messy-doc.md"
+        doc.write_text("---\ntitle: Messy\ntags: [general]\nstatus: draft\n---\n\n# Messy   \n")
+
+        result = CliRunner().invoke(cli, [
+            'validate', '--path', 'docs', '--force', '--auto-fix', '--preview', '--patch', 'fixes.patch'
+        ])
+
+        assert result.exit_code == 0, result.output
+        patch = (tmp_path / "fixes.patch").read_text()
+        assert patch.startswith("diff --git a/docs/messy-doc.md b/docs/messy-doc.md\n")
+        assert "-# Messy   \n+# Messy\n" in patch
+        assert doc.read_text().endswith("# Messy   \n")
+
+    def test_patch_requires_preview(self):
+        """Test --patch is rejected outside preview mode."""
+        result = CliRunner().invoke(cli, [
+            'validate', '--path', 'tests/fixtures', '--auto-fix', '--patch', 'fixes.patch'
+        ])
+
+        assert result.exit_code == 1
+        assert '--patch requires --preview' in result.output
+
+    def test_add_field_preview_streams_all_documents(self, tmp_path):
+        """Test add-field preview diffs every document, not just the first ten."""
+        for index in range(12):
+            (tmp_path / f"doc-{index:02d}.md").write_text(f"# Doc {index}\n")
+
+        result = CliRunner().invoke(cli, [
+            'frontmatter', 'add-field', '--path', str(tmp_path), '--field', 'owner', '--value', 'ops', '--preview'
+        ])
+
+        assert result.exit_code == 0, result.output
+        assert result.output.count("+owner: ops") == 12
+        assert "Would change: 12 document(s)" in result.output
+        assert (tmp_path / "doc-11.md").read_text() == "# Doc 11\n"
+
+
+class TestFrontmatterApply:
+    """Test the frontmatter apply command."""
+
+    def test_apply_operations_file(self, tmp_path):
+        """Test operations from a file are applied to every document."""
+        ops_file = tmp_path / "ops.yaml"
+        ops_file.write_text("- {op: set, field: owner, value: ops}\n- {op: rename, field: author, to: lead}\n")
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        doc = docs_dir / "doc.md"
+        doc.write_text("---\ntitle: Doc\nauthor: Ann\n---\n# Doc\n")
+
+        result = CliRunner().invoke(cli, ['frontmatter', 'apply', str(ops_file), '--path', str(docs_dir)])
+
+        assert result.exit_code == 0, result.output
+        assert "Changed: 1" in result.output
+        assert doc.read_text() == "---\ntitle: Doc\nlead: Ann\nowner: ops\n---\n# Doc\n"
+
+    def test_apply_invalid_operations_file(self, tmp_path):
+        """Test an invalid operations file is rejected before any document is read."""
+        ops_file = tmp_path / "ops.yaml"
+        ops_file.write_text("- {op: drop, field: owner}\n")
+
+        result = CliRunner().invoke(cli, ['frontmatter', 'apply', str(ops_file), '--path', str(tmp_path)])
+
+        assert result.exit_code == 1
+        assert "Unknown operation 'drop'" in result.output
+
+
+class TestFrontmatterQuery:
+    """Test the frontmatter query command."""
+
+    @pytest.fixture
+    def docs_dir(self, tmp_path, monkeypatch):
+        """Create documents to query."""
+        monkeypatch.chdir(tmp_path)
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        (docs_dir / "a.md").write_text("---\ntitle: A\ntags: [pricing]\nstatus: draft\nversion: 1.0\n---\n")
+        (docs_dir / "b.md").write_text("---\ntitle: B\ntags: [legal]\nstatus: final\n---\n")
+        (docs_dir / "c.md").write_text("# No frontmatter\n")
+        return docs_dir
+
+    def test_query_conditions(self, docs_dir):
+        """Test conditions are combined and values parsed as YAML."""
+        runner = CliRunner()
+
+        result = runner.invoke(cli, ['frontmatter', 'query', '--path', 'docs', '--missing', 'status'])
+        assert result.exit_code == 0, result.output
+        assert result.output.split() == ["docs/c.md"]
+
+        result = runner.invoke(cli, [
+            'frontmatter', 'query', '--path', 'docs', '--contains', 'tags=pricing', '--equals', 'version=1.0'
+        ])
+        assert result.output.split() == ["docs/a.md"]
+
+        result = runner.invoke(cli, ['frontmatter', 'query', '--path', 'docs', '--has', 'title', '--count'])
+        assert result.output.strip() == "2"
+        assert (docs_dir.parent / "_meta" / ".metadata-index.json").exists()
+
+    def test_query_json(self, docs_dir):
+        """Test JSON output includes each match's metadata."""
+        result = CliRunner().invoke(cli, [
+            'frontmatter', 'query', '--path', 'docs', '--equals', 'status=final', '--format', 'json'
+        ])
+
+        data = json.loads(result.output)
+        assert data['count'] == 1
+        assert data['documents'][0]['metadata']['title'] == "B"
+
+    def test_query_invalid_expression(self, docs_dir):
+        """Test a malformed FIELD=VALUE expression is rejected."""
+        result = CliRunner().invoke(cli, ['frontmatter', 'query', '--path', 'docs', '--equals', 'status'])
+
+        assert result.exit_code == 1
+        assert "Expected FIELD=VALUE" in result.output
+
+    def test_add_field_preview_exact_counts(self, docs_dir):
+        """Test add-field preview reports counts for the whole corpus."""
+        result = CliRunner().invoke(cli, [
+            'frontmatter', 'add-field', '--path', 'docs', '--field', 'version', '--value', '2.0', '--preview'
+        ])
+
+        assert result.exit_code == 0, result.output
+        assert "Documents with 'version': 1" in result.output
+        assert "Documents missing 'version': 2 (1 without frontmatter)" in result.output
+
+
+class TestTagFiltering:
+    """Test validate --tags selects documents by tag."""
+
+    @pytest.fixture
+    def docs_dir(self, tmp_path, monkeypatch):
+        """Create documents with different tags."""
+        monkeypatch.chdir(tmp_path)
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        for name, tag in (("price-list", "pricing"), ("refund-policy", "policies"), ("team-handbook", "general")):
+            (docs_dir / f"{name}.md").write_text(f"---\ntitle: {name}\ntags: [{tag}]\nstatus: draft\n---\n# {name}\n")
+        return docs_dir
+
+    def test_force_mode_filters_by_tag(self, docs_dir):
+        """Test a forced run only processes documents with a requested tag."""
+        result = CliRunner().invoke(cli, ['validate', '--path', 'docs', '--force', '--tags', 'pricing,policies'])
+
+        assert result.exit_code == 0, result.output
+        assert "Documents to process: 2" in result.output
+
+    def test_incremental_mode_filters_by_tag(self, docs_dir):
+        """Test incremental runs check only tagged documents and keep the rest cached."""
+        runner = CliRunner()
+        runner.invoke(cli, ['validate', '--path', 'docs'])
+        (docs_dir / "price-list.md").write_text("---\ntitle: Prices\ntags: [pricing]\nstatus: draft\n---\n# Prices\n")
+        (docs_dir / "team-handbook.md").write_text("---\ntitle: Team\ntags: [general]\nstatus: draft\n---\n# Team\n")
+
+        result = runner.invoke(cli, ['validate', '--path', 'docs', '--tags', 'pricing'])
+
+        assert result.exit_code == 0, result.output
+        assert "Documents to process: 1" in result.output
+
+        result = runner.invoke(cli, ['validate', '--path', 'docs'])
+        assert "Documents to process: 1" in result.output
+
+
+class TestStatePaths:
+    """Test caches and indexes are kept at the repository root."""
+
+    def test_state_files_under_repo_root(self, tmp_path, monkeypatch):
+        """Test running from a subdirectory uses the repository's _meta directory."""
+        (tmp_path / ".git").mkdir()
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        (docs_dir / "a-doc.md").write_text("---\ntitle: A\ntags: [general]\nstatus: draft\n---\n# A\n")
+        monkeypatch.chdir(docs_dir)
+
+        result = CliRunner().invoke(cli, ['validate', '--path', '.'])
+
+        assert result.exit_code == 0, result.output
+        assert (tmp_path / "_meta" / ".document-cache.json").exists()
+        assert (tmp_path / "_meta" / ".metadata-index.json").exists()
+        assert not (docs_dir / "_meta").exists()
+
+
+class TestLinkChecks:
+    """Test validate only checks links across documents when enabled."""
+
+    @pytest.fixture
+    def docs_dir(self, tmp_path, monkeypatch):
+        """Create a document with a broken link."""
+        monkeypatch.chdir(tmp_path)
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        (docs_dir / "a-doc.md").write_text(
+            "---\ntitle: A\ntags: [general]\nstatus: draft\n---\n# A\n\nSee [missing](missing-doc.md).\n"
+        )
+        return docs_dir
+
+    def test_links_not_checked_by_default(self, docs_dir):
+        """Test broken links are not reported unless link checks are enabled."""
+        result = CliRunner().invoke(cli, ['validate', '--path', 'docs', '--force'])
+
+        assert result.exit_code == 0, result.output
+        assert "MD-003" not in result.output
+        assert not Path('_meta/.link-graph.json').exists()
+
+    @pytest.fixture
+    def links_enabled(self, mocker):
+        """Turn on validation.links.enabled."""
+        from src.utils.config import Config
+
+        get = Config.get
+        mocker.patch.object(
+            Config, 'get', autospec=True,
+            side_effect=lambda self, key, default=None:
+                True if key == 'validation.links.enabled' else get(self, key, default)
+        )
+
+    def test_links_checked_when_enabled(self, docs_dir, links_enabled):
+        """Test validation.links.enabled reports broken links as MD-003."""
+        result = CliRunner().invoke(cli, ['validate', '--path', 'docs', '--force'])
+
+        assert result.exit_code == 0, result.output
+        assert "MD-003: Broken link" in result.output
+
+
+    def test_referrers_of_moved_document_revalidated(self, docs_dir, links_enabled):
+        """Test an incremental run reports links broken by moving their target."""
+        (docs_dir / "missing-doc.md").write_text(
+            "---\ntitle: M\ntags: [general]\nstatus: draft\n---\n# M\n"
+        )
+        runner = CliRunner()
+        first = runner.invoke(cli, ['validate', '--path', 'docs'])
+        (docs_dir / "missing-doc.md").rename(docs_dir / "moved-doc.md")
+
+        result = runner.invoke(cli, ['validate', '--path', 'docs'])
+
+        assert "MD-003" not in first.output
+        assert "Documents to process: 2" in result.output
+        assert "docs/a-doc.md" in result.output
+        assert "MD-003: Broken link" in result.output
+
+class TestRenameCommands:
+    """Test rename apply."""
+
+    @pytest.fixture
+    def docs_dir(self, tmp_path, monkeypatch):
+        """Create a misnamed document and a document linking to it."""
+        monkeypatch.chdir(tmp_path)
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        (docs_dir / "Pricing Plan.md").write_text("# Plan\n")
+        (docs_dir / "index-page.md").write_text("# Index\n\n[plan](Pricing%20Plan.md)\n")
+        return docs_dir
+
+    def test_preview_writes_patch_and_changes_nothing(self, docs_dir, tmp_path):
+        """Test preview lists the rename and the link rewrite as a patch."""
+        patch = tmp_path / "renames.patch"
+
+        result = CliRunner().invoke(cli, ['rename', 'apply', '--path', 'docs', '--preview', '--patch', str(patch)])
+
+        assert result.exit_code == 0, result.output
+        assert "Renames: 1 (1 file(s), 0 directory(ies))" in result.output
+        assert "Documents with links to update: 1 (1 link(s))" in result.output
+        assert "rename to docs/pricing-plan.md\n" in patch.read_text()
+        assert "+[plan](pricing-plan.md)\n" in patch.read_text()
+        assert (docs_dir / "Pricing Plan.md").exists()
+
+    def test_apply_then_rollback(self, docs_dir):
+        """Test applying renames and rewrites, then undoing them."""
+        runner = CliRunner()
+
+        result = runner.invoke(cli, ['rename', 'apply', '--path', 'docs', '--jobs', '2'])
+
+        assert result.exit_code == 0, result.output
+        assert "Rewritten documents: 1 (1 link(s))" in result.output
+        assert (docs_dir / "pricing-plan.md").exists()
+        assert (docs_dir / "index-page.md").read_text() == "# Index\n\n[plan](pricing-plan.md)\n"
+
+        result = runner.invoke(cli, ['autofix', 'rollback', '--run', 'latest'])
+
+        assert result.exit_code == 0, result.output
+        assert "Undid 1 rename(s)" in result.output
+        assert (docs_dir / "Pricing Plan.md").exists()
+        assert (docs_dir / "index-page.md").read_text() == "# Index\n\n[plan](Pricing%20Plan.md)\n"
+
+    def test_rewrites_links_from_outside_path(self, docs_dir, tmp_path):
+        """Test documents outside --path that link into it are rewritten too."""
+        other = tmp_path / "other"
+        other.mkdir()
+        (other / "ref-page.md").write_text("[plan](../docs/Pricing%20Plan.md)\n")
+
+        result = CliRunner().invoke(cli, ['rename', 'apply', '--path', 'docs'])
+
+        assert result.exit_code == 0, result.output
+        assert "Rewritten documents: 2 (2 link(s))" in result.output
+        assert (other / "ref-page.md").read_text() == "[plan](../docs/pricing-plan.md)\n"
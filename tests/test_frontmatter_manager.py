@@ -6,12 +6,15 @@ import pytest
 from pathlib import Path
 from src.core.frontmatter_manager import (
     FrontmatterManager,
-    FrontmatterOperationResult
+    FrontmatterOperation,
+    FrontmatterOperationResult,
+    load_operations
 )
 from src.utils.frontmatter import (
     parse_frontmatter,
     add_frontmatter,
-    has_frontmatter
+    has_frontmatter,
+    atomic_write_text
 )
 
 
@@ -548,3 +551,202 @@ class TestFrontmatterOperationResult:
         assert result.field_name is None
         assert result.old_value is None
         assert result.new_value is None
+
+
+class TestPreviewAddField:
+    """Tests for preview_add_field method."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create a FrontmatterManager instance."""
+        return FrontmatterManager()
+
+    def test_preview_matches_apply(self, manager, sample_documents, tmp_path):
+        """Test previewed diffs leave files untouched and match apply mode."""
+        originals = [doc.read_text(encoding='utf-8') for doc in sample_documents]
+
+        previews = [
+            manager.preview_add_field(doc, "owner", "ops", root=tmp_path)
+            for doc in sample_documents
+        ]
+
+        assert [doc.read_text(encoding='utf-8') for doc in sample_documents] == originals
+        assert all(result.success for result, _ in previews)
+        assert previews[0][1].startswith("diff --git a/doc1.md b/doc1.md\n")
+        assert "+owner: ops\n" in previews[2][1]
+
+        manager.add_field_to_documents(sample_documents, "owner", "ops")
+        assert parse_frontmatter(sample_documents[2])["owner"] == "ops"
+
+    def test_preview_skipped_document_has_no_diff(self, manager, sample_documents):
+        """Test documents that would be skipped produce no diff."""
+        result, diff = manager.preview_add_field(sample_documents[0], "title", "New")
+
+        assert result.success is False
+        assert "already exists" in result.message
+        assert diff == ""
+
+
+class TestFrontmatterOperation:
+    """Tests for FrontmatterOperation."""
+
+    def test_from_dict_rejects_malformed_operations(self):
+        """Test unknown operations, missing and unexpected keys are rejected."""
+        with pytest.raises(ValueError, match="Unknown operation"):
+            FrontmatterOperation.from_dict({'op': 'delete', 'field': 'a'})
+        with pytest.raises(ValueError, match="requires: to"):
+            FrontmatterOperation.from_dict({'op': 'rename', 'field': 'a'})
+        with pytest.raises(ValueError, match="Unexpected key"):
+            FrontmatterOperation.from_dict({'op': 'unset', 'field': 'a', 'value': 1})
+        with pytest.raises(ValueError, match="Condition"):
+            FrontmatterOperation.from_dict({'op': 'unset', 'field': 'a', 'when': {'is': 1}})
+
+    def test_operations(self):
+        """Test each operation edits metadata and reports its change."""
+        metadata = {'title': 'Doc', 'author': 'Ann', 'tags': 'pricing', 'old': 1}
+
+        assert FrontmatterOperation('set', 'status', 'draft').apply(metadata) == "Set 'status' to 'draft'"
+        assert FrontmatterOperation('unset', 'old').apply(metadata) == "Removed 'old'"
+        assert FrontmatterOperation('rename', 'author', to='owner').apply(metadata) is not None
+        assert FrontmatterOperation('append', 'tags', ['billing', 'pricing']).apply(metadata) is not None
+
+        assert metadata == {'title': 'Doc', 'owner': 'Ann', 'tags': ['pricing', 'billing'], 'status': 'draft'}
+        assert list(metadata) == ['title', 'owner', 'tags', 'status']
+
+    def test_operations_are_idempotent(self):
+        """Test re-applying operations reports no changes."""
+        metadata = {'status': 'draft', 'tags': ['a']}
+
+        assert FrontmatterOperation('set', 'status', 'draft').apply(metadata) is None
+        assert FrontmatterOperation('unset', 'missing').apply(metadata) is None
+        assert FrontmatterOperation('rename', 'missing', to='other').apply(metadata) is None
+        assert FrontmatterOperation('append', 'tags', 'a').apply(metadata) is None
+
+    def test_conditional_set(self):
+        """Test operations only apply to documents matching their condition."""
+        set_review = FrontmatterOperation('set', 'status', 'review', when={'equals': 'draft'})
+        set_owner = FrontmatterOperation('set', 'owner', 'ops', when={'field': 'tags', 'contains': 'ops'})
+
+        draft = {'status': 'draft', 'tags': ['ops']}
+        final = {'status': 'final', 'tags': ['sales']}
+        for metadata in (draft, final):
+            set_review.apply(metadata)
+            set_owner.apply(metadata)
+
+        assert draft == {'status': 'review', 'tags': ['ops'], 'owner': 'ops'}
+        assert final == {'status': 'final', 'tags': ['sales']}
+
+    def test_rename_onto_existing_field_fails(self):
+        """Test renaming onto an existing field is an error."""
+        with pytest.raises(ValueError, match="already exists"):
+            FrontmatterOperation('rename', 'a', to='b').apply({'a': 1, 'b': 2})
+
+    def test_load_operations(self, tmp_path):
+        """Test operations load from a YAML file in order."""
+        ops_file = tmp_path / "ops.yaml"
+        ops_file.write_text(
+            "operations:\n"
+            "  - {op: set, field: owner, value: ops}\n"
+            "  - {op: unset, field: legacy}\n",
+            encoding='utf-8'
+        )
+
+        operations = load_operations(ops_file)
+
+        assert [(op.op, op.field) for op in operations] == [('set', 'owner'), ('unset', 'legacy')]
+
+    def test_load_operations_reports_bad_entry(self, tmp_path):
+        """Test a malformed entry is reported with its position."""
+        ops_file = tmp_path / "ops.yaml"
+        ops_file.write_text("- {op: set, field: a, value: 1}\n- {op: bogus, field: b}\n", encoding='utf-8')
+
+        with pytest.raises(ValueError, match="Operation 2: Unknown operation"):
+            load_operations(ops_file)
+
+
+class TestApplyOperations:
+    """Tests for apply_operations method."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create a FrontmatterManager instance."""
+        return FrontmatterManager()
+
+    @pytest.fixture
+    def operations(self):
+        """Operations touching several fields."""
+        return [
+            FrontmatterOperation('set', 'owner', 'ops'),
+            FrontmatterOperation('set', 'status', 'review', when={'equals': 'draft'}),
+            FrontmatterOperation('append', 'tags', 'reviewed'),
+        ]
+
+    def test_single_write_per_document(self, manager, sample_documents, operations, mocker):
+        """Test all operations are applied with one write per changed document."""
+        write_spy = mocker.patch(
+            'src.core.frontmatter_manager.atomic_write_text',
+            wraps=atomic_write_text
+        )
+
+        results = manager.apply_operations(sample_documents, operations)
+
+        assert all(result.success for result in results)
+        assert write_spy.call_count == 3
+        assert parse_frontmatter(sample_documents[0]) == {
+            'title': 'Document 1', 'tags': ['test', 'reviewed'], 'status': 'review', 'owner': 'ops'
+        }
+        assert parse_frontmatter(sample_documents[2]) == {'owner': 'ops', 'tags': ['reviewed']}
+        assert "# Document 3" in sample_documents[2].read_text(encoding='utf-8')
+
+        # A second run changes nothing
+        again = manager.apply_operations(sample_documents, operations)
+        assert [result.message for result in again] == ["No changes"] * 3
+        assert write_spy.call_count == 3
+
+    def test_parallel_matches_sequential(self, manager, tmp_path, operations):
+        """Test parallel workers give the same results in document order."""
+        documents = []
+        for index in range(10):
+            doc = tmp_path / f"doc{index}.md"
+            doc.write_text(f"---\ntitle: Doc {index}\nstatus: draft\n---\n# Doc {index}\n", encoding='utf-8')
+            documents.append(doc)
+
+        results = manager.apply_operations(documents, operations, jobs=4)
+
+        assert [result.file_path for result in results] == documents
+        assert all(parse_frontmatter(doc)['status'] == 'review' for doc in documents)
+
+    def test_failed_operation_leaves_document_untouched(self, manager, tmp_path):
+        """Test a document is not half-edited when an operation fails."""
+        doc = tmp_path / "doc.md"
+        original = "---\ntitle: Doc\ntags: 3\n---\n# Doc\n"
+        doc.write_text(original, encoding='utf-8')
+
+        results = manager.apply_operations([doc], [
+            FrontmatterOperation('set', 'owner', 'ops'),
+            FrontmatterOperation('append', 'tags', 'x'),
+        ])
+
+        assert results[0].success is False
+        assert "Cannot append" in results[0].message
+        assert doc.read_text(encoding='utf-8') == original
+
+
+class TestIndexedLookups:
+    """Tests for field lookups answered from a metadata index."""
+
+    def test_lookups_match_unindexed_results(self, sample_documents, tmp_path):
+        """Test indexed lookups give the same answers as parsing each document."""
+        from src.core.metadata_index import MetadataIndex
+
+        plain = FrontmatterManager()
+        indexed = FrontmatterManager(metadata_index=MetadataIndex(tmp_path))
+
+        for manager in (plain, indexed):
+            assert manager.find_documents_with_field(sample_documents, 'tags') == [
+                (sample_documents[0], ['test'])
+            ]
+            assert manager.find_documents_with_field(sample_documents, 'status', 'review') == [
+                (sample_documents[1], 'review')
+            ]
+            assert manager.find_documents_without_field(sample_documents, 'tags') == sample_documents[1:]
@@ -8,6 +8,16 @@ from datetime import datetime
 from src.utils.cache import DocumentCache, compute_file_hash, CacheError
 import tempfile
 import json
+import multiprocessing
+import os
+
+
+def _update_and_save(cache_file, worker):
+    """Add entries to a shared cache, saving after each one."""
+    cache = DocumentCache(cache_file)
+    for index in range(20):
+        cache.update_document(Path(f"worker{worker}/doc{index}.md"), f"hash{index}")
+        cache.save()
 
 
 class TestDocumentCache:
@@ -54,6 +64,121 @@ class TestDocumentCache:
         assert len(cache) == 1
         assert "test.md" in cache.cache_data['documents']
 
+    def test_migrates_older_cache_version(self, temp_cache_file):
+        """Test a 1.0.0 cache is upgraded in place instead of wiped."""
+        temp_cache_file.write_text(json.dumps({
+            "version": "1.0.0",
+            "last_updated": "2025-11-07T10:30:00",
+            "documents": {
+                "doc.md": {
+                    "hash": "hash123",
+                    "last_processed": "2025-11-07T10:30:00",
+                    "last_modified": None,
+                    "validation_status": "passed",
+                    "error_count": 0,
+                    "warning_count": 0
+                }
+            }
+        }))
+
+        cache = DocumentCache(temp_cache_file)
+
+        assert cache.cache_data['version'] == DocumentCache.VERSION
+        entry = cache.get_document(Path("doc.md"))
+        assert entry['hash'] == "hash123"
+        assert entry['validation_status'] == "passed"
+        assert entry['issues'] is None
+        assert entry['inode'] is None
+
+    def test_unknown_cache_version_reinitialized(self, temp_cache_file):
+        """Test a cache with no migration path is discarded."""
+        temp_cache_file.write_text(json.dumps({
+            "version": "99.0.0",
+            "documents": {"doc.md": {"hash": "hash123"}}
+        }))
+
+        cache = DocumentCache(temp_cache_file)
+
+        assert cache.cache_data['version'] == DocumentCache.VERSION
+        assert len(cache) == 0
+
+    def test_keys_relative_to_repo_root(self, tmp_path, monkeypatch):
+        """Test equivalent spellings of a path share one root-relative key."""
+        (tmp_path / "docs").mkdir()
+        monkeypatch.chdir(tmp_path / "docs")
+        cache = DocumentCache(tmp_path / "cache.json", repo_root=tmp_path)
+
+        cache.update_document(Path("guide.md"), "hash123")
+
+        assert list(cache.cache_data['documents']) == ["docs/guide.md"]
+        assert cache.cache_data['repo_root'] == tmp_path.as_posix()
+        assert Path("./guide.md") in cache
+        assert tmp_path / "docs" / "guide.md" in cache
+        assert cache.get_all_cached_paths() == [Path("guide.md")]
+
+    def test_cache_portable_across_checkouts(self, tmp_path, monkeypatch):
+        """Test a cache file copied to another checkout path stays warm."""
+        checkout_a = tmp_path / "a"
+        checkout_b = tmp_path / "b"
+        checkout_a.mkdir()
+        checkout_b.mkdir()
+
+        cache_a = DocumentCache(checkout_a / "cache.json", repo_root=checkout_a)
+        cache_a.update_document(checkout_a / "docs" / "guide.md", "hash123")
+        cache_a.save()
+        (checkout_b / "cache.json").write_text((checkout_a / "cache.json").read_text())
+
+        monkeypatch.chdir(checkout_b)
+        cache_b = DocumentCache(checkout_b / "cache.json", repo_root=checkout_b)
+
+        assert not cache_b.has_document_changed(Path("docs/guide.md"), "hash123")
+        assert cache_b.cache_data['repo_root'] == checkout_b.as_posix()
+
+    def test_migrates_path_keys_to_root_relative(self, tmp_path, monkeypatch):
+        """Test 1.1.0 caches keyed by caller paths are re-keyed."""
+        monkeypatch.chdir(tmp_path)
+        cache_file = tmp_path / "cache.json"
+        cache_file.write_text(json.dumps({
+            "version": "1.1.0",
+            "documents": {
+                "./docs/a.md": {"hash": "h1", "renamed_from": "docs/old.md"},
+                str(tmp_path / "docs" / "b.md"): {"hash": "h2"}
+            }
+        }))
+
+        cache = DocumentCache(cache_file, repo_root=tmp_path)
+
+        assert sorted(cache.cache_data['documents']) == ["docs/a.md", "docs/b.md"]
+        assert cache.get_document(Path("docs/a.md"))['renamed_from'] == "docs/old.md"
+
+    def test_merge_cache_data_keeps_newer_entries(self, tmp_path):
+        """Test merging another cache keeps the most recently processed entries."""
+        cache = DocumentCache(tmp_path / "cache.json", repo_root=tmp_path)
+        cache.cache_data['documents'] = {
+            "a.md": {"hash": "local-a", "last_processed": "2025-11-07T10:00:00"},
+            "b.md": {"hash": "local-b", "last_processed": "2025-11-07T10:00:00"}
+        }
+
+        merged = cache.merge_cache_data({
+            "version": DocumentCache.VERSION,
+            "documents": {
+                "a.md": {"hash": "other-a", "last_processed": "2025-11-06T10:00:00"},
+                "b.md": {"hash": "other-b", "last_processed": "2025-11-08T10:00:00"},
+                "c.md": {"hash": "other-c", "last_processed": "2025-11-01T10:00:00"}
+            }
+        })
+
+        documents = cache.cache_data['documents']
+        assert merged == 2
+        assert documents["a.md"]["hash"] == "local-a"
+        assert documents["b.md"]["hash"] == "other-b"
+        assert documents["c.md"]["hash"] == "other-c"
+
+    def test_merge_cache_data_rejects_unknown_version(self, cache):
+        """Test merging a cache with an unknown version fails."""
+        with pytest.raises(CacheError):
+            cache.merge_cache_data({"version": "0.1.0", "documents": {}})
+
     def test_update_document(self, cache):
         """Test updating document in cache."""
         doc_path = Path("test.md")
@@ -115,6 +240,18 @@ class TestDocumentCache:
         cache.remove_document(doc_path)
         assert len(cache) == 0
 
+    def test_rename_document(self, cache):
+        """Test renaming moves the entry and records its old path."""
+        cache.update_document(Path("old.md"), "hash123", issues=[], inode=42)
+
+        cache.rename_document(Path("old.md"), Path("new/old.md"))
+
+        assert Path("old.md") not in cache
+        entry = cache.get_document(Path("new/old.md"))
+        assert entry['hash'] == "hash123"
+        assert entry['issues'] == []
+        assert entry['renamed_from'] == "old.md"
+
     def test_save_and_reload(self, cache, temp_cache_file):
         """Test saving and reloading cache persists data."""
         doc_path = Path("test.md")
@@ -127,6 +264,156 @@ class TestDocumentCache:
         assert len(cache2) == 1
         assert doc_path in cache2
 
+    def test_save_keeps_file_mode(self, cache, temp_cache_file):
+        """Test saving keeps the cache file's permission bits."""
+        umask = os.umask(0)
+        os.umask(umask)
+        assert temp_cache_file.stat().st_mode & 0o777 == 0o666 & ~umask
+
+        temp_cache_file.chmod(0o640)
+        cache.update_document(Path("test.md"), "hash123")
+        cache.save()
+
+        assert temp_cache_file.stat().st_mode & 0o777 == 0o640
+
+    def test_concurrent_saves_merge_entries(self, temp_cache_file):
+        """Test two instances saving the same file keep each other's entries."""
+        cache_a = DocumentCache(temp_cache_file)
+        cache_b = DocumentCache(temp_cache_file)
+
+        cache_a.update_document(Path("a.md"), "hash-a")
+        cache_b.update_document(Path("b.md"), "hash-b")
+        cache_a.save()
+        cache_b.save()
+
+        reloaded = DocumentCache(temp_cache_file)
+        assert Path("a.md") in reloaded
+        assert Path("b.md") in reloaded
+        assert list(temp_cache_file.parent.glob("*.tmp")) == []
+
+    def test_concurrent_saves_keep_newest_entry(self, temp_cache_file):
+        """Test the most recently processed entry wins on merge."""
+        cache_a = DocumentCache(temp_cache_file)
+        cache_b = DocumentCache(temp_cache_file)
+
+        cache_a.update_document(Path("doc.md"), "older")
+        cache_b.update_document(Path("doc.md"), "newer")
+        cache_b.save()
+        cache_a.save()
+
+        assert DocumentCache(temp_cache_file).get_document(Path("doc.md"))['hash'] == "newer"
+
+    def test_save_does_not_resurrect_removed_entries(self, temp_cache_file):
+        """Test removals are not undone by merging with the file on disk."""
+        cache = DocumentCache(temp_cache_file)
+        cache.update_document(Path("doc.md"), "hash")
+        cache.save()
+
+        cache.remove_document(Path("doc.md"))
+        cache.save()
+
+        assert Path("doc.md") not in DocumentCache(temp_cache_file)
+
+    def test_journal_replayed_without_save(self, temp_cache_file):
+        """Test updates survive a run that never reached save()."""
+        cache = DocumentCache(temp_cache_file)
+        cache.update_document(Path("a.md"), "hash-a")
+        cache.update_document(Path("b.md"), "hash-b")
+        cache.remove_document(Path("b.md"))
+        # No save: simulate an interrupted run
+
+        resumed = DocumentCache(temp_cache_file)
+
+        assert Path("a.md") in resumed
+        assert Path("b.md") not in resumed
+
+    def test_journal_truncated_tail_ignored(self, temp_cache_file):
+        """Test a partially written last journal record is skipped."""
+        cache = DocumentCache(temp_cache_file)
+        cache.update_document(Path("a.md"), "hash-a")
+        with open(cache.journal_file, 'a', encoding='utf-8') as f:
+            f.write('{"version": "2.0.0", "op": "put", "key": "b.md", "da')
+
+        resumed = DocumentCache(temp_cache_file)
+
+        assert Path("a.md") in resumed
+        assert Path("b.md") not in resumed
+
+    def test_save_compacts_journal(self, temp_cache_file):
+        """Test saving folds the journal into the cache file."""
+        cache = DocumentCache(temp_cache_file)
+        cache.update_document(Path("a.md"), "hash-a")
+        assert cache.journal_file.exists()
+
+        cache.save()
+
+        assert not cache.journal_file.exists()
+        assert "a.md" in json.loads(temp_cache_file.read_text())['documents']
+
+    def test_journal_compacted_once_larger_than_cache(self, temp_cache_file, monkeypatch):
+        """Test the journal is compacted when it outgrows the cache file."""
+        monkeypatch.setattr(DocumentCache, 'MIN_COMPACT_BYTES', 0)
+        cache = DocumentCache(temp_cache_file)
+        for index in range(4):
+            cache.update_document(Path(f"doc{index}.md"), f"hash{index}")
+        cache.save()
+        cache_size = temp_cache_file.stat().st_size
+
+        cache.update_document(Path("doc4.md"), "hash4")
+        assert cache.journal_file.stat().st_size < cache_size
+        while cache.journal_file.exists():
+            cache.update_document(Path("doc4.md"), "hash4")
+
+        assert temp_cache_file.stat().st_size > cache_size
+
+    def test_compactions_grow_geometrically(self, temp_cache_file, monkeypatch, mocker):
+        """Test a long run compacts a logarithmic number of times."""
+        monkeypatch.setattr(DocumentCache, 'MIN_COMPACT_BYTES', 0)
+        cache = DocumentCache(temp_cache_file)
+        save = mocker.spy(cache, 'save')
+
+        for index in range(1000):
+            cache.update_document(Path(f"doc{index}.md"), f"hash{index}")
+
+        assert 1 <= save.call_count <= 12
+
+    def test_compact_ratio_zero_compacts_only_on_save(self, temp_cache_file, monkeypatch):
+        """Test compact_ratio=0 leaves the journal until save."""
+        monkeypatch.setattr(DocumentCache, 'MIN_COMPACT_BYTES', 0)
+        cache = DocumentCache(temp_cache_file, compact_ratio=0)
+        for index in range(20):
+            cache.update_document(Path(f"doc{index}.md"), f"hash{index}")
+
+        assert json.loads(temp_cache_file.read_text())['documents'] == {}
+        assert len(cache.journal_file.read_text().splitlines()) == 20
+
+    def test_corrupt_cache_moved_aside(self, temp_cache_file):
+        """Test a corrupt cache file is set aside instead of aborting."""
+        cache = DocumentCache(temp_cache_file)
+        cache.update_document(Path("a.md"), "hash-a")
+        temp_cache_file.write_text('{"version": "2.0.0", "documents": {')
+
+        recovered = DocumentCache(temp_cache_file)
+
+        assert temp_cache_file.with_name(temp_cache_file.name + '.corrupt').exists()
+        assert Path("a.md") in recovered
+
+    @pytest.mark.skipif(os.name == 'nt', reason="Cache locking requires fcntl")
+    def test_parallel_processes_lose_no_entries(self, temp_cache_file):
+        """Test processes saving the same cache concurrently keep all entries."""
+        context = multiprocessing.get_context('fork')
+        workers = [
+            context.Process(target=_update_and_save, args=(temp_cache_file, worker))
+            for worker in range(4)
+        ]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join()
+
+        assert all(process.exitcode == 0 for process in workers)
+        assert len(DocumentCache(temp_cache_file)) == 4 * 20
+
     def test_get_all_cached_paths(self, cache):
         """Test getting all cached document paths."""
         cache.update_document(Path("doc1.md"), "hash1")
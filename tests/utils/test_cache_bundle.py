@@ -0,0 +1,137 @@
+"""
+Tests for cache bundle export and import.
+"""
+
+import json
+import tarfile
+import pytest
+from pathlib import Path
+from src.utils.cache import DocumentCache, CacheError
+from src.utils.cache_bundle import export_bundle, import_bundle
+
+
+class TestCacheBundle:
+    """Tests for export_bundle and import_bundle."""
+
+    @pytest.fixture
+    def source_repo(self, tmp_path):
+        """Create a repository with a populated cache, signatures and link graph."""
+        repo = tmp_path / "source"
+        (repo / "_meta").mkdir(parents=True)
+
+        cache = DocumentCache(repo / "_meta" / "cache.json", repo_root=repo)
+        cache.cache_data['documents'] = {
+            "docs/a.md": {
+                "hash": "hash-a",
+                "last_processed": "2025-11-07T10:00:00",
+                "issues": [{"rule_id": "YAML-001", "severity": "error", "message": "m"}]
+            }
+        }
+        cache.save()
+
+        (repo / "_meta" / "signatures.json").write_text(json.dumps({
+            "version": "1.0.0",
+            "params": {"num_perm": 128, "seed": 1, "shingle_size": 5},
+            "signatures": {"hash-a": [1, 2, 3]}
+        }))
+        (repo / "_meta" / "graph.json").write_text(json.dumps({
+            "version": "1.1.0",
+            "root": (repo / "docs").resolve().as_posix(),
+            "nodes": {"a.md": {"hash": "hash-a", "stat": None, "links": [], "anchors": []}}
+        }))
+
+        return repo, cache
+
+    def _extra_files(self, repo):
+        return {
+            'signature_cache': repo / "_meta" / "signatures.json",
+            'link_graph': repo / "_meta" / "graph.json"
+        }
+
+    def test_export_writes_manifest_and_members(self, source_repo, tmp_path):
+        """Test export bundles all caches with a manifest."""
+        repo, cache = source_repo
+        bundle = tmp_path / "bundle.tar.gz"
+
+        manifest = export_bundle(bundle, cache, "fp", "1.0.0", self._extra_files(repo))
+
+        assert manifest['documents'] == 1
+        assert manifest['link_graph_root'] == "docs"
+        with tarfile.open(bundle, 'r:gz') as tar:
+            assert sorted(tar.getnames()) == [
+                "document-cache.json", "link-graph.json",
+                "manifest.json", "signature-cache.json"
+            ]
+
+    def test_import_into_empty_checkout(self, source_repo, tmp_path):
+        """Test import restores caches under a different checkout path."""
+        repo, cache = source_repo
+        bundle = tmp_path / "bundle.tar.gz"
+        export_bundle(bundle, cache, "fp", "1.0.0", self._extra_files(repo))
+
+        target = tmp_path / "target"
+        (target / "docs").mkdir(parents=True)
+        local_cache = DocumentCache(target / "_meta" / "cache.json", repo_root=target)
+
+        manifest = import_bundle(bundle, local_cache, "fp", self._extra_files(target))
+
+        assert manifest['merged'] == {'documents': 1, 'signatures': 1, 'link_graph_nodes': 1}
+        reloaded = DocumentCache(target / "_meta" / "cache.json", repo_root=target)
+        assert reloaded.get_document(target / "docs" / "a.md")['issues'][0]['rule_id'] == "YAML-001"
+
+        graph = json.loads((target / "_meta" / "graph.json").read_text())
+        assert graph['root'] == (target / "docs").resolve().as_posix()
+
+    def test_import_merges_with_local_cache(self, source_repo, tmp_path):
+        """Test import keeps newer local entries and local signatures."""
+        repo, cache = source_repo
+        bundle = tmp_path / "bundle.tar.gz"
+        export_bundle(bundle, cache, "fp", "1.0.0", self._extra_files(repo))
+
+        target = tmp_path / "target"
+        (target / "_meta").mkdir(parents=True)
+        local_cache = DocumentCache(target / "_meta" / "cache.json", repo_root=target)
+        local_cache.cache_data['documents'] = {
+            "docs/a.md": {"hash": "local-a", "last_processed": "2025-11-08T10:00:00"},
+            "docs/b.md": {"hash": "local-b", "last_processed": "2025-11-08T10:00:00"}
+        }
+        (target / "_meta" / "signatures.json").write_text(json.dumps({
+            "version": "1.0.0",
+            "params": {"num_perm": 128, "seed": 1, "shingle_size": 5},
+            "signatures": {"hash-a": [9, 9, 9]}
+        }))
+
+        manifest = import_bundle(bundle, local_cache, "fp", self._extra_files(target))
+
+        assert manifest['merged']['documents'] == 0
+        assert manifest['merged']['signatures'] == 0
+        assert local_cache.cache_data['documents']["docs/a.md"]['hash'] == "local-a"
+        assert "docs/b.md" in local_cache.cache_data['documents']
+        signatures = json.loads((target / "_meta" / "signatures.json").read_text())
+        assert signatures['signatures']['hash-a'] == [9, 9, 9]
+
+    def test_import_rejects_fingerprint_mismatch(self, source_repo, tmp_path):
+        """Test import refuses bundles from a different configuration unless forced."""
+        repo, cache = source_repo
+        bundle = tmp_path / "bundle.tar.gz"
+        export_bundle(bundle, cache, "fp", "1.0.0")
+
+        local_cache = DocumentCache(tmp_path / "local.json", repo_root=tmp_path)
+
+        with pytest.raises(CacheError, match="different validation configuration"):
+            import_bundle(bundle, local_cache, "other-fp")
+        assert len(local_cache) == 0
+
+        import_bundle(bundle, local_cache, "other-fp", force=True)
+        assert len(local_cache) == 1
+
+    def test_import_rejects_non_bundle(self, tmp_path):
+        """Test importing an archive without a manifest fails."""
+        bundle = tmp_path / "bundle.tar.gz"
+        with tarfile.open(bundle, 'w:gz'):
+            pass
+
+        local_cache = DocumentCache(tmp_path / "local.json", repo_root=tmp_path)
+
+        with pytest.raises(CacheError, match="Not a cache bundle"):
+            import_bundle(bundle, local_cache, "fp")
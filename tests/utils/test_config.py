@@ -385,12 +385,37 @@ class TestConfigGetters:
     def test_get_cache_file_path(self, config):
         """Test getting cache file path."""
         cache_path = config.get_cache_file_path()
-        assert cache_path == Path('_meta/.cache.json')
+        assert cache_path == config.get_repo_root() / '_meta/.cache.json'
 
     def test_get_backup_dir(self, config):
         """Test getting backup directory."""
         backup_dir = config.get_backup_dir()
-        assert backup_dir == Path('_meta/.backups/')
+        assert backup_dir == config.get_repo_root() / '_meta/.backups/'
+
+    def test_repo_root_detected_from_git(self, config, tmp_path, monkeypatch):
+        """Test the repository root is found from a subdirectory."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / "docs").mkdir()
+        monkeypatch.chdir(tmp_path / "docs")
+
+        assert config.get_repo_root() == tmp_path
+        assert config.get_state_path('processing.cache_file') == tmp_path / '_meta/.cache.json'
+
+    def test_repo_root_relative_to_config_file(self, config, tmp_path, monkeypatch):
+        """Test a configured relative root is resolved against the config file."""
+        config.config_data['processing']['repo_root'] = '..'
+        monkeypatch.chdir(tmp_path / "config")
+
+        assert config.get_repo_root() == tmp_path
+
+    def test_get_state_path(self, config, tmp_path):
+        """Test absolute state paths are kept and empty ones disable state."""
+        config.config_data['processing']['index_file'] = str(tmp_path / "index.json")
+        config.config_data['processing']['link_graph_file'] = ''
+
+        assert config.get_state_path('processing.index_file') == tmp_path / "index.json"
+        assert config.get_state_path('processing.link_graph_file', '_meta/graph.json') is None
+        assert config.get_state_path('processing.missing') is None
 
     def test_get_report_output_dir(self, config):
         """Test getting report output directory."""
@@ -419,6 +444,23 @@ class TestConfigGetters:
         max_length = config.get_max_filename_length()
         assert max_length == 50
 
+    def test_fingerprint_is_stable(self, config):
+        """Test fingerprint only depends on configuration values."""
+        fingerprint = config.fingerprint()
+
+        assert fingerprint == config.fingerprint()
+        assert len(fingerprint) == 64
+
+    def test_fingerprint_tracks_validation_settings(self, config):
+        """Test fingerprint changes with validation settings but not reporting."""
+        fingerprint = config.fingerprint()
+
+        config.config_data['reporting']['format'] = 'json'
+        assert config.fingerprint() == fingerprint
+
+        config.config_data['validation']['naming']['max_length'] = 60
+        assert config.fingerprint() != fingerprint
+
 
 class TestConfigEnvironmentOverrides:
     """Tests for environment variable overrides."""
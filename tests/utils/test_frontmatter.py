@@ -2,6 +2,7 @@
 Tests for YAML frontmatter parsing and manipulation.
 """
 
+import os
 import pytest
 from pathlib import Path
 from src.utils.frontmatter import (
@@ -11,6 +12,12 @@ from src.utils.frontmatter import (
     add_frontmatter,
     update_frontmatter,
     remove_frontmatter,
+    split_frontmatter,
+    parse_frontmatter_text,
+    render_frontmatter,
+    atomic_write_text,
+    atomic_write_prefix,
+    read_frontmatter_prefix,
     FrontmatterError
 )
 
@@ -422,3 +429,101 @@ class TestRemoveFrontmatter:
 
         with pytest.raises(FileNotFoundError):
             remove_frontmatter(test_file)
+
+
+class TestFrontmatterText:
+    """Tests for in-memory frontmatter helpers."""
+
+    def test_split_frontmatter(self):
+        """Test splitting keeps the block and body byte-for-byte."""
+        content = "---  \ntitle: Test\n---\n# Body\n"
+        block, body = split_frontmatter(content)
+
+        assert block == "---  \ntitle: Test\n---\n"
+        assert body == "# Body\n"
+        assert block + body == content
+
+    def test_split_without_frontmatter(self):
+        """Test documents without frontmatter are all body."""
+        assert split_frontmatter("# Body\n") == ("", "# Body\n")
+
+    def test_parse_frontmatter_text(self):
+        """Test parsing a block with or without delimiters."""
+        assert parse_frontmatter_text("---\ntitle: Test\n---\n") == {'title': 'Test'}
+        assert parse_frontmatter_text("title: Test") == {'title': 'Test'}
+
+        with pytest.raises(FrontmatterError):
+            parse_frontmatter_text("- a list")
+
+    def test_render_round_trip(self):
+        """Test rendered text splits back into the same metadata and body."""
+        content = render_frontmatter({'title': 'Test', 'tags': ['a']}, "# Body\n")
+        block, body = split_frontmatter(content)
+
+        assert parse_frontmatter_text(block) == {'title': 'Test', 'tags': ['a']}
+        assert body == "# Body\n"
+
+
+class TestAtomicWriteText:
+    """Tests for atomic_write_text."""
+
+    def test_replaces_content_and_keeps_mode(self, tmp_path):
+        """Test the file is replaced with its permission bits intact."""
+        test_file = tmp_path / "test.md"
+        test_file.write_text("old", encoding='utf-8')
+        test_file.chmod(0o640)
+
+        atomic_write_text(test_file, "new")
+
+        assert test_file.read_text(encoding='utf-8') == "new"
+        assert test_file.stat().st_mode & 0o777 == 0o640
+        assert [p.name for p in tmp_path.iterdir()] == ["test.md"]
+
+    def test_new_file_gets_umask_mode(self, tmp_path):
+        """Test a new file is not left readable by its owner only."""
+        umask = os.umask(0)
+        os.umask(umask)
+        test_file = tmp_path / "new.md"
+
+        atomic_write_text(test_file, "new")
+
+        assert test_file.stat().st_mode & 0o777 == 0o666 & ~umask
+
+
+class TestReadFrontmatterPrefix:
+    """Tests for read_frontmatter_prefix."""
+
+    def test_reads_block_only(self, tmp_path):
+        """Test the block is returned without decoding the body."""
+        test_file = tmp_path / "test.md"
+        test_file.write_bytes(b"---\r\ntitle: Test\r\n---\r\n\xff body")
+
+        assert read_frontmatter_prefix(test_file) == ("---\ntitle: Test\n---\n", 23)
+
+    @pytest.mark.parametrize("content", [
+        b"# No frontmatter\n",
+        b"---\ntitle: Unclosed\n",
+        b"",
+    ])
+    def test_no_frontmatter(self, tmp_path, content):
+        """Test documents without a complete block give no prefix."""
+        test_file = tmp_path / "test.md"
+        test_file.write_bytes(content)
+
+        assert read_frontmatter_prefix(test_file) == ("", 0)
+
+
+class TestAtomicWritePrefix:
+    """Tests for atomic_write_prefix."""
+
+    def test_replaces_prefix_and_copies_rest(self, tmp_path):
+        """Test the start is replaced and the remaining bytes kept as is."""
+        test_file = tmp_path / "test.md"
+        test_file.write_bytes(b"---\na: 1\n---\n\xff rest\r\n")
+        test_file.chmod(0o640)
+
+        atomic_write_prefix(test_file, "---\na: 2\n---\n", 13)
+
+        assert test_file.read_bytes() == b"---\na: 2\n---\n\xff rest\r\n"
+        assert test_file.stat().st_mode & 0o777 == 0o640
+        assert [p.name for p in tmp_path.iterdir()] == ["test.md"]
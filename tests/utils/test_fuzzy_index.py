@@ -0,0 +1,84 @@
+"""
+Tests for fuzzy string index.
+"""
+
+import random
+
+from src.utils.fuzzy_index import FuzzyIndex, deletion_variants, edit_distance
+
+
+class TestEditDistance:
+    """Tests for edit_distance function."""
+
+    def test_basic_operations(self):
+        """Test insertions, deletions and substitutions each cost 1."""
+        assert edit_distance('pricing', 'pricing') == 0
+        assert edit_distance('pricing', 'pricings') == 1
+        assert edit_distance('pricing', 'prcing') == 1
+        assert edit_distance('pricing', 'pricong') == 1
+        assert edit_distance('', 'abc') == 3
+
+    def test_transposition_costs_one(self):
+        """Test swapped adjacent characters count as a single edit."""
+        assert edit_distance('onboarding', 'onbaording') == 1
+
+    def test_unrelated_words(self):
+        """Test distance for unrelated words."""
+        assert edit_distance('sales', 'wordpress') > 2
+
+    def test_max_distance_cutoff(self):
+        """Test distances beyond max_distance are capped."""
+        assert edit_distance('sales', 'wordpress', max_distance=1) == 2
+        assert edit_distance('onboarding', 'onbaording', max_distance=1) == 1
+
+
+class TestFuzzyIndex:
+    """Tests for FuzzyIndex class."""
+
+    def test_deletion_variants(self):
+        """Test variants include the word and all single deletions."""
+        assert deletion_variants('abc', 1) == {'abc', 'bc', 'ac', 'ab'}
+        assert 'a' in deletion_variants('abc', 2)
+
+    def test_finds_similar_pairs(self):
+        """Test only pairs within max_distance are reported."""
+        index = FuzzyIndex(max_distance=1)
+        for word in ['onboarding', 'onbaording', 'onboardings', 'pricing', 'pricking']:
+            index.add(word)
+
+        pairs = {(a, b) for a, b, _ in index.similar_pairs()}
+
+        assert pairs == {
+            ('onbaording', 'onboarding'),
+            ('onboarding', 'onboardings'),
+            ('pricing', 'pricking'),
+        }
+        assert len(index) == 5
+
+    def test_larger_distance(self):
+        """Test max_distance=2 finds pairs two edits apart."""
+        index = FuzzyIndex(max_distance=2)
+        index.add('gohighlevel')
+        index.add('gohighlvl')
+
+        assert [(a, b, d) for a, b, d in index.similar_pairs()] == [
+            ('gohighlevel', 'gohighlvl', 2)
+        ]
+
+    def test_large_vocabulary(self):
+        """Test tens of thousands of words are indexed and paired correctly."""
+        rng = random.Random(0)
+        words = {
+            ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz-') for _ in range(rng.randint(6, 14)))
+            for _ in range(20000)
+        }
+        index = FuzzyIndex(max_distance=1)
+        for word in words:
+            index.add(word)
+        index.add('gohighlevel')
+        index.add('gohighlevle')
+
+        pairs = list(index.similar_pairs())
+
+        assert ('gohighlevel', 'gohighlevle', 1) in pairs
+        assert all(edit_distance(a, b) == d <= 1 for a, b, d in pairs)
@@ -0,0 +1,57 @@
+"""
+Tests for Aho-Corasick keyword matcher.
+"""
+
+from src.utils.keyword_matcher import KeywordMatcher
+
+
+class TestKeywordMatcher:
+    """Tests for KeywordMatcher class."""
+
+    def test_finds_all_keywords(self):
+        """Test every keyword occurrence is reported with its value."""
+        matcher = KeywordMatcher({'basic': 'basic', 'premium': 'premium'})
+
+        matches = list(matcher.find_all('basic or premium, then basic again'))
+
+        assert [value for _, _, value in matches] == ['basic', 'premium', 'basic']
+        assert matches[0][:2] == (0, 5)
+
+    def test_overlapping_keywords(self):
+        """Test keywords that are prefixes or suffixes of others all match."""
+        matcher = KeywordMatcher({'pro': 'pro', 'pro plus': 'pro-plus', 'plus': 'plus'})
+
+        values = [value for _, _, value in matcher.find_all('the pro plus plan')]
+
+        assert values == ['pro', 'pro-plus', 'plus']
+
+    def test_whole_words_only(self):
+        """Test matches inside longer words are skipped by default."""
+        matcher = KeywordMatcher({'pro': 'pro'})
+
+        assert list(matcher.find_all('our product line')) == []
+        assert len(list(matcher.find_all('our product line', whole_words=False))) == 1
+
+    def test_aliases_share_value(self):
+        """Test several keywords can map to one value."""
+        matcher = KeywordMatcher({'enterprise': 'ent', 'ent plan': 'ent'})
+
+        values = {value for _, _, value in matcher.find_all('ent plan and enterprise')}
+
+        assert values == {'ent'}
+        assert len(matcher) == 2
+
+    def test_failure_links(self):
+        """Test matching continues correctly after a partial match fails."""
+        matcher = KeywordMatcher({'abcd': 1, 'bce': 2})
+
+        matches = list(matcher.find_all('abce', whole_words=False))
+
+        assert matches == [(1, 4, 2)]
+
+    def test_empty_matcher(self):
+        """Test an empty matcher is falsy and matches nothing."""
+        matcher = KeywordMatcher()
+
+        assert not matcher
+        assert list(matcher.find_all('anything')) == []
@@ -0,0 +1,102 @@
+"""
+Tests for memory-mapped large file helpers.
+"""
+
+import hashlib
+import mmap
+import pytest
+from src.utils.cache import compute_file_hash
+from src.utils.large_files import hash_file, is_large_file, iter_lines, read_prefix
+
+
+class TestIterLines:
+    """Tests for iter_lines."""
+
+    @pytest.mark.parametrize("content", [
+        b"first\nsecond\n",
+        b"first\r\nsecond\r\n",
+        b"no trailing newline",
+        b"blank\n\n\nlines\n",
+        b"trailing spaces   \nunicode \xc3\xa9\n",
+    ])
+    def test_matches_splitlines(self, tmp_path, content):
+        """Test streamed lines match str.splitlines()."""
+        test_file = tmp_path / "doc.md"
+        test_file.write_bytes(content)
+
+        assert list(iter_lines(test_file)) == content.decode('utf-8').splitlines()
+
+    def test_chunk_boundaries(self, tmp_path):
+        """Test lines and multi-byte characters spanning chunks are intact."""
+        content = "é line\r\n" * 50 + "a much longer line without a break " * 5 + "\nend"
+        test_file = tmp_path / "doc.md"
+        test_file.write_bytes(content.encode('utf-8'))
+
+        for chunk_size in (1, 2, 7, 64):
+            assert list(iter_lines(test_file, chunk_size=chunk_size)) == content.splitlines()
+
+    def test_carriage_return_line_endings(self, tmp_path):
+        """Test bare \\r line endings split lines at every chunk size."""
+        content = "first\rsecond\r\rthird\r\nlast\r"
+        test_file = tmp_path / "doc.md"
+        test_file.write_bytes(content.encode('utf-8'))
+
+        for chunk_size in (1, 2, 3, 64):
+            assert list(iter_lines(test_file, chunk_size=chunk_size)) == content.splitlines()
+
+    def test_empty_file(self, tmp_path):
+        """Test an empty file yields no lines."""
+        test_file = tmp_path / "empty.md"
+        test_file.write_bytes(b"")
+
+        assert list(iter_lines(test_file)) == []
+
+
+class TestIsLargeFile:
+    """Tests for is_large_file."""
+
+    def test_threshold(self, tmp_path):
+        """Test files are large at or above the threshold."""
+        test_file = tmp_path / "doc.md"
+        test_file.write_bytes(b"x" * 100)
+
+        assert is_large_file(test_file, threshold=100)
+        assert not is_large_file(test_file, threshold=101)
+
+    def test_missing_file(self, tmp_path):
+        """Test a missing file is not large."""
+        assert not is_large_file(tmp_path / "missing.md", threshold=0)
+
+
+class TestReadPrefix:
+    """Tests for read_prefix."""
+
+    def test_cuts_at_line_boundary(self, tmp_path):
+        """Test a long file is cut after the last whole line."""
+        test_file = tmp_path / "doc.md"
+        test_file.write_bytes(b"one\ntwo\nthree\n")
+
+        assert read_prefix(test_file, 10) == b"one\ntwo\n"
+        assert read_prefix(test_file, 100) == b"one\ntwo\nthree\n"
+
+
+class TestMappedHashing:
+    """Tests for memory-mapped hashing in compute_file_hash."""
+
+    def test_mapped_hash_matches_content_hash(self, tmp_path, mocker):
+        """Test hashing through a memory map gives the same digest."""
+        test_file = tmp_path / "doc.md"
+        content = b"line\n" * 50000
+        test_file.write_bytes(content)
+        mocker.patch('src.utils.large_files.is_large_file', return_value=True)
+
+        assert compute_file_hash(test_file) == hashlib.sha256(content).hexdigest()
+
+    def test_threshold_is_passed_through(self, tmp_path, mocker):
+        """Test compute_file_hash maps files at the configured threshold."""
+        test_file = tmp_path / "doc.md"
+        test_file.write_bytes(b"small")
+        mmap_spy = mocker.patch.object(mmap, 'mmap', wraps=mmap.mmap)
+
+        assert compute_file_hash(test_file, large_file_threshold=1) == hash_file(test_file)
+        assert mmap_spy.call_count == 1
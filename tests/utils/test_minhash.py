@@ -0,0 +1,132 @@
+"""
+Tests for MinHash signatures and LSH index.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from src.utils.minhash import (
+    MinHasher,
+    LSHIndex,
+    SignatureCache,
+    shingle_hashes,
+    estimate_similarity
+)
+
+
+BASE_TEXT = " ".join(f"word{i}" for i in range(200))
+
+
+class TestShingles:
+    """Tests for shingle hashing."""
+
+    def test_shingle_count(self):
+        """Test one shingle per window of consecutive words."""
+        assert len(shingle_hashes("a b c d e f", shingle_size=3)) == 4
+
+    def test_short_text_has_no_shingles(self):
+        """Test texts shorter than the shingle size produce no shingles."""
+        assert shingle_hashes("only three words", shingle_size=5) == set()
+
+    def test_case_and_punctuation_insensitive(self):
+        """Test shingles ignore case and punctuation."""
+        assert shingle_hashes("Hello, World! Foo", 2) == shingle_hashes("hello world foo", 2)
+
+
+class TestMinHasher:
+    """Tests for MinHasher class."""
+
+    def test_signature_is_deterministic(self):
+        """Test the same seed produces the same signature."""
+        shingles = shingle_hashes(BASE_TEXT)
+
+        sig_a = MinHasher(num_perm=64, seed=7).signature(shingles)
+        sig_b = MinHasher(num_perm=64, seed=7).signature(shingles)
+
+        assert sig_a.dtype == np.uint32
+        assert len(sig_a) == 64
+        assert np.array_equal(sig_a, sig_b)
+
+    def test_similarity_tracks_jaccard(self):
+        """Test estimated similarity is high for near-duplicates and low otherwise."""
+        hasher = MinHasher(num_perm=128)
+        edited = BASE_TEXT.replace("word100", "changed")
+        unrelated = " ".join(f"other{i}" for i in range(200))
+
+        base_sig = hasher.signature(shingle_hashes(BASE_TEXT))
+
+        assert estimate_similarity(base_sig, hasher.signature(shingle_hashes(edited))) > 0.9
+        assert estimate_similarity(base_sig, hasher.signature(shingle_hashes(unrelated))) < 0.1
+
+
+class TestLSHIndex:
+    """Tests for LSHIndex class."""
+
+    def test_similar_documents_become_candidates(self):
+        """Test only documents sharing a band are paired."""
+        hasher = MinHasher(num_perm=128)
+        index = LSHIndex(num_perm=128, bands=32)
+        index.add("a", hasher.signature(shingle_hashes(BASE_TEXT)))
+        index.add("b", hasher.signature(shingle_hashes(BASE_TEXT + " extra words here")))
+        index.add("c", hasher.signature(shingle_hashes(" ".join(f"x{i}" for i in range(200)))))
+
+        assert index.candidate_pairs() == {("a", "b")}
+
+    def test_bands_must_divide_num_perm(self):
+        """Test invalid band configuration is rejected."""
+        with pytest.raises(ValueError):
+            LSHIndex(num_perm=128, bands=30)
+
+
+class TestSignatureCache:
+    """Tests for SignatureCache class."""
+
+    def test_round_trip(self, tmp_path):
+        """Test signatures persist across instances."""
+        cache_file = tmp_path / "signatures.json"
+        cache = SignatureCache(cache_file, num_perm=4, seed=1, shingle_size=5)
+        cache.put("abc", np.array([1, 2, 3, 4], dtype=np.uint32))
+        cache.save()
+
+        reloaded = SignatureCache(cache_file, num_perm=4, seed=1, shingle_size=5)
+
+        assert reloaded.get("abc").tolist() == [1, 2, 3, 4]
+
+    def test_save_uses_unique_temp_file(self, tmp_path):
+        """Test saving never touches a fixed '.tmp' sibling of the cache."""
+        cache_file = tmp_path / "signatures.json"
+        (tmp_path / "signatures.tmp").write_text("not ours")
+        cache = SignatureCache(cache_file, num_perm=4, seed=1, shingle_size=5)
+        cache.put("abc", np.array([1, 2, 3, 4], dtype=np.uint32))
+        cache.save()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["signatures.json", "signatures.tmp"]
+        assert (tmp_path / "signatures.tmp").read_text() == "not ours"
+
+    def test_parameter_change_invalidates(self, tmp_path):
+        """Test signatures computed with other parameters are discarded."""
+        cache_file = tmp_path / "signatures.json"
+        cache = SignatureCache(cache_file, num_perm=4, seed=1, shingle_size=5)
+        cache.put("abc", np.array([1, 2, 3, 4], dtype=np.uint32))
+        cache.save()
+
+        reloaded = SignatureCache(cache_file, num_perm=4, seed=1, shingle_size=3)
+
+        assert reloaded.get("abc") is None
+
+    def test_only_used_signatures_saved(self, tmp_path):
+        """Test stale signatures are dropped on save."""
+        cache_file = tmp_path / "signatures.json"
+        cache = SignatureCache(cache_file, num_perm=2, seed=1, shingle_size=5)
+        cache.put("old", np.array([1, 2], dtype=np.uint32))
+        cache.put("kept", np.array([3, 4], dtype=np.uint32))
+        cache.save()
+
+        reloaded = SignatureCache(cache_file, num_perm=2, seed=1, shingle_size=5)
+        reloaded.get("kept")
+        reloaded.save()
+
+        data = json.loads(cache_file.read_text())
+        assert list(data['signatures']) == ["kept"]
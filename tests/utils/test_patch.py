@@ -0,0 +1,66 @@
+"""
+Tests for unified diff rendering.
+"""
+
+from pathlib import Path
+from src.utils.patch import patch_path, split_patch_lines, unified_diff
+
+
+class TestSplitPatchLines:
+    """Tests for split_patch_lines."""
+
+    def test_keeps_line_endings(self):
+        """Test only newlines split lines and carriage returns are kept."""
+        assert split_patch_lines("a\r\nb\n") == ["a\r\n", "b\n"]
+        assert split_patch_lines("a\x0cb\nlast") == ["a\x0cb\n", "last"]
+        assert split_patch_lines("") == []
+
+
+class TestUnifiedDiff:
+    """Tests for unified_diff."""
+
+    def test_unchanged_content(self, tmp_path):
+        """Test identical content produces no diff."""
+        assert unified_diff(tmp_path / "doc.md", "same\n", "same\n", root=tmp_path) == ""
+
+    def test_git_style_headers(self, tmp_path):
+        """Test paths are relative to the root with a/ and b/ prefixes."""
+        diff = unified_diff(tmp_path / "docs" / "doc.md", "old\n", "new\n", root=tmp_path)
+
+        assert diff == (
+            "diff --git a/docs/doc.md b/docs/doc.md\n"
+            "--- a/docs/doc.md\n"
+            "+++ b/docs/doc.md\n"
+            "@@ -1 +1 @@\n"
+            "-old\n"
+            "+new\n"
+        )
+
+    def test_rename_headers(self, tmp_path):
+        """Test a moved file gets git rename headers, with hunks only if changed."""
+        renamed = unified_diff(
+            tmp_path / "My Doc.md", "same\n", "same\n", root=tmp_path, new_path=tmp_path / "my-doc.md"
+        )
+        assert renamed == (
+            "diff --git a/My Doc.md b/my-doc.md\n"
+            "rename from My Doc.md\n"
+            "rename to my-doc.md\n"
+        )
+
+        changed = unified_diff(
+            tmp_path / "My Doc.md", "old\n", "new\n", root=tmp_path, new_path=tmp_path / "my-doc.md"
+        )
+        assert changed.startswith(renamed + "--- a/My Doc.md\n+++ b/my-doc.md\n@@ -1 +1 @@\n")
+
+    def test_missing_trailing_newline(self, tmp_path):
+        """Test a last line without a newline is marked as in git diffs."""
+        diff = unified_diff(tmp_path / "doc.md", "text", "text\n", root=tmp_path)
+
+        assert diff.endswith("-text\n\\ No newline at end of file\n+text\n")
+
+    def test_patch_path_relative_to_cwd(self, tmp_path, monkeypatch):
+        """Test paths default to being relative to the current directory."""
+        monkeypatch.chdir(tmp_path)
+
+        assert patch_path(Path("docs/doc.md")) == "docs/doc.md"
+        assert patch_path(tmp_path / "doc.md") == "doc.md"
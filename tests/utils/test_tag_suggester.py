@@ -0,0 +1,144 @@
+"""
+Tests for TF-IDF tag suggestions.
+"""
+
+import json
+
+import pytest
+
+from src.utils.tag_suggester import TagSuggester, TermCountCache, term_counts
+
+
+CORPUS = [
+    ("Invoice payment terms and invoice due dates for billing", ['billing']),
+    ("Refund an invoice and issue billing credit notes", ['billing']),
+    ("Onboarding checklist for new hires and laptop setup", ['hr', 'onboarding']),
+    ("New hires onboarding: benefits enrollment and payroll setup", ['hr', 'onboarding']),
+    ("Quarterly planning notes", []),
+]
+
+
+class TestTermCounts:
+    """Tests for term_counts function."""
+
+    def test_counts_lowercased_terms(self):
+        """Test terms are lowercased and short words and stop words dropped."""
+        assert term_counts("Invoice the INVOICE to an ops team") == {'invoice': 2, 'ops': 1, 'team': 1}
+
+    def test_ignores_code_blocks_and_link_urls(self):
+        """Test code and link targets do not contribute terms."""
+        text = "See [pricing](docs/secret-path.md)\n\n```python\nimport internals\n```\n"
+        assert term_counts(text) == {'see': 1, 'pricing': 1}
+
+
+class TestTermCountCache:
+    """Tests for TermCountCache class."""
+
+    def test_persists_used_counts(self, tmp_path):
+        """Test only counts used in the run are saved and reloaded."""
+        cache_file = tmp_path / "terms.json"
+        cache = TermCountCache(cache_file)
+        cache.get("invoice billing")
+        cache.save()
+
+        reloaded = TermCountCache(cache_file)
+        reloaded.get("payroll setup")
+        reloaded.save()
+
+        counts = json.loads(cache_file.read_text())['counts']
+        assert list(counts.values()) == [{'payroll': 1, 'setup': 1}]
+
+    def test_save_uses_unique_temp_file(self, tmp_path):
+        """Test saving never touches a fixed '.tmp' sibling of the cache."""
+        cache_file = tmp_path / "terms.json"
+        (tmp_path / "terms.tmp").write_text("not ours")
+        cache = TermCountCache(cache_file)
+        cache.get("invoice billing")
+        cache.save()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["terms.json", "terms.tmp"]
+        assert (tmp_path / "terms.tmp").read_text() == "not ours"
+
+    def test_cached_counts_are_reused(self, tmp_path, mocker):
+        """Test text seen in an earlier run is not re-tokenized."""
+        cache_file = tmp_path / "terms.json"
+        cache = TermCountCache(cache_file)
+        cache.get("invoice billing")
+        cache.save()
+
+        tokenize = mocker.patch('src.utils.tag_suggester.term_counts')
+        assert TermCountCache(cache_file).get("invoice billing") == {'invoice': 1, 'billing': 1}
+        tokenize.assert_not_called()
+
+    def test_tokenizer_change_discards_cache(self, tmp_path):
+        """Test counts from another tokenizer version are ignored."""
+        cache_file = tmp_path / "terms.json"
+        cache_file.write_text(json.dumps({
+            'version': TermCountCache.VERSION,
+            'params': {'tokenizer': 0},
+            'counts': {'abc': {'stale': 1}}
+        }))
+
+        assert TermCountCache(cache_file)._counts == {}
+
+    def test_bad_file_is_ignored(self, tmp_path):
+        """Test a corrupt cache file starts an empty cache."""
+        cache_file = tmp_path / "terms.json"
+        cache_file.write_text("{not json")
+
+        assert TermCountCache(cache_file).get("invoice") == {'invoice': 1}
+
+
+class TestTagSuggester:
+    """Tests for TagSuggester class."""
+
+    @pytest.fixture
+    def suggester(self):
+        """Create a suggester fitted on a small corpus."""
+        suggester = TagSuggester(top_k=2, min_similarity=0.1)
+        suggester.fit(CORPUS)
+        return suggester
+
+    def test_fit_learns_tags_with_enough_documents(self, suggester):
+        """Test tags are learned from tagged documents only."""
+        assert suggester.fitted
+        assert suggester.tags == ['billing', 'hr', 'onboarding']
+
+    def test_min_tag_documents(self):
+        """Test tags on too few documents are not learned."""
+        suggester = TagSuggester(min_tag_documents=2)
+        learned = suggester.fit(CORPUS + [("Security incident runbook", ['security'])])
+
+        assert learned == 5
+        assert 'security' not in suggester.tags
+
+    def test_suggests_most_similar_tags(self, suggester):
+        """Test documents get the tags of the documents they resemble."""
+        assert suggester.suggest("Overdue invoice reminders for billing") == ['billing']
+        assert sorted(suggester.suggest("Payroll setup for new hires")) == ['hr', 'onboarding']
+
+    def test_dissimilar_document_gets_no_tags(self, suggester):
+        """Test nothing is suggested below the similarity threshold."""
+        assert suggester.suggest("Kubernetes cluster autoscaling") == []
+
+    def test_unfitted_suggests_nothing(self):
+        """Test a suggester with no learned tags returns empty suggestions."""
+        suggester = TagSuggester()
+        suggester.fit([("Untagged notes", [])])
+
+        assert not suggester.fitted
+        assert suggester.suggest("more notes") == []
+
+    def test_top_k_limits_suggestions(self, suggester):
+        """Test no more than top_k tags are suggested."""
+        suggester.top_k = 1
+
+        assert len(suggester.suggest("Payroll setup for new hires")) == 1
+
+    def test_uses_term_cache(self, tmp_path):
+        """Test corpus term counts go through the cache."""
+        cache = TermCountCache(tmp_path / "terms.json")
+        TagSuggester(term_cache=cache).fit(CORPUS)
+        cache.save()
+
+        assert len(TermCountCache(tmp_path / "terms.json")._counts) == len(CORPUS)